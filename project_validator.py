@@ -7,6 +7,13 @@ Usage:
     python3 project_validator.py                    # Check for issues
     python3 project_validator.py --fix              # Check and attempt fixes (not fully implemented)
     python3 project_validator.py --project <path>   # Specify custom project path
+    python3 project_validator.py --select privacy-manifest,accessibility
+    python3 project_validator.py --ignore accessibility
+    python3 project_validator.py --list-checks      # Built-in and plugin checks
+    python3 project_validator.py --all [--jobs N]   # Every project and workspace in the repo
+    python3 project_validator.py --workspace <path> # The projects a workspace references
+    python3 project_validator.py --profile trace.json [--cprofile stats.prof]
+                                                    # Time each check (Chrome trace, cProfile)
 
 This tool performs comprehensive validation of Xcode project files:
 1. File Structure Audit - Checks for missing Swift files
@@ -14,26 +21,63 @@ This tool performs comprehensive validation of Xcode project files:
 3. Group Structure Verification - Checks PBXGroup paths are empty
 4. Build Settings Verification - Validates iOS target build settings
 5. Project File Integrity - Checks for syntax errors
+6. Privacy Manifest - Reconciles required-reason API usage with PrivacyInfo.xcprivacy
+7. Accessibility - Lints SwiftUI views for unlabelled images/controls, fixed fonts, grouping
+8. Target Membership - Flags Shared files compiled by a target they have no code for
+
+Checks live in scripts/xcproj/checks/ (more can be installed as plugins,
+see that package), project-specific settings in xcproj.json next to the
+.xcodeproj. A check whose declared inputs are unchanged since the last run
+shows its cached result. With --all or --workspace the repository is
+indexed once and the projects are validated in a process pool, each with
+its own report, followed by a merged summary.
 
 Exit codes:
     0 - No errors found
     1 - Errors found
 """
 
-import re
+import contextlib
+import io
 import os
 import sys
+import time
 import argparse
+import json
 from pathlib import Path
-from collections import defaultdict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'scripts'))
+from xcproj.cache import DEFAULT_CACHE_DIR, Cache, content_hash
+from xcproj.fsindex import FileIndex
+from xcproj.pbxproj import PlistError
+from xcproj.session import open_project
+from xcproj.workspace import WorkspaceError, discover, read_workspace
+from xcproj import checks, tracing
+
+DEFAULT_CONFIG = 'xcproj.json'
 
 class ProjectValidator:
-    def __init__(self, project_path='DisabilityAdvocacy.xcodeproj/project.pbxproj', fix=False):
+    def __init__(self, project_path='DisabilityAdvocacy.xcodeproj/project.pbxproj', fix=False,
+                 select=None, ignore=None, use_cache=True, config_path=None, files=None):
         self.project_path = project_path
         self.fix = fix
-        self.project_root = Path('.')
+        self.select = select
+        self.ignore = ignore
+        self.use_cache = use_cache
+        # Paths in the project are relative to the directory holding the .xcodeproj
+        self.project_root = Path(project_path).parent.parent
+        self.config_path = config_path or self.project_root / DEFAULT_CONFIG
         self.issues = []
         self.warnings = []
+        self._files = files
+        self._fingerprints = {}
+    
+    @property
+    def files(self):
+        """Index of the working tree, walked once on first use"""
+        if self._files is None:
+            self._files = FileIndex(self.project_root)
+        return self._files
         
     def run(self):
         """Run all validation checks"""
@@ -46,19 +90,37 @@ class ProjectValidator:
             print(f"ERROR: Project file not found: {self.project_path}")
             return False
         
-        # Read project file
-        with open(self.project_path, 'r') as f:
-            self.content = f.read()
+        try:
+            config = load_config(self.config_path)
+            selected = checks.select(checks.discover(), self.select, self.ignore)
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            return False
         
-        # Run all checks
-        self.check_file_structure()
-        self.check_resource_files()
-        self.check_group_structure()
-        self.check_build_settings()
-        self.check_project_integrity()
+        cache = Cache('checks') if self.use_cache else None
+        # Map project file; each check decodes only the objects it needs
+        with open_project(self.project_path) as self.project:
+            try:
+                for number, check in enumerate(selected, 1):
+                    with tracing.span(check.name, 'check'):
+                        self.run_check(number, check, config.get(check.name, {}), cache)
+            except PlistError as e:
+                self.issues.append({
+                    'type': 'integrity',
+                    'severity': 'error',
+                    'message': 'Project file could not be parsed',
+                    'details': [str(e)],
+                    'count': 1
+                })
+                print(f"✗ Project file could not be parsed: {e}")
+                print()
+        if cache is not None:
+            # A partial run keeps the other checks' results for the next full run
+            cache.save(prune=not (self.select or self.ignore))
         
         # Print summary
-        self.print_summary()
+        with tracing.span('print_summary', 'report'):
+            self.print_summary()
         
         # Apply fixes if requested
         if self.fix and self.issues:
@@ -66,367 +128,66 @@ class ProjectValidator:
         
         return len(self.issues) == 0
     
-    def check_file_structure(self):
-        """Check file structure and missing files"""
+    def run_check(self, number, check, options, cache):
+        """Run one check, or replay its cached result if its inputs are unchanged"""
+        if check.source != 'builtin':
+            check.load()  # plugins declare title and inputs on the function
         print("=" * 70)
-        print("1. FILE STRUCTURE AUDIT")
+        print(f"{number}. {check.title}")
         print("=" * 70)
         print()
         
-        # Find all Swift files
-        all_swift_files = {}
-        for swift_file in self.project_root.rglob('*.swift'):
-            if '.xcodeproj' in str(swift_file) or 'Tests' in str(swift_file) or 'UITests' in str(swift_file):
-                continue
-            rel_path = str(swift_file.relative_to(self.project_root))
-            all_swift_files[rel_path] = {
-                'path': rel_path,
-                'filename': swift_file.name,
-                'directory': str(swift_file.parent.relative_to(self.project_root))
-            }
-        
-        print(f"Found {len(all_swift_files)} Swift files (excluding tests)")
-        print(f"  - Shared/: {len([f for f in all_swift_files if f.startswith('Shared/')])}")
-        print(f"  - iOS/: {len([f for f in all_swift_files if f.startswith('iOS/')])}")
-        print(f"  - macOS/: {len([f for f in all_swift_files if f.startswith('macOS/')])}")
-        print()
-        
-        # Extract file references
-        file_refs = {}
-        file_ref_pattern = r'(\w+) /\* ([^*]+) \*/ = \{isa = PBXFileReference; ([^}]+)\};'
-        for match in re.finditer(file_ref_pattern, self.content):
-            file_id = match.group(1)
-            filename = match.group(2).strip()
-            settings = match.group(3)
-            path_match = re.search(r'path = ([^;]+);', settings)
-            if path_match:
-                path = path_match.group(1).strip()
-                file_refs[file_id] = {
-                    'id': file_id,
-                    'filename': filename,
-                    'path': path,
-                    'settings': settings
-                }
-        
-        print(f"Found {len(file_refs)} file references in project")
-        
-        # Extract build files
-        build_files = {}
-        build_file_pattern = r'(\w+) /\* ([^*]+) in Sources \*/ = \{isa = PBXBuildFile; fileRef = (\w+)'
-        for match in re.finditer(build_file_pattern, self.content):
-            build_id = match.group(1)
-            filename = match.group(2).strip()
-            file_ref_id = match.group(3)
-            build_files[build_id] = {
-                'id': build_id,
-                'filename': filename,
-                'file_ref_id': file_ref_id
-            }
-        
-        print(f"Found {len(build_files)} build file entries")
-        print()
-        
-        # Check for missing files
-        project_paths = set()
-        for ref in file_refs.values():
-            project_paths.add(ref['path'])
-        
-        missing_from_project = []
-        for file_path in all_swift_files:
-            if file_path not in project_paths:
-                missing_from_project.append(file_path)
-        
-        if missing_from_project:
-            self.issues.append({
-                'type': 'missing_files',
-                'severity': 'error',
-                'message': f'{len(missing_from_project)} files missing from project',
-                'details': missing_from_project[:20],
-                'count': len(missing_from_project)
+        key = None
+        if cache is not None and check.inputs is not None:
+            key = self.cache_key(check, options)
+            cached = cache.get(key)
+            if cached is not None:
+                print("↺ Inputs unchanged since the last run - cached result")
+                sys.stdout.write(cached['output'])
+                self.issues.extend(cached['issues'])
+                self.warnings.extend(cached['warnings'])
+                return
+        
+        function = check.load()
+        issues_before = len(self.issues)
+        warnings_before = len(self.warnings)
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                function(self, options)
+        finally:
+            sys.stdout.write(output.getvalue())
+        if key is not None:
+            cache.set(key, {
+                'output': output.getvalue(),
+                'issues': self.issues[issues_before:],
+                'warnings': self.warnings[warnings_before:],
             })
-            print(f"✗ Files missing from project: {len(missing_from_project)}")
-            for path in sorted(missing_from_project)[:10]:
-                print(f"  - {path}")
-            if len(missing_from_project) > 10:
-                print(f"  ... and {len(missing_from_project) - 10} more")
-        else:
-            print("✓ All Swift files are referenced in project")
-        
-        # Check for files in project but not on disk
-        missing_from_disk = []
-        for ref in file_refs.values():
-            if ref['path'] not in all_swift_files and not ref['path'].startswith('Resources/'):
-                if not os.path.exists(ref['path']):
-                    missing_from_disk.append(ref['path'])
-        
-        if missing_from_disk:
-            self.issues.append({
-                'type': 'orphaned_references',
-                'severity': 'warning',
-                'message': f'{len(missing_from_disk)} files referenced but not on disk',
-                'details': missing_from_disk[:10],
-                'count': len(missing_from_disk)
-            })
-            print(f"\n⚠ Files in project but not on disk: {len(missing_from_disk)}")
-            for path in sorted(missing_from_disk)[:5]:
-                print(f"  - {path}")
-        
-        # Check for orphaned build files
-        build_file_refs = set()
-        for build_file in build_files.values():
-            build_file_refs.add(build_file['file_ref_id'])
-        
-        missing_file_refs = []
-        for build_id, build_file in build_files.items():
-            if build_file['file_ref_id'] not in file_refs:
-                missing_file_refs.append(build_file)
-        
-        if missing_file_refs:
-            self.issues.append({
-                'type': 'orphaned_build_files',
-                'severity': 'error',
-                'message': f'{len(missing_file_refs)} build files with missing file references',
-                'details': [bf['filename'] for bf in missing_file_refs[:10]],
-                'count': len(missing_file_refs)
-            })
-            print(f"\n✗ Build files with missing file references: {len(missing_file_refs)}")
-        
-        print()
     
-    def check_resource_files(self):
-        """Check resource files"""
-        print("=" * 70)
-        print("2. RESOURCE FILES VERIFICATION")
-        print("=" * 70)
-        print()
-        
-        required_resources = {
-            'Resources/Resources.json': 'text.json',
-            'Resources/Assets.xcassets': 'folder.assetcatalog',
-            'Resources/Events.json': 'text.json',
-            'Resources/Localizable.xcstrings': 'text.plist.strings',
-            'Resources/PrivacyInfo.xcprivacy': 'text',
-        }
-        
-        missing_resources = []
-        for file_path, file_type in required_resources.items():
-            filename = file_path.split('/')[-1]
-            pattern = rf'(\w+) /\* {re.escape(filename)} \*/ = \{{isa = PBXFileReference[^}}]+path = {re.escape(file_path)}[^}}]+\}};'
-            match = re.search(pattern, self.content)
-            
-            if not match:
-                missing_resources.append((file_path, file_type))
-                print(f"✗ {filename} - Missing from project")
-            elif not os.path.exists(file_path):
-                self.warnings.append(f"Resource file {file_path} is referenced but doesn't exist on disk")
-                print(f"⚠ {filename} - Referenced but file missing on disk")
-            else:
-                print(f"✓ {filename} - OK")
-        
-        if missing_resources:
-            self.issues.append({
-                'type': 'missing_resources',
-                'severity': 'error',
-                'message': f'{len(missing_resources)} resource files missing from project',
-                'details': [r[0] for r in missing_resources],
-                'count': len(missing_resources)
-            })
-        
-        # Check if resources are in Resources build phase
-        resources_in_phase = re.findall(r'(\w+) /\* ([^*]+) in Resources \*/', self.content)
-        print(f"\nResources in build phase: {len(resources_in_phase)}")
-        print()
+    def cache_key(self, check, options):
+        """Hash of a check's code, options and declared inputs"""
+        parts = [check.name, checks.code_version(check), json.dumps(options, sort_keys=True)]
+        with tracing.span('fingerprint inputs', 'read', inputs=','.join(check.inputs)):
+            parts += [self.fingerprint(name) for name in check.inputs if name != 'config']
+        return content_hash(*parts)
     
-    def check_group_structure(self):
-        """Check PBXGroup structure"""
-        print("=" * 70)
-        print("3. GROUP STRUCTURE VERIFICATION")
-        print("=" * 70)
-        print()
-        
-        # Find all PBXGroup entries
-        group_pattern = r'(\w+) /\* ([^*]+) \*/ = \{[\s\S]*?isa = PBXGroup;[\s\S]*?\};'
-        groups = {}
-        
-        for match in re.finditer(group_pattern, self.content):
-            group_id = match.group(1)
-            group_name = match.group(2).strip()
-            group_content = match.group(0)
-            
-            path_match = re.search(r'path = ([^;]+);', group_content)
-            path = path_match.group(1).strip() if path_match else None
-            
-            groups[group_id] = {
-                'name': group_name,
-                'path': path,
-                'content': group_content
-            }
-        
-        print(f"Found {len(groups)} PBXGroup entries")
-        
-        # Check for groups with non-empty paths
-        path_issues = []
-        for group_id, group in groups.items():
-            if group['path'] and group['path'] not in ['""', '', 'None']:
-                path_issues.append((group_id, group['name'], group['path']))
-        
-        if path_issues:
-            self.issues.append({
-                'type': 'group_paths',
-                'severity': 'warning',
-                'message': f'{len(path_issues)} groups with non-empty paths',
-                'details': [f"{name}: {path}" for _, name, path in path_issues[:10]],
-                'count': len(path_issues)
-            })
-            print(f"\n⚠ Groups with non-empty paths: {len(path_issues)}")
-            for group_id, group_name, path in path_issues[:5]:
-                print(f"  - {group_name}: {path}")
-        else:
-            print("✓ All group paths are empty")
-        
-        print()
-    
-    def check_build_settings(self):
-        """Check build settings"""
-        print("=" * 70)
-        print("4. BUILD SETTINGS VERIFICATION")
-        print("=" * 70)
-        print()
-        
-        # Find target build configurations - look for the configuration list
-        # First find the target's build configuration list ID
-        target_match = re.search(r'buildConfigurationList = (\w+) /\* Build configuration list for PBXNativeTarget', self.content)
-        if not target_match:
-            self.issues.append({
-                'type': 'build_config',
-                'severity': 'error',
-                'message': 'Could not find target build configuration list',
-                'details': [],
-                'count': 1
-            })
-            print("✗ Could not find target build configuration list")
-            return
-        
-        config_list_id = target_match.group(1)
-        
-        # Find the configuration list
-        config_list_pattern = rf'{re.escape(config_list_id)} /\* Build configuration list for PBXNativeTarget[\s\S]*?buildConfigurations = \(([\s\S]*?)\);'
-        config_list_match = re.search(config_list_pattern, self.content)
-        if not config_list_match:
-            self.issues.append({
-                'type': 'build_config',
-                'severity': 'error',
-                'message': 'Could not find target build configurations',
-                'details': [],
-                'count': 1
-            })
-            print("✗ Could not find target build configurations")
-            return
-        
-        config_ids = re.findall(r'(\w+) /\* (Debug|Release) \*/', config_list_match.group(1))
-        
-        expected_settings = {
-            'INFOPLIST_FILE': 'iOS/Info.plist',
-            'GENERATE_INFOPLIST_FILE': 'NO',
-            'SUPPORTED_PLATFORMS': 'iphoneos iphonesimulator',
-        }
-        
-        for config_id, config_type in config_ids:
-            print(f"=== {config_type} Configuration ===")
-            
-            pattern = rf'{re.escape(config_id)} /\* {re.escape(config_type)} \*/ = \{{[\s\S]*?buildSettings = \{{([\s\S]*?)\}};[\s\S]*?name = {re.escape(config_type)};'
-            match = re.search(pattern, self.content)
-            if not match:
-                print(f"  ✗ Could not find {config_type} configuration section")
-                continue
-            
-            settings = match.group(1)
-            
-            for setting, expected in expected_settings.items():
-                expected_clean = expected.strip('"')
-                setting_match = re.search(rf'{re.escape(setting)} = ([^;]+);', settings)
-                if setting_match:
-                    value = setting_match.group(1).strip().strip('"')
-                    if value == expected_clean or (setting == 'SUPPORTED_PLATFORMS' and expected_clean in value):
-                        print(f"  ✓ {setting}: {value}")
-                    else:
-                        print(f"  ✗ {setting}: {value} (expected: {expected_clean})")
-                        self.issues.append({
-                            'type': 'build_setting',
-                            'severity': 'error',
-                            'message': f'{config_type}: {setting} is incorrect',
-                            'details': [f"Current: {value}, Expected: {expected_clean}"],
-                            'count': 1
-                        })
-                else:
-                    print(f"  ✗ {setting}: Not found (expected: {expected_clean})")
-                    self.issues.append({
-                        'type': 'build_setting',
-                        'severity': 'error',
-                        'message': f'{config_type}: {setting} is missing',
-                        'details': [f"Expected: {expected_clean}"],
-                        'count': 1
-                    })
-            
-            # Check deployment target
-            deployment_match = re.search(r'IPHONEOS_DEPLOYMENT_TARGET = ([^;]+);', settings)
-            if deployment_match:
-                print(f"  ✓ IPHONEOS_DEPLOYMENT_TARGET: {deployment_match.group(1).strip()}")
-            else:
-                print(f"  ⚠ IPHONEOS_DEPLOYMENT_TARGET: Not found")
-            
-            # Check Swift version
-            swift_match = re.search(r'SWIFT_VERSION = ([^;]+);', settings)
-            if swift_match:
-                print(f"  ✓ SWIFT_VERSION: {swift_match.group(1).strip()}")
+    def fingerprint(self, name):
+        """Hash of one check input, computed once per run"""
+        if name not in self._fingerprints:
+            if name == 'pbxproj':
+                value = content_hash(self.project.data)
+            elif name == 'filesystem':
+                value = self.files.fingerprint()
+            elif name == 'sources':
+                value = self.files.content_fingerprint(
+                    [path for path in self.files.with_suffix('.swift') if '.xcodeproj' not in path]
+                )
+            elif name == 'resources':
+                value = self.files.content_fingerprint(self.files.under('Resources'))
             else:
-                print(f"  ⚠ SWIFT_VERSION: Not found")
-            
-            print()
-    
-    def check_project_integrity(self):
-        """Check project file integrity"""
-        print("=" * 70)
-        print("5. PROJECT FILE INTEGRITY")
-        print("=" * 70)
-        print()
-        
-        # Check for balanced braces
-        open_braces = self.content.count('{')
-        close_braces = self.content.count('}')
-        if open_braces != close_braces:
-            self.issues.append({
-                'type': 'integrity',
-                'severity': 'error',
-                'message': 'Mismatched braces in project file',
-                'details': [f"Opening: {open_braces}, Closing: {close_braces}"],
-                'count': 1
-            })
-            print(f"✗ Mismatched braces: {open_braces} opening, {close_braces} closing")
-        else:
-            print(f"✓ Braces are balanced: {open_braces} pairs")
-        
-        # Check for balanced parentheses
-        open_parens = self.content.count('(')
-        close_parens = self.content.count(')')
-        if open_parens != close_parens:
-            self.issues.append({
-                'type': 'integrity',
-                'severity': 'error',
-                'message': 'Mismatched parentheses in project file',
-                'details': [f"Opening: {open_parens}, Closing: {close_parens}"],
-                'count': 1
-            })
-            print(f"✗ Mismatched parentheses: {open_parens} opening, {close_parens} closing")
-        else:
-            print(f"✓ Parentheses are balanced: {open_parens} pairs")
-        
-        # Check for common issues
-        if 'MoreView.swift' in self.content or 'LiquidGlass.swift' in self.content:
-            self.warnings.append("Project contains references to non-existent files (MoreView.swift, LiquidGlass.swift)")
-            print("⚠ Project contains references to non-existent files")
-        
-        print()
+                raise ValueError(f"unknown check input: {name}")
+            self._fingerprints[name] = value
+        return self._fingerprints[name]
     
     def print_summary(self):
         """Print summary of all issues"""
@@ -478,7 +239,131 @@ class ProjectValidator:
         print()
         return False
 
-def main():
+# Repository index handed to each pool worker once, by _init_worker
+_repo_index = None
+
+def _init_worker(index):
+    global _repo_index
+    _repo_index = index
+
+def _validate_captured(project, exclude, options):
+    """Validate one .xcodeproj (relative to the repository index) with its output captured"""
+    started = time.perf_counter()
+    root = os.path.dirname(project) or '.'
+    # Each project gets its own cache directory so parallel runs don't prune each other
+    base = os.environ.get('XCPROJ_CACHE_DIR') or str(DEFAULT_CACHE_DIR)
+    os.environ['XCPROJ_CACHE_DIR'] = os.path.join(base, 'projects', project.replace('/', '_'))
+    validator = ProjectValidator(
+        project_path=os.path.join(_repo_index.root, project, 'project.pbxproj'),
+        files=_repo_index.subtree(root, exclude), **options
+    )
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            success = validator.run()
+    finally:
+        os.environ['XCPROJ_CACHE_DIR'] = base
+    return {
+        'project': project,
+        'success': success,
+        'output': output.getvalue(),
+        'errors': sum(1 for issue in validator.issues if issue['severity'] == 'error'),
+        'warnings': sum(1 for issue in validator.issues if issue['severity'] == 'warning') + len(validator.warnings),
+        'seconds': time.perf_counter() - started,
+    }
+
+def _nested_roots(projects):
+    """For each project, the roots of other projects inside its own root"""
+    roots = {project: os.path.dirname(project) for project in projects}
+    nested = {}
+    for project, root in roots.items():
+        prefix = '' if not root else root + '/'
+        nested[project] = [
+            other_root for other, other_root in roots.items()
+            if other != project and other_root != root and other_root.startswith(prefix)
+        ]
+    return nested
+
+def validate_many(projects, index, jobs=None, options=None):
+    """Validate projects (paths relative to index.root) concurrently; yields results in order"""
+    options = options or {}
+    nested = _nested_roots(projects)
+    jobs = min(jobs or os.cpu_count() or 1, len(projects))
+    if jobs <= 1:
+        _init_worker(index)
+        for project in projects:
+            yield _validate_captured(project, nested[project], options)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(index,)) as pool:
+        futures = [pool.submit(_validate_captured, project, nested[project], options) for project in projects]
+        for future in futures:
+            yield future.result()
+
+def run_many(root='.', workspaces=None, jobs=None, options=None):
+    """Discover and validate several projects, print every report and a merged summary"""
+    started = time.perf_counter()
+    index = FileIndex(root)
+    try:
+        projects, found_workspaces, missing = discover(index)
+        if workspaces:
+            missing = []
+            selected = []
+            for workspace in workspaces:
+                workspace = os.path.relpath(workspace, root).replace(os.sep, '/')
+                for project in read_workspace(os.path.join(root, workspace)):
+                    project = os.path.relpath(project, root).replace(os.sep, '/')
+                    if f"{project}/project.pbxproj" not in index:
+                        missing.append((workspace, project))
+                    elif project not in selected:
+                        selected.append(project)
+            projects = selected
+    except WorkspaceError as e:
+        print(f"ERROR: {e}")
+        return False
+    
+    print(f"Found {len(projects)} project(s)" + (f" in {len(found_workspaces)} workspace(s)" if found_workspaces else ''))
+    print()
+    results = []
+    for result in validate_many(projects, index, jobs, options):
+        print(f"### {result['project']}")
+        sys.stdout.write(result['output'])
+        results.append(result)
+    
+    print("=" * 70)
+    print(f"MERGED SUMMARY ({len(results)} projects, {time.perf_counter() - started:.1f}s)")
+    print("=" * 70)
+    print()
+    width = max([len(result['project']) for result in results] + [10])
+    for result in results:
+        mark = '✓' if result['success'] else '✗'
+        print(f"{mark} {result['project']:<{width}}  {result['errors']:>3} errors  "
+              f"{result['warnings']:>3} warnings  {result['seconds']:5.2f}s")
+    for workspace, project in missing:
+        print(f"✗ {workspace} references missing project {project}")
+    failed = [result for result in results if not result['success']]
+    print()
+    print(f"Total issues: {sum(r['errors'] for r in results)} errors, "
+          f"{sum(r['warnings'] for r in results)} warnings in {len(failed)} of {len(results)} projects")
+    print()
+    return not failed and not missing
+
+def load_config(path=DEFAULT_CONFIG):
+    """Per-check options from xcproj.json ({"checks": {name: options}}); {} if absent"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        raise ValueError(f"could not read {path}: {e}")
+    return config.get('checks', {})
+
+def _names(values):
+    """Flatten repeatable, comma-separated --select/--ignore values"""
+    return [name.strip() for value in values or () for name in value.split(',') if name.strip()]
+
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description='Xcode Project Validator - Check for file structure and build process errors'
     )
@@ -492,13 +377,88 @@ def main():
         default='DisabilityAdvocacy.xcodeproj/project.pbxproj',
         help='Path to project.pbxproj file'
     )
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help='Validate every .xcodeproj and workspace-referenced project under --root'
+    )
+    parser.add_argument(
+        '--workspace',
+        action='append',
+        help='Validate the projects referenced by this .xcworkspace (repeatable)'
+    )
+    parser.add_argument(
+        '--root',
+        default='.',
+        help='Repository root for --all/--workspace (default: current directory)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        help='Projects validated in parallel (default: CPU count)'
+    )
+    parser.add_argument(
+        '--select',
+        action='append',
+        metavar='CHECKS',
+        help='Only run these checks (comma-separated, repeatable)'
+    )
+    parser.add_argument(
+        '--ignore',
+        action='append',
+        metavar='CHECKS',
+        help='Skip these checks (comma-separated, repeatable)'
+    )
+    parser.add_argument(
+        '--list-checks',
+        action='store_true',
+        help='List available checks and their inputs'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Run every check even if its inputs are unchanged'
+    )
+    parser.add_argument(
+        '--config',
+        help='Per-check options (default: xcproj.json next to the .xcodeproj)'
+    )
+    parser.add_argument(
+        '--profile',
+        metavar='TRACE_JSON',
+        help='Record per-check timing, CPU and memory as a Chrome/Perfetto trace'
+    )
+    parser.add_argument(
+        '--cprofile',
+        metavar='STATS_FILE',
+        help='Also write cProfile stats (python3 -m pstats STATS_FILE)'
+    )
+    parser.add_argument(
+        '--no-tracemalloc',
+        action='store_true',
+        help='Profile without tracemalloc: realistic timings, allocation block counts only'
+    )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
-    validator = ProjectValidator(project_path=args.project, fix=args.fix)
-    success = validator.run()
+    if args.list_checks:
+        for check in checks.discover():
+            inputs = ', '.join(check.inputs) if check.inputs is not None else 'undeclared'
+            print(f"{check.name:<18} {check.title:<30} inputs: {inputs} [{check.source}]")
+        return 0
+    
+    options = dict(
+        fix=args.fix, select=_names(args.select), ignore=_names(args.ignore),
+        use_cache=not args.no_cache, config_path=args.config
+    )
+    with tracing.profile(args.profile, args.cprofile, process_name='ProjectValidator',
+                         memory=not args.no_tracemalloc):
+        if args.all or args.workspace:
+            success = run_many(args.root, args.workspace, args.jobs, options)
+        else:
+            success = ProjectValidator(project_path=args.project, **options).run()
     
-    sys.exit(0 if success else 1)
+    return 0 if success else 1
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
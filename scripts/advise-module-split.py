@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Propose a Swift Package module split of Shared/
+
+Usage:
+    python3 scripts/advise-module-split.py             # Modules, critical path, parallel width
+    python3 scripts/advise-module-split.py --files     # Also list each module's files
+    python3 scripts/advise-module-split.py --package   # Package.swift targets for the proposal
+
+The report is advice; the exit code is 0 unless the directory is missing.
+"""
+
+import sys
+
+from xcproj.modules import main
+
+if __name__ == '__main__':
+    sys.exit(main())
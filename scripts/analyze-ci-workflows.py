@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Critical path and duplicated work of the GitHub Actions workflows
+
+Usage:
+    python3 scripts/analyze-ci-workflows.py                      # Weighted by step counts
+    python3 scripts/analyze-ci-workflows.py --fetch 30           # Median durations of the last 30 runs (gh)
+    python3 scripts/analyze-ci-workflows.py --runs run.json      # Durations from `gh run view ID --json jobs,workflowName`
+    python3 scripts/analyze-ci-workflows.py --event pull_request --format json
+
+Exit codes:
+    0 - Report printed (also when duplicated work was found, unless --strict)
+    1 - Duplicated work was found with --strict, or the workflows could
+        not be read
+"""
+
+import sys
+
+from xcproj.workflows import main
+
+if __name__ == '__main__':
+    sys.exit(main())
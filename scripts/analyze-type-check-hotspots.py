@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Rank Swift files by likely type-checking cost
+
+Usage:
+    python3 scripts/analyze-type-check-hotspots.py                  # Shared/, iOS/, macOS/
+    python3 scripts/analyze-type-check-hotspots.py Shared/Views     # Specific directories
+    python3 scripts/analyze-type-check-hotspots.py --timings build.log
+
+To record timings, build with the frontend flags and keep the log:
+
+    xcodebuild ... OTHER_SWIFT_FLAGS='$(inherited) -Xfrontend -debug-time-function-bodies' | tee build.log
+
+Exit codes:
+    0 - Report printed (hotspots are advice, never a failure)
+    1 - A timings log could not be read
+"""
+
+import sys
+
+from xcproj.typecheck import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Attach open PRs to their milestone projects using the GraphQL API
+
+Usage:
+    GITHUB_TOKEN=... python3 scripts/attach-prs-to-projects-graphql.py [--dry-run]
+    python3 scripts/attach-prs-to-projects-graphql.py --endpoint http://127.0.0.1:8080/graphql
+"""
+
+import sys
+
+from ghgraphql.attach import main
+
+if __name__ == '__main__':
+    sys.exit(main())
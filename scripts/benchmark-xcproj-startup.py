@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for the xcproj CLI
+
+Times `xcproj --help` and `xcproj COMMAND --help` against a bare
+interpreter, and checks with `python -X importtime` what each one imports.
+Fails when:
+
+- `xcproj --help` imports any command module (commands must load lazily)
+- any command imports concurrent.futures/multiprocessing at startup (the
+  process pool is imported only when a run is big enough to use it)
+- the median startup overhead exceeds the budget
+
+Usage:
+    python3 scripts/benchmark-xcproj-startup.py
+    python3 scripts/benchmark-xcproj-startup.py --pyz dist/xcproj.pyz
+    python3 scripts/benchmark-xcproj-startup.py --runs 20 --budget-ms 30 --command-budget-ms 100
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from xcproj.cli import COMMANDS
+
+ENTRY = Path(__file__).resolve().parent / 'xcproj-cli.py'
+
+# Modules the bare CLI may load from this repository
+STARTUP_ALLOWED = {'xcproj', 'xcproj.cli'}
+PROJECT_MODULES = re.compile(r'^(xcproj(\..*)?|project_validator)$')
+# Never needed just to start a command
+EAGER_FORBIDDEN = re.compile(r'^(concurrent\.futures|multiprocessing)(\..*)?$')
+
+_IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def time_command(command, runs):
+    """Median wall time of command in milliseconds"""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def imports(command):
+    """Return {module: cumulative microseconds} for top-level imports of one run"""
+    result = subprocess.run(
+        [command[0], '-X', 'importtime'] + command[1:], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            modules[match.group(4)] = (int(match.group(2)), len(match.group(3)) // 2)
+    return modules
+
+
+def slowest(modules, count=3):
+    """Top-level imports with the largest cumulative time"""
+    top = sorted(
+        ((micros, name) for name, (micros, depth) in modules.items() if depth == 0), reverse=True
+    )[:count]
+    return ', '.join(f"{name} {micros / 1000:.1f}" for micros, name in top)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark xcproj CLI startup and guard against import bloat')
+    parser.add_argument('--pyz', help='Benchmark a built zipapp instead of the source tree')
+    parser.add_argument('--runs', type=int, default=10, help='Runs per command (default 10)')
+    parser.add_argument('--budget-ms', type=float, default=40,
+                        help='Max overhead of `xcproj --help` over a bare interpreter (default 40)')
+    parser.add_argument('--command-budget-ms', type=float, default=150,
+                        help='Max overhead of `xcproj COMMAND --help` (default 150)')
+    args = parser.parse_args(argv)
+
+    cli = [sys.executable, args.pyz or str(ENTRY)]
+    baseline = time_command([sys.executable, '-c', 'pass'], args.runs)
+    print(f"🐍 Interpreter startup: {baseline:.1f} ms (median of {args.runs})")
+    print()
+    print(f"{'command':<20} {'median':>8} {'overhead':>9}  slowest imports (ms)")
+
+    failures = []
+    for name in [None] + list(COMMANDS):
+        command = cli + ([name] if name else []) + ['--help']
+        label = f"xcproj {name or ''} --help".replace('  ', ' ')
+        median = time_command(command, args.runs)
+        overhead = median - baseline
+        modules = imports(command)
+        print(f"{(name or '(none)'):<20} {median:7.1f}  {overhead:+8.1f}  {slowest(modules)}")
+
+        budget = args.command_budget_ms if name else args.budget_ms
+        if overhead > budget:
+            failures.append(f"{label}: {overhead:.1f} ms over the interpreter, budget {budget:.0f} ms")
+        eager = sorted(module for module in modules if EAGER_FORBIDDEN.match(module))
+        if eager:
+            failures.append(f"{label} imports {', '.join(eager[:3])} at startup")
+        if name is None:
+            loaded = sorted(
+                module for module in modules if PROJECT_MODULES.match(module) and module not in STARTUP_ALLOWED
+            )
+            if loaded:
+                failures.append(f"{label} imports command modules: {', '.join(loaded)}")
+
+    print()
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Startup within budget and commands load lazily")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
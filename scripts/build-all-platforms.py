@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Build and test iOS and macOS in parallel
+
+Usage:
+    python3 scripts/build-all-platforms.py                   # Debug builds and unit tests
+    python3 scripts/build-all-platforms.py Release --skip-tests
+    python3 scripts/build-all-platforms.py --ui-tests --simulators 2
+    python3 scripts/build-all-platforms.py --xcodebuild ./stub-xcodebuild   # Dry run of the scheduler
+    python3 scripts/build-all-platforms.py --dump-plan > plan.json           # Edit, then --plan plan.json
+
+Exit codes:
+    0 - Every job passed
+    1 - A job failed (later jobs were skipped unless --keep-going), or the
+        plan or simulator could not be set up
+    130 - Interrupted
+"""
+
+import sys
+
+from xcproj.orchestrator import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Build the xcproj CLI as a single-file zipapp
+
+Bundles the xcproj package and project_validator.py into dist/xcproj.pyz,
+runnable with any Python 3 and nothing else on disk:
+
+    python3 scripts/build-xcproj-zipapp.py
+    ./dist/xcproj.pyz structure + privacy
+
+Modules are stored uncompressed next to precompiled .pyc files, because
+zipimport can't write bytecode caches and would otherwise recompile every
+imported module on every run. The .pyc files are hash-based and unchecked,
+so they don't depend on file times; an interpreter with a different
+bytecode version ignores them and compiles the sources instead.
+"""
+
+import argparse
+import py_compile
+import shutil
+import sys
+import tempfile
+import zipapp
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = REPO_ROOT / 'scripts' / 'xcproj'
+EXTRA_MODULES = [REPO_ROOT / 'project_validator.py']
+DEFAULT_OUTPUT = REPO_ROOT / 'dist' / 'xcproj.pyz'
+
+# zipapp's generated __main__ drops main()'s return value, so findings would exit 0
+MAIN = '''import sys
+
+from xcproj.cli import main
+
+sys.exit(main())
+'''
+
+
+def stage(directory):
+    """Copy sources into directory with a .pyc beside each; returns the file count"""
+    sources = [(path, Path('xcproj') / path.relative_to(PACKAGE)) for path in sorted(PACKAGE.rglob('*.py'))]
+    sources += [(path, Path(path.name)) for path in EXTRA_MODULES]
+    for source, relative in sources:
+        target = directory / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, target)
+        py_compile.compile(
+            str(source), cfile=str(target.with_suffix('.pyc')), dfile=str(relative), doraise=True,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+        )
+    (directory / '__main__.py').write_text(MAIN, encoding='utf-8')
+    return len(sources)
+
+
+def build(output=DEFAULT_OUTPUT, interpreter='/usr/bin/env python3'):
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory() as directory:
+        count = stage(Path(directory))
+        zipapp.create_archive(directory, output, interpreter=interpreter)
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build dist/xcproj.pyz')
+    parser.add_argument('-o', '--output', default=str(DEFAULT_OUTPUT), help='Archive to write')
+    parser.add_argument('--python', default='/usr/bin/env python3', help='Interpreter for the #! line')
+    args = parser.parse_args(argv)
+
+    try:
+        count = build(args.output, args.python)
+    except (OSError, py_compile.PyCompileError) as e:
+        print(f"❌ Could not build {args.output}: {e}")
+        return 1
+    size = Path(args.output).stat().st_size
+    print(f"✅ Built {args.output} ({count} modules, {size // 1024} KB)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
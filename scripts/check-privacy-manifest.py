@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Check required-reason API usage against Resources/PrivacyInfo.xcprivacy
+
+Usage:
+    python3 scripts/check-privacy-manifest.py              # Scan Shared/, iOS/, macOS/
+    python3 scripts/check-privacy-manifest.py Shared       # Scan specific directories
+    python3 scripts/check-privacy-manifest.py --no-cache   # Ignore cached per-file results
+
+Exit codes:
+    0 - Manifest covers every API in use (unused declarations only warn)
+    1 - An API is used without a declaration, or a declaration has no reason
+"""
+
+import sys
+
+from xcproj.privacy import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Validate Localizable.xcstrings and compile compact per-locale tables
+
+Usage:
+    python3 scripts/compile-string-catalog.py --check      # Validate only
+    python3 scripts/compile-string-catalog.py              # Resources/Generated/<locale>.lproj/
+    python3 scripts/compile-string-catalog.py --register   # Also wire the tables and a build
+                                                           # phase into the project
+
+Exit codes:
+    0 - Catalog valid (and tables up to date)
+    1 - Catalog invalid or unreadable
+"""
+
+import sys
+
+from xcproj.xcstrings import main
+
+if __name__ == '__main__':
+    sys.exit(main())
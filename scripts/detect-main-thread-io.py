@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Find blocking file, JSON and network work reachable from the main actor
+
+Usage:
+    python3 scripts/detect-main-thread-io.py                      # Shared, iOS, macOS
+    python3 scripts/detect-main-thread-io.py Shared/Managers      # Specific directories
+    python3 scripts/detect-main-thread-io.py --category file      # One kind of work only
+    python3 scripts/detect-main-thread-io.py --format json        # Machine-readable report
+
+Suppress a finding with `// main-thread: ignore` on the same or previous line.
+
+Exit codes:
+    0 - Report printed (also when something was found, unless --strict)
+    1 - Something was found with --strict
+"""
+
+import sys
+
+from xcproj.mainthread import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Coverage of the Swift lines changed since the base branch
+
+Usage:
+    python3 scripts/diff-coverage.py --coverage coverage.lcov             # Against origin/main
+    python3 scripts/diff-coverage.py --xcresult build/Logs/Test/Run.xcresult --base main
+    python3 scripts/diff-coverage.py --coverage coverage.lcov --format markdown >> "$GITHUB_STEP_SUMMARY"
+    python3 scripts/diff-coverage.py --coverage coverage.lcov --full coverage-by-file.md
+
+Exit codes:
+    0 - Report printed
+    1 - Diff coverage is below --fail-under, or the coverage or diff could
+        not be read
+"""
+
+import sys
+
+from xcproj.diffcoverage import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Find Swift files no entry point reaches and resources no code loads
+
+Usage:
+    python3 scripts/find-dead-code.py                      # Every target
+    python3 scripts/find-dead-code.py --target DisabilityAdvocacy-iOS
+    python3 scripts/find-dead-code.py --format json        # Machine-readable report
+
+Exit codes:
+    0 - Report printed (also when something was found, unless --strict)
+    1 - Something unreachable or unused was found with --strict, or the
+        project file is missing
+"""
+
+import sys
+
+from xcproj.deadcode import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,7 +9,16 @@ PROJECT="DisabilityAdvocacy.xcodeproj"
 SCHEME="DisabilityAdvocacy-iOS"
 SDK="iphonesimulator"
 CONFIGURATION="Debug"
-DESTINATION="platform=iOS Simulator,name=iPhone 16 Pro"
+DEVICE="${DEVICE:-iPhone 16 Pro}"
+
+# A name-only destination means "on the newest OS", which fails when that
+# runtime doesn't have the device; resolve it to an installed simulator's id
+if [ -z "$DESTINATION" ]; then
+    DESTINATION=$(python3 "$(dirname "$0")/resolve-destination.py" --name "$DEVICE" --boot) || {
+        echo "❌ No simulator available (list them with scripts/resolve-destination.py --list)"
+        exit 1
+    }
+fi
 
 echo "🧪 Running tests with coverage..."
 echo ""
@@ -82,6 +91,14 @@ else
     COVERAGE=$(tail -1 coverage-report.txt | awk '{print $NF}' | sed 's/%//' || echo "0")
     echo ""
     echo "📊 Overall Coverage: ${COVERAGE}%"
+
+    # Coverage of the lines changed on this branch (skipped when there is no base to compare with)
+    xcrun llvm-cov export -format=lcov "$BINARY" -instr-profile="$COVERAGE_DATA" > coverage.lcov
+    BASE="${BASE:-origin/main}"
+    if git rev-parse --verify --quiet "$BASE" > /dev/null; then
+        echo ""
+        python3 "$(dirname "$0")/diff-coverage.py" --coverage coverage.lcov --base "$BASE" --full coverage-by-file.md || true
+    fi
 fi
 
 # Determine status
@@ -98,4 +115,5 @@ fi
 
 echo ""
 echo "📁 Coverage report saved to: coverage-report.txt"
+[ -f coverage-by-file.md ] && echo "📁 Per-file line coverage saved to: coverage-by-file.md"
 echo "📁 Test output saved to: test-output.txt"
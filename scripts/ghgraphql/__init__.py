@@ -0,0 +1,10 @@
+"""
+GitHub GraphQL tooling for the repository's project boards
+
+Used by attach-prs-to-projects-graphql.sh. mock_server provides a local
+stand-in for the API so the scripts can be exercised without a token.
+"""
+
+from .client import GraphQLClient, GraphQLError
+
+__all__ = ['GraphQLClient', 'GraphQLError']
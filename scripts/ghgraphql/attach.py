@@ -0,0 +1,129 @@
+"""
+Attach open pull requests to the project named after their milestone
+
+Projects and PRs are each fetched once with cursor pagination (100 per
+page), and the addProjectV2ItemById mutations are sent in aliased batches
+over a small worker pool. Hundreds of PRs take a handful of round-trips.
+addProjectV2ItemById is idempotent, so re-running is safe.
+"""
+
+import argparse
+import os
+
+from .client import DEFAULT_ENDPOINT, GraphQLClient, GraphQLError
+
+REPO_OWNER = 'linuxliam'
+REPO_NAME = 'disability'
+
+PROJECTS_QUERY = '''
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    projectsV2(first: 100, after: $cursor) {
+      nodes { id number title }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+'''
+
+PULL_REQUESTS_QUERY = '''
+query($owner: String!, $name: String!, $states: [PullRequestState!], $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: 100, after: $cursor, states: $states) {
+      nodes { id number title milestone { title } }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+'''
+
+
+def plan(projects, pull_requests):
+    """Pair PRs with the project whose title matches their milestone
+
+    Returns (additions, skipped) where additions are (pr, project) pairs and
+    skipped are (pr, reason) pairs.
+    """
+    project_map = {project['title']: project for project in projects}
+    additions = []
+    skipped = []
+    for pr in pull_requests:
+        milestone = (pr.get('milestone') or {}).get('title')
+        if not milestone:
+            skipped.append((pr, 'No milestone'))
+        elif milestone not in project_map:
+            skipped.append((pr, f"Project '{milestone}' not found"))
+        else:
+            additions.append((pr, project_map[milestone]))
+    return additions, skipped
+
+
+def attach(client, owner=REPO_OWNER, name=REPO_NAME, states=('OPEN',), dry_run=False, batch_size=25, workers=4):
+    """Attach PRs to projects; returns the number of failures"""
+    repository = {'owner': owner, 'name': name}
+    print("Fetching projects...")
+    projects = list(client.paginate(PROJECTS_QUERY, ['repository', 'projectsV2'], repository))
+    print("Fetching PRs...")
+    pull_requests = list(client.paginate(
+        PULL_REQUESTS_QUERY, ['repository', 'pullRequests'], dict(repository, states=list(states))
+    ))
+    print(f"   {len(projects)} projects, {len(pull_requests)} PRs")
+    print()
+
+    additions, skipped = plan(projects, pull_requests)
+    for pr, reason in skipped:
+        print(f"⚠️  PR #{pr['number']}: {reason} - skipping")
+
+    if dry_run:
+        for pr, project in additions:
+            print(f"🔍 [DRY RUN] PR #{pr['number']}: would add to project '{project['title']}'")
+        return 0
+
+    results = client.mutate_all(
+        'addProjectV2ItemById',
+        [{'projectId': project['id'], 'contentId': pr['id']} for pr, project in additions],
+        '{ item { id } }', 'AddProjectV2ItemByIdInput',
+        batch_size=batch_size, workers=workers,
+    )
+    failures = 0
+    for (pr, project), (_, error) in zip(additions, results):
+        if error:
+            failures += 1
+            print(f"❌ PR #{pr['number']}: Failed to add to project - {error}")
+        else:
+            print(f"✅ PR #{pr['number']}: Added to project '{project['title']}'")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Attach pull requests to their milestone projects')
+    parser.add_argument('--owner', default=REPO_OWNER)
+    parser.add_argument('--repo', default=REPO_NAME)
+    parser.add_argument('--state', action='append', choices=['OPEN', 'CLOSED', 'MERGED'],
+                        help='PR states to include (repeatable, default OPEN)')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would be attached')
+    parser.add_argument('--batch-size', type=int, default=25, help='Mutations per request (default 25)')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent requests (default 4)')
+    parser.add_argument('--endpoint', default=os.environ.get('GITHUB_GRAPHQL_URL', DEFAULT_ENDPOINT),
+                        help='GraphQL endpoint (e.g. a mock server)')
+    args = parser.parse_args(argv)
+
+    token = os.environ.get('GITHUB_TOKEN', '')
+    if not token:
+        print("❌ Error: GITHUB_TOKEN environment variable not set")
+        return 1
+
+    print("Attaching PRs to milestone projects using GraphQL API...")
+    print()
+    with GraphQLClient(token, endpoint=args.endpoint) as client:
+        try:
+            failures = attach(
+                client, args.owner, args.repo, states=args.state or ['OPEN'], dry_run=args.dry_run,
+                batch_size=args.batch_size, workers=args.workers,
+            )
+        except (GraphQLError, OSError) as e:
+            print(f"❌ Error: {e}")
+            return 1
+        print()
+        print(f"✅ Done! ({client.requests} GraphQL requests)")
+    return 1 if failures else 0
@@ -0,0 +1,168 @@
+"""
+Minimal GitHub GraphQL client
+
+- One keep-alive HTTP connection per thread, instead of a new TLS handshake
+  per request
+- Cursor pagination over any connection field
+- Mutations grouped into one request as aliased fields, with per-alias
+  errors mapped back to the operation that caused them
+- A bounded thread pool for sending batches concurrently
+"""
+
+import http.client
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+DEFAULT_ENDPOINT = 'https://api.github.com/graphql'
+
+# Connection-level failures worth one reconnect and retry
+_RECONNECT_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionError, BrokenPipeError)
+
+
+class GraphQLError(RuntimeError):
+    """Raised when a request fails or the response contains errors"""
+
+    def __init__(self, message, errors=None):
+        super().__init__(message)
+        self.errors = errors or []
+
+
+class GraphQLClient:
+    """Send GraphQL requests over persistent connections"""
+
+    def __init__(self, token, endpoint=DEFAULT_ENDPOINT, timeout=30, retries=2):
+        url = urlsplit(endpoint)
+        self._connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+        self._host = url.netloc
+        self._path = url.path or '/'
+        self._headers = {
+            'Authorization': f'bearer {token}',
+            'Content-Type': 'application/json',
+            'User-Agent': 'disability-project-scripts',
+        }
+        self.timeout = timeout
+        self.retries = retries
+        self.requests = 0
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = self._connection_class(self._host, timeout=self.timeout)
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _post(self, body):
+        for attempt in range(self.retries + 1):
+            connection = self._connection()
+            try:
+                connection.request('POST', self._path, body=body, headers=self._headers)
+                response = connection.getresponse()
+                payload = response.read()
+            except _RECONNECT_ERRORS:
+                # The server closed an idle keep-alive connection; reconnect
+                connection.close()
+                if attempt == self.retries:
+                    raise
+                continue
+            if response.status in (502, 503) and attempt < self.retries:
+                time.sleep(2 ** attempt)
+                continue
+            with self._lock:
+                self.requests += 1
+            if response.status != 200:
+                raise GraphQLError(f"HTTP {response.status}: {payload[:200].decode('utf-8', 'replace')}")
+            return json.loads(payload)
+        raise GraphQLError("Request failed after retries")
+
+    def execute(self, query, variables=None, allow_partial=False):
+        """Run a query or mutation and return its `data`
+
+        With allow_partial, return (data, errors) instead of raising on errors.
+        """
+        result = self._post(json.dumps({'query': query, 'variables': variables or {}}).encode('utf-8'))
+        errors = result.get('errors') or []
+        if allow_partial:
+            return result.get('data') or {}, errors
+        if errors:
+            raise GraphQLError('; '.join(error.get('message', str(error)) for error in errors), errors)
+        return result.get('data') or {}
+
+    def paginate(self, query, path, variables=None):
+        """Yield every node of a connection, following pageInfo cursors
+
+        The query takes a `$cursor: String` variable, passes it as `after:` on
+        the connection at `path` (e.g. ['repository', 'pullRequests']) and
+        selects `nodes` and `pageInfo { hasNextPage endCursor }`.
+        """
+        variables = dict(variables or {}, cursor=None)
+        while True:
+            connection = self.execute(query, variables)
+            for key in path:
+                connection = (connection or {}).get(key)
+            if not connection:
+                return
+            yield from connection.get('nodes') or []
+            page = connection.get('pageInfo') or {}
+            if not page.get('hasNextPage'):
+                return
+            variables['cursor'] = page['endCursor']
+
+    def mutate_batch(self, field, operations, selection, input_type):
+        """Run many calls of one mutation field as a single aliased request
+
+        `operations` is a list of input dicts. Returns a list of
+        (result, error) pairs in the same order.
+        """
+        declarations = ', '.join(f"$input{i}: {input_type}!" for i in range(len(operations)))
+        fields = '\n'.join(f"  m{i}: {field}(input: $input{i}) {selection}" for i in range(len(operations)))
+        query = f"mutation({declarations}) {{\n{fields}\n}}"
+        variables = {f"input{i}": operation for i, operation in enumerate(operations)}
+
+        data, errors = self.execute(query, variables, allow_partial=True)
+        failures = {}
+        for error in errors:
+            alias = (error.get('path') or [None])[0]
+            failures.setdefault(alias, error.get('message', str(error)))
+        results = []
+        for i in range(len(operations)):
+            alias = f"m{i}"
+            error = failures.get(alias)
+            if error is None and data.get(alias) is None:
+                # Errors without a path (e.g. rate limiting) fail the whole batch
+                error = failures.get(None, 'No result returned')
+            results.append((data.get(alias), error))
+        return results
+
+    def mutate_all(self, field, operations, selection, input_type, batch_size=25, workers=4):
+        """mutate_batch() over any number of operations with a bounded pool"""
+        batches = [operations[i:i + batch_size] for i in range(0, len(operations), batch_size)]
+        if not batches:
+            return []
+
+        def send(batch):
+            try:
+                return self.mutate_batch(field, batch, selection, input_type)
+            except (GraphQLError, OSError) as e:
+                return [(None, str(e))] * len(batch)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(batches)))) as pool:
+            return [result for batch_results in pool.map(send, batches) for result in batch_results]
+
+    def close(self):
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
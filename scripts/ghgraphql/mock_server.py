@@ -0,0 +1,129 @@
+"""
+Local stand-in for the GitHub GraphQL API
+
+Serves exactly what attach.py uses - repository.projectsV2,
+repository.pullRequests (with cursor pagination) and aliased
+addProjectV2ItemById mutations - over HTTP/1.1 keep-alive, and counts
+requests and connections so batching and connection reuse can be checked
+without a token or network access.
+"""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_CONNECTION_FIRST = re.compile(r'(projectsV2|pullRequests)\(first: (\d+)')
+_ALIASED_MUTATION = re.compile(r'(\w+): addProjectV2ItemById\(input: \$(\w+)\)')
+
+
+class MockGitHub:
+    """A repository with projects, PRs and project items, served on localhost"""
+
+    def __init__(self, projects=(), pull_requests=()):
+        self.projects = list(projects)
+        self.pull_requests = list(pull_requests)
+        self.items = {}  # (project id, content id) -> item id
+        self.requests = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    @classmethod
+    def generate(cls, pr_count, milestones=('v0.2.0 - Core Features', 'v1.0.0-beta - Beta Release')):
+        """A repository with one project per milestone and pr_count PRs spread over them"""
+        projects = [{'id': f"PVT_{i}", 'number': i + 1, 'title': title} for i, title in enumerate(milestones)]
+        pull_requests = [
+            {
+                'id': f"PR_{number}", 'number': number, 'title': f"PR {number}", 'state': 'OPEN',
+                # Every fifth PR has no milestone, like real repositories
+                'milestone': None if number % 5 == 0 else {'title': milestones[number % len(milestones)]},
+            }
+            for number in range(1, pr_count + 1)
+        ]
+        return cls(projects, pull_requests)
+
+    # -- GraphQL ------------------------------------------------------------
+
+    def _page(self, nodes, name, query, variables):
+        match = next((m for m in _CONNECTION_FIRST.finditer(query) if m.group(1) == name), None)
+        size = int(match.group(2)) if match else 100
+        start = int(variables.get('cursor') or 0)
+        end = start + size
+        return {
+            'nodes': nodes[start:end],
+            'pageInfo': {'hasNextPage': end < len(nodes), 'endCursor': str(end)},
+        }
+
+    def resolve(self, query, variables):
+        """Answer one request body; returns the response dict"""
+        if query.lstrip().startswith('mutation'):
+            data = {}
+            errors = []
+            for alias, variable in _ALIASED_MUTATION.findall(query):
+                args = variables.get(variable) or {}
+                if args.get('projectId') not in {p['id'] for p in self.projects}:
+                    data[alias] = None
+                    errors.append({'message': f"Could not resolve to a node with the global id of "
+                                              f"'{args.get('projectId')}'", 'path': [alias]})
+                    continue
+                with self._lock:
+                    key = (args['projectId'], args['contentId'])
+                    item_id = self.items.setdefault(key, f"PVTI_{len(self.items) + 1}")
+                data[alias] = {'item': {'id': item_id}}
+            return {'data': data, 'errors': errors} if errors else {'data': data}
+
+        repository = {}
+        if 'projectsV2' in query:
+            repository['projectsV2'] = self._page(self.projects, 'projectsV2', query, variables)
+        if 'pullRequests' in query:
+            states = variables.get('states') or ['OPEN']
+            pull_requests = [
+                {key: pr[key] for key in ('id', 'number', 'title', 'milestone')}
+                for pr in self.pull_requests if pr['state'] in states
+            ]
+            repository['pullRequests'] = self._page(pull_requests, 'pullRequests', query, variables)
+        return {'data': {'repository': repository}}
+
+    # -- HTTP ---------------------------------------------------------------
+
+    def start(self, port=0):
+        """Serve on localhost in a background thread; returns the endpoint URL"""
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                with mock._lock:
+                    mock.connections += 1
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+                with mock._lock:
+                    mock.requests += 1
+                if not self.headers.get('Authorization', '').startswith('bearer '):
+                    response, status = {'message': 'Bad credentials'}, 401
+                else:
+                    response, status = mock.resolve(body.get('query', ''), body.get('variables') or {}), 200
+                payload = json.dumps(response).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{self._server.server_address[1]}/graphql"
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
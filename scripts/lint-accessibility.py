@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Lint SwiftUI views for accessibility problems
+
+Usage:
+    python3 scripts/lint-accessibility.py                       # Shared/Views, iOS/Views, macOS/Views
+    python3 scripts/lint-accessibility.py Shared/Views/Settings # Specific directories
+    python3 scripts/lint-accessibility.py --rule dynamic-type   # One rule only
+
+Suppress a finding with `// a11y-lint: ignore` on the same or previous line.
+
+Exit codes:
+    0 - No errors (warnings may be reported)
+    1 - Controls without an accessible label
+"""
+
+import sys
+
+from xcproj.accessibility import main
+
+if __name__ == '__main__':
+    sys.exit(main())
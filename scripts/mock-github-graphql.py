@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Run a local mock of the GitHub GraphQL API for the project-board scripts
+
+Usage:
+    python3 scripts/mock-github-graphql.py --prs 500             # Serve until Ctrl-C
+    python3 scripts/mock-github-graphql.py --prs 500 --demo      # Run attach against it and report round-trips
+"""
+
+import argparse
+import sys
+import time
+
+from ghgraphql.attach import attach
+from ghgraphql.client import GraphQLClient
+from ghgraphql.mock_server import MockGitHub
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local mock of the GitHub GraphQL API')
+    parser.add_argument('--prs', type=int, default=100, help='Number of open PRs to generate')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on (0 for any)')
+    parser.add_argument('--demo', action='store_true', help='Attach all PRs against the mock and print statistics')
+    args = parser.parse_args()
+
+    mock = MockGitHub.generate(args.prs)
+    endpoint = mock.start(0 if args.demo else args.port)
+
+    if args.demo:
+        started = time.perf_counter()
+        with GraphQLClient('mock-token', endpoint=endpoint) as client:
+            failures = attach(client)
+        elapsed = time.perf_counter() - started
+        mock.stop()
+        print()
+        print(f"📊 {len(mock.items)} items created for {args.prs} PRs in {elapsed:.2f}s")
+        print(f"   {mock.requests} requests over {mock.connections} connections")
+        return 1 if failures else 0
+
+    print(f"🧪 Mock GitHub GraphQL API with {args.prs} PRs at {endpoint}")
+    print(f"   GITHUB_TOKEN=x python3 scripts/attach-prs-to-projects-graphql.py --endpoint {endpoint}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        mock.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Find Shared files that compile to nothing on one of their targets
+
+Usage:
+    python3 scripts/optimize-target-membership.py                  # Report wasted work per target
+    python3 scripts/optimize-target-membership.py --fix --dry-run  # Show the membership changes
+    python3 scripts/optimize-target-membership.py --fix            # Move them to a single target
+    python3 scripts/optimize-target-membership.py --format json    # Machine-readable report
+
+Exit codes:
+    0 - Report printed or fixes applied (also when files were found, unless --strict)
+    1 - Files were found with --strict, or the project could not be read
+"""
+
+import sys
+
+from xcproj.membership import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Semantic diff of project.pbxproj between revisions
+
+Usage:
+    python3 scripts/pbxdiff.py                          # HEAD vs working tree
+    python3 scripts/pbxdiff.py origin/main              # origin/main vs working tree
+    python3 scripts/pbxdiff.py origin/main HEAD         # Between two revisions
+    python3 scripts/pbxdiff.py --commits origin/main..HEAD --format markdown
+"""
+
+import sys
+
+from xcproj.diff import main
+
+if __name__ == '__main__':
+    sys.exit(main())
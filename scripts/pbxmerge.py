@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Git merge driver for project.pbxproj
+
+Merges base/ours/theirs by object instead of by line, so branches that each
+add files no longer conflict. Real conflicts fall back to conflict markers.
+
+Setup (once per clone; .gitattributes already routes *.pbxproj here):
+    python3 scripts/pbxmerge.py --install
+
+Git then runs:
+    python3 scripts/pbxmerge.py %O %A %B %P
+"""
+
+import sys
+
+from xcproj.merge import main
+
+if __name__ == '__main__':
+    sys.exit(main())
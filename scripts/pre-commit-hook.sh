@@ -25,5 +25,13 @@ if [ -f "scripts/validate-platform-code.sh" ]; then
     }
 fi
 
+# Check required-reason APIs against the privacy manifest (cached per file)
+if [ -f "scripts/check-privacy-manifest.py" ]; then
+    python3 scripts/check-privacy-manifest.py || {
+        echo "Privacy manifest check failed. Commit aborted."
+        exit 1
+    }
+fi
+
 echo "Pre-commit validation passed!"
 exit 0
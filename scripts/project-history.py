@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Chart project.pbxproj health over git history
+
+Usage:
+    python3 scripts/project-history.py                        # Last 1000 commits, summary only
+    python3 scripts/project-history.py -n 5000 --csv history.csv
+    python3 scripts/project-history.py --html history.html    # Charts of every metric
+    python3 scripts/project-history.py origin/main -n 200     # Ending at another revision
+
+Exit codes:
+    0 - Time series computed
+    1 - Not a git repository, or the revision doesn't exist
+"""
+
+import sys
+
+from xcproj.history import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Pick an xcodebuild -destination that exists on this machine
+
+Usage:
+    python3 scripts/resolve-destination.py --name "iPhone 16 Pro"           # platform=iOS Simulator,id=...
+    python3 scripts/resolve-destination.py --name "iPhone 16 Pro" --boot    # ...and boot it
+    python3 scripts/resolve-destination.py --family ipad --os '>=18.0'
+    python3 scripts/resolve-destination.py --from test-output.txt --list    # Inventory from a saved log
+    python3 scripts/resolve-destination.py --format github                  # destination= to $GITHUB_OUTPUT
+
+Exit codes:
+    0 - Destination printed on stdout (notes go to stderr)
+    1 - No device matches, or no inventory could be read
+"""
+
+import sys
+
+from xcproj.destinations import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -14,18 +14,30 @@ NC='\033[0m' # No Color
 # Configuration
 PROJECT_NAME="DisabilityAdvocacy"
 PROJECT_FILE="${PROJECT_NAME}.xcodeproj"
+SCHEME="${PROJECT_NAME}-iOS"
 IOS_TEST_TARGET="DisabilityAdvocacyTests"
 IOS_UI_TEST_TARGET="DisabilityAdvocacyUITests"
 CONFIGURATION="${1:-Debug}"
 REPORT_DIR="test-reports"
+DEVICE="${DEVICE:-iPhone 16 Pro}"
 TIMESTAMP=$(date +%Y%m%d_%H%M%S)
 
 # Create report directory
 mkdir -p "${REPORT_DIR}"
 
+# Resolve the simulator once, by id, so xcodebuild never fails its own lookup
+# (override with DESTINATION=... or pick another device with DEVICE=...)
+if [ -z "${DESTINATION}" ]; then
+    if ! DESTINATION=$(python3 "$(dirname "$0")/resolve-destination.py" --name "${DEVICE}" --boot); then
+        echo -e "${RED}✗ No simulator available for tests (list them with scripts/resolve-destination.py --list)${NC}"
+        exit 1
+    fi
+fi
+
 echo -e "${GREEN}=== Running Tests for ${PROJECT_NAME} ===${NC}"
 echo "Configuration: ${CONFIGURATION}"
 echo "Timestamp: ${TIMESTAMP}"
+echo "Destination: ${DESTINATION}"
 echo ""
 
 # Function to run tests
@@ -40,14 +52,15 @@ run_tests() {
     # Test command
     xcodebuild test \
         -project "${PROJECT_FILE}" \
-        -scheme "${target}" \
+        -scheme "${SCHEME}" \
+        -only-testing:"${target}" \
         -sdk "${sdk}" \
         -configuration "${CONFIGURATION}" \
         CODE_SIGN_IDENTITY="" \
         CODE_SIGNING_REQUIRED=NO \
         CODE_SIGNING_ALLOWED=NO \
         -derivedDataPath build \
-        -destination 'generic/platform=iOS Simulator' \
+        -destination "${DESTINATION}" \
         2>&1 | tee "${report_file}"
     
     local test_status=${PIPESTATUS[0]}
@@ -0,0 +1,9 @@
+"""Make the script packages (xcproj, ghgraphql) importable from the tests"""
+
+import sys
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent.parent
+
+if str(SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS))
@@ -0,0 +1,56 @@
+"""add.py places new Shared files in the right Sources phases"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from xcproj import add, session
+from xcproj.pbxproj import PBXProject
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+PROJECT = 'DisabilityAdvocacy.xcodeproj/project.pbxproj'
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    (tmp_path / PROJECT).parent.mkdir()
+    shutil.copyfile(REPO_ROOT / PROJECT, tmp_path / PROJECT)
+    (tmp_path / 'Shared' / 'Views').mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
+    session.clear()
+
+
+def _build_files(path):
+    """{target label: [PBXBuildFile ids]} of the Sources phases compiling path's file"""
+    with PBXProject.open(PROJECT) as project:
+        name = Path(path).name
+        members = {}
+        for (label, isa), phase_id in add.target_phases(project).items():
+            if isa != 'PBXSourcesBuildPhase':
+                continue
+            for build_file_id in project.get(phase_id).get('files', []):
+                file_ref = project.get(build_file_id).get('fileRef')
+                if project.get(file_ref).get('path') == name:
+                    members.setdefault(label, []).append(build_file_id)
+        return members
+
+
+def test_shared_file_gets_a_build_file_per_phase(tree):
+    path = 'Shared/Views/NewThing.swift'
+    (tree / path).write_text('struct NewThing {}\n')
+
+    assert add.add_files_to_project(PROJECT, [path]) == 1
+    members = _build_files(path)
+    assert sorted(members) == ['iOS', 'macOS']
+    assert all(len(ids) == 1 for ids in members.values())
+    assert members['iOS'] != members['macOS']
+
+
+def test_platform_only_shared_file_joins_one_phase(tree):
+    path = 'Shared/Views/PhoneThing.swift'
+    (tree / path).write_text('#if os(iOS)\nstruct PhoneThing {}\n#endif\n')
+
+    assert add.add_files_to_project(PROJECT, [path]) == 1
+    assert list(_build_files(path)) == ['iOS']
@@ -0,0 +1,106 @@
+"""GraphQLClient against the MockGitHub server: pagination, batching, keep-alive"""
+
+import pytest
+
+from ghgraphql.attach import PROJECTS_QUERY, PULL_REQUESTS_QUERY
+from ghgraphql.client import GraphQLClient, GraphQLError
+from ghgraphql.mock_server import MockGitHub
+
+REPOSITORY = {'owner': 'octo', 'name': 'repo'}
+
+
+@pytest.fixture
+def github():
+    mock = MockGitHub.generate(250)
+    endpoint = mock.start()
+    mock.endpoint = endpoint
+    yield mock
+    mock.stop()
+
+
+@pytest.fixture
+def client(github):
+    with GraphQLClient('token', endpoint=github.endpoint) as client:
+        yield client
+
+
+def _add_item(project_id, content_id):
+    return {'projectId': project_id, 'contentId': content_id}
+
+
+def test_resolve_pages_by_cursor():
+    mock = MockGitHub.generate(7)
+    query = PULL_REQUESTS_QUERY.replace('first: 100', 'first: 3')
+    first = mock.resolve(query, {'cursor': None})['data']['repository']['pullRequests']
+    assert [pr['number'] for pr in first['nodes']] == [1, 2, 3]
+    assert first['pageInfo'] == {'hasNextPage': True, 'endCursor': '3'}
+    last = mock.resolve(query, {'cursor': '6'})['data']['repository']['pullRequests']
+    assert [pr['number'] for pr in last['nodes']] == [7]
+    assert last['pageInfo']['hasNextPage'] is False
+
+
+def test_paginate_follows_cursors(github, client):
+    pull_requests = list(client.paginate(
+        PULL_REQUESTS_QUERY, ['repository', 'pullRequests'], dict(REPOSITORY, states=['OPEN'])
+    ))
+    assert [pr['number'] for pr in pull_requests] == list(range(1, 251))
+    assert github.requests == 3  # pages of 100, 100 and 50
+
+
+def test_paginate_filters_by_state(github, client):
+    github.pull_requests[0]['state'] = 'MERGED'
+    open_prs = list(client.paginate(
+        PULL_REQUESTS_QUERY, ['repository', 'pullRequests'], dict(REPOSITORY, states=['OPEN'])
+    ))
+    assert len(open_prs) == 249
+    assert open_prs[0]['number'] == 2
+
+
+def test_batched_mutations_map_errors_to_their_alias(github, client):
+    operations = [_add_item('PVT_0', 'PR_1'), _add_item('PVT_missing', 'PR_2'), _add_item('PVT_1', 'PR_3')]
+    results = client.mutate_batch('addProjectV2ItemById', operations, '{ item { id } }',
+                                  'AddProjectV2ItemByIdInput')
+    assert github.requests == 1
+    (first, first_error), (second, second_error), (third, third_error) = results
+    assert first == {'item': {'id': 'PVTI_1'}} and first_error is None
+    assert second is None and 'PVT_missing' in second_error
+    assert third == {'item': {'id': 'PVTI_2'}} and third_error is None
+
+
+def test_batched_mutations_are_idempotent(github, client):
+    operations = [_add_item('PVT_0', 'PR_1')] * 2
+    results = client.mutate_batch('addProjectV2ItemById', operations, '{ item { id } }',
+                                  'AddProjectV2ItemByIdInput')
+    assert [result for result, _ in results] == [{'item': {'id': 'PVTI_1'}}] * 2
+    assert len(github.items) == 1
+
+
+def test_mutate_all_splits_into_batches(github, client):
+    operations = [_add_item('PVT_0', f"PR_{number}") for number in range(1, 61)]
+    results = client.mutate_all('addProjectV2ItemById', operations, '{ item { id } }',
+                                'AddProjectV2ItemByIdInput', batch_size=25, workers=2)
+    assert len(results) == 60 and all(error is None for _, error in results)
+    assert github.requests == 3
+    assert len(github.items) == 60
+
+
+def test_requests_reuse_one_keep_alive_connection(github, client):
+    for _ in range(5):
+        client.execute(PROJECTS_QUERY, REPOSITORY)
+    assert github.requests == 5
+    assert github.connections == 1
+
+
+def test_worker_threads_each_keep_one_connection(github, client):
+    operations = [_add_item('PVT_0', f"PR_{number}") for number in range(1, 101)]
+    client.mutate_all('addProjectV2ItemById', operations, '{ item { id } }', 'AddProjectV2ItemByIdInput',
+                      batch_size=10, workers=2)
+    assert github.requests == 10
+    assert github.connections <= 2
+
+
+def test_bad_credentials_raise(github):
+    with GraphQLClient('', endpoint=github.endpoint) as client:
+        client._headers['Authorization'] = 'token nope'
+        with pytest.raises(GraphQLError, match='HTTP 401'):
+            client.execute(PROJECTS_QUERY, REPOSITORY)
@@ -0,0 +1,126 @@
+"""The build DAG scheduler end to end, with stub xcodebuild and simctl"""
+
+import json
+import os
+import sys
+import textwrap
+import time
+
+import pytest
+
+from xcproj import orchestrator
+
+SIMULATOR_ID = '11111111-2222-3333-4444-555555555555'
+
+# Records each call as a JSON line, sleeps for the scheme's STUB_SECONDS_<SCHEME>
+# and fails the scheme:action named by STUB_FAIL
+XCODEBUILD = '''
+    import json, os, sys, time
+    args = sys.argv[1:]
+    scheme = args[args.index('-scheme') + 1]
+    action = args[-1]
+    key = scheme.replace('-', '_').upper()
+    with open(os.environ['STUB_EVENTS'], 'a') as f:
+        f.write(json.dumps({'scheme': scheme, 'action': action, 'event': 'start', 'time': time.time(),
+                            'args': args}) + '\\n')
+    time.sleep(float(os.environ.get('STUB_SECONDS_' + key, '0.1')))
+    print(f"** {action.upper()} {scheme} **", flush=True)
+    if os.environ.get('STUB_FAIL') == f"{scheme}:{action}":
+        print("error: stub failure", flush=True)
+        sys.exit(65)
+    with open(os.environ['STUB_EVENTS'], 'a') as f:
+        f.write(json.dumps({'scheme': scheme, 'action': action, 'event': 'end', 'time': time.time()}) + '\\n')
+'''
+
+XCRUN = f'''
+    import json, sys
+    if sys.argv[1:3] == ['simctl', 'list']:
+        print(json.dumps({{'devices': {{'com.apple.CoreSimulator.SimRuntime.iOS-17-2': [
+            {{'name': 'iPhone 15', 'udid': '{SIMULATOR_ID}', 'state': 'Shutdown', 'isAvailable': True}},
+        ]}}}}))
+'''
+
+
+def _stub(directory, name, body):
+    path = directory / name
+    path.write_text(f"#!{sys.executable}\n" + textwrap.dedent(body))
+    path.chmod(0o755)
+    return path
+
+
+@pytest.fixture
+def stubs(tmp_path, monkeypatch):
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    xcodebuild = _stub(bin_dir, 'xcodebuild', XCODEBUILD)
+    _stub(bin_dir, 'xcrun', XCRUN)
+    events = tmp_path / 'events.jsonl'
+    monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv('STUB_EVENTS', str(events))
+    monkeypatch.setenv('XCPROJ_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setenv('DEVELOPER_DIR', str(tmp_path))  # skips xcode-select
+
+    def run(*args):
+        timings = tmp_path / 'timings.json'
+        code = orchestrator.main(['--xcodebuild', str(xcodebuild), '--slots', '4',
+                                  '--report-dir', str(tmp_path / 'reports'), '--timings', str(timings), *args])
+        records = [json.loads(line) for line in events.read_text().splitlines()] if events.exists() else []
+        with open(timings, encoding='utf-8') as f:
+            statuses = {job['name']: job['status'] for job in json.load(f)['jobs']}
+        return code, statuses, records
+
+    return run
+
+
+def _span(records, scheme, action):
+    times = {r['event']: r['time'] for r in records if r['scheme'] == scheme and r['action'] == action}
+    return times['start'], times.get('end')
+
+
+def test_independent_builds_run_in_parallel(stubs, monkeypatch):
+    monkeypatch.setenv('STUB_SECONDS_DISABILITYADVOCACY_IOS', '0.6')
+    monkeypatch.setenv('STUB_SECONDS_DISABILITYADVOCACY_MACOS', '0.6')
+    code, statuses, records = stubs()
+
+    assert code == 0
+    assert set(statuses.values()) == {'passed'}
+    ios_start, ios_end = _span(records, 'DisabilityAdvocacy-iOS', 'build-for-testing')
+    macos_start, macos_end = _span(records, 'DisabilityAdvocacy-macOS', 'build-for-testing')
+    assert ios_start < macos_end and macos_start < ios_end  # the builds overlap
+
+    # Each test starts after its own build and runs on the stub simulator
+    test_start, _ = _span(records, 'DisabilityAdvocacy-iOS', 'test-without-building')
+    assert test_start >= ios_end
+    test_args = next(r['args'] for r in records if r['action'] == 'test-without-building'
+                     and r['scheme'] == 'DisabilityAdvocacy-iOS')
+    assert any(SIMULATOR_ID in arg for arg in test_args)
+
+
+def test_failure_cancels_running_and_dependent_jobs(stubs, monkeypatch):
+    monkeypatch.setenv('STUB_SECONDS_DISABILITYADVOCACY_MACOS', '5')
+    monkeypatch.setenv('STUB_FAIL', 'DisabilityAdvocacy-iOS:build-for-testing')
+    started = time.time()
+    code, statuses, records = stubs()
+
+    assert code == 1
+    assert statuses == {
+        'build-ios': 'failed',
+        'build-macos': 'cancelled',
+        'test-ios': 'skipped',
+        'test-macos': 'skipped',
+    }
+    assert time.time() - started < 4  # the slow macOS build was stopped, not waited for
+    assert not any(r['action'] == 'test-without-building' for r in records)
+
+
+def test_keep_going_finishes_independent_jobs(stubs, monkeypatch):
+    monkeypatch.setenv('STUB_FAIL', 'DisabilityAdvocacy-iOS:build-for-testing')
+    code, statuses, _ = stubs('--keep-going')
+
+    assert code == 1
+    assert statuses == {
+        'build-ios': 'failed',
+        'build-macos': 'passed',
+        'test-ios': 'skipped',
+        'test-macos': 'passed',
+    }
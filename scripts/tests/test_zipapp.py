@@ -0,0 +1,43 @@
+"""dist/xcproj.pyz runs the CLI and keeps its exit codes"""
+
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS = Path(__file__).resolve().parent.parent
+
+UNLABELLED_BUTTON = '''struct V: View {
+    var body: some View {
+        Button(action: {}) { Image(systemName: "xmark") }
+    }
+}
+'''
+
+LABELLED_BUTTON = '''struct V: View {
+    var body: some View {
+        Button("Close", action: {})
+    }
+}
+'''
+
+
+@pytest.fixture(scope='module')
+def pyz(tmp_path_factory):
+    spec = importlib.util.spec_from_file_location('build_xcproj_zipapp', SCRIPTS / 'build-xcproj-zipapp.py')
+    builder = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(builder)
+    output = tmp_path_factory.mktemp('dist') / 'xcproj.pyz'
+    builder.build(output, sys.executable)
+    return output
+
+
+@pytest.mark.parametrize('source, code', [(UNLABELLED_BUTTON, 1), (LABELLED_BUTTON, 0)])
+def test_a11y_exit_code(pyz, tmp_path, source, code):
+    (tmp_path / 'V.swift').write_text(source)
+    result = subprocess.run([sys.executable, str(pyz), 'a11y', '--no-cache', str(tmp_path)],
+                            cwd=tmp_path, capture_output=True, text=True)
+    assert 'Traceback' not in result.stderr
+    assert result.returncode == code
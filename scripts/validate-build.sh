@@ -19,45 +19,22 @@ WARNINGS=0
 echo -e "${GREEN}=== Build Validation ===${NC}"
 echo ""
 
-# Function to check build
-check_build() {
-    local target=$1
-    local sdk=$2
-    local platform=$3
-    
-    echo -e "${YELLOW}Checking ${target} for ${platform}...${NC}"
-    
-    local output=$(xcodebuild \
-        -project "${PROJECT_FILE}" \
-        -target "${target}" \
-        -sdk "${sdk}" \
-        -configuration Debug \
-        CODE_SIGN_IDENTITY="" \
-        CODE_SIGNING_REQUIRED=NO \
-        CODE_SIGNING_ALLOWED=NO \
-        clean build 2>&1)
-    
-    local build_status=$?
-    local error_count=$(echo "$output" | grep -c "error:" || true)
-    local warning_count=$(echo "$output" | grep -c "warning:" || true)
-    
-    if [ ${build_status} -eq 0 ]; then
-        echo -e "${GREEN}✓ ${target} builds successfully${NC}"
-        if [ ${warning_count} -gt 0 ]; then
-            echo -e "${YELLOW}  ${warning_count} warning(s)${NC}"
-            WARNINGS=$((WARNINGS + warning_count))
-        fi
-    else
-        echo -e "${RED}✗ ${target} build failed${NC}"
-        echo -e "${RED}  ${error_count} error(s)${NC}"
-        ERRORS=$((ERRORS + error_count))
-        return 1
-    fi
-}
+# Build every target in parallel; warning and error counts come from the
+# orchestrator's timings file (see scripts/build-all-platforms.py)
+TIMINGS=$(mktemp -t build-timings.XXXXXX)
+trap 'rm -f "${TIMINGS}"' EXIT
 
-# Check all targets
-check_build "DisabilityAdvocacy-iOS" "iphonesimulator" "iOS Simulator"
-check_build "DisabilityAdvocacy-macOS" "macosx" "macOS"
+echo -e "${YELLOW}Checking DisabilityAdvocacy-iOS and DisabilityAdvocacy-macOS...${NC}"
+if python3 "$(dirname "$0")/build-all-platforms.py" Debug --skip-tests --clean --keep-going --quiet \
+        --timings "${TIMINGS}"; then
+    echo -e "${GREEN}✓ All targets build successfully${NC}"
+else
+    echo -e "${RED}✗ Build failed${NC}"
+    ERRORS=$((ERRORS + 1))
+fi
+if [ -s "${TIMINGS}" ]; then
+    WARNINGS=$(python3 -c "import json, sys; print(sum(job['warnings'] for job in json.load(open(sys.argv[1]))['jobs']))" "${TIMINGS}")
+fi
 
 # Check Info.plist files exist
 echo ""
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+List targets, build configurations and schemes without xcodebuild
+
+Same information as `xcodebuild -list`, read straight from project.pbxproj
+and the .xcscheme files, so it runs in milliseconds on macOS and Linux.
+
+Usage:
+    python3 scripts/xcode-list.py                 # xcodebuild -list style output
+    python3 scripts/xcode-list.py --json          # Including scheme details
+    python3 scripts/xcode-list.py --check         # Fail if a scheme points at a missing target
+"""
+
+import sys
+
+from xcproj.schemes import main
+
+if __name__ == '__main__':
+    sys.exit(main())
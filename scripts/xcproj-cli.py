@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+xcproj command line, straight from the source tree
+
+Usage:
+    python3 scripts/xcproj-cli.py --help
+    python3 scripts/xcproj-cli.py validate
+    python3 scripts/xcproj-cli.py structure + privacy + a11y
+
+The same CLI ships as a single file: python3 scripts/build-xcproj-zipapp.py
+builds dist/xcproj.pyz.
+"""
+
+import sys
+
+from xcproj.cli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
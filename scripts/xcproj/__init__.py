@@ -0,0 +1,26 @@
+"""
+Shared tooling for working with DisabilityAdvocacy.xcodeproj
+
+The scripts in this directory (and project_validator.py at the repository
+root) import from this package instead of scanning project.pbxproj with
+ad-hoc regular expressions.
+
+The names below are resolved on first access so that importing one
+submodule (or starting the xcproj CLI) doesn't load the parser and writer.
+"""
+
+_EXPORTS = {
+    'PBXProject': 'pbxproj',
+    'PlistError': 'pbxproj',
+    'parse_plist': 'pbxproj',
+    'ProjectEditor': 'writer',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
@@ -0,0 +1,324 @@
+"""
+SwiftUI accessibility linter
+
+Each view file is tokenized and parsed once into a light tree of view
+expressions - `Name(args) { content }` followed by its `.modifier(...)`
+chain - which is enough to check how views and modifiers are nested
+without a Swift compiler. Rules:
+
+- image-label    Image with no accessibilityLabel/accessibilityHidden (and
+                 not `Image(decorative:)`) outside any labelled container;
+                 VoiceOver reads SF Symbol names like "book closed fill"
+- control-label  Button/Toggle/Link/... whose only content is images, with
+                 no title and no accessibilityLabel
+- dynamic-type   `.font(.system(size:))` or `.custom(_, size:)` without
+                 `relativeTo:`, which ignore the user's text size
+- grouping       HStack/VStack/ZStack of an icon and text without
+                 accessibilityElement(children:), read as separate elements
+
+Suppress a finding with `// a11y-lint: ignore` on the same or previous line.
+Results are cached per file by content hash (and by this module's source,
+so rule changes invalidate them).
+"""
+
+import argparse
+import re
+from pathlib import Path
+
+from . import tracing
+from .cache import Cache, map_files, source_version
+
+DEFAULT_ROOTS = ('Shared/Views', 'iOS/Views', 'macOS/Views')
+
+# Cache misses needed before linting in a process pool
+PARALLEL_THRESHOLD = 200
+
+RULE_SEVERITY = {
+    'image-label': 'warning',
+    'control-label': 'error',
+    'dynamic-type': 'warning',
+    'grouping': 'warning',
+}
+
+CONTROLS = {'Button', 'Toggle', 'Link', 'NavigationLink', 'Menu', 'Picker', 'Slider', 'Stepper', 'ShareLink'}
+STACKS = {'HStack', 'VStack', 'ZStack', 'LazyHStack', 'LazyVStack'}
+TEXT_VIEWS = {'Text', 'Label', 'TextField', 'SecureField'}
+# Views that aren't content of their own: a control whose content is only these has no label
+PLAIN_VIEWS = {'Image', 'Spacer', 'Divider', 'Color', 'Circle', 'Rectangle', 'RoundedRectangle', 'Capsule'} | STACKS
+# Modifiers that give a view (and its children) an accessible name or remove it
+LABELLING_MODIFIERS = {'accessibilityLabel', 'accessibilityHidden', 'accessibilityRepresentation', 'accessibilityElement'}
+
+SUPPRESS = 'a11y-lint: ignore'
+
+_TOKEN = re.compile(r'''
+    (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>"""(?:.|\n)*?"""|"(?:[^"\\\n]|\\.)*")
+  | (?P<ident>[@#]?[A-Za-z_]\w*)
+  | (?P<number>\d[\w.]*)
+  | (?P<newline>\n)
+  | (?P<space>[ \t\r]+)
+  | (?P<punct>.)
+''', re.S | re.X)
+
+_CLOSE = {'(': ')', '{': '}', '[': ']'}
+# Matched against argument text with whitespace removed
+_FIXED_FONT = re.compile(r'\.system\(size:|\.custom\([^)]*,size:')
+
+_SOURCE_VERSION = source_version(__name__)
+
+
+class Node:
+    """A call-like expression: name, argument/closure children and modifiers"""
+
+    __slots__ = ('name', 'line', 'args', 'arg_text', 'children', 'closures', 'modifiers', 'parent')
+
+    def __init__(self, name, line, parent):
+        self.name = name
+        self.line = line
+        self.args = []        # nodes inside the argument list
+        self.arg_text = ''
+        self.children = []    # nodes inside trailing closures
+        self.closures = []    # the same nodes, one list per trailing closure
+        self.modifiers = []   # (name, arg_text, line)
+        self.parent = parent
+
+    def content(self):
+        return self.args + self.children
+
+    def has_modifier(self, names):
+        return any(name in names for name, _, _ in self.modifiers)
+
+    def ancestors(self):
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def descendants(self):
+        for child in self.content():
+            yield child
+            yield from child.descendants()
+
+
+def tokenize(text):
+    """Return [(kind, value, line)] without whitespace; comments kept for suppressions"""
+    tokens = []
+    line = 1
+    for match in _TOKEN.finditer(text):
+        kind = match.lastgroup
+        value = match.group()
+        if kind not in ('space', 'newline'):
+            tokens.append((kind, value, line))
+        line += value.count('\n')
+    return tokens
+
+
+class _Parser:
+    def __init__(self, tokens):
+        self.tokens = [token for token in tokens if token[0] != 'comment']
+        self.pos = 0
+
+    def peek(self, offset=0):
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None, 0)
+
+    def group(self, parent):
+        """Parse a bracketed group starting at the opener; returns (nodes, text)"""
+        opener = self.tokens[self.pos][1]
+        start = self.pos
+        self.pos += 1
+        nodes = self.items(parent, _CLOSE[opener])
+        text = ' '.join(value for _, value, _ in self.tokens[start + 1:self.pos])
+        self.pos += 1  # closer
+        return nodes, text
+
+    def items(self, parent, closer=None):
+        nodes = []
+        while self.pos < len(self.tokens):
+            kind, value, line = self.tokens[self.pos]
+            if value == closer:
+                return nodes
+            if kind == 'punct' and value in _CLOSE:
+                # A bare group (if/else bodies, tuples, arrays) is transparent
+                inner, _ = self.group(parent)
+                nodes.extend(inner)
+            elif kind == 'ident' and not (self.pos and self.tokens[self.pos - 1][1] == '.'):
+                nodes.append(self.call(parent))
+            else:
+                self.pos += 1
+        return nodes
+
+    def call(self, parent):
+        _, name, line = self.tokens[self.pos]
+        node = Node(name, line, parent)
+        self.pos += 1
+        if self.peek()[1] == '(':
+            node.args, node.arg_text = self.group(node)
+        self.trailing_closures(node)
+        # Modifier chain: .name(args) { closure }
+        while self.peek()[1] == '.' and self.peek(1)[0] == 'ident':
+            _, modifier, modifier_line = self.peek(1)
+            self.pos += 2
+            text = ''
+            if self.peek()[1] == '(':
+                inner, text = self.group(node)
+                node.args.extend(inner)
+            if self.peek()[1] == '{':
+                inner, _ = self.group(node)
+                node.args.extend(inner)
+            node.modifiers.append((modifier, text, modifier_line))
+        return node
+
+    def trailing_closures(self, node):
+        while True:
+            if self.peek()[1] == '{':
+                inner, _ = self.group(node)
+                node.children.extend(inner)
+                node.closures.append(inner)
+            elif self.peek()[0] == 'ident' and self.peek(1)[1] == ':' and self.peek(2)[1] == '{' and node.children:
+                # Additional labelled trailing closure: `} label: { ... }`
+                self.pos += 2
+            else:
+                return
+
+
+def parse(text):
+    """Parse Swift source into a list of top-level Nodes"""
+    return _Parser(tokenize(text)).items(None)
+
+
+def _walk(nodes):
+    for node in nodes:
+        yield node
+        yield from _walk(node.content())
+
+
+def _has_title(node):
+    """True when a control's first argument is an unlabelled title"""
+    return bool(node.arg_text) and not re.match(r'\w+ :', node.arg_text)
+
+
+def _is_labelled(node):
+    """True if node or an ancestor gives it an accessible name or hides it"""
+    if node.has_modifier(LABELLING_MODIFIERS):
+        return True
+    return any(
+        ancestor.has_modifier(LABELLING_MODIFIERS) or ancestor.name in CONTROLS or ancestor.name == 'Label'
+        for ancestor in node.ancestors()
+    )
+
+
+def _label_content(node):
+    """Nodes making up a control's label: the last trailing closure, unless the
+    only closure is a Button's action"""
+    if len(node.closures) > 1 or (node.closures and node.arg_text):
+        return node.closures[-1]
+    return []
+
+
+def _speaks(node):
+    """False only for views known to have no text: images, shapes, spacers and
+    stacks of those. Other views and properties may well contain text."""
+    if node.name in PLAIN_VIEWS and not node.has_modifier({'accessibilityLabel'}):
+        return any(_speaks(child) for child in node.children)
+    return True
+
+
+def lint_nodes(nodes):
+    """Return findings as (rule, line, message) for a parsed file"""
+    findings = []
+    for node in _walk(nodes):
+        if node.name == 'Image' and not node.arg_text.startswith('decorative') and not _is_labelled(node):
+            findings.append(('image-label', node.line,
+                             'Image has no accessibilityLabel; add one, or accessibilityHidden(true) if decorative'))
+
+        elif node.name in CONTROLS and not _has_title(node) and not _is_labelled(node):
+            content = _label_content(node)
+            if content and not any(_speaks(child) for child in content):
+                findings.append(('control-label', node.line,
+                                 f'{node.name} has no text label; add a title or accessibilityLabel'))
+            elif not content and node.name in ('Slider', 'Stepper'):
+                findings.append(('control-label', node.line,
+                                 f'{node.name} has no label; add accessibilityLabel'))
+
+        elif node.name in STACKS and not _is_labelled(node):
+            direct = node.children
+            icons = [child for child in direct if child.name == 'Image' and not child.has_modifier({'accessibilityHidden'})]
+            texts = [child for child in direct if child.name == 'Text']
+            if icons and texts:
+                findings.append(('grouping', node.line,
+                                 f'{node.name} of icon and text is read as separate elements; '
+                                 'add .accessibilityElement(children: .combine)'))
+
+        for modifier, text, line in node.modifiers:
+            compact = text.replace(' ', '')
+            if modifier == 'font' and _FIXED_FONT.search(compact) and 'relativeTo:' not in compact:
+                findings.append(('dynamic-type', line,
+                                 'Fixed font size ignores Dynamic Type; use a text style, relativeTo: or @ScaledMetric'))
+    return findings
+
+
+def lint_source(text):
+    """Lint Swift source; returns [(rule, line, message)] sorted by line"""
+    tokens = tokenize(text)
+    suppressed = {line for kind, value, line in tokens if kind == 'comment' and SUPPRESS in value}
+    findings = [
+        finding for finding in lint_nodes(_Parser(tokens).items(None))
+        if finding[1] not in suppressed and finding[1] - 1 not in suppressed
+    ]
+    return sorted(set(findings), key=lambda finding: (finding[1], finding[0]))
+
+
+def _lint_file(path):
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return lint_source(f.read())
+
+
+def view_sources(roots=DEFAULT_ROOTS, base='.', files=None):
+    """Swift files under roots; from a FileIndex of base when one is given, else by walking"""
+    if files is not None:
+        return [Path(files.root, path) for root in roots for path in files.under(root) if path.endswith('.swift')]
+    return [path for root in roots for path in sorted(Path(base, root).rglob('*.swift'))]
+
+
+def lint(roots=DEFAULT_ROOTS, base='.', cache=True, workers=None, files=None):
+    """Return {path: [(rule, line, message)]} for every view file under roots"""
+    with tracing.span('walk views', 'fs'):
+        paths = view_sources(roots, base, files)
+    results = map_files(
+        _lint_file, paths, cache=Cache('accessibility') if cache else None,
+        version=_SOURCE_VERSION, parallel_threshold=PARALLEL_THRESHOLD, workers=workers,
+    )
+    return {path: [tuple(finding) for finding in findings] for path, findings in results.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Lint SwiftUI views for accessibility problems')
+    parser.add_argument('roots', nargs='*', default=list(DEFAULT_ROOTS), help='Directories to lint')
+    parser.add_argument('--rule', action='append', choices=sorted(RULE_SEVERITY), help='Only report these rules')
+    parser.add_argument('--no-cache', action='store_true', help='Re-lint every file')
+    parser.add_argument('--format', choices=['text', 'github'], default='text',
+                        help='github prints workflow annotations')
+    args = parser.parse_args(argv)
+
+    results = lint(args.roots, cache=not args.no_cache)
+    counts = {}
+    for path, findings in sorted(results.items()):
+        for rule, line, message in findings:
+            if args.rule and rule not in args.rule:
+                continue
+            counts[rule] = counts.get(rule, 0) + 1
+            if args.format == 'github':
+                print(f"::{RULE_SEVERITY[rule]} file={path},line={line},title={rule}::{message}")
+            else:
+                icon = '❌' if RULE_SEVERITY[rule] == 'error' else '⚠️ '
+                print(f"{icon} {path}:{line}: [{rule}] {message}")
+
+    if not counts:
+        print(f"✅ No accessibility issues in {len(results)} view files")
+        return 0
+    print()
+    print(f"📊 {sum(counts.values())} issue(s) in {len(results)} view files: " +
+          ', '.join(f"{rule} {count}" for rule, count in sorted(counts.items())))
+    errors = sum(count for rule, count in counts.items() if RULE_SEVERITY[rule] == 'error')
+    return 1 if errors else 0
@@ -0,0 +1,292 @@
+"""
+Automatically add missing Swift files to Xcode project
+Uses a simpler, more reliable approach
+"""
+
+import argparse
+import os
+import uuid
+from pathlib import Path
+
+from .membership import compiled_platforms
+from .reconcile import project_files, reconcile
+from .session import open_project
+from .sources import DEFAULT_PROJECT, find_swift_files_in_filesystem
+from .writer import ProjectEditor
+
+def generate_uuid():
+    """Generate a 24-character hex UUID for Xcode project"""
+    return ''.join([format(b, '02X') for b in uuid.uuid4().bytes[:12]])
+
+def determine_targets(file_path, root='.'):
+    """Determine which targets a file should be added to based on path
+
+    A Shared Swift file with code for only one platform (all of it inside
+    `#if os(iOS)`, say) goes to that platform's target alone; see
+    membership.py.
+    """
+    targets = []
+    
+    # Test folders live under iOS/, so they are checked first
+    if 'DisabilityAdvocacyTests' in file_path or 'DisabilityAdvocacyUITests' in file_path or '/Tests/' in file_path:
+        if 'UITests' in file_path:
+            targets = ['UITests']
+        else:
+            targets = ['Tests']
+    elif file_path.startswith(('Shared/', 'Resources/')):
+        targets = ['iOS', 'macOS']
+        if file_path.endswith('.swift'):
+            targets = compiled_platforms(Path(root, file_path)) or targets
+    elif file_path.startswith('iOS/'):
+        targets = ['iOS']
+    elif file_path.startswith('macOS/'):
+        targets = ['macOS']
+    
+    return targets
+
+def find_group_id_for_path(project, file_path):
+    """Find the group ID that matches the file's directory path"""
+    path_parts = file_path.split('/')
+    if len(path_parts) < 2:
+        return None
+    
+    dir_parts = path_parts[:-1]  # All directory parts
+    
+    group_ids = project.ids('PBXGroup')
+    
+    # Find root group (Shared, iOS, macOS)
+    root_group_id = None
+    for group_id in group_ids:
+        if project.get(group_id).get('path') == dir_parts[0]:
+            root_group_id = group_id
+            break
+    
+    # If we can't find root group, return None (caller will handle fallback)
+    if not root_group_id:
+        return None
+    
+    # Traverse down the hierarchy
+    current_group_id = root_group_id
+    for dir_part in dir_parts[1:]:
+        found = False
+        
+        # Look for child group with matching path
+        # Children can be subgroups or file refs; only groups are candidates
+        for child_id in project.get(current_group_id).get('children', []):
+            if child_id not in project or project.isa(child_id) != 'PBXGroup':
+                continue
+            child_group = project.get(child_id)
+            # Check if this child group's path matches, or its name for
+            # groups without an explicit path
+            if child_group.get('path') == dir_part or (
+                    not child_group.get('path') and project.display_name(child_id) == dir_part):
+                current_group_id = child_id
+                found = True
+                break
+        
+        if not found:
+            # Couldn't find nested group, use current group as fallback
+            # This is acceptable - Xcode will organize files correctly
+            break
+    
+    return current_group_id
+
+# Labels returned by determine_targets(), matched against the end of target names
+TARGET_LABELS = ('UITests', 'Tests', 'macOS', 'iOS')
+
+def target_label(target_name):
+    return next((label for label in TARGET_LABELS if target_name.endswith(label)), None)
+
+def target_phases(project):
+    """Map (target label, phase isa) to build phase IDs, resolved through the project's targets"""
+    phases = {}
+    for target_id in project.targets():
+        label = target_label(project.display_name(target_id))
+        if label is None:
+            continue
+        for phase_id in project.get(target_id).get('buildPhases', []):
+            phases.setdefault((label, project.isa(phase_id)), phase_id)
+    return phases
+
+def add_file_to_project(project_path, file_path, dry_run=False):
+    """Add a Swift file to the Xcode project"""
+    return add_files_to_project(project_path, [file_path], dry_run=dry_run) == 1
+
+def add_files_to_project(project_path, file_paths, dry_run=False):
+    """Add Swift files to the Xcode project as one batch with a single write"""
+    added = 0
+    with open_project(project_path) as project:
+        editor = ProjectEditor(project)
+        # Resolved paths already in the project, plus those added in this batch
+        known_paths = set(project_files(project)[0])
+        for file_path in file_paths:
+            if _add_file(editor, file_path, known_paths, dry_run=dry_run):
+                added += 1
+        
+        # Write back: untouched bytes are copied, edits are spliced in
+        if editor.modified:
+            editor.write(project_path)
+    
+    return added
+
+def _add_file(editor, file_path, known_paths, dry_run=False):
+    """Record the edits that add one Swift file; returns False if skipped"""
+    project = editor.project
+    filename = os.path.basename(file_path)
+    
+    # Check if file already exists (by exact path: iOS/ and macOS/ share filenames)
+    if file_path in known_paths:
+        print(f"⚠️  File {file_path} already exists in project")
+        return False
+    
+    # Find appropriate group
+    group_id = find_group_id_for_path(project, file_path)
+    if not group_id:
+        # Try fallback: find root group (Shared, iOS, macOS) by its path or name
+        path_parts = file_path.split('/')
+        root_path = path_parts[0] if path_parts else None
+        
+        if root_path:
+            for candidate_id in project.ids('PBXGroup'):
+                if project.get(candidate_id).get('path') == root_path or project.comment(candidate_id) == root_path:
+                    group_id = candidate_id
+                    break
+            
+            if group_id:
+                print(f"⚠️  Using root group '{root_path}' as fallback for {file_path}")
+            else:
+                print(f"❌ Could not find appropriate group for {file_path}")
+                print(f"   Tried to find group matching: {os.path.dirname(file_path)} or root: {root_path}")
+                # For debugging, show what groups exist
+                all_groups = [project.display_name(g) for g in project.ids('PBXGroup')]
+                root_groups = [g for g in all_groups if g in ['Shared', 'iOS', 'macOS']]
+                if root_groups:
+                    print(f"   Available root groups: {root_groups}")
+                return False
+        else:
+            print(f"❌ Could not find appropriate group for {file_path}")
+            return False
+    
+    # Add to build phases for appropriate targets
+    targets = determine_targets(file_path)
+    
+    phases = target_phases(project)
+    phases_to_update = []
+    for target in targets:
+        if (target, 'PBXSourcesBuildPhase') in phases:
+            phases_to_update.append(phases[(target, 'PBXSourcesBuildPhase')])
+    
+    # Generate IDs: Xcode needs a PBXBuildFile of its own in each phase
+    file_ref_id = generate_uuid()
+    build_file_ids = {phase_id: generate_uuid() for phase_id in phases_to_update}
+    
+    if dry_run:
+        print(f"🔍 [DRY RUN] Would add {file_path}:")
+        print(f"   File Reference ID: {file_ref_id}")
+        print(f"   Build File IDs: {', '.join(build_file_ids.values()) or 'none'}")
+        print(f"   Target Group ID: {group_id}")
+        print(f"   Targets: {', '.join(targets)}")
+        print(f"   Build Phases: {len(phases_to_update)} phase(s) will be updated")
+        return True
+    
+    # Add PBXFileReference (placed in its section in ID order)
+    editor.add_object(file_ref_id, {
+        'isa': 'PBXFileReference',
+        'lastKnownFileType': 'sourcecode.swift',
+        'path': filename,
+        'sourceTree': '<group>',
+    })
+    
+    # Add file reference to group's children
+    editor.append_child(group_id, 'children', file_ref_id)
+    
+    # Add a PBXBuildFile to each phase
+    for phase_id, build_file_id in build_file_ids.items():
+        editor.add_object(build_file_id, {
+            'isa': 'PBXBuildFile',
+            'fileRef': file_ref_id,
+        }, comment=f"{filename} in {editor.comment(phase_id)}")
+        editor.append_child(phase_id, 'files', build_file_id)
+    
+    known_paths.add(file_path)
+    print(f"✅ Added {file_path} to project")
+    return True
+
+def find_missing_files(project_path=DEFAULT_PROJECT):
+    """Find Swift files that are not in the project
+    
+    Matched by exact path, so a file is found even when a file with the same
+    name exists elsewhere. Moved and renamed files, and files named by a
+    reference that sits in no group, are left out: adding them would leave
+    a second, stale reference behind.
+    """
+    with open_project(project_path) as project:
+        result = reconcile(project, find_swift_files_in_filesystem('.'))
+    for old, new in result.moved + result.renamed:
+        print(f"⚠️  {old} is now {new}; update its reference in Xcode instead of adding it")
+    if result.ungrouped:
+        print(f"⚠️  {len(result.ungrouped)} file references are in no group and were skipped "
+              f"(see `xcproj structure`)")
+    return result.missing
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Automatically add missing Swift files to Xcode project')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would be done without making changes')
+    parser.add_argument('--file', help='Specific file to add (relative to project root)')
+    parser.add_argument('--project', default=DEFAULT_PROJECT, help='Path to project.pbxproj')
+    parser.add_argument('--auto', action='store_true', help='Automatically add all missing files without prompting')
+    parser.add_argument('--import-tree', metavar='DIR',
+                        help='Import a new directory with its groups and all supported files (see importtree.py)')
+    args = parser.parse_args(argv)
+    
+    project_path = Path(args.project)
+    if not project_path.exists():
+        print(f"❌ Project file not found: {project_path}")
+        return 1
+    
+    if args.import_tree:
+        from .importtree import main as import_tree_main
+        return import_tree_main([args.import_tree, '--project', str(project_path)]
+                                + (['--dry-run'] if args.dry_run else []))
+    
+    if args.file:
+        # Add specific file
+        file_path = Path(args.file)
+        if not file_path.exists():
+            print(f"❌ File not found: {file_path}")
+            return 1
+        
+        # Get relative path from project root
+        project_root = project_path.parent.parent
+        try:
+            rel_path = str(file_path.relative_to(project_root))
+        except ValueError:
+            rel_path = str(file_path)
+        
+        if not add_file_to_project(project_path, rel_path, dry_run=args.dry_run):
+            return 1
+    else:
+        # Find and add all missing files
+        missing = find_missing_files(project_path)
+        
+        if not missing:
+            print("✅ No missing files found!")
+            return 0
+        
+        print(f"Found {len(missing)} missing files:")
+        for file in missing:
+            print(f"  - {file}")
+        
+        if args.dry_run:
+            print("\n[DRY RUN] Would add the following files:")
+            add_files_to_project(project_path, missing, dry_run=True)
+        elif args.auto:
+            print(f"\nAutomatically adding {len(missing)} files to project...")
+            add_files_to_project(project_path, missing, dry_run=False)
+        else:
+            response = input(f"\nAdd {len(missing)} files to project? (y/N): ")
+            if response.lower() == 'y':
+                add_files_to_project(project_path, missing, dry_run=False)
+            else:
+                print("Cancelled.")
+    return 0
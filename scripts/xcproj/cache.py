@@ -0,0 +1,150 @@
+"""
+Content-addressed cache for data derived from project files
+
+Results are keyed by a hash of the bytes they were computed from, so a
+cached entry is valid for exactly as long as its inputs are unchanged and
+there is nothing to invalidate. Each cache is one JSON file under
+.cache/xcproj/ at the repository root (override with XCPROJ_CACHE_DIR).
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from . import tracing
+
+
+def _default_cache_dir():
+    """.cache/xcproj in the checkout holding this package
+
+    From the zipapp there is no checkout around the package (its path runs
+    through the archive), so the one holding the working directory is used.
+    """
+    package = Path(__file__).resolve().parent
+    if package.is_dir():
+        root = package.parents[1]
+    else:
+        cwd = Path.cwd()
+        root = next((path for path in (cwd, *cwd.parents) if (path / '.git').exists()), cwd)
+    return root / '.cache' / 'xcproj'
+
+
+DEFAULT_CACHE_DIR = _default_cache_dir()
+
+
+def content_hash(*parts):
+    """SHA-256 over byte strings (or str), unambiguous about where each part ends"""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        digest.update(len(part).to_bytes(8, 'little'))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def source_version(module_name):
+    """Short hash of a module's source, to mix into the keys of results it computes
+
+    Read through the module's loader rather than from __file__, so it works
+    from the zipapp too.
+    """
+    module = sys.modules[module_name]
+    return content_hash(module.__spec__.loader.get_source(module_name) or '')[:12]
+
+
+class Cache:
+    """A JSON file of {content hash: result}; only entries used in a run are kept"""
+
+    def __init__(self, name, directory=None):
+        directory = directory or os.environ.get('XCPROJ_CACHE_DIR') or DEFAULT_CACHE_DIR
+        self.path = Path(directory) / f"{name}.json"
+        self._entries = None
+        self._used = {}
+        self._dirty = False
+
+    def _load(self):
+        if self._entries is None:
+            with tracing.span('cache load', 'cache', path=self.path.name):
+                try:
+                    with open(self.path, encoding='utf-8') as f:
+                        self._entries = json.load(f)
+                except (OSError, ValueError):
+                    self._entries = {}
+
+    def get(self, key):
+        self._load()
+        value = self._entries.get(key)
+        if value is not None:
+            self._used[key] = value
+        return value
+
+    def set(self, key, value):
+        self._load()
+        self._entries[key] = self._used[key] = value
+        self._dirty = True
+
+    def save(self, prune=True):
+        """Write the cache if it changed; with prune, drop entries not used in this run"""
+        if self._entries is None:
+            return
+        entries = self._used if prune else self._entries
+        if not self._dirty and len(entries) == len(self._entries):
+            return
+        import tempfile  # only needed when writing; it pulls in random and shutil
+        try:
+            with tracing.span('cache save', 'cache', path=self.path.name, entries=len(entries)):
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=self.path.parent)
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f, separators=(',', ':'))
+                os.replace(temp_path, self.path)
+        except OSError:
+            # A read-only checkout just doesn't get a cache
+            return
+        self._entries = dict(entries)
+        self._dirty = False
+
+
+def map_files(function, paths, cache=None, version='', parallel_threshold=500, workers=None):
+    """Return {path: function(path)}, reusing cached results for unchanged files
+
+    Results must be JSON-serializable; cached ones come back as JSON types
+    (lists rather than tuples). `version` is mixed into every key so that
+    changing the function invalidates its cached results. Cache misses are
+    computed in a process pool when there are more than parallel_threshold
+    of them; below that, pool startup costs more than it saves.
+    """
+    results = {}
+    misses = []
+    keys = {}
+    with tracing.span('read and hash files', 'read') as hashing:
+        for path in paths:
+            with open(path, 'rb') as f:
+                keys[path] = content_hash(version, f.read())
+            cached = cache.get(keys[path]) if cache is not None else None
+            if cached is not None:
+                results[path] = cached
+            else:
+                misses.append(path)
+        hashing.set(files=len(keys), cache_hits=len(results))
+
+    parallel = len(misses) > parallel_threshold and (workers or os.cpu_count() or 1) > 1
+    with tracing.span(function.__name__.lstrip('_'), 'compute', files=len(misses), parallel=parallel):
+        if parallel:
+            # Imported here: concurrent.futures costs ~20 ms, more than most warm runs
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                computed = list(zip(misses, pool.map(function, misses, chunksize=16)))
+        else:
+            computed = [(path, function(path)) for path in misses]
+    for path, result in computed:
+        results[path] = result
+        if cache is not None:
+            cache.set(keys[path], result)
+
+    if cache is not None:
+        cache.save()
+    return results
@@ -0,0 +1,146 @@
+"""
+Registry of project_validator.py checks
+
+A check is a function `check(validator, options)` that reads what it needs
+from the validator (project, files, project_root) and reports through
+validator.issues / validator.warnings and print(). Each check declares its
+inputs:
+
+    pbxproj     bytes of project.pbxproj
+    filesystem  the set of paths in the working tree (FileIndex)
+    sources     contents of the Swift sources
+    resources   contents of Resources/
+    config      the check's options from xcproj.json
+
+Built-in checks are listed below; other packages add checks through the
+`xcproj.checks` entry point group, pointing at a function that may carry
+`title` and `inputs` attributes (see the check() decorator). A check's
+module is imported only when the check runs, and a check whose inputs and
+code are unchanged since the last run replays its cached result instead.
+"""
+
+import importlib
+import importlib.util
+import sys
+
+from ..cache import content_hash
+
+ENTRY_POINT_GROUP = 'xcproj.checks'
+
+INPUTS = ('pbxproj', 'filesystem', 'sources', 'resources', 'config')
+
+
+class Check:
+    """A registered check; `target` is 'module:function', imported on load()"""
+
+    def __init__(self, name, target, title, inputs=None, source='builtin'):
+        self.name = name
+        self.target = target
+        self.title = title
+        self.inputs = tuple(inputs) if inputs is not None else None  # None: unknown, never cached
+        self.source = source
+        self._function = None
+
+    @property
+    def module(self):
+        return self.target.partition(':')[0]
+
+    def load(self):
+        if self._function is None:
+            module, _, attribute = self.target.partition(':')
+            self._function = getattr(importlib.import_module(module), attribute)
+            # Plugins declare their metadata on the function itself
+            self.title = getattr(self._function, 'title', self.title)
+            if self.inputs is None and getattr(self._function, 'inputs', None) is not None:
+                self.inputs = tuple(self._function.inputs)
+        return self._function
+
+    def __repr__(self):
+        return f"Check({self.name!r}, {self.target!r})"
+
+
+def check(title=None, inputs=None):
+    """Decorator for plugin checks: attach a title and declared inputs"""
+    def decorate(function):
+        function.title = title or function.__name__.replace('_', ' ').upper()
+        function.inputs = tuple(inputs) if inputs is not None else None
+        return function
+    return decorate
+
+
+BUILTIN_CHECKS = [
+    Check('file-structure', 'xcproj.checks.file_structure:check', 'FILE STRUCTURE AUDIT',
+          ('pbxproj', 'filesystem')),
+    Check('resources', 'xcproj.checks.resources:check', 'RESOURCE FILES VERIFICATION',
+          ('pbxproj', 'filesystem', 'config')),
+    Check('groups', 'xcproj.checks.groups:check', 'GROUP STRUCTURE VERIFICATION',
+          ('pbxproj',)),
+    Check('build-settings', 'xcproj.checks.build_settings:check', 'BUILD SETTINGS VERIFICATION',
+          ('pbxproj', 'config')),
+    Check('integrity', 'xcproj.checks.integrity:check', 'PROJECT FILE INTEGRITY',
+          ('pbxproj', 'config')),
+    Check('privacy-manifest', 'xcproj.checks.privacy_manifest:check', 'PRIVACY MANIFEST',
+          ('sources', 'resources')),
+    Check('accessibility', 'xcproj.checks.accessibility:check', 'ACCESSIBILITY',
+          ('sources',)),
+    Check('target-membership', 'xcproj.checks.target_membership:check', 'TARGET MEMBERSHIP',
+          ('pbxproj', 'sources')),
+]
+
+
+def discover():
+    """Built-in checks followed by entry-point plugins, in registration order"""
+    checks = list(BUILTIN_CHECKS)
+    names = {c.name for c in checks}
+    from importlib.metadata import entry_points
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name in names:
+            print(f"⚠ Ignoring plugin check '{entry_point.name}': name already registered", file=sys.stderr)
+            continue
+        names.add(entry_point.name)
+        dist = getattr(entry_point, 'dist', None)
+        checks.append(Check(
+            entry_point.name, entry_point.value, entry_point.name.replace('-', ' ').upper(),
+            source=dist.name if dist is not None else 'plugin',
+        ))
+    return checks
+
+
+def select(checks, selected=None, ignored=None):
+    """Filter checks by name; raises ValueError for unknown names"""
+    known = {c.name for c in checks}
+    unknown = sorted((set(selected or ()) | set(ignored or ())) - known)
+    if unknown:
+        raise ValueError(f"unknown check(s): {', '.join(unknown)} (available: {', '.join(sorted(known))})")
+    return [
+        c for c in checks
+        if (not selected or c.name in selected) and c.name not in (ignored or ())
+    ]
+
+
+_package_version = None
+
+
+def _source(module_name):
+    spec = importlib.util.find_spec(module_name)
+    return (spec.loader.get_source(module_name) or '') if spec is not None else ''
+
+
+def code_version(check):
+    """Hash of the code a check's result depends on
+
+    For built-in checks that is the whole xcproj package (checks use its
+    parsers and linters); for plugins, the module the entry point names.
+    Read through the module loaders, so it works from the zipapp too.
+    """
+    global _package_version
+    if check.source != 'builtin':
+        return content_hash(check.target, _source(check.module))
+    if _package_version is None:
+        import pkgutil
+        package = __name__.rpartition('.')[0]
+        names = sorted(
+            info.name for info in pkgutil.walk_packages(sys.modules[package].__path__, package + '.')
+        )
+        _package_version = content_hash(*(part for name in names for part in (name, _source(name))))
+    return _package_version
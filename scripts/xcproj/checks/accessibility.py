@@ -0,0 +1,34 @@
+"""Accessibility lint of the SwiftUI views"""
+
+from collections import defaultdict
+
+from .. import accessibility
+
+
+def check(validator, options):
+    """Lint SwiftUI views for accessibility problems"""
+    results = accessibility.lint(base=validator.project_root, cache=validator.use_cache,
+                                 files=validator.files)
+    by_rule = defaultdict(list)
+    for path, findings in sorted(results.items()):
+        for rule, line, message in findings:
+            by_rule[rule].append(f"{path}:{line}: {message}")
+
+    print(f"Linted {len(results)} view files")
+    for rule, details in sorted(by_rule.items()):
+        severity = accessibility.RULE_SEVERITY[rule]
+        validator.issues.append({
+            'type': 'accessibility',
+            'severity': severity,
+            'message': f'{len(details)} accessibility issue(s): {rule}',
+            'details': details,
+            'count': len(details)
+        })
+        print(f"{'✗' if severity == 'error' else '⚠'} {rule}: {len(details)}")
+        for detail in details[:3]:
+            print(f"  - {detail}")
+
+    if not by_rule:
+        print("✓ No accessibility issues found")
+
+    print()
@@ -0,0 +1,94 @@
+"""Build settings verification for the first native target
+
+Options (xcproj.json, "build-settings"):
+    expected  {setting: value} required in its Debug and Release configurations
+              (SUPPORTED_PLATFORMS only needs to contain the value)
+"""
+
+
+def check(validator, options):
+    """Check build settings"""
+    # Find target build configurations - look for the configuration list
+    # First find the target's build configuration list ID
+    native_targets = validator.project.ids('PBXNativeTarget')
+    config_list_id = validator.project.get(native_targets[0]).get('buildConfigurationList') if native_targets else None
+    if config_list_id is None:
+        validator.issues.append({
+            'type': 'build_config',
+            'severity': 'error',
+            'message': 'Could not find target build configuration list',
+            'details': [],
+            'count': 1
+        })
+        print("✗ Could not find target build configuration list")
+        return
+
+    # Find the configuration list
+    if config_list_id not in validator.project:
+        validator.issues.append({
+            'type': 'build_config',
+            'severity': 'error',
+            'message': 'Could not find target build configurations',
+            'details': [],
+            'count': 1
+        })
+        print("✗ Could not find target build configurations")
+        return
+
+    config_ids = [
+        (config_id, validator.project.display_name(config_id))
+        for config_id in validator.project.get(config_list_id).get('buildConfigurations', [])
+        if validator.project.display_name(config_id) in ('Debug', 'Release')
+    ]
+
+    expected_settings = options.get('expected', {})
+
+    for config_id, config_type in config_ids:
+        print(f"=== {config_type} Configuration ===")
+
+        if config_id not in validator.project:
+            print(f"  ✗ Could not find {config_type} configuration section")
+            continue
+
+        settings = validator.project.get(config_id).get('buildSettings', {})
+
+        for setting, expected in expected_settings.items():
+            expected_clean = expected.strip('"')
+            if setting in settings:
+                value = settings[setting]
+                if isinstance(value, list):
+                    value = ' '.join(value)
+                if value == expected_clean or (setting == 'SUPPORTED_PLATFORMS' and expected_clean in value):
+                    print(f"  ✓ {setting}: {value}")
+                else:
+                    print(f"  ✗ {setting}: {value} (expected: {expected_clean})")
+                    validator.issues.append({
+                        'type': 'build_setting',
+                        'severity': 'error',
+                        'message': f'{config_type}: {setting} is incorrect',
+                        'details': [f"Current: {value}, Expected: {expected_clean}"],
+                        'count': 1
+                    })
+            else:
+                print(f"  ✗ {setting}: Not found (expected: {expected_clean})")
+                validator.issues.append({
+                    'type': 'build_setting',
+                    'severity': 'error',
+                    'message': f'{config_type}: {setting} is missing',
+                    'details': [f"Expected: {expected_clean}"],
+                    'count': 1
+                })
+
+        # Check deployment target
+        if 'IPHONEOS_DEPLOYMENT_TARGET' in settings:
+            print(f"  ✓ IPHONEOS_DEPLOYMENT_TARGET: {settings['IPHONEOS_DEPLOYMENT_TARGET']}")
+        else:
+            print("  ⚠ IPHONEOS_DEPLOYMENT_TARGET: Not found")
+
+        # Check Swift version
+        if 'SWIFT_VERSION' in settings:
+            print(f"  ✓ SWIFT_VERSION: {settings['SWIFT_VERSION']}")
+        else:
+            print("  ⚠ SWIFT_VERSION: Not found")
+
+        print()
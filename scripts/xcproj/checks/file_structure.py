@@ -0,0 +1,124 @@
+"""File structure audit: Swift files on disk vs. file references in the project"""
+
+from .. import tracing
+from ..reconcile import reconcile
+
+
+def check(validator, options):
+    """Check file structure and missing files"""
+    with tracing.span('reconcile', 'analyze'):
+        result = reconcile(validator.project, validator.files.with_suffix('.swift'))
+    on_disk = result.matched + result.missing + [new for _, new in result.moved + result.renamed]
+
+    print(f"Found {len(on_disk)} Swift files")
+    print(f"  - Shared/: {len([f for f in on_disk if f.startswith('Shared/')])}")
+    print(f"  - iOS/: {len([f for f in on_disk if f.startswith('iOS/')])}")
+    print(f"  - macOS/: {len([f for f in on_disk if f.startswith('macOS/')])}")
+    print()
+
+    file_refs = set(validator.project.ids('PBXFileReference'))
+    print(f"Found {len(file_refs)} file references in project")
+    print(f"  - {len(result.matched)} Swift files matched by exact path")
+
+    # Extract build files
+    build_files = {}
+    with tracing.span('decode build files', 'parse'):
+        for build_id in validator.project.ids('PBXBuildFile'):
+            comment = validator.project.comment(build_id) or ''
+            if not comment.endswith(' in Sources'):
+                continue
+            filename = comment[:-len(' in Sources')]
+            file_ref_id = validator.project.get(build_id).get('fileRef')
+            build_files[build_id] = {
+                'id': build_id,
+                'filename': filename,
+                'file_ref_id': file_ref_id
+            }
+
+    print(f"Found {len(build_files)} build file entries")
+    print()
+
+    # Check for missing files
+    if result.missing:
+        validator.issues.append({
+            'type': 'missing_files',
+            'severity': 'error',
+            'message': f'{len(result.missing)} files missing from project',
+            'details': result.missing[:20],
+            'count': len(result.missing)
+        })
+        print(f"✗ Files missing from project: {len(result.missing)}")
+        for path in result.missing[:10]:
+            print(f"  - {path}")
+        if len(result.missing) > 10:
+            print(f"  ... and {len(result.missing) - 10} more")
+    else:
+        print("✓ All Swift files are referenced in project")
+
+    # Check for files in project but not on disk
+    if result.orphaned:
+        validator.issues.append({
+            'type': 'orphaned_references',
+            'severity': 'warning',
+            'message': f'{len(result.orphaned)} files referenced but not on disk',
+            'details': result.orphaned[:10],
+            'count': len(result.orphaned)
+        })
+        print(f"\n⚠ Files in project but not on disk: {len(result.orphaned)}")
+        for path in result.orphaned[:5]:
+            print(f"  - {path}")
+
+    # References whose file was moved or renamed on disk
+    changed = result.moved + result.renamed
+    if changed:
+        validator.issues.append({
+            'type': 'moved_files',
+            'severity': 'warning',
+            'message': f'{len(changed)} files moved or renamed on disk without updating the project',
+            'details': [f'{old} -> {new}' for old, new in changed[:10]],
+            'count': len(changed)
+        })
+        print(f"\n⚠ Files moved or renamed on disk: {len(changed)}")
+        for old, new in changed[:5]:
+            print(f"  - {old} → {new}")
+
+    # References that sit in no group, so their path can't be resolved
+    if result.ungrouped:
+        validator.warnings.append(f"{len(result.ungrouped)} file references are in no group "
+                                  f"({', '.join(attribute for _, attribute, _ in result.ungrouped[:10])})")
+        print(f"\n⚠ File references in no group: {len(result.ungrouped)}")
+        for _, attribute, disk_path in result.ungrouped[:5]:
+            print(f"  - {attribute}" + (f" → {disk_path}" if disk_path else ''))
+
+    # Xcode refuses to compile two files with the same name into one target
+    if result.clashes:
+        validator.issues.append({
+            'type': 'duplicate_filenames',
+            'severity': 'error',
+            'message': f'{len(result.clashes)} filenames compiled twice in one target',
+            'details': [f"{target}: {', '.join(paths)}" for target, _, paths in result.clashes[:10]],
+            'count': len(result.clashes)
+        })
+        print(f"\n✗ Same filename compiled twice in one target: {len(result.clashes)}")
+
+    # Check for orphaned build files
+    build_file_refs = set()
+    for build_file in build_files.values():
+        build_file_refs.add(build_file['file_ref_id'])
+
+    missing_file_refs = []
+    for build_id, build_file in build_files.items():
+        if build_file['file_ref_id'] not in file_refs:
+            missing_file_refs.append(build_file)
+
+    if missing_file_refs:
+        validator.issues.append({
+            'type': 'orphaned_build_files',
+            'severity': 'error',
+            'message': f'{len(missing_file_refs)} build files with missing file references',
+            'details': [bf['filename'] for bf in missing_file_refs[:10]],
+            'count': len(missing_file_refs)
+        })
+        print(f"\n✗ Build files with missing file references: {len(missing_file_refs)}")
+
+    print()
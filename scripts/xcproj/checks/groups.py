@@ -0,0 +1,39 @@
+"""Group structure verification: PBXGroups should be path-less"""
+
+
+def check(validator, options):
+    """Check PBXGroup structure"""
+    # Find all PBXGroup entries
+    groups = {}
+
+    for group_id in validator.project.ids('PBXGroup'):
+        group = validator.project.get(group_id)
+        groups[group_id] = {
+            'name': validator.project.display_name(group_id),
+            'path': group.get('path'),
+            'content': group
+        }
+
+    print(f"Found {len(groups)} PBXGroup entries")
+
+    # Check for groups with non-empty paths
+    path_issues = []
+    for group_id, group in groups.items():
+        if group['path']:
+            path_issues.append((group_id, group['name'], group['path']))
+
+    if path_issues:
+        validator.issues.append({
+            'type': 'group_paths',
+            'severity': 'warning',
+            'message': f'{len(path_issues)} groups with non-empty paths',
+            'details': [f"{name}: {path}" for _, name, path in path_issues[:10]],
+            'count': len(path_issues)
+        })
+        print(f"\n⚠ Groups with non-empty paths: {len(path_issues)}")
+        for group_id, group_name, path in path_issues[:5]:
+            print(f"  - {group_name}: {path}")
+    else:
+        print("✓ All group paths are empty")
+
+    print()
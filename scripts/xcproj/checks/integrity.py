@@ -0,0 +1,49 @@
+"""Project file integrity: balanced delimiters and known-stale references
+
+Options (xcproj.json, "integrity"):
+    stale_references  file names of deleted files that must not be referenced
+"""
+
+
+def check(validator, options):
+    """Check project file integrity"""
+    # Check for balanced braces
+    open_braces = validator.project.count(b'{')
+    close_braces = validator.project.count(b'}')
+    if open_braces != close_braces:
+        validator.issues.append({
+            'type': 'integrity',
+            'severity': 'error',
+            'message': 'Mismatched braces in project file',
+            'details': [f"Opening: {open_braces}, Closing: {close_braces}"],
+            'count': 1
+        })
+        print(f"✗ Mismatched braces: {open_braces} opening, {close_braces} closing")
+    else:
+        print(f"✓ Braces are balanced: {open_braces} pairs")
+
+    # Check for balanced parentheses
+    open_parens = validator.project.count(b'(')
+    close_parens = validator.project.count(b')')
+    if open_parens != close_parens:
+        validator.issues.append({
+            'type': 'integrity',
+            'severity': 'error',
+            'message': 'Mismatched parentheses in project file',
+            'details': [f"Opening: {open_parens}, Closing: {close_parens}"],
+            'count': 1
+        })
+        print(f"✗ Mismatched parentheses: {open_parens} opening, {close_parens} closing")
+    else:
+        print(f"✓ Parentheses are balanced: {open_parens} pairs")
+
+    # Files known to have been deleted that must not creep back in
+    stale = [
+        name for name in options.get('stale_references', [])
+        if validator.project.find(name.encode('utf-8')) != -1
+    ]
+    if stale:
+        validator.warnings.append(f"Project contains references to non-existent files ({', '.join(stale)})")
+        print("⚠ Project contains references to non-existent files")
+
+    print()
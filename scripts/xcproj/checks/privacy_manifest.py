@@ -0,0 +1,60 @@
+"""Privacy manifest: required-reason API usage vs. PrivacyInfo.xcprivacy"""
+
+import plistlib
+
+from .. import privacy
+
+
+def check(validator, options):
+    """Check required-reason API usage against the privacy manifest"""
+    manifest = validator.project_root / privacy.DEFAULT_MANIFEST
+    if not manifest.exists():
+        print(f"⚠ {privacy.DEFAULT_MANIFEST} not found - skipping")
+        print()
+        return
+
+    try:
+        undeclared, unused, missing_reasons = privacy.check(
+            base=validator.project_root, cache=validator.use_cache, files=validator.files)
+    except (OSError, plistlib.InvalidFileException) as e:
+        validator.issues.append({
+            'type': 'privacy_manifest',
+            'severity': 'error',
+            'message': 'Privacy manifest could not be read',
+            'details': [str(e)],
+            'count': 1
+        })
+        print(f"✗ Privacy manifest could not be read: {e}")
+        print()
+        return
+
+    for category, hits in undeclared.items():
+        validator.issues.append({
+            'type': 'privacy_manifest',
+            'severity': 'error',
+            'message': f'{privacy.CATEGORY_PREFIX}{category} is used but not declared',
+            'details': [f"{path}:{line}: {symbol}" for path, line, symbol in hits],
+            'count': len(hits)
+        })
+        print(f"✗ {category} APIs used but not declared: {len(hits)} uses")
+        for path, line, symbol in hits[:5]:
+            print(f"  - {path}:{line}: {symbol}")
+
+    for category in missing_reasons:
+        validator.issues.append({
+            'type': 'privacy_manifest',
+            'severity': 'error',
+            'message': f'{privacy.CATEGORY_PREFIX}{category} is declared without a reason',
+            'details': [],
+            'count': 1
+        })
+        print(f"✗ {category} declared without a reason")
+
+    for category in unused:
+        validator.warnings.append(f"{privacy.CATEGORY_PREFIX}{category} is declared but no longer used")
+        print(f"⚠ {category} declared but no longer used")
+
+    if not (undeclared or unused or missing_reasons):
+        print("✓ Privacy manifest matches required-reason API usage")
+
+    print()
@@ -0,0 +1,46 @@
+"""Resource files verification
+
+Options (xcproj.json, "resources"):
+    required  {path: lastKnownFileType} of resources the project must reference
+"""
+
+
+def check(validator, options):
+    """Check resource files"""
+    required_resources = options.get('required', {})
+
+    referenced_paths = {
+        validator.project.get(file_id).get('path')
+        for file_id in validator.project.ids('PBXFileReference')
+    }
+
+    missing_resources = []
+    for file_path, file_type in required_resources.items():
+        filename = file_path.split('/')[-1]
+
+        if file_path not in referenced_paths:
+            missing_resources.append((file_path, file_type))
+            print(f"✗ {filename} - Missing from project")
+        elif not validator.files.exists(file_path):
+            validator.warnings.append(f"Resource file {file_path} is referenced but doesn't exist on disk")
+            print(f"⚠ {filename} - Referenced but file missing on disk")
+        else:
+            print(f"✓ {filename} - OK")
+
+    if missing_resources:
+        validator.issues.append({
+            'type': 'missing_resources',
+            'severity': 'error',
+            'message': f'{len(missing_resources)} resource files missing from project',
+            'details': [r[0] for r in missing_resources],
+            'count': len(missing_resources)
+        })
+
+    # Check if resources are in Resources build phase
+    resources_in_phase = [
+        build_file_id
+        for phase_id in validator.project.ids('PBXResourcesBuildPhase')
+        for build_file_id in validator.project.get(phase_id).get('files', [])
+    ]
+    print(f"\nResources in build phase: {len(resources_in_phase)}")
+    print()
@@ -0,0 +1,31 @@
+"""Target membership: Shared files compiled by a target they have no code for"""
+
+from .. import membership
+
+
+def check(validator, options):
+    """Report Shared files that compile to nothing on one of their targets"""
+    _, members, findings = membership.analyze(validator.project, validator.project_root,
+                                             cache=validator.use_cache, files=validator.files)
+    print(f"Checked {sum(members.values())} Sources memberships of the app targets")
+
+    if findings:
+        details = [f"{f['path']}: {f['platform']} only, also compiled by {', '.join(f['wasted'])}"
+                   for f in findings]
+        validator.issues.append({
+            'type': 'target_membership',
+            'severity': 'warning',
+            'message': f'{len(findings)} Shared files compiled by a target they have no code for',
+            'details': details,
+            'count': len(findings)
+        })
+        print(f"⚠ Platform-exclusive files in several targets: {len(findings)}")
+        for detail in details[:5]:
+            print(f"  - {detail}")
+        for platform, (files, lines, _) in sorted(membership.wasted_by_target(findings).items()):
+            print(f"  {platform} compiles {files} files ({lines} lines) to nothing")
+        print("  Fix with: python3 scripts/optimize-target-membership.py --fix")
+    else:
+        print("✓ Every shared file has code for each target compiling it")
+
+    print()
@@ -0,0 +1,158 @@
+"""
+xcproj - one entry point for the project tools
+
+    xcproj validate                     # project_validator.py
+    xcproj structure + privacy + a11y   # chain commands with '+'
+    xcproj add --dry-run
+    xcproj --profile trace.json structure + a11y   # see tracing.py
+
+A command's module is imported only when that command runs, so `xcproj`
+costs the interpreter plus this file until real work starts. Chained
+commands run in one process and share one parsed project.pbxproj (see
+session.py); every command runs, and the chain fails if any of them did.
+
+Build the single-file zipapp with scripts/build-xcproj-zipapp.py.
+"""
+
+import importlib
+import os
+import sys
+import time
+
+# name -> (module, summary); modules are imported on first use
+COMMANDS = {
+    'validate': ('project_validator', 'Run every project check (project_validator.py)'),
+    'structure': ('xcproj.structure', 'Compare Swift files on disk with the project'),
+    'add': ('xcproj.add', 'Add missing Swift files to the project'),
+    'import-tree': ('xcproj.importtree', 'Import a directory with its groups and files'),
+    'list': ('xcproj.schemes', 'List targets, configurations and schemes'),
+    'diff': ('xcproj.diff', 'Semantic diff of project.pbxproj between revisions'),
+    'history': ('xcproj.history', 'Chart project.pbxproj health over git history'),
+    'merge': ('xcproj.merge', 'Three-way merge driver for project.pbxproj'),
+    'privacy': ('xcproj.privacy', 'Check required-reason APIs against the privacy manifest'),
+    'a11y': ('xcproj.accessibility', 'Lint SwiftUI views for accessibility problems'),
+    'hotspots': ('xcproj.typecheck', 'Rank Swift files by likely type-checking cost'),
+    'modules': ('xcproj.modules', 'Propose a Swift Package module split of Shared/'),
+    'dead': ('xcproj.deadcode', 'Find unreachable Swift files and unused resources'),
+    'strings': ('xcproj.xcstrings', 'Validate the string catalog and compile per-locale tables'),
+    'destination': ('xcproj.destinations', 'Pick an xcodebuild -destination that exists'),
+    'build': ('xcproj.orchestrator', 'Build and test every platform in parallel'),
+    'ci': ('xcproj.workflows', 'Critical path and duplicated work of the CI workflows'),
+    'diff-coverage': ('xcproj.diffcoverage', 'Coverage of the lines changed since the base branch'),
+    'main-thread': ('xcproj.mainthread', 'Find blocking I/O reachable from the main actor'),
+    'membership': ('xcproj.membership', 'Move platform-exclusive Shared files to one target'),
+}
+
+CHAIN_SEPARATOR = '+'
+
+# project_validator.py lives at the repository root; inside the zipapp it
+# sits next to the xcproj package instead
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def usage():
+    lines = [
+        'usage: xcproj [--profile TRACE_JSON] [--cprofile STATS_FILE] COMMAND [ARGS...] [+ COMMAND [ARGS...]]...',
+        '', 'commands:',
+    ]
+    width = max(len(name) for name in COMMANDS)
+    lines += [f"  {name:<{width}}  {summary}" for name, (_, summary) in COMMANDS.items()]
+    lines += ['', "Run 'xcproj COMMAND --help' for a command's options."]
+    return '\n'.join(lines)
+
+
+def split_chain(argv):
+    """Split argv on '+' into [(command, args)]"""
+    chain = [[]]
+    for arg in argv:
+        if arg == CHAIN_SEPARATOR:
+            chain.append([])
+        else:
+            chain[-1].append(arg)
+    return [(part[0], part[1:]) for part in chain if part]
+
+
+def load(name):
+    """Import a command's module and return its main()"""
+    module_name = COMMANDS[name][0]
+    if '.' not in module_name and os.path.isfile(os.path.join(_REPO_ROOT, f"{module_name}.py")):
+        if _REPO_ROOT not in sys.path:
+            sys.path.append(_REPO_ROOT)
+    return importlib.import_module(module_name).main
+
+
+def run(name, args):
+    """Run one command; returns its exit code"""
+    main = load(name)
+    program = sys.argv[0]
+    sys.argv[0] = f"xcproj {name}"  # argparse usage lines
+    try:
+        code = main(args)
+    except SystemExit as e:
+        # --help, argument errors and tools that still call sys.exit()
+        code = e.code
+    finally:
+        sys.argv[0] = program
+    if code is None or isinstance(code, int):
+        return code or 0
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _global_options(argv):
+    """Strip leading --profile/--cprofile PATH options; returns (options, rest)"""
+    options = {}
+    while len(argv) >= 2 and argv[0] in ('--profile', '--cprofile'):
+        options[argv[0][2:]] = argv[1]
+        argv = argv[2:]
+    return options, argv
+
+
+def _run_traced(name, args):
+    if 'xcproj.tracing' not in sys.modules:
+        return run(name, args)
+    with sys.modules['xcproj.tracing'].span(name, 'command', args=' '.join(args)):
+        return run(name, args)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    options, argv = _global_options(argv)
+    if options:
+        from . import tracing
+        with tracing.profile(options.get('profile'), options.get('cprofile'), process_name='xcproj'):
+            return _main(argv)
+    return _main(argv)
+
+
+def _main(argv):
+    if not argv or argv[0] in ('-h', '--help', 'help'):
+        print(usage())
+        return 0 if argv else 2
+
+    chain = split_chain(argv)
+    unknown = [name for name, _ in chain if name not in COMMANDS]
+    if unknown:
+        print(f"xcproj: unknown command '{unknown[0]}'", file=sys.stderr)
+        print(usage(), file=sys.stderr)
+        return 2
+
+    if len(chain) == 1:
+        return _run_traced(*chain[0])
+
+    results = []
+    for name, args in chain:
+        print(f"━━━ xcproj {' '.join([name] + args)}", flush=True)
+        started = time.perf_counter()
+        code = _run_traced(name, args)
+        results.append((name, code, time.perf_counter() - started))
+        sys.stdout.flush()
+        print()
+
+    for name, code, elapsed in results:
+        print(f"{'✅' if code == 0 else '❌'} {name:<10} {elapsed:6.2f}s")
+    return next((code for _, code, _ in results if code), 0)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
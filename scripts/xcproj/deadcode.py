@@ -0,0 +1,330 @@
+"""
+Dead source and unused resource detector
+
+A file compiled into a target costs compile time whether or not anything
+uses it, and a Resources-phase entry ships in the bundle whether or not
+anything loads it. This tool finds both, per target, from the target's
+Sources and Resources phases in project.pbxproj:
+
+1. Each Swift file is scanned (comments stripped) for its top-level
+   declarations (types, free functions, globals, and the members of
+   extensions on types the target doesn't declare), the identifiers it
+   uses, its string literals, and whether it is an entry point (`@main`,
+   an XCTestCase or swift-testing suite).
+2. A file depends on every other file of the target declaring a name it
+   uses, and a type's file on the files extending it. Files not reachable
+   from an entry point are unreachable.
+3. A resource is used when reachable code mentions it in a string literal
+   (`"Events.json"`, or `"Events"` with `withExtension:`). Asset catalogs
+   are checked per set (`accentGreen.colorset`), also against the symbol
+   Xcode generates for it (`Color.accentGreen`); sets named by build
+   settings (the app icon, the accent color) are always used. Files the
+   system loads by itself (Info.plist, string catalogs, privacy manifests)
+   are not checked.
+
+Matching is by name, so the analysis errs towards "used": a file is only
+reported when nothing in the target could refer to it. File scans are
+cached by content hash, so a warm run only re-reads the project.
+"""
+
+import argparse
+import json
+import os
+import posixpath
+import re
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from . import tracing
+from .cache import Cache, map_files, source_version
+from .session import open_project
+from .sources import DEFAULT_PROJECT
+
+# Cache misses needed before scanning in a process pool
+PARALLEL_THRESHOLD = 300
+
+# Resources loaded by the system rather than by name from code
+SYSTEM_RESOURCES = ('.plist', '.xcstrings', '.strings', '.stringsdict', '.xcprivacy',
+                    '.storyboard', '.xib', '.intentdefinition', '.entitlements')
+
+# Asset set folders and the suffix Xcode drops from their generated symbol
+ASSET_SETS = {'.imageset': 'Image', '.colorset': 'Color', '.symbolset': '', '.dataset': ''}
+
+_LITERAL = re.compile(r'//[^\n]*|/\*.*?\*/|"""(.*?)"""|"((?:[^"\\\n]|\\.)*)"', re.S)
+_IDENTIFIER = re.compile(r'\b[A-Za-z_]\w*')
+_TOP_LEVEL = re.compile(
+    r'^(?:@\w+(?:\([^)]*\))?\s*)*(?:(?:public|internal|private|fileprivate|open|final|nonisolated|'
+    r'indirect|static)\s+)*(class|struct|enum|protocol|actor|typealias|extension|func|let|var)\s+'
+    r'([A-Za-z_]\w*)', re.M
+)
+_MEMBER = re.compile(r'\b(?:func|var|let|case)\s+([A-Za-z_]\w*)')
+_ENTRY_POINT = re.compile(r'@main\b|@(?:UI|NS)ApplicationMain\b|:\s*XCTestCase\b|@Suite\b|@Test\b')
+
+_SOURCE_VERSION = source_version(__name__)
+
+
+def scan_source(text):
+    """Declarations, references and string literals of one file
+
+    Returns {'types': [...], 'globals': [...], 'extends': {type: [members]},
+    'identifiers': [...], 'strings': [...], 'entry': bool, 'lines': int}.
+    """
+    strings = set()
+
+    def strip(match):
+        literal = match.group(1) if match.group(1) is not None else match.group(2)
+        if literal is None:
+            return ' '
+        strings.add(literal.strip())
+        return '""'
+
+    code = _LITERAL.sub(strip, text)
+    types = set()
+    global_names = set()
+    extends = defaultdict(set)
+    starts = []
+    depth = scanned = 0
+    for match in _TOP_LEVEL.finditer(code):
+        segment = code[scanned:match.start()]
+        depth += segment.count('{') - segment.count('}')
+        scanned = match.start()
+        if depth == 0:
+            starts.append(match)
+    for index, match in enumerate(starts):
+        kind, name = match.groups()
+        if kind == 'extension':
+            end = starts[index + 1].start() if index + 1 < len(starts) else len(code)
+            extends[name].update(_MEMBER.findall(code[match.end():end]))
+        elif kind in ('func', 'let', 'var'):
+            global_names.add(name)
+        else:
+            types.add(name)
+    return {
+        'types': sorted(types),
+        'globals': sorted(global_names),
+        'extends': {name: sorted(members) for name, members in extends.items()},
+        'identifiers': sorted(set(_IDENTIFIER.findall(code))),
+        'strings': sorted(strings),
+        'entry': bool(_ENTRY_POINT.search(code)),
+        'lines': sum(1 for line in text.splitlines() if line.strip()),
+    }
+
+
+def _scan_file(path):
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return scan_source(f.read())
+
+
+def reachable_files(scans):
+    """Files reachable from the entry points among scans ({path: scan})"""
+    declared = defaultdict(set)   # name -> files declaring it
+    extenders = defaultdict(set)  # type -> files extending it
+    for path, scan in scans.items():
+        for name in scan['types'] + scan['globals']:
+            declared[name].add(path)
+    for path, scan in scans.items():
+        for name, members in scan['extends'].items():
+            if name in declared:
+                extenders[name].add(path)
+            else:
+                # Extensions of SDK types are used through their members
+                for member in members:
+                    declared[member].add(path)
+
+    reached = {path for path, scan in scans.items() if scan['entry']}
+    stack = list(reached)
+    while stack:
+        scan = scans[stack.pop()]
+        targets = set()
+        for name in scan['identifiers']:
+            targets.update(declared.get(name, ()))
+        for name in scan['types']:
+            targets.update(extenders.get(name, ()))
+        for target in targets - reached:
+            reached.add(target)
+            stack.append(target)
+    return reached
+
+
+def asset_symbol(name, kind):
+    """The Swift symbol Xcode generates for an asset (`accent-green` -> accentGreen)"""
+    words = [word for word in re.split(r'[^A-Za-z0-9]+', name) if word]
+    if not words:
+        return ''
+    symbol = words[0][:1].lower() + words[0][1:] + ''.join(w[:1].upper() + w[1:] for w in words[1:])
+    suffix = ASSET_SETS.get(kind, '')
+    if suffix and symbol.endswith(suffix) and len(symbol) > len(suffix):
+        symbol = symbol[:-len(suffix)]
+    return symbol
+
+
+def asset_sets(catalog):
+    """(path, name, kind) of the sets in an asset catalog on disk"""
+    sets = []
+    for directory, subdirectories, _ in os.walk(catalog):
+        for name in sorted(subdirectories):
+            stem, kind = os.path.splitext(name)
+            if kind in ASSET_SETS or kind == '.appiconset':
+                sets.append((Path(directory, name).as_posix(), stem, kind))
+        subdirectories[:] = [name for name in subdirectories if os.path.splitext(name)[1] not in ASSET_SETS]
+    return sorted(sets)
+
+
+def _setting_values(project, target_id):
+    """Every string in the target's and the project's build settings"""
+    values = set()
+    owners = [target_id]
+    if project.root_object in project:
+        owners.append(project.root_object)
+    for owner_id in owners:
+        list_id = project.get(owner_id).get('buildConfigurationList')
+        if list_id not in project:
+            continue
+        for configuration_id in project.get(list_id).get('buildConfigurations', []):
+            if configuration_id not in project:
+                continue
+            for value in project.get(configuration_id).get('buildSettings', {}).values():
+                values.update(value if isinstance(value, list) else [value])
+    return values
+
+
+class TargetReport:
+    def __init__(self, name):
+        self.name = name
+        self.sources = []
+        self.entries = []
+        self.unreachable = []   # (path, lines)
+        self.unused = []        # resource files and asset sets
+
+
+def analyze(project, targets=None, cache=True):
+    """Analyze the named targets (default: all); returns ([TargetReport], seconds)"""
+    started = time.perf_counter()
+    paths = project.file_paths()
+    members = {}
+    for target_id in project.targets():
+        name = project.display_name(target_id)
+        if targets and name not in targets:
+            continue
+        phases = {}
+        for isa in ('PBXSourcesBuildPhase', 'PBXResourcesBuildPhase'):
+            phase_id = project.build_phase(target_id, isa)
+            # Localized variant groups (en.lproj/...) are loaded by the system
+            phases[isa] = [
+                paths[file_ref_id] for _, file_ref_id in (project.phase_file_refs(phase_id) if phase_id else [])
+                if file_ref_id in paths and project.isa(file_ref_id) != 'PBXVariantGroup'
+            ]
+        members[target_id] = (name, phases)
+
+    swift = sorted({
+        path for _, phases in members.values() for path in phases['PBXSourcesBuildPhase']
+        if path.endswith('.swift') and os.path.isfile(path)
+    })
+    scans = map_files(_scan_file, swift, Cache('deadcode') if cache else None,
+                      version=_SOURCE_VERSION, parallel_threshold=PARALLEL_THRESHOLD)
+
+    reports = []
+    with tracing.span('reachability', 'compute', targets=len(members)):
+        for target_id, (name, phases) in members.items():
+            report = TargetReport(name)
+            target_scans = {path: scans[path] for path in phases['PBXSourcesBuildPhase'] if path in scans}
+            report.sources = sorted(target_scans)
+            report.entries = sorted(path for path, scan in target_scans.items() if scan['entry'])
+            reached = reachable_files(target_scans) if report.entries else set(target_scans)
+            report.unreachable = sorted(
+                (path, target_scans[path]['lines']) for path in target_scans if path not in reached
+            )
+
+            strings = set()
+            identifiers = set()
+            for path in reached:
+                strings.update(target_scans[path]['strings'])
+                identifiers.update(target_scans[path]['identifiers'])
+            settings = _setting_values(project, target_id)
+            for path in phases['PBXResourcesBuildPhase']:
+                name_on_disk = posixpath.basename(path)
+                stem, suffix = posixpath.splitext(name_on_disk)
+                if suffix in SYSTEM_RESOURCES:
+                    continue
+                if suffix == '.xcassets':
+                    for set_path, set_name, kind in asset_sets(path):
+                        if kind == '.appiconset' or set_name in settings or set_name in strings:
+                            continue
+                        if asset_symbol(set_name, kind) not in identifiers:
+                            report.unused.append(set_path)
+                elif name_on_disk not in strings and stem not in strings:
+                    report.unused.append(path)
+            reports.append(report)
+    return reports, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Find unreachable Swift files and unused resources per target')
+    parser.add_argument('--project', default=DEFAULT_PROJECT, help='Path to project.pbxproj')
+    parser.add_argument('--target', action='append', help='Target to analyze (repeatable; default: all)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text')
+    parser.add_argument('--strict', action='store_true', help='Exit 1 when anything is reported')
+    parser.add_argument('--no-cache', action='store_true', help='Re-scan every file')
+    args = parser.parse_args(argv)
+
+    if not Path(args.project).exists():
+        print(f"❌ Project file not found: {args.project}")
+        return 1
+    with open_project(args.project) as project:
+        reports, seconds = analyze(project, args.target, cache=not args.no_cache)
+
+    # Files compiled into several targets are dead only if no target reaches them
+    compiled_in = defaultdict(list)
+    unreachable_in = defaultdict(list)
+    for report in reports:
+        for path in report.sources:
+            compiled_in[path].append(report.name)
+        for path, _ in report.unreachable:
+            unreachable_in[path].append(report.name)
+    dead = sorted(path for path, names in unreachable_in.items() if len(names) == len(compiled_in[path]))
+    findings = bool(dead or any(report.unreachable or report.unused for report in reports))
+
+    if args.format == 'json':
+        print(json.dumps({
+            'targets': [{
+                'name': report.name,
+                'sources': len(report.sources),
+                'entry_points': report.entries,
+                'unreachable': [{'path': path, 'lines': lines} for path, lines in report.unreachable],
+                'unused_resources': report.unused,
+            } for report in reports],
+            'dead': dead,
+        }, indent=2))
+        return 1 if args.strict and findings else 0
+
+    for report in reports:
+        print(f"🎯 {report.name}: {len(report.sources)} Swift files, "
+              f"entry points: {', '.join(report.entries) or 'none (not analyzed)'}")
+        if report.unreachable:
+            lines = sum(count for _, count in report.unreachable)
+            print(f"  🪦 Unreachable files ({len(report.unreachable)}, {lines} lines):")
+            for path, count in report.unreachable:
+                shared = len(compiled_in[path]) > 1 and path not in dead
+                print(f"    - {path} ({count} lines)" + ('  (used by another target)' if shared else ''))
+        if report.unused:
+            print(f"  📦 Unused resources ({len(report.unused)}):")
+            for path in report.unused:
+                print(f"    - {path}")
+        if not (report.unreachable or report.unused):
+            print("  ✅ Every file and resource is used")
+        print()
+
+    if dead:
+        lines = {path: count for report in reports for path, count in report.unreachable}
+        print(f"🪦 Unreachable in every target that compiles them: {len(dead)} files, "
+              f"{sum(lines[path] for path in dead)} lines")
+        for path in dead:
+            print(f"  - {path}")
+    print(f"⏱️  Analyzed {len(compiled_in)} files in {seconds * 1000:.0f} ms")
+    return 1 if args.strict and findings else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
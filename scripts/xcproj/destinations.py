@@ -0,0 +1,281 @@
+"""
+Simulator destination resolver
+
+`-destination 'platform=iOS Simulator,name=iPhone 16 Pro'` means "iPhone 16
+Pro on the newest installed OS", so it fails - after xcodebuild has
+resolved the whole project - as soon as the newest runtime doesn't ship
+that device (see the "Unable to find a device matching the provided
+destination specifier" in test-output.txt). This module picks a
+destination that exists before xcodebuild runs and hands it over by id.
+
+The inventory comes from either source, parsed into one list of devices:
+
+- `xcrun simctl list -j devices available` (run and cached), or a saved
+  copy of its output
+- xcodebuild logs with "Available destinations" lines
+  (`{ platform:iOS Simulator, arch:arm64, id:..., OS:18.5, name:iPhone 16 }`),
+  including `xcodebuild -showdestinations` output
+
+The simctl inventory is cached under .cache/xcproj/ keyed by the
+developer directory and the simulator device set's modification time, so
+it is re-read after Xcode switches or a simulator is added or removed, and
+at least once a day.
+
+Policy, applied in order: the platform and device family (iphone/ipad);
+the first available preferred name (--name, repeatable; exact match, so
+"iPhone 15" never picks "iPhone 15 Pro"); the newest OS (or --os, a
+version or a minimum like `>=17.0`); an already booted device; the newest
+model. If no preferred name exists the newest device of the family is
+used, with a notice.
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from . import tracing
+from .cache import Cache, content_hash
+
+IOS_SIMULATOR = 'iOS Simulator'
+FAMILIES = ('iphone', 'ipad', 'any')
+
+# How long a simctl inventory is trusted when the device set gives no signal
+MAX_AGE = 24 * 60 * 60
+
+DEVICE_SET = Path.home() / 'Library' / 'Developer' / 'CoreSimulator' / 'Devices' / 'device_set.plist'
+
+_DESTINATION_LINE = re.compile(r'\{\s*(platform:[^{}]*?)\s*\}')
+# com.apple.CoreSimulator.SimRuntime.iOS-18-5 -> ('iOS', '18.5')
+_RUNTIME = re.compile(r'SimRuntime\.(\w+?)-(\d+(?:-\d+)*)$')
+_SIMULATOR_PLATFORMS = {'iOS': IOS_SIMULATOR, 'tvOS': 'tvOS Simulator',
+                        'watchOS': 'watchOS Simulator', 'xrOS': 'visionOS Simulator'}
+
+
+class DestinationError(Exception):
+    pass
+
+
+def _version(text):
+    return tuple(int(part) for part in re.findall(r'\d+', text or ''))
+
+
+def _device(platform, os_version, name, identifier, state=None):
+    return {'platform': platform, 'os': os_version, 'name': name, 'id': identifier, 'state': state}
+
+
+def parse_xcodebuild(text):
+    """Devices from xcodebuild's `{ platform:..., id:..., OS:..., name:... }` lines
+
+    Placeholders (Any iOS Device) and the failed request itself (no id)
+    are skipped; one device listed once per architecture is kept once.
+    """
+    devices = {}
+    for match in _DESTINATION_LINE.finditer(text):
+        fields = {}
+        for field in match.group(1).split(', '):
+            key, _, value = field.partition(':')
+            fields[key.strip()] = value.strip()
+        identifier = fields.get('id', '')
+        if not identifier or 'placeholder' in identifier:
+            continue
+        devices.setdefault(identifier, _device(
+            fields.get('platform', ''), fields.get('OS', ''), fields.get('name', ''), identifier
+        ))
+    return list(devices.values())
+
+
+def parse_simctl(data):
+    """Devices from `simctl list -j devices` output (a dict or JSON text)"""
+    if isinstance(data, str):
+        data = json.loads(data)
+    devices = []
+    for runtime, entries in data.get('devices', {}).items():
+        match = _RUNTIME.search(runtime)
+        if not match:
+            continue
+        platform = _SIMULATOR_PLATFORMS.get(match.group(1), f"{match.group(1)} Simulator")
+        os_version = match.group(2).replace('-', '.')
+        for entry in entries:
+            if entry.get('isAvailable', True):
+                devices.append(_device(platform, os_version, entry['name'], entry['udid'], entry.get('state')))
+    return devices
+
+
+def parse(text):
+    """Devices from simctl JSON or an xcodebuild log, whichever text is"""
+    if text.lstrip().startswith('{'):
+        try:
+            return parse_simctl(text)
+        except (ValueError, KeyError):
+            pass
+    return parse_xcodebuild(text)
+
+
+def read_inventory(paths):
+    """Devices from saved logs or simctl output, parsed once per file content"""
+    cache = Cache('destinations')
+    devices = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        key = content_hash('file', data)
+        parsed = cache.get(key)
+        if parsed is None:
+            parsed = parse(data.decode('utf-8', errors='replace'))
+            cache.set(key, parsed)
+        devices.extend(parsed)
+    cache.save()
+    return devices
+
+
+def _developer_dir():
+    if os.environ.get('DEVELOPER_DIR'):
+        return os.environ['DEVELOPER_DIR']
+    try:
+        return subprocess.run(['xcode-select', '-p'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def simctl_inventory(refresh=False):
+    """Devices from `xcrun simctl list -j devices available`, cached"""
+    if shutil.which('xcrun') is None:
+        raise DestinationError("xcrun not found; pass saved logs or simctl JSON with --from")
+    try:
+        device_set = DEVICE_SET.stat().st_mtime_ns
+    except OSError:
+        device_set = 0
+    key = content_hash('simctl', _developer_dir(), str(device_set))
+    cache = Cache('simulators')
+    cached = None if refresh else cache.get(key)
+    if cached is not None and time.time() - cached['created'] < MAX_AGE:
+        cache.save()
+        return cached['devices']
+    with tracing.span('simctl list', 'process'):
+        try:
+            result = subprocess.run(['xcrun', 'simctl', 'list', '-j', 'devices', 'available'],
+                                    capture_output=True, text=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise DestinationError(f"simctl list failed: {e.stderr.strip() or e}")
+    devices = parse_simctl(result.stdout)
+    cache.set(key, {'created': time.time(), 'devices': devices})
+    cache.save()
+    return devices
+
+
+def _family(device):
+    name = device['name'].lower()
+    if name.startswith('iphone'):
+        return 'iphone'
+    if name.startswith('ipad'):
+        return 'ipad'
+    return 'other'
+
+
+def _os_filter(spec):
+    """Predicate on OS version strings for --os: 'latest', '18.5' or '>=17.0'"""
+    if not spec or spec == 'latest':
+        return lambda version: True
+    if spec.startswith('>='):
+        minimum = _version(spec[2:])
+        return lambda version: _version(version) >= minimum
+    wanted = _version(spec)
+    return lambda version: _version(version)[:len(wanted)] == wanted
+
+
+def resolve(devices, names=(), family='iphone', platform=IOS_SIMULATOR, os_spec='latest'):
+    """Pick the best device; returns (device, note) or raises DestinationError"""
+    os_matches = _os_filter(os_spec)
+    candidates = [
+        device for device in devices
+        if device['platform'] == platform and os_matches(device['os'])
+        and (family == 'any' or _family(device) == family)
+    ]
+    if not candidates:
+        available = sorted({f"{d['name']} ({d['os']})" for d in devices if d['platform'] == platform})
+        raise DestinationError(
+            f"no {family} device for {platform} with OS {os_spec} in the inventory"
+            + (f"; available: {', '.join(available[:10])}" if available else '')
+        )
+
+    def newest(device):
+        return (_version(device['os']), device.get('state') == 'Booted', _version(device['name']), device['name'])
+
+    note = None
+    for name in names:
+        named = [device for device in candidates if device['name'].lower() == name.lower()]
+        if named:
+            return max(named, key=newest), note
+    chosen = max(candidates, key=newest)
+    if names:
+        note = f"{' / '.join(names)} not available; using the newest {family} device instead"
+    return chosen, note
+
+
+def specifier(device):
+    """xcodebuild -destination value; by id, so nothing is left to look up"""
+    return f"platform={device['platform']},id={device['id']}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Pick an xcodebuild -destination that exists')
+    parser.add_argument('--name', action='append', default=[],
+                        help='Preferred device name, exact (repeatable, in order of preference)')
+    parser.add_argument('--family', choices=FAMILIES, default='iphone', help='Device family (default: iphone)')
+    parser.add_argument('--platform', default=IOS_SIMULATOR, help=f'Destination platform (default: {IOS_SIMULATOR})')
+    parser.add_argument('--os', default='latest', help="'latest' (default), a version like 18.5, or >=17.0")
+    parser.add_argument('--from', dest='sources', action='append', metavar='FILE',
+                        help='Read the inventory from saved xcodebuild logs or simctl JSON instead of simctl')
+    parser.add_argument('--refresh', action='store_true', help='Re-run simctl instead of using the cached inventory')
+    parser.add_argument('--boot', action='store_true', help='Boot the chosen simulator')
+    parser.add_argument('--format', choices=['specifier', 'json', 'github'], default='specifier',
+                        help='github appends destination= and device= lines to $GITHUB_OUTPUT')
+    parser.add_argument('--list', action='store_true', help='List the inventory instead of resolving')
+    args = parser.parse_args(argv)
+
+    if args.platform == 'macOS':
+        print('platform=macOS')
+        return 0
+
+    try:
+        devices = read_inventory(args.sources) if args.sources else simctl_inventory(args.refresh)
+        if args.list:
+            for device in sorted(devices, key=lambda d: (d['platform'], d['name'], _version(d['os']))):
+                state = f"  [{device['state']}]" if device.get('state') else ''
+                print(f"{device['platform']:<18} {device['os']:<6} {device['name']:<32} {device['id']}{state}")
+            return 0
+        device, note = resolve(devices, args.name, args.family, args.platform, args.os)
+    except (OSError, DestinationError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    if note:
+        print(f"⚠️  {note}", file=sys.stderr)
+    print(f"📱 {device['name']} ({device['platform']} {device['os']}) {device['id']}", file=sys.stderr)
+
+    if args.boot and device.get('state') != 'Booted':
+        # Already-booted devices and "Unable to boot device in current state: Booted" are fine
+        subprocess.run(['xcrun', 'simctl', 'boot', device['id']], capture_output=True)
+
+    if args.format == 'json':
+        print(json.dumps(dict(device, destination=specifier(device)), indent=2))
+    elif args.format == 'github':
+        output = os.environ.get('GITHUB_OUTPUT')
+        lines = f"destination={specifier(device)}\ndevice={device['name']} ({device['os']})\n"
+        if output:
+            with open(output, 'a', encoding='utf-8') as f:
+                f.write(lines)
+        print(lines, end='')
+    else:
+        print(specifier(device))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,294 @@
+"""
+Semantic diff of project.pbxproj between revisions
+
+Instead of a textual diff of very long lines, both revisions are loaded as
+object graphs and compared by what they mean:
+
+    + Shared/Views/FooView.swift added to DisabilityAdvocacy-iOS Sources
+    ~ SWIFT_VERSION changed in DisabilityAdvocacy-iOS Release: 5.0 -> 6.0
+
+Revisions come from the working tree or from git blobs streamed through one
+`git cat-file --batch` process. Summaries are cached by blob SHA, so diffing
+every commit in a range parses each distinct project file once.
+"""
+
+import argparse
+import json
+import sys
+
+from .git import GitError, GitObjectReader, git
+from .pbxproj import PBXProject, PlistError
+from .session import open_project
+
+DEFAULT_PROJECT = 'DisabilityAdvocacy.xcodeproj/project.pbxproj'
+
+# Objects whose changes are already described by summarize()
+SUMMARIZED_ISAS = {
+    'PBXFileReference', 'PBXGroup', 'PBXVariantGroup', 'PBXBuildFile',
+    'PBXNativeTarget', 'PBXAggregateTarget', 'PBXLegacyTarget',
+    'XCBuildConfiguration', 'XCConfigurationList',
+    'PBXSourcesBuildPhase', 'PBXResourcesBuildPhase', 'PBXFrameworksBuildPhase',
+    'PBXHeadersBuildPhase', 'PBXCopyFilesBuildPhase', 'PBXShellScriptBuildPhase',
+}
+
+
+def summarize(project):
+    """Reduce a project to the facts reviewers care about"""
+    paths = project.file_paths()
+
+    def label(object_id):
+        return paths.get(object_id) or project.display_name(object_id) or object_id
+
+    summary = summarize_empty()
+    for object_id in project.ids():
+        isa = project.isa(object_id)
+        if isa in ('PBXFileReference', 'PBXVariantGroup'):
+            summary['files'][object_id] = label(object_id)
+        elif isa == 'PBXGroup':
+            summary['groups'][object_id] = label(object_id)
+        elif isa not in SUMMARIZED_ISAS:
+            summary['objects'][object_id] = (isa, project.get(object_id))
+
+    def add_settings(owner, config_list_id):
+        if config_list_id not in project:
+            return
+        for config_id in project.get(config_list_id).get('buildConfigurations', []):
+            if config_id in project:
+                config = project.get(config_id)
+                summary['settings'][(owner, config.get('name'))] = config.get('buildSettings', {})
+
+    for target_id in project.targets():
+        if target_id not in project:
+            continue
+        target = project.get(target_id)
+        name = target.get('name') or project.display_name(target_id)
+        phases = {}
+        for phase_id in target.get('buildPhases', []):
+            if phase_id in project:
+                phases[project.display_name(phase_id)] = {
+                    label(file_ref_id)
+                    for _, file_ref_id in project.phase_file_refs(phase_id)
+                    if file_ref_id is not None
+                }
+        summary['targets'][name] = {
+            'productType': target.get('productType'),
+            'phases': phases,
+        }
+        add_settings(name, target.get('buildConfigurationList'))
+
+    if project.root_object in project:
+        add_settings('project', project.get(project.root_object).get('buildConfigurationList'))
+    return summary
+
+
+def summarize_empty():
+    """Summary of a revision in which the project file doesn't exist"""
+    return {'files': {}, 'groups': {}, 'targets': {}, 'settings': {}, 'objects': {}}
+
+
+def _format_setting(value):
+    return ' '.join(value) if isinstance(value, list) else str(value)
+
+
+def diff_summaries(old, new):
+    """Return semantic changes as (kind, sign, message) tuples"""
+    changes = []
+
+    for kind in ('files', 'groups'):
+        noun = 'file' if kind == 'files' else 'group'
+        old_paths = set(old[kind].values())
+        new_paths = set(new[kind].values())
+        for object_id, path in new[kind].items():
+            if object_id in old[kind] and old[kind][object_id] != path:
+                changes.append((kind, '~', f"{noun} moved: {old[kind][object_id]} -> {path}"))
+        moved_from = {old[kind][i] for i in new[kind] if i in old[kind] and old[kind][i] != new[kind][i]}
+        moved_to = {new[kind][i] for i in new[kind] if i in old[kind] and old[kind][i] != new[kind][i]}
+        for path in sorted(new_paths - old_paths - moved_to):
+            changes.append((kind, '+', f"{noun} {path} added to project"))
+        for path in sorted(old_paths - new_paths - moved_from):
+            changes.append((kind, '-', f"{noun} {path} removed from project"))
+
+    for name in sorted(new['targets'].keys() - old['targets'].keys()):
+        changes.append(('targets', '+', f"target {name} added"))
+    for name in sorted(old['targets'].keys() - new['targets'].keys()):
+        changes.append(('targets', '-', f"target {name} removed"))
+    for name in sorted(new['targets'].keys() & old['targets'].keys()):
+        old_phases = old['targets'][name]['phases']
+        new_phases = new['targets'][name]['phases']
+        for phase in sorted(new_phases.keys() - old_phases.keys()):
+            changes.append(('targets', '+', f"{phase} phase added to {name}"))
+        for phase in sorted(old_phases.keys() - new_phases.keys()):
+            changes.append(('targets', '-', f"{phase} phase removed from {name}"))
+        for phase in sorted(new_phases.keys() & old_phases.keys()):
+            for path in sorted(new_phases[phase] - old_phases[phase]):
+                changes.append(('membership', '+', f"{path} added to {name} {phase}"))
+            for path in sorted(old_phases[phase] - new_phases[phase]):
+                changes.append(('membership', '-', f"{path} removed from {name} {phase}"))
+
+    for owner, config in sorted(new['settings'].keys() | old['settings'].keys(), key=lambda k: (k[0], str(k[1]))):
+        where = f"{owner} {config}"
+        if (owner, config) not in old['settings']:
+            changes.append(('settings', '+', f"configuration {config} added to {owner}"))
+            continue
+        if (owner, config) not in new['settings']:
+            changes.append(('settings', '-', f"configuration {config} removed from {owner}"))
+            continue
+        old_settings = old['settings'][(owner, config)]
+        new_settings = new['settings'][(owner, config)]
+        for key in sorted(new_settings.keys() | old_settings.keys()):
+            if key not in old_settings:
+                changes.append(('settings', '+', f"setting {key} added in {where}: {_format_setting(new_settings[key])}"))
+            elif key not in new_settings:
+                changes.append(('settings', '-', f"setting {key} removed in {where}"))
+            elif old_settings[key] != new_settings[key]:
+                changes.append((
+                    'settings', '~',
+                    f"setting {key} changed in {where}: "
+                    f"{_format_setting(old_settings[key])} -> {_format_setting(new_settings[key])}"
+                ))
+
+    for object_id in sorted(new['objects'].keys() | old['objects'].keys()):
+        if object_id not in old['objects']:
+            changes.append(('objects', '+', f"{new['objects'][object_id][0]} {object_id} added"))
+        elif object_id not in new['objects']:
+            changes.append(('objects', '-', f"{old['objects'][object_id][0]} {object_id} removed"))
+        else:
+            isa, old_obj = old['objects'][object_id]
+            new_obj = new['objects'][object_id][1]
+            keys = sorted(key for key in old_obj.keys() | new_obj.keys() if old_obj.get(key) != new_obj.get(key))
+            if keys:
+                changes.append(('objects', '~', f"{isa} {object_id} changed: {', '.join(keys)}"))
+
+    return changes
+
+
+class RevisionLoader:
+    """Load and summarize project revisions, caching summaries by blob SHA"""
+
+    def __init__(self, project_path):
+        self.project_path = project_path
+        self.reader = GitObjectReader()
+        self._summaries = {}
+
+    def summary(self, revision=None):
+        """Summarize the project at a git revision, or the working tree for None
+
+        A revision without the project file (before it was added) summarizes
+        as an empty project; check user-given revisions with verify_revision
+        first, since a revision that doesn't exist looks the same.
+        """
+        if revision is None:
+            with open_project(self.project_path) as project:
+                return summarize(project)
+
+        spec = f"{revision}:./{self.project_path}"
+        sha = self.reader.object_id(spec)
+        if sha is None:
+            return summarize_empty()
+        if sha not in self._summaries:
+            _, data = self.reader.read(spec)
+            self._summaries[sha] = summarize(PBXProject(data))
+        return self._summaries[sha]
+
+    def close(self):
+        self.reader.close()
+
+
+def verify_revision(revision):
+    """Raise GitError unless revision names a commit"""
+    try:
+        git('rev-parse', '--verify', '--quiet', f"{revision}^{{commit}}")
+    except GitError:
+        raise GitError(f"Not a commit: {revision}") from None
+
+
+CATEGORY_TITLES = {
+    'membership': 'Target membership',
+    'files': 'Files',
+    'groups': 'Groups',
+    'targets': 'Targets',
+    'settings': 'Build settings',
+    'objects': 'Other objects',
+}
+
+
+def format_changes(changes, fmt='text', title=None):
+    """Render changes as text, Markdown or JSON"""
+    if fmt == 'json':
+        return json.dumps({
+            'title': title,
+            'changes': [{'kind': kind, 'change': sign, 'message': message} for kind, sign, message in changes],
+        }, indent=2)
+
+    lines = []
+    if fmt == 'markdown':
+        if title:
+            lines.append(f"### {title}")
+            lines.append('')
+        if not changes:
+            lines.append('_No semantic changes to project.pbxproj_')
+        for kind, kind_title in CATEGORY_TITLES.items():
+            entries = [(sign, message) for k, sign, message in changes if k == kind]
+            if entries:
+                lines.append(f"**{kind_title}**")
+                lines.append('')
+                lines.extend(f"- `{sign}` {message}" for sign, message in entries)
+                lines.append('')
+        return '\n'.join(lines).rstrip('\n')
+
+    if title:
+        lines.append(title)
+    if not changes:
+        lines.append('  (no semantic changes)')
+    lines.extend(f"  {sign} {message}" for _, sign, message in changes)
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Show what changed in project.pbxproj between revisions, by meaning rather than by line'
+    )
+    parser.add_argument('revisions', nargs='*', metavar='REV',
+                        help='No revision: HEAD vs working tree; one: REV vs working tree; two: REV_A vs REV_B')
+    parser.add_argument('--commits', metavar='RANGE',
+                        help='Diff every commit in a range (e.g. origin/main..HEAD) against its first parent')
+    parser.add_argument('--project', default=DEFAULT_PROJECT, help='Path to project.pbxproj')
+    parser.add_argument('--format', choices=['text', 'markdown', 'json'], default='text', help='Output format')
+    args = parser.parse_args(argv)
+
+    if len(args.revisions) > 2 or (args.commits and args.revisions):
+        parser.error('pass at most two revisions, or --commits RANGE on its own')
+
+    loader = RevisionLoader(args.project)
+    try:
+        if args.commits:
+            log = git('log', '--reverse', '--first-parent', '--format=%H %s', args.commits, '--', args.project)
+            outputs = []
+            for line in log.splitlines():
+                commit, _, subject = line.partition(' ')
+                changes = diff_summaries(loader.summary(f"{commit}^"), loader.summary(commit))
+                outputs.append(format_changes(changes, args.format, f"{commit[:10]} {subject}"))
+            if args.format == 'json':
+                print('[' + ',\n'.join(outputs) + ']')
+            else:
+                print('\n\n'.join(outputs) if outputs else 'No commits in range change the project file')
+            return 0
+
+        old_rev = args.revisions[0] if args.revisions else 'HEAD'
+        new_rev = args.revisions[1] if len(args.revisions) == 2 else None
+        for revision in (old_rev, new_rev):
+            if revision is not None:
+                verify_revision(revision)
+        changes = diff_summaries(loader.summary(old_rev), loader.summary(new_rev))
+        title = f"{old_rev}..{new_rev or 'working tree'}"
+        print(format_changes(changes, args.format, title))
+        return 0
+    except (GitError, PlistError, OSError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    finally:
+        loader.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
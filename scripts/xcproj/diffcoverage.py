@@ -0,0 +1,329 @@
+"""
+Coverage of the lines a pull request changes
+
+generate-coverage-report.sh reports the whole app's coverage, which a PR
+barely moves. Here line coverage is loaded once and intersected with the
+changed line ranges of one `git diff -U0`, so the report is about the code
+under review: how many of its changed executable lines ran, and which did
+not.
+
+Line coverage comes from either export, detected by content:
+
+- LCOV (`xcrun llvm-cov export -format=lcov BINARY -instr-profile=PROFDATA`)
+- xccov archive JSON (`xcrun xccov view --archive --json RESULT.xcresult`),
+  or --xcresult to run that export here
+
+Coverage files are split per source file and each file's record is
+summarized once, cached under .cache/xcproj/ by the hash of the record,
+so a rerun after new tests re-reads only the files whose coverage
+changed. The full per-file report (--full) is built from the same
+summaries.
+
+Paths in coverage data are absolute and machine-specific (the CI
+checkout, DerivedData); they are mapped back to repository paths by the
+longest tracked path they end with.
+"""
+
+import argparse
+import json
+import posixpath
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+from .cache import Cache, content_hash
+from .git import GitError, git
+
+DEFAULT_BASE = 'origin/main'
+SUFFIXES = ('.swift',)
+# Test code is not measured against itself
+IGNORED = ('Tests/', '.swiftpm/', '/.build/')
+
+_HUNK = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+
+class CoverageError(Exception):
+    pass
+
+
+def changed_lines(diff_text):
+    """{path: set(line numbers)} added or modified on the new side of a -U0 diff"""
+    changed = defaultdict(set)
+    path = None
+    for line in diff_text.splitlines():
+        if line.startswith('+++ '):
+            target = line[4:].split('\t')[0]
+            path = None if target == '/dev/null' else target[2:]
+        elif path and line.startswith('@@'):
+            match = _HUNK.match(line)
+            if match:
+                start, count = int(match.group(1)), int(match.group(2) or 1)
+                changed[path].update(range(start, start + count))
+    return {path: lines for path, lines in changed.items() if lines}
+
+
+def git_diff(base, paths=('*.swift',)):
+    """One `git diff -U0` from the merge base with base to the working tree"""
+    merge_base = git('merge-base', base, 'HEAD').strip()
+    return git('diff', '-U0', '--no-color', '--no-ext-diff', '--no-renames', '--src-prefix=a/', '--dst-prefix=b/',
+               merge_base, '--', *paths)
+
+
+def _lcov_records(text):
+    """(source path, record text) per LCOV record"""
+    record = []
+    source = None
+    for line in text.splitlines():
+        if line.startswith('SF:'):
+            source = line[3:]
+            record = [line]
+        elif line == 'end_of_record':
+            if source is not None:
+                yield source, '\n'.join(record)
+            source = None
+        elif source is not None:
+            record.append(line)
+
+
+def _summarize_lcov(record):
+    lines = {}
+    for line in record.splitlines():
+        if line.startswith('DA:'):
+            number, count = line[3:].split(',')[:2]
+            # A line with several regions is listed once per region
+            lines[int(number)] = max(lines.get(int(number), 0), int(float(count)))
+    return _summary(lines)
+
+
+def _summarize_xccov(entries):
+    return _summary({
+        entry['line']: entry.get('executionCount') or 0 for entry in entries if entry.get('isExecutable')
+    })
+
+
+def _summary(lines):
+    return {
+        'executable': sorted(lines),
+        'missed': sorted(number for number, count in lines.items() if not count),
+    }
+
+
+def load_coverage(text, cache=True):
+    """{source path: summary} from LCOV or xccov archive JSON text"""
+    cache = Cache('coverage') if cache else None
+    coverage = {}
+    if text.lstrip().startswith('{'):
+        data = json.loads(text)
+        items = ((path, json.dumps(entries, sort_keys=True), entries) for path, entries in data.items())
+        summarize = _summarize_xccov
+    else:
+        items = ((path, record, record) for path, record in _lcov_records(text))
+        summarize = _summarize_lcov
+    for path, record, raw in items:
+        key = content_hash('coverage', record)
+        summary = cache.get(key) if cache else None
+        if summary is None:
+            summary = summarize(raw)
+            if cache:
+                cache.set(key, summary)
+        coverage[path] = summary
+    if cache:
+        cache.save()
+    return coverage
+
+
+def export_xcresult(path):
+    """xccov archive JSON for an .xcresult bundle"""
+    try:
+        result = subprocess.run(['xcrun', 'xccov', 'view', '--archive', '--json', path],
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise CoverageError(f"xccov could not read {path}: {getattr(e, 'stderr', '') or e}")
+    return result.stdout
+
+
+def map_paths(coverage, tracked, root):
+    """Re-key coverage by repository path; sources outside the repo are dropped"""
+    by_name = defaultdict(list)
+    for path in tracked:
+        by_name[posixpath.basename(path)].append(path)
+    root = root.rstrip('/') + '/'
+    mapped = {}
+    for source, summary in coverage.items():
+        source = source.replace('\\', '/')
+        if source.startswith(root):
+            relative = source[len(root):]
+        else:
+            candidates = [path for path in by_name.get(posixpath.basename(source), [])
+                          if source == path or source.endswith('/' + path)]
+            relative = max(candidates, key=len) if candidates else None
+        if relative and not any(fragment in relative for fragment in IGNORED):
+            mapped[relative] = summary
+    return mapped
+
+
+def ranges(numbers):
+    """[1, 2, 3, 7] -> '1-3, 7'"""
+    spans = []
+    for number in sorted(numbers):
+        if spans and number == spans[-1][1] + 1:
+            spans[-1][1] = number
+        else:
+            spans.append([number, number])
+    return ', '.join(str(a) if a == b else f"{a}-{b}" for a, b in spans)
+
+
+def diff_coverage(coverage, changed):
+    """Per changed file: changed executable lines, the missed ones, or no data"""
+    files = []
+    for path, lines in sorted(changed.items()):
+        if not path.endswith(SUFFIXES) or any(fragment in path for fragment in IGNORED):
+            continue
+        summary = coverage.get(path)
+        if summary is None:
+            files.append({'path': path, 'changed': len(lines), 'executable': None, 'missed': None})
+            continue
+        executable = lines.intersection(summary['executable'])
+        missed = lines.intersection(summary['missed'])
+        files.append({'path': path, 'changed': len(lines), 'executable': sorted(executable),
+                      'missed': sorted(missed)})
+    return files
+
+
+def totals(files):
+    executable = sum(len(f['executable']) for f in files if f['executable'] is not None)
+    missed = sum(len(f['missed']) for f in files if f['missed'] is not None)
+    percent = 100.0 * (executable - missed) / executable if executable else None
+    return executable, missed, percent
+
+
+def _percent(executable, missed):
+    return f"{100.0 * (executable - missed) / executable:.1f}%" if executable else 'n/a'
+
+
+def full_report(coverage):
+    """Markdown table of every measured file, least covered first"""
+    rows = sorted(
+        ((path, len(s['executable']), len(s['missed'])) for path, s in coverage.items() if s['executable']),
+        key=lambda row: ((row[1] - row[2]) / row[1], row[0]),
+    )
+    executable = sum(row[1] for row in rows)
+    missed = sum(row[2] for row in rows)
+    lines = [
+        '# Line Coverage', '',
+        f"**Overall:** {_percent(executable, missed)} ({executable - missed}/{executable} lines in {len(rows)} files)", '',
+        '| File | Lines | Covered | Coverage |', '|------|-------|---------|----------|',
+    ]
+    lines += [f"| `{path}` | {total} | {total - miss} | {_percent(total, miss)} |" for path, total, miss in rows]
+    return '\n'.join(lines) + '\n'
+
+
+def print_text(files):
+    executable, missed, percent = totals(files)
+    if not files:
+        print('✅ No changed Swift lines to measure')
+        return
+    for f in files:
+        if f['executable'] is None:
+            print(f"⚪ {f['path']}: no coverage data ({f['changed']} changed lines; not in a tested target?)")
+        elif not f['executable']:
+            print(f"⚪ {f['path']}: no executable changed lines")
+        else:
+            icon = '✅' if not f['missed'] else '⚠️ '
+            print(f"{icon} {f['path']}: {_percent(len(f['executable']), len(f['missed']))} "
+                  f"of {len(f['executable'])} changed lines"
+                  + (f"; not run: {ranges(f['missed'])}" if f['missed'] else ''))
+    print()
+    if percent is None:
+        print('📊 Diff coverage: no executable changed lines')
+    else:
+        print(f"📊 Diff coverage: {percent:.1f}% ({executable - missed}/{executable} changed executable lines)")
+
+
+def print_markdown(files):
+    executable, missed, percent = totals(files)
+    print('## 📐 Diff Coverage')
+    print()
+    if percent is None:
+        print('No executable Swift lines changed.')
+        return
+    print(f"**{percent:.1f}%** of changed executable lines ran ({executable - missed}/{executable})")
+    print()
+    print('| File | Changed lines | Coverage | Not run |')
+    print('|------|---------------|----------|---------|')
+    for f in files:
+        if f['executable'] is None:
+            print(f"| `{f['path']}` | {f['changed']} | no data | |")
+        elif f['executable']:
+            print(f"| `{f['path']}` | {len(f['executable'])} | {_percent(len(f['executable']), len(f['missed']))} "
+                  f"| {ranges(f['missed'])} |")
+
+
+def print_github(files):
+    for f in files:
+        for line in ranges(f['missed'] or []).split(', ') if f['missed'] else []:
+            first, _, last = line.partition('-')
+            print(f"::warning file={f['path']},line={first},endLine={last or first},"
+                  f"title=Not covered::Changed line(s) {line} did not run in the tests")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Coverage of the lines a pull request changes')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--coverage', help='LCOV or xccov archive JSON file')
+    source.add_argument('--xcresult', help='Result bundle to export with xccov')
+    parser.add_argument('--base', default=DEFAULT_BASE, help=f'Compare against this ref (default: {DEFAULT_BASE})')
+    parser.add_argument('--diff', help='Read a saved `git diff -U0` instead of running git')
+    parser.add_argument('--format', choices=['text', 'markdown', 'github', 'json'], default='text',
+                        help='markdown for PR comments and step summaries; github prints annotations')
+    parser.add_argument('--full', metavar='FILE', help='Also write the per-file report of all measured files')
+    parser.add_argument('--fail-under', type=float, metavar='PERCENT',
+                        help='Exit 1 when diff coverage is below PERCENT')
+    parser.add_argument('--no-cache', action='store_true', help='Re-read every file record')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.xcresult:
+            text = export_xcresult(args.xcresult)
+        else:
+            with open(args.coverage, encoding='utf-8') as f:
+                text = f.read()
+        if args.diff:
+            with open(args.diff, encoding='utf-8') as f:
+                diff_text = f.read()
+        else:
+            diff_text = git_diff(args.base)
+        root = git('rev-parse', '--show-toplevel').strip()
+        tracked = git('ls-files', '--', *(f"*{suffix}" for suffix in SUFFIXES)).splitlines()
+        coverage = map_paths(load_coverage(text, cache=not args.no_cache), tracked, root)
+    except (OSError, ValueError, GitError, CoverageError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    files = diff_coverage(coverage, changed_lines(diff_text))
+    if args.format == 'json':
+        executable, missed, percent = totals(files)
+        print(json.dumps({'files': files, 'executable': executable, 'missed': missed, 'percent': percent}, indent=2))
+    elif args.format == 'markdown':
+        print_markdown(files)
+    elif args.format == 'github':
+        print_github(files)
+        print_text(files)
+    else:
+        print_text(files)
+
+    if args.full:
+        with open(args.full, 'w', encoding='utf-8') as f:
+            f.write(full_report(coverage))
+        print(f"📁 Full report written to {args.full}", file=sys.stderr)
+
+    _, _, percent = totals(files)
+    if args.fail_under is not None and percent is not None and percent < args.fail_under:
+        print(f"❌ Diff coverage {percent:.1f}% is below {args.fail_under:g}%", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
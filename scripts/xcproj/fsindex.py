@@ -0,0 +1,90 @@
+"""
+One walk of the working tree, shared by every check
+
+Checks used to run their own Path.rglob() over the whole checkout,
+descending into .git each time. FileIndex walks once, pruning directories
+that never hold project files, and answers suffix and prefix queries from
+the sorted list of relative paths. An index of a whole repository can hand
+out subtree() indexes for each project in it without walking again (and
+pickles cheaply, for process pools).
+"""
+
+import bisect
+import os
+
+from . import tracing
+from .cache import content_hash
+
+# Directory names never descended into
+PRUNED = {'.git', '.cache', '__pycache__'}
+
+
+class FileIndex:
+    """Sorted relative POSIX paths of the files under root"""
+
+    def __init__(self, root='.', files=None):
+        self.root = str(root)
+        if files is None:
+            files = self._walk(self.root)
+        self.files = sorted(files)
+        self._set = set(self.files)
+        self._fingerprint = None
+
+    @staticmethod
+    def _walk(root):
+        files = []
+        with tracing.span('walk filesystem', 'fs') as walk:
+            for directory, subdirectories, names in os.walk(root):
+                subdirectories[:] = [name for name in subdirectories if name not in PRUNED]
+                relative = os.path.relpath(directory, root).replace(os.sep, '/')
+                prefix = '' if relative == '.' else relative + '/'
+                files.extend(prefix + name for name in names)
+            walk.set(files=len(files))
+        return files
+
+    def __len__(self):
+        return len(self.files)
+
+    def __contains__(self, path):
+        return path in self._set
+
+    def with_suffix(self, suffix):
+        return [path for path in self.files if path.endswith(suffix)]
+
+    def under(self, directory):
+        """Files below a directory (given without trailing slash)"""
+        prefix = directory.rstrip('/') + '/'
+        start = bisect.bisect_left(self.files, prefix)
+        end = bisect.bisect_left(self.files, prefix[:-1] + '0')  # '0' sorts right after '/'
+        return self.files[start:end]
+
+    def subtree(self, directory, exclude=()):
+        """Index of the files below directory, relative to it, leaving out the
+        excluded directories (given relative to this index, like directory)"""
+        directory = directory.strip('/')
+        if directory in ('', '.'):
+            files, root, offset = self.files, self.root, 0
+        else:
+            files, root, offset = self.under(directory), os.path.join(self.root, directory), len(directory) + 1
+        if not exclude and not offset:
+            return self
+        excluded = tuple(path.strip('/') + '/' for path in exclude)
+        return FileIndex(root, [path[offset:] for path in files if not path.startswith(excluded)])
+
+    def exists(self, path):
+        """True for indexed files and for directories containing indexed files"""
+        return path in self._set or bool(self.under(path))
+
+    def fingerprint(self):
+        """Hash of the set of paths (not their contents)"""
+        if self._fingerprint is None:
+            self._fingerprint = content_hash('\n'.join(self.files))
+        return self._fingerprint
+
+    def content_fingerprint(self, paths):
+        """Hash of the given files' paths and bytes"""
+        parts = []
+        for path in paths:
+            with open(os.path.join(self.root, path), 'rb') as f:
+                parts += [path, f.read()]
+        return content_hash(*parts)
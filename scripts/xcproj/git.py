@@ -0,0 +1,80 @@
+"""
+Read blobs from git history through long-lived `git cat-file` processes
+
+Spawning `git show` per revision costs a process per blob. GitObjectReader
+keeps one `git cat-file --batch-check` and one `git cat-file --batch`
+process open and streams requests through them, so walking hundreds of
+revisions of project.pbxproj costs two process spawns in total.
+"""
+
+import subprocess
+
+
+class GitError(RuntimeError):
+    """Raised when a git command fails"""
+
+
+def git(*args, cwd=None):
+    """Run a git command and return its stdout as text"""
+    result = subprocess.run(['git', *args], cwd=cwd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise GitError(result.stderr.strip() or f"git {' '.join(args)} failed")
+    return result.stdout
+
+
+class GitObjectReader:
+    """Stream objects out of `git cat-file --batch` without respawning git"""
+
+    def __init__(self, cwd=None):
+        self.cwd = cwd
+        self._check = None
+        self._batch = None
+
+    def _start(self, mode):
+        return subprocess.Popen(
+            ['git', 'cat-file', mode], cwd=self.cwd,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        )
+
+    def _request(self, process, spec):
+        process.stdin.write(spec.encode('utf-8') + b'\n')
+        process.stdin.flush()
+        header = process.stdout.readline()
+        if not header:
+            raise GitError("git cat-file exited unexpectedly")
+        fields = header.split()
+        if len(fields) != 3:
+            # `<spec> missing` or `<spec> ambiguous`
+            return None, None, None
+        return fields[0].decode('ascii'), fields[1].decode('ascii'), int(fields[2])
+
+    def object_id(self, spec):
+        """Return the object SHA for a spec such as `HEAD:path`, or None if missing"""
+        if self._check is None:
+            self._check = self._start('--batch-check')
+        sha, _, _ = self._request(self._check, spec)
+        return sha
+
+    def read(self, spec):
+        """Return (sha, bytes) for a spec such as `HEAD:path`, or (None, None)"""
+        if self._batch is None:
+            self._batch = self._start('--batch')
+        sha, _, size = self._request(self._batch, spec)
+        if sha is None:
+            return None, None
+        data = self._batch.stdout.read(size)
+        self._batch.stdout.read(1)  # trailing newline
+        return sha, data
+
+    def close(self):
+        for process in (self._check, self._batch):
+            if process is not None:
+                process.stdin.close()
+                process.wait()
+        self._check = self._batch = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,398 @@
+"""
+Project health over git history
+
+Charts how project.pbxproj evolves: file references and groups, group
+depth, files per target, references that point at nothing, and drift of
+the build settings, at every commit of the last N on the first-parent
+line. A CSV or self-contained HTML time series is written.
+
+Running the validator per checkout costs a checkout and a full parse per
+commit. Here everything is read through one `git cat-file --batch`
+process: the commit's tree, the path to the project file within it, and
+each distinct project blob. Each blob is parsed once, in a process pool
+when there are many, and its metrics are cached under .cache/xcproj/ by
+blob SHA, so a rerun only parses project files from new commits. Tree
+objects are read once per SHA too, and unchanged subtrees are shared
+between commits, so checking which references exist on disk at each
+commit reads little more than the trees that changed.
+
+Metrics per commit:
+
+    files             PBXFileReferences
+    groups            PBXGroups
+    group_depth       deepest group below the main group
+    missing           references whose path is not in the commit's tree
+    ungrouped         references not reachable from the main group
+    dangling          build files whose file reference doesn't exist
+    <target> sources / resources
+                      entries in the target's Sources and Resources phases
+    settings          build settings over all configurations
+    settings_changed  settings added, removed or changed since the previous commit
+    settings_drift    settings that differ from the oldest commit in the series
+"""
+
+import argparse
+import csv
+import html
+import json
+import os
+import posixpath
+import sys
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+from . import tracing
+from .cache import Cache, content_hash, source_version
+from .git import GitError, GitObjectReader, git
+from .pbxproj import PBXProject, PlistError
+from .sources import DEFAULT_PROJECT
+
+DEFAULT_COMMITS = 1000
+
+# Cache misses needed before parsing in a process pool; a parse costs
+# tens of milliseconds, so a pool pays off much sooner than for scans
+PARALLEL_THRESHOLD = 16
+
+# Columns charted in the HTML report, before the per-target ones
+CHARTED = ('files', 'groups', 'group_depth', 'missing', 'ungrouped', 'dangling', 'settings', 'settings_drift')
+
+_SOURCE_VERSION = source_version(__name__)
+
+
+def measure(project):
+    """Metrics of one project revision that depend on the project file alone"""
+    paths = project.file_paths()
+    root = project.get(project.root_object) if project.root_object in project else {}
+
+    group_depth = 0
+    stack = [(root.get('mainGroup'), 0)]
+    while stack:
+        group_id, depth = stack.pop()
+        if group_id not in project or project.isa(group_id) not in ('PBXGroup', 'PBXVariantGroup'):
+            continue
+        group_depth = max(group_depth, depth)
+        stack.extend((child_id, depth + 1) for child_id in project.get(group_id).get('children', []))
+
+    file_refs = project.ids('PBXFileReference')
+    dangling = sum(
+        1 for build_file_id in project.ids('PBXBuildFile')
+        if 'productRef' not in project.get(build_file_id)
+        and project.get(build_file_id).get('fileRef') not in project
+    )
+
+    targets = {}
+    for target_id in project.targets():
+        if target_id not in project:
+            continue
+        counts = {}
+        for column, isa in (('sources', 'PBXSourcesBuildPhase'), ('resources', 'PBXResourcesBuildPhase')):
+            phase_id = project.build_phase(target_id, isa)
+            counts[column] = len(project.get(phase_id).get('files', [])) if phase_id else 0
+        targets[project.display_name(target_id)] = counts
+
+    # Setting values are kept as short hashes: only whether they changed matters
+    settings = {}
+    owners = [(project.display_name(target_id), target_id) for target_id in project.targets() if target_id in project]
+    if project.root_object in project:
+        owners.append(('project', project.root_object))
+    for owner, owner_id in owners:
+        list_id = project.get(owner_id).get('buildConfigurationList')
+        if list_id not in project:
+            continue
+        for configuration_id in project.get(list_id).get('buildConfigurations', []):
+            if configuration_id not in project:
+                continue
+            configuration = project.get(configuration_id)
+            for key, value in configuration.get('buildSettings', {}).items():
+                settings[f"{owner}/{configuration.get('name')}/{key}"] = content_hash(
+                    json.dumps(value, sort_keys=True))[:8]
+
+    return {
+        'files': len(file_refs),
+        'groups': len(project.ids('PBXGroup')),
+        'group_depth': group_depth,
+        'ungrouped': sum(1 for file_ref_id in file_refs if file_ref_id not in paths),
+        'dangling': dangling,
+        'targets': targets,
+        'settings': settings,
+        # Repository-relative paths are checked against each commit's tree
+        'references': sorted({
+            paths[file_ref_id] for file_ref_id in file_refs
+            if paths.get(file_ref_id) and not paths[file_ref_id].startswith(('$(', '/', '..'))
+        }),
+    }
+
+
+def _measure_blob(data):
+    try:
+        return measure(PBXProject(data))
+    except (PlistError, UnicodeDecodeError, KeyError, AttributeError) as e:
+        return {'error': str(e) or type(e).__name__}
+
+
+class TreeReader:
+    """Look up paths in git trees, reading each tree object once"""
+
+    def __init__(self, reader):
+        self.reader = reader
+        self._trees = {}
+
+    def entries(self, sha):
+        """{name: object SHA} of a tree"""
+        if sha not in self._trees:
+            # `^{tree}` makes a blob where a directory was expected read as missing
+            _, data = self.reader.read(f"{sha}^{{tree}}")
+            width = len(sha) // 2
+            entries = {}
+            position = 0
+            while data and position < len(data):
+                space = data.index(b' ', position)
+                nul = data.index(b'\0', space)
+                entries[data[space + 1:nul].decode('utf-8', 'surrogateescape')] = data[nul + 1:nul + 1 + width].hex()
+                position = nul + 1 + width
+            self._trees[sha] = entries
+        return self._trees[sha]
+
+    def lookup(self, tree, path):
+        """SHA of the object at path in tree, or None"""
+        sha = tree
+        for part in path.split('/'):
+            if part in ('', '.'):
+                continue
+            sha = self.entries(sha).get(part)
+            if sha is None:
+                return None
+        return sha
+
+
+def commits(revision='HEAD', count=DEFAULT_COMMITS):
+    """[(commit, tree, timestamp, subject)] of the last count first-parent commits, oldest first"""
+    log = git('log', '--first-parent', f'--max-count={count}', '--format=%H%x00%T%x00%ct%x00%s', revision, '--')
+    points = []
+    for line in log.splitlines():
+        commit, tree, timestamp, subject = line.split('\0', 3)
+        points.append((commit, tree, int(timestamp), subject))
+    return points[::-1]
+
+
+def _parse_blobs(reader, shas, cache, workers=None):
+    """{blob SHA: metrics}, streaming the blobs not in cache through reader"""
+    results = {}
+    misses = []
+    for sha in shas:
+        cached = cache.get(content_hash(_SOURCE_VERSION, sha)) if cache is not None else None
+        if cached is not None:
+            results[sha] = cached
+        else:
+            misses.append(sha)
+
+    parallel = len(misses) > PARALLEL_THRESHOLD and (workers or os.cpu_count() or 1) > 1
+    with tracing.span('parse revisions', 'compute', blobs=len(misses), parallel=parallel):
+        if parallel:
+            from concurrent.futures import ProcessPoolExecutor
+            workers = workers or os.cpu_count()
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # A bounded window of blobs in flight keeps memory flat on long histories
+                window = deque()
+                for sha in misses:
+                    window.append((sha, pool.submit(_measure_blob, reader.read(sha)[1])))
+                    if len(window) >= workers * 4:
+                        done, future = window.popleft()
+                        results[done] = future.result()
+                for done, future in window:
+                    results[done] = future.result()
+        else:
+            for sha in misses:
+                results[sha] = _measure_blob(reader.read(sha)[1])
+
+    if cache is not None:
+        for sha in misses:
+            cache.set(content_hash(_SOURCE_VERSION, sha), results[sha])
+        cache.save()
+    return results, len(misses)
+
+
+def _settings_difference(old, new):
+    return sum(1 for key in old.keys() | new.keys() if old.get(key) != new.get(key))
+
+
+def series(project_path=DEFAULT_PROJECT, revision='HEAD', count=DEFAULT_COMMITS, cache=True, workers=None):
+    """(rows, target names, parsed blob count) for the last count commits, oldest first"""
+    points = commits(revision, count)
+    project_dir = posixpath.dirname(posixpath.dirname(posixpath.normpath(project_path)))
+    with GitObjectReader() as reader:
+        trees = TreeReader(reader)
+        with tracing.span('read trees', 'read', commits=len(points)):
+            blobs = [trees.lookup(tree, project_path) for _, tree, _, _ in points]
+        metrics, parsed = _parse_blobs(reader, sorted({blob for blob in blobs if blob}),
+                                       Cache('history') if cache else None, workers)
+
+        targets = []
+        rows = []
+        first_settings = previous_settings = None
+        missing_memo = {}
+        with tracing.span('series', 'compute', commits=len(points)):
+            for (commit, tree, timestamp, subject), blob in zip(points, blobs):
+                row = {
+                    'commit': commit,
+                    'date': datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%d %H:%M'),
+                    'subject': subject,
+                    'blob': blob or '',
+                }
+                measured = metrics.get(blob)
+                if not measured or 'error' in measured:
+                    row['error'] = measured['error'] if measured else 'project file not in this commit'
+                    rows.append(row)
+                    continue
+                if (blob, tree) not in missing_memo:
+                    missing_memo[(blob, tree)] = sum(
+                        1 for path in measured['references']
+                        if trees.lookup(tree, posixpath.join(project_dir, path)) is None
+                    )
+                settings = measured['settings']
+                if first_settings is None:
+                    first_settings = previous_settings = settings
+                row.update({
+                    'files': measured['files'],
+                    'groups': measured['groups'],
+                    'group_depth': measured['group_depth'],
+                    'missing': missing_memo[(blob, tree)],
+                    'ungrouped': measured['ungrouped'],
+                    'dangling': measured['dangling'],
+                    'settings': len(settings),
+                    'settings_changed': _settings_difference(previous_settings, settings),
+                    'settings_drift': _settings_difference(first_settings, settings),
+                })
+                for name, counts in measured['targets'].items():
+                    if name not in targets:
+                        targets.append(name)
+                    for column, value in counts.items():
+                        row[f"{name} {column}"] = value
+                previous_settings = settings
+                rows.append(row)
+    return rows, targets, parsed
+
+
+def columns(targets):
+    return (['date', 'commit', 'subject', 'blob', 'files', 'groups', 'group_depth', 'missing', 'ungrouped',
+             'dangling', 'settings', 'settings_changed', 'settings_drift']
+            + [f"{name} {column}" for name in targets for column in ('sources', 'resources')] + ['error'])
+
+
+def write_csv(rows, targets, path):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns(targets), extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _chart(title, rows, column, width=640, height=120):
+    """Inline SVG line chart of one column"""
+    points = [(index, row[column]) for index, row in enumerate(rows) if isinstance(row.get(column), int)]
+    if not points:
+        return ''
+    low = min(value for _, value in points)
+    high = max(value for _, value in points)
+    span_x = max(len(rows) - 1, 1)
+    span_y = max(high - low, 1)
+    coordinates = ' '.join(
+        f"{8 + index * (width - 16) / span_x:.1f},{height - 8 - (value - low) * (height - 16) / span_y:.1f}"
+        for index, value in points
+    )
+    return (
+        f'<section><h2>{html.escape(title)} <small>{points[0][1]} &rarr; {points[-1][1]} '
+        f'(min {low}, max {high})</small></h2>'
+        f'<svg viewBox="0 0 {width} {height}" width="{width}" height="{height}" role="img" '
+        f'aria-label="{html.escape(title)}"><polyline fill="none" stroke="#0a66c2" stroke-width="1.5" '
+        f'points="{coordinates}"/></svg></section>'
+    )
+
+
+def write_html(rows, targets, path, title):
+    charts = [_chart(column.replace('_', ' '), rows, column) for column in CHARTED]
+    charts += [_chart(f"{name} {column}", rows, f"{name} {column}") for name in targets
+               for column in ('sources', 'resources')]
+    # The table lists the commits where some metric changed
+    shown = columns(targets)[4:-1]
+    changed = [row for index, row in enumerate(rows)
+               if index == 0 or any(row.get(column) != rows[index - 1].get(column) for column in shown)]
+    header = ''.join(f"<th>{html.escape(column)}</th>" for column in ['date', 'commit', 'subject'] + shown)
+    body = '\n'.join(
+        '<tr>' + f"<td>{row['date']}</td><td><code>{row['commit'][:10]}</code></td>"
+        f"<td>{html.escape(row['subject'])}</td>"
+        + ''.join(f"<td>{row.get(column, '')}</td>" for column in shown) + '</tr>'
+        for row in changed
+    )
+    document = f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{html.escape(title)}</title>
+<style>body{{font-family:-apple-system,sans-serif;margin:2em}}h2{{font-size:1em;margin:1.5em 0 .3em}}
+small{{color:#666;font-weight:normal}}svg{{background:#f6f8fa}}table{{border-collapse:collapse;font-size:.85em}}
+td,th{{border:1px solid #ddd;padding:2px 6px;text-align:right}}td:nth-child(3){{text-align:left}}</style>
+</head><body><h1>{html.escape(title)}</h1>
+{''.join(charts)}
+<h2>Commits that changed a metric</h2>
+<table><tr>{header}</tr>
+{body}
+</table></body></html>
+"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(document)
+
+
+def print_summary(rows, targets):
+    measured = [row for row in rows if 'error' not in row]
+    if not measured:
+        print("⚠️  The project file is in none of these commits")
+        return
+    first, last = measured[0], measured[-1]
+    shown = [column for column in columns(targets)[4:-1] if column != 'settings_changed']
+    width = max(len(column) for column in shown)
+    print(f"  {'':{width}} {'first':>8} {'last':>8} {'change':>8}")
+    for column in shown:
+        old, new = first.get(column, 0), last.get(column, 0)
+        print(f"  {column:{width}} {old:>8} {new:>8} {new - old:>+8}")
+    busiest = max(measured, key=lambda row: row['settings_changed'])
+    if busiest['settings_changed']:
+        print(f"⚙️  Most settings changed at once: {busiest['settings_changed']} in "
+              f"{busiest['commit'][:10]} {busiest['subject']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Chart project.pbxproj health over git history')
+    parser.add_argument('revision', nargs='?', default='HEAD', help='Newest commit (default: HEAD)')
+    parser.add_argument('-n', '--commits', type=int, default=DEFAULT_COMMITS,
+                        help=f'First-parent commits to measure (default: {DEFAULT_COMMITS})')
+    parser.add_argument('--project', default=DEFAULT_PROJECT, help='Path to project.pbxproj')
+    parser.add_argument('--csv', metavar='FILE', help='Write the time series as CSV')
+    parser.add_argument('--html', metavar='FILE', help='Write charts of the time series as HTML')
+    parser.add_argument('--jobs', '-j', type=int, help='Parser processes (default: one per CPU)')
+    parser.add_argument('--no-cache', action='store_true', help='Re-parse every project revision')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        rows, targets, parsed = series(args.project, args.revision, args.commits,
+                                       cache=not args.no_cache, workers=args.jobs)
+    except (GitError, OSError) as e:
+        print(f"❌ {e}")
+        return 1
+    seconds = time.perf_counter() - started
+
+    revisions = len({row['blob'] for row in rows if row['blob']})
+    span = f" ({rows[0]['date'][:10]} → {rows[-1]['date'][:10]})" if rows else ''
+    print(f"📈 {args.project} over {len(rows)} commits{span}: {revisions} distinct revisions, "
+          f"{parsed} parsed, {revisions - parsed} cached")
+    print_summary(rows, targets)
+    if args.csv:
+        write_csv(rows, targets, args.csv)
+        print(f"📁 Time series written to {args.csv}")
+    if args.html:
+        write_html(rows, targets, args.html, f"{args.project} since {rows[0]['date'][:10]}" if rows else args.project)
+        print(f"📁 Charts written to {args.html}")
+    print(f"⏱️  {seconds * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""
+Import a directory tree into the project in one pass
+
+auto-add puts a file in the deepest group that already exists on its path,
+falling back to the root Shared/iOS/macOS group, so a new feature folder
+is flattened. import_tree() walks the directory once, creates the missing
+PBXGroup chain (one group per folder, with a `path` like Xcode's), and adds
+every supported file with one build file per target phase: Swift sources
+to Sources, the rest to Resources. Asset catalogs are added as a single
+reference and not descended into; files in `xx.lproj/` folders are
+gathered into a variant group per file name, as Xcode does.
+
+All edits go through one ProjectEditor and are written once, so importing
+hundreds of files costs one walk, one group-tree resolution and one write.
+"""
+
+import argparse
+import os
+import posixpath
+from pathlib import Path
+
+from .add import determine_targets, generate_uuid, target_phases
+from .session import open_project
+from .sources import DEFAULT_PROJECT, EXCLUDED
+from .writer import ProjectEditor
+
+# suffix -> (lastKnownFileType, build phase)
+FILE_TYPES = {
+    '.swift': ('sourcecode.swift', 'PBXSourcesBuildPhase'),
+    '.json': ('text.json', 'PBXResourcesBuildPhase'),
+    '.xcstrings': ('text.json.xcstrings', 'PBXResourcesBuildPhase'),
+    '.strings': ('text.plist.strings', 'PBXResourcesBuildPhase'),
+    '.stringsdict': ('text.plist.stringsdict', 'PBXResourcesBuildPhase'),
+    '.xcassets': ('folder.assetcatalog', 'PBXResourcesBuildPhase'),
+}
+
+# Directories added as one file reference
+BUNDLES = ('.xcassets',)
+
+
+def scan(directory, root='.'):
+    """Supported files (and bundles) below directory, relative to root, sorted"""
+    found = []
+    for current, subdirectories, names in os.walk(directory):
+        relative = Path(os.path.relpath(current, root)).as_posix()
+        keep = []
+        for name in sorted(subdirectories):
+            path = posixpath.normpath(posixpath.join(relative, name))
+            if name.startswith('.') or any(fragment in path for fragment in EXCLUDED):
+                continue
+            if name.endswith(BUNDLES):
+                found.append(path)
+            else:
+                keep.append(name)
+        subdirectories[:] = keep
+        found.extend(
+            posixpath.normpath(posixpath.join(relative, name)) for name in names
+            if posixpath.splitext(name)[1] in FILE_TYPES and not name.startswith('.')
+        )
+    return sorted(found)
+
+
+class TreeImport:
+    """Pending additions to one project; call add() per path, then write"""
+
+    def __init__(self, editor, root='.'):
+        self.editor = editor
+        self.root = root
+        project = editor.project
+        paths = project.file_paths()
+
+        self.known = set()
+        self.groups = {}  # resolved folder path -> group id
+        for object_id, path in paths.items():
+            isa = project.isa(object_id)
+            if isa == 'PBXFileReference':
+                self.known.add(path)
+            elif isa == 'PBXGroup':
+                # Prefer a group that maps to the folder over a name-only
+                # group resolving to the same path
+                if path not in self.groups or (
+                        project.get(object_id).get('path') and not project.get(self.groups[path]).get('path')):
+                    self.groups[path] = object_id
+
+        self.variants = {}  # (group id, name) -> PBXVariantGroup id
+        for group_id in set(self.groups.values()):
+            for child_id in project.get(group_id).get('children', []):
+                if child_id in project and project.isa(child_id) == 'PBXVariantGroup':
+                    self.variants[(group_id, project.display_name(child_id))] = child_id
+
+        self.phases = target_phases(project)  # (target label, phase isa) -> phase id
+
+        self.created = []   # folders that got a new group
+        self.added = []
+        self.skipped = []   # already in the project
+        self.unplaced = set()  # (target label, phase isa) with no such phase
+
+    def group(self, directory):
+        """The group for a folder, creating it and any missing parents"""
+        group_id = self.groups.get(directory)
+        if group_id is not None:
+            return group_id
+        parent_id = self.group(posixpath.dirname(directory))
+        group_id = generate_uuid()
+        self.editor.add_object(group_id, {
+            'isa': 'PBXGroup',
+            'children': [],
+            'path': posixpath.basename(directory),
+            'sourceTree': '<group>',
+        })
+        self.editor.append_child(parent_id, 'children', group_id)
+        self.groups[directory] = group_id
+        self.created.append(directory)
+        return group_id
+
+    def add(self, path):
+        """Record the edits that add one file; returns False if it is already referenced"""
+        if path in self.known:
+            self.skipped.append(path)
+            return False
+        file_type, phase_isa = FILE_TYPES[posixpath.splitext(path)[1]]
+        directory, name = posixpath.split(path)
+        parent, folder = posixpath.split(directory)
+        file_ref_id = generate_uuid()
+
+        if folder.endswith('.lproj'):
+            # en.lproj/Localizable.strings joins the Localizable.strings variant group
+            group_id = self.group(parent)
+            member_id = self.variants.get((group_id, name))
+            is_new_member = member_id is None
+            if is_new_member:
+                member_id = generate_uuid()
+                self.editor.add_object(member_id, {
+                    'isa': 'PBXVariantGroup', 'children': [], 'name': name, 'sourceTree': '<group>',
+                })
+                self.editor.append_child(group_id, 'children', member_id)
+                self.variants[(group_id, name)] = member_id
+            self.editor.add_object(file_ref_id, {
+                'isa': 'PBXFileReference',
+                'lastKnownFileType': file_type,
+                'name': folder[:-len('.lproj')],
+                'path': f"{folder}/{name}",
+                'sourceTree': '<group>',
+            })
+            self.editor.append_child(member_id, 'children', file_ref_id)
+        else:
+            self.editor.add_object(file_ref_id, {
+                'isa': 'PBXFileReference',
+                'lastKnownFileType': file_type,
+                'path': name,
+                'sourceTree': '<group>',
+            })
+            self.editor.append_child(self.group(directory), 'children', file_ref_id)
+            member_id, is_new_member = file_ref_id, True
+
+        if is_new_member:
+            for label in determine_targets(path, self.root):
+                phase_id = self.phases.get((label, phase_isa))
+                if phase_id is None:
+                    self.unplaced.add((label, phase_isa))
+                    continue
+                build_file_id = generate_uuid()
+                # Passing the comment saves the writer a scan for the owning phase
+                self.editor.add_object(build_file_id, {'isa': 'PBXBuildFile', 'fileRef': member_id},
+                                       comment=f"{self.editor.comment(member_id)} in {self.editor.comment(phase_id)}")
+                self.editor.append_child(phase_id, 'files', build_file_id)
+
+        self.known.add(path)
+        self.added.append(path)
+        return True
+
+
+def import_tree(project_path, directory, dry_run=False):
+    """Add every supported file below directory; returns the TreeImport"""
+    root = Path(project_path).parent.parent
+    paths = scan(directory, root)
+    with open_project(project_path) as project:
+        editor = ProjectEditor(project)
+        tree = TreeImport(editor, root)
+        for path in paths:
+            tree.add(path)
+        if editor.modified and not dry_run:
+            editor.write(project_path)
+    return tree
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Import a directory into the project, creating its groups')
+    parser.add_argument('directory', help='Directory to import (relative to the project root)')
+    parser.add_argument('--project', default=DEFAULT_PROJECT, help='Path to project.pbxproj')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would be done without making changes')
+    args = parser.parse_args(argv)
+
+    if not Path(args.project).exists():
+        print(f"❌ Project file not found: {args.project}")
+        return 1
+    if not os.path.isdir(args.directory):
+        print(f"❌ Not a directory: {args.directory}")
+        return 1
+
+    tree = import_tree(args.project, args.directory, dry_run=args.dry_run)
+    prefix = '🔍 [DRY RUN] Would create' if args.dry_run else '📁 Created'
+    if tree.created:
+        print(f"{prefix} {len(tree.created)} groups:")
+        for directory in tree.created:
+            print(f"  - {directory}")
+    prefix = '🔍 [DRY RUN] Would add' if args.dry_run else '✅ Added'
+    print(f"{prefix} {len(tree.added)} files")
+    for path in tree.added:
+        targets = ', '.join(determine_targets(path, tree.root)) or 'no target'
+        print(f"  - {path} ({targets})")
+    if tree.skipped:
+        print(f"⚠️  {len(tree.skipped)} files already in the project were skipped")
+    for label, phase_isa in sorted(tree.unplaced):
+        print(f"⚠️  No {phase_isa} in the {label} target; those files were added without membership there")
+    return 0
@@ -0,0 +1,662 @@
+"""
+Main-thread blocking I/O detector
+
+`@MainActor` code runs on the main thread, and so does every synchronous
+function it calls that isn't isolated to another actor. A
+`Data(contentsOf:)`, `JSONDecoder().decode` or `data.write(to:)` anywhere
+on such a path stalls the UI for as long as the disk or the network
+takes. This tool finds those paths without a compiler:
+
+1. Each Swift file is tokenized (accessibility.tokenize) and scanned for
+   its types and functions: isolation (`@MainActor` on the function, its
+   type or extension, `nonisolated`, `actor`, and View/App/Scene
+   conformance, which SwiftUI isolates to the main actor), `async`, the
+   calls each function makes and the blocking APIs it uses. Every call is
+   tagged with the executor of the closures around it: `Task.detached`,
+   `DispatchQueue.global().async` and other queues run elsewhere;
+   `DispatchQueue.main.async`, `MainActor.run` and `@MainActor in`
+   closures run on the main thread; anything else runs where its function
+   does.
+2. Calls are resolved by name, through the receiver's type when that is
+   known: a type, a `.shared` singleton, or a property, local or
+   parameter with a declared or constructed type. A call on an unknown
+   receiver is followed only when a single project type declares that
+   method.
+3. From every main-actor function, calls are followed into the functions
+   that then run on the main thread. Actor methods and nonisolated `async`
+   functions leave it, so they are not followed. Every blocking API found
+   on the way is reported with a call chain from a main-actor entry point
+   (one that no other main-actor code calls).
+
+Findings are ranked by the kind of work (synchronous network and waits,
+then file I/O, then JSON coding), times the number of entry points that
+reach them. Suppress one with `// main-thread: ignore` on the same or
+previous line. Scans are cached per file by content hash.
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+
+from . import tracing
+from .accessibility import tokenize
+from .cache import Cache, map_files, source_version
+
+DEFAULT_ROOTS = ('Shared', 'iOS', 'macOS')
+
+# Cache misses needed before scanning in a process pool
+PARALLEL_THRESHOLD = 300
+
+SUPPRESS = 'main-thread: ignore'
+
+# Cost of blocking the main thread, by kind of work
+CATEGORY_WEIGHT = {'network': 4, 'wait': 4, 'file': 2, 'json': 1}
+
+# Conformances SwiftUI isolates to the main actor
+MAIN_ACTOR_PROTOCOLS = {'View', 'App', 'Scene'}
+
+TYPE_KEYWORDS = {'class', 'struct', 'enum', 'actor', 'extension', 'protocol'}
+MODIFIERS = {
+    'public', 'private', 'fileprivate', 'internal', 'open', 'package', 'final', 'static', 'class',
+    'override', 'mutating', 'nonmutating', 'convenience', 'required', 'lazy', 'weak', 'unowned',
+    'dynamic', 'indirect', 'nonisolated', 'isolated', 'distributed', 'optional',
+}
+# Declarations that end a pending `var` accessor without a body of their own
+OTHER_DECLARATIONS = {'let', 'case', 'typealias', 'associatedtype', 'import', 'operator'}
+NOT_CALLS = {'if', 'guard', 'while', 'switch', 'for', 'return', 'catch', 'case', 'in', 'func', 'init',
+             'self', 'super', 'try', 'await', 'throw', 'as', 'is'}
+
+# Blocking APIs
+CONTENTS_TYPES = {'Data', 'NSData', 'String', 'NSString', 'NSDictionary', 'NSArray', 'UIImage', 'NSImage'}
+FILE_MANAGER_METHODS = {
+    'contentsOfDirectory', 'subpathsOfDirectory', 'createDirectory', 'createFile', 'removeItem',
+    'copyItem', 'moveItem', 'replaceItemAt', 'fileExists', 'attributesOfItem', 'setAttributes',
+}
+CODERS = {'JSONDecoder', 'JSONEncoder', 'PropertyListDecoder', 'PropertyListEncoder'}
+
+_SOURCE_VERSION = source_version(__name__)
+
+
+def _opening(tokens, index):
+    """Index of the bracket that the closing bracket at index matches"""
+    depth = 0
+    while index >= 0:
+        value = tokens[index][1]
+        if value in (')', ']', '}'):
+            depth += 1
+        elif value in ('(', '[', '{'):
+            depth -= 1
+            if depth == 0:
+                return index
+        index -= 1
+    return 0
+
+
+def _chain(tokens, index):
+    """Identifiers of the member chain ending at index: `DispatchQueue.global().async` ->
+    ['DispatchQueue', 'global', 'async']"""
+    chain = []
+    while index >= 0:
+        kind, value, _ = tokens[index]
+        if value in (')', ']'):
+            index = _opening(tokens, index) - 1
+            continue
+        if kind != 'ident' or value.startswith(('@', '#')):
+            break
+        chain.append(value)
+        index -= 1
+        if index < 0 or tokens[index][1] != '.':
+            break
+        index -= 1
+        if index >= 0 and tokens[index][1] in ('?', '!'):
+            index -= 1
+    return chain[::-1]
+
+
+def _closure_context(chain):
+    """Where a closure passed to chain runs: 'main', 'background' or None (where its caller does)"""
+    if not chain:
+        return None
+    if chain[0] == 'Task':
+        return 'background' if 'detached' in chain else None
+    if chain[0] in ('DispatchQueue', 'OperationQueue', 'Thread'):
+        return 'main' if 'main' in chain else 'background'
+    if chain[0] == 'MainActor' and chain[-1] == 'run':
+        return 'main'
+    if chain[-1] in ('dataTask', 'downloadTask', 'uploadTask'):
+        return 'background'
+    if len(chain) > 1 and chain[-1] in ('async', 'asyncAfter', 'addOperation') and 'queue' in chain[-2].lower():
+        return 'main' if 'main' in chain else 'background'
+    return None
+
+
+def _attributes(tokens, index):
+    """Attributes and modifiers in front of the declaration keyword at index"""
+    found = set()
+    index -= 1
+    while index >= 0:
+        value = tokens[index][1]
+        if value == ')':
+            index = _opening(tokens, index) - 1
+            continue
+        if not (value.startswith('@') or value in MODIFIERS):
+            break
+        found.add(value)
+        index -= 1
+    return found
+
+
+def _type_at(tokens, index):
+    """First type name at index, skipping `some`/`any`/attributes"""
+    while index < len(tokens) and (tokens[index][1] in ('some', 'any', 'inout') or tokens[index][1].startswith('@')):
+        index += 1
+    if index < len(tokens) and tokens[index][0] == 'ident':
+        return tokens[index][1]
+    return None
+
+
+def _declared_type(tokens, index):
+    """Type of a `var`/`let` from its annotation or a `Type(...)`/`Type.shared` initializer"""
+    if index >= len(tokens):
+        return None
+    if tokens[index][1] == ':':
+        return _type_at(tokens, index + 1)
+    if tokens[index][1] == '=':
+        index += 1
+        while index < len(tokens) and tokens[index][1] in ('try', 'await', '?', '!'):
+            index += 1
+        if index < len(tokens) and tokens[index][0] == 'ident' and tokens[index][1][:1].isupper():
+            return tokens[index][1]
+    return None
+
+
+def _parameters(tokens, start):
+    """(argument labels, {parameter name: type}) of the parameter list opening at start"""
+    segments = [[]]
+    depth = 0
+    for index in range(start + 1, len(tokens)):
+        value = tokens[index][1]
+        if value in ('(', '[', '{', '<'):
+            depth += 1
+        elif value in (')', ']', '}') or (value == '>' and tokens[index - 1][1] != '-'):
+            if depth == 0:
+                break
+            depth -= 1
+        elif value == ',' and depth == 0:
+            segments.append([])
+            continue
+        segments[-1].append(tokens[index])
+    labels = []
+    parameters = {}
+    for segment in segments:
+        values = [value for _, value, _ in segment]
+        if ':' not in values:
+            continue
+        colon = values.index(':')
+        names = [value for kind, value, _ in segment[:colon] if kind == 'ident' and not value.startswith('@')]
+        if not names:
+            continue
+        labels.append(names[0])
+        type_name = _type_at(segment, colon + 1)
+        if type_name:
+            parameters[names[-1]] = type_name
+    return labels, parameters
+
+
+def _blocking_api(tokens, index, chain, receiver_type=None):
+    """(category, API) when the call at index is a blocking API, else None"""
+    name = tokens[index][1]
+    label = tokens[index + 2][1] if index + 3 < len(tokens) and tokens[index + 3][1] == ':' else None
+    receiver = chain[-1] if chain else ''
+    if receiver_type in CODERS or receiver_type in ('DispatchSemaphore', 'DispatchGroup'):
+        receiver = receiver_type
+    if name in CONTENTS_TYPES and label in ('contentsOf', 'contentsOfFile'):
+        remote = [value for _, value, _ in tokens[index + 4:index + 8]] == ['URL', '(', 'string', ':']
+        return ('network' if remote else 'file'), f"{name}({label}:)"
+    if name == 'FileHandle' and label and label.startswith('for'):
+        return 'file', f"FileHandle({label}:)"
+    if name == 'write' and chain and label in ('to', 'toFile'):
+        return 'file', f"write({label}:)"
+    if name in FILE_MANAGER_METHODS and chain:
+        return 'file', f"FileManager.{name}"
+    if name in ('decode', 'encode') and (receiver in CODERS or 'decoder' in receiver.lower()
+                                         or 'encoder' in receiver.lower()):
+        coder = receiver if receiver in CODERS else ('JSONDecoder' if name == 'decode' else 'JSONEncoder')
+        return 'json', f"{coder}.{name}"
+    if receiver in ('JSONSerialization', 'PropertyListSerialization'):
+        return 'json', f"{receiver}.{name}"
+    if name == 'sendSynchronousRequest':
+        return 'network', 'NSURLConnection.sendSynchronousRequest'
+    if name == 'wait' and ('semaphore' in receiver.lower() or 'group' in receiver.lower()):
+        return 'wait', f"{receiver}.wait"
+    if (name == 'sleep' and chain == ['Thread']) or (name in ('sleep', 'usleep') and not chain):
+        return 'wait', '.'.join(chain + [name])
+    return None
+
+
+class _Scanner:
+    """One pass over a file's tokens, tracking the scope each token is in"""
+
+    def __init__(self, tokens, suppressed):
+        self.tokens = tokens
+        self.suppressed = suppressed
+        self.types = []
+        self.functions = []
+        self.scopes = []     # (kind, record): 'type', 'func' or 'closure' (record is its context)
+        self.brackets = []   # callee chain of each open ( and [
+        self.pending = None  # declaration waiting for its {
+
+    def value(self, index):
+        return self.tokens[index][1] if 0 <= index < len(self.tokens) else None
+
+    def innermost(self, kind):
+        for scope_kind, record in reversed(self.scopes):
+            if scope_kind == kind:
+                return record
+        return None
+
+    def context(self):
+        for kind, record in reversed(self.scopes):
+            if kind != 'closure':
+                return None
+            if record:
+                return record
+        return None
+
+    def run(self):
+        for index, (kind, value, _) in enumerate(self.tokens):
+            if value == '(':
+                self.brackets.append(_chain(self.tokens, index - 1))
+            elif value == '[':
+                self.brackets.append([])
+            elif value in (')', ']'):
+                if self.brackets:
+                    self.brackets.pop()
+            elif value == '{':
+                self.open(index)
+            elif value == '}':
+                if self.pending and len(self.scopes) <= self.pending['scope']:
+                    self.pending = None
+                if self.scopes:
+                    self.scopes.pop()
+            elif kind == 'ident':
+                self.identifier(index)
+        return {'types': self.types, 'functions': self.functions}
+
+    def declare(self, kind, index, name, **fields):
+        self.pending = dict(fields, kind=kind, name=name, line=self.tokens[index][2], modifiers=set(),
+                            attributes=_attributes(self.tokens, index),
+                            depth=len(self.brackets), scope=len(self.scopes), start=index)
+
+    def identifier(self, index):
+        value = self.value(index)
+        previous = self.value(index - 1)
+        following = self.value(index + 1)
+        pending = self.pending
+        if value == 'async' and pending and pending['kind'] == 'func' and len(self.brackets) == pending['depth']:
+            pending['modifiers'].add('async')
+        elif previous == 'func' or (previous == '.' and value == 'init'):
+            return
+        elif (value in TYPE_KEYWORDS and self.tokens[index + 1:index + 2] and self.tokens[index + 1][0] == 'ident'
+                and following not in MODIFIERS and following not in ('func', 'var', 'let', 'subscript', 'init')):
+            name_index = index + 1
+            while self.value(name_index + 1) == '.' and self.value(name_index + 2):
+                name_index += 2
+            self.declare('type', index, self.value(name_index), keyword=value)
+        elif value in ('func', 'subscript') or (value in ('init', 'deinit') and following in ('(', '?', '!', '<', '{')):
+            name = self.value(index + 1) if value == 'func' else value
+            start = index + 2 if value == 'func' else index + 1
+            if self.value(start) == '<':
+                while start < len(self.tokens) and self.value(start) != '(':
+                    start += 1
+            while self.value(start) in ('?', '!'):
+                start += 1
+            labels, parameters = _parameters(self.tokens, start) if self.value(start) == '(' else ([], {})
+            self.declare('func', index, name, labels=labels, parameters=parameters, accessor=False)
+        elif value in ('var', 'let'):
+            name = following if self.tokens[index + 1:index + 2] and self.tokens[index + 1][0] == 'ident' else None
+            declared = _declared_type(self.tokens, index + 2) if name else None
+            function = self.scopes and self.scopes[-1][0] != 'type' and self.innermost('func')
+            if name:
+                # Untyped names are kept too: a call on them is not guessed at
+                if function:
+                    function['locals'][name] = declared
+                elif self.innermost('type') is not None:
+                    self.innermost('type')['properties'][name] = declared
+            if value == 'var' and name and (not self.scopes or self.scopes[-1][0] == 'type'):
+                self.declare('func', index, name, labels=None, parameters={}, accessor=True)
+            elif pending and pending.get('accessor'):
+                self.pending = None
+        elif value in OTHER_DECLARATIONS:
+            if pending and pending.get('accessor'):
+                self.pending = None
+        elif following == '(' and value not in NOT_CALLS and not value.startswith(('@', '#')):
+            self.call(index)
+
+    def open(self, index):
+        pending = self.pending
+        if pending and len(self.brackets) == pending['depth'] and len(self.scopes) == pending['scope']:
+            self.pending = None
+            attributes = pending['attributes']
+            if pending['kind'] == 'type':
+                inherits = set()
+                for _, value, _ in self.tokens[pending['start'] + 2:index]:
+                    if value == 'where':
+                        break
+                    inherits.add(value)
+                record = {
+                    'name': pending['name'], 'kind': pending['keyword'], 'line': pending['line'],
+                    'main': '@MainActor' in attributes or bool(inherits & MAIN_ACTOR_PROTOCOLS),
+                    'properties': {},
+                }
+                self.types.append(record)
+                self.scopes.append(('type', record))
+                return
+            self.scopes.append(('func', self.function(pending)))
+            return
+        if self.value(index + 1) == '@MainActor':
+            context = 'main'
+        elif self.value(index - 1) in ('(', ',', ':') and self.brackets:
+            context = _closure_context(self.brackets[-1])
+        else:
+            context = _closure_context(_chain(self.tokens, index - 1))
+        self.scopes.append(('closure', context))
+
+    def function(self, pending):
+        attributes = pending['attributes']
+        owner = self.innermost('type')
+        enclosing = next((kind for kind, _ in reversed(self.scopes) if kind != 'closure'), None)
+        if enclosing == 'func':
+            # A local function is isolated like the function around it
+            inherited = self.innermost('func')['isolation']
+        elif owner is not None:
+            inherited = 'main' if owner['main'] else 'actor' if owner['kind'] == 'actor' else None
+        else:
+            inherited = None
+        isolation = 'main' if '@MainActor' in attributes else 'nonisolated' if 'nonisolated' in attributes \
+            else inherited
+        name = pending['name']
+        labels = pending['labels']
+        record = {
+            'name': name,
+            'display': name if labels is None else f"{name}({''.join(label + ':' for label in labels)})",
+            'labels': labels,
+            'owner': owner['name'] if owner is not None else None,
+            'line': pending['line'],
+            'isolation': isolation,
+            'async': 'async' in pending['modifiers'],
+            'locals': dict(pending['parameters']),
+            'calls': [],
+            'sinks': [],
+        }
+        self.functions.append(record)
+        return record
+
+    def call(self, index):
+        function = self.innermost('func')
+        if function is None:
+            return
+        chain = _chain(self.tokens, index)[:-1]
+        if self.value(index - 1) == '.' and not chain:
+            return  # implicit member (`.success(value)`), not a call into project code
+        line = self.tokens[index][2]
+        api = _blocking_api(self.tokens, index, chain, function['locals'].get(chain[-1]) if chain else None)
+        if api is None:
+            # First argument label: None without arguments, '_' when unlabelled
+            label = None if self.value(index + 2) == ')' else (
+                self.value(index + 2) if self.value(index + 3) == ':' else '_')
+            function['calls'].append([self.value(index), chain, line, self.context(), label])
+        elif line not in self.suppressed and line - 1 not in self.suppressed:
+            function['sinks'].append([api[0], api[1], line, self.context()])
+
+
+def scan_source(text):
+    """Types and functions of one Swift file, with their calls and blocking APIs
+
+    Returns {'types': [...], 'functions': [...]}; each call is
+    [name, receiver chain, line, context, first argument label] and each blocking API
+    [category, API, line, context], where context is where the enclosing
+    closure runs ('main', 'background' or None for the function's own).
+    """
+    tokens = tokenize(text)
+    suppressed = {line for kind, value, line in tokens if kind == 'comment' and SUPPRESS in value}
+    return _Scanner([token for token in tokens if token[0] != 'comment'], suppressed).run()
+
+
+def _scan_file(path):
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return scan_source(f.read())
+
+
+def swift_sources(roots=DEFAULT_ROOTS, base='.'):
+    """App Swift files under roots; test targets are skipped"""
+    return [
+        path.as_posix() for root in roots for path in sorted(Path(base, root).rglob('*.swift'))
+        if not any(part.endswith('Tests') or part == '.build' for part in path.parts)
+    ]
+
+
+class CallGraph:
+    """Functions of all scanned files, with name-based call resolution"""
+
+    def __init__(self, scans):
+        self.types = {}
+        self.functions = {}
+        self.methods = defaultdict(list)   # (owner, name) -> function ids
+        self.free = defaultdict(list)      # name -> function ids
+        self.owners = defaultdict(set)     # method name -> owners declaring it
+        for path, scan in sorted(scans.items()):
+            for record in scan['types']:
+                entry = self.types.setdefault(record['name'], {'main': False, 'actor': False, 'properties': {}})
+                if record['kind'] != 'extension':
+                    entry['main'] = entry['main'] or record['main']
+                    entry['actor'] = entry['actor'] or record['kind'] == 'actor'
+                entry['properties'].update(record['properties'])
+            for position, record in enumerate(scan['functions']):
+                function_id = f"{path}#{position}"
+                self.functions[function_id] = dict(record, path=path)
+                if record['owner']:
+                    self.methods[(record['owner'], record['name'])].append(function_id)
+                    self.owners[record['name']].add(record['owner'])
+                else:
+                    self.free[record['name']].append(function_id)
+
+    def isolation(self, function_id):
+        """'main', 'actor' or None (runs wherever it is called from)"""
+        function = self.functions[function_id]
+        if function['isolation'] == 'nonisolated':
+            return None
+        if function['isolation']:
+            return function['isolation']
+        owner = self.types.get(function['owner'])
+        if owner:
+            return 'main' if owner['main'] else 'actor' if owner['actor'] else None
+        return None
+
+    def name(self, function_id):
+        function = self.functions[function_id]
+        return f"{function['owner']}.{function['display']}" if function['owner'] else function['display']
+
+    def _property(self, type_name, name):
+        return self.types.get(type_name, {}).get('properties', {}).get(name)
+
+    def _matching(self, candidates, label):
+        """Candidates whose parameters can take a call whose first argument label is label"""
+        return [
+            function_id for function_id in candidates
+            if label is None or self.functions[function_id]['labels'] is None
+            or label in self.functions[function_id]['labels']
+        ]
+
+    def resolve(self, function_id, call):
+        """Function ids a call may reach"""
+        name, chain, label = call[0], call[1], call[4]
+        function = self.functions[function_id]
+        if name[:1].isupper():
+            return self._matching(self.methods.get((name, 'init'), []), label)
+        if chain and chain[0] == 'self':
+            current, chain = function['owner'], chain[1:]
+        else:
+            current = None
+        if not chain:
+            candidates = self.methods.get((current or function['owner'], name)) or (
+                [] if current else self.free.get(name, []))
+            return self._matching(candidates, label)
+        undeclared = False
+        for position, ident in enumerate(chain):
+            if ident[:1].isupper():
+                current = ident
+            elif position == 0 and current is None:
+                properties = self.types.get(function['owner'], {}).get('properties', {})
+                if ident in function['locals']:
+                    current = function['locals'][ident]
+                elif ident in properties:
+                    current = properties[ident]
+                else:
+                    undeclared = True
+            else:
+                current = self._property(current, ident)
+            if current is None:
+                break
+        if current is None:
+            # A receiver declared nowhere in view (an inherited or environment
+            # property): follow only a method name that one project type declares
+            owners = self.owners.get(name, ())
+            if undeclared and len(chain) == 1 and len(owners) == 1:
+                return self._matching(self.methods[(next(iter(owners)), name)], label)
+            return []
+        return self._matching(self.methods.get((current, name), []), label)
+
+    def reach(self, start, closures_only=False):
+        """{function id: call chain} of what runs on the main thread from start, and
+        [(function id, blocking API)] found there. With closures_only, start is not
+        main-actor code and only its main-thread closures are followed."""
+        chains = {start: [start]}
+        found = []
+        queue = deque([start])
+        while queue:
+            function_id = queue.popleft()
+            function = self.functions[function_id]
+            contexts = ('main',) if closures_only and function_id == start else (None, 'main')
+            found.extend((function_id, sink) for sink in function['sinks'] if sink[3] in contexts)
+            for call in function['calls']:
+                if call[3] not in contexts:
+                    continue
+                for callee in self.resolve(function_id, call):
+                    isolation = self.isolation(callee)
+                    # Actor methods and nonisolated async functions leave the main thread
+                    if callee in chains or isolation == 'actor':
+                        continue
+                    if isolation != 'main' and self.functions[callee]['async']:
+                        continue
+                    chains[callee] = chains[function_id] + [callee]
+                    queue.append(callee)
+        return chains, found
+
+
+def analyze(scans):
+    """Blocking APIs reachable from the main actor, highest priority first"""
+    graph = CallGraph(scans)
+    roots = [(function_id, False) for function_id in graph.functions if graph.isolation(function_id) == 'main']
+    roots += [
+        (function_id, True) for function_id, function in graph.functions.items()
+        if graph.isolation(function_id) != 'main'
+        and any(item[3] == 'main' for item in function['calls'] + function['sinks'])
+    ]
+
+    reached_by = defaultdict(dict)   # (function id, line, API) -> {root: chain}
+    sinks = {}
+    called = set()                   # main-thread functions other main-thread code calls
+    for root, closures_only in roots:
+        chains, found = graph.reach(root, closures_only)
+        called.update(function_id for function_id in chains if function_id != root)
+        for function_id, sink in found:
+            key = (function_id, sink[2], sink[1])
+            sinks[key] = sink
+            reached_by[key][(root, closures_only)] = chains[function_id]
+
+    findings = []
+    for key, by_root in reached_by.items():
+        function_id, line, api = key
+        entries = {root: chain for root, chain in by_root.items() if root[0] not in called} or by_root
+        (root, closures_only), chain = min(entries.items(), key=lambda item: (len(item[1]), item[1]))
+        names = [graph.name(function_id) for function_id in chain]
+        if closures_only:
+            names[0] += ' (main-thread closure)'
+        category = sinks[key][0]
+        findings.append({
+            'category': category,
+            'api': api,
+            'path': graph.functions[function_id]['path'],
+            'line': line,
+            'function': graph.name(function_id),
+            'entry_points': len(entries),
+            'chain': names,
+            'score': CATEGORY_WEIGHT[category] * len(entries),
+        })
+    findings.sort(key=lambda f: (-f['score'], -CATEGORY_WEIGHT[f['category']], f['path'], f['line']))
+    return findings
+
+
+def detect(roots=DEFAULT_ROOTS, base='.', cache=True):
+    """(findings, files scanned, seconds) for the Swift sources under roots"""
+    started = time.perf_counter()
+    with tracing.span('walk sources', 'fs'):
+        paths = swift_sources(roots, base)
+    scans = map_files(_scan_file, paths, Cache('mainthread') if cache else None,
+                      version=_SOURCE_VERSION, parallel_threshold=PARALLEL_THRESHOLD)
+    with tracing.span('call graph', 'compute', files=len(scans)):
+        findings = analyze(scans)
+    return findings, len(scans), time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Find blocking file, JSON and network work on the main thread')
+    parser.add_argument('roots', nargs='*', default=list(DEFAULT_ROOTS), help='Directories to scan')
+    parser.add_argument('--category', action='append', choices=sorted(CATEGORY_WEIGHT),
+                        help='Only report these kinds of work (repeatable)')
+    parser.add_argument('--format', choices=['text', 'github', 'json'], default='text',
+                        help='github prints workflow annotations')
+    parser.add_argument('--strict', action='store_true', help='Exit 1 when anything is reported')
+    parser.add_argument('--no-cache', action='store_true', help='Re-scan every file')
+    args = parser.parse_args(argv)
+
+    findings, files, seconds = detect(args.roots, cache=not args.no_cache)
+    if args.category:
+        findings = [finding for finding in findings if finding['category'] in args.category]
+
+    if args.format == 'json':
+        print(json.dumps({'findings': findings, 'files': files}, indent=2))
+        return 1 if args.strict and findings else 0
+
+    for rank, finding in enumerate(findings, 1):
+        path = ' → '.join(finding['chain'])
+        if args.format == 'github':
+            print(f"::warning file={finding['path']},line={finding['line']},title=Main-thread {finding['category']}::"
+                  f"{finding['api']} blocks the main thread via {path}")
+            continue
+        icon = {4: '🔴', 2: '🟠'}.get(CATEGORY_WEIGHT[finding['category']], '🟡')
+        print(f"{icon} {rank}. [{finding['category']}] {finding['api']} in {finding['function']}")
+        print(f"     {finding['path']}:{finding['line']}, "
+              f"from {finding['entry_points']} main-actor entry point(s), e.g.:")
+        print(f"     {path}")
+
+    if not findings:
+        print(f"✅ No blocking I/O reachable from the main actor in {files} files")
+    else:
+        counts = defaultdict(int)
+        for finding in findings:
+            counts[finding['category']] += 1
+        functions = len({(finding['path'], finding['function']) for finding in findings})
+        print()
+        print(f"📊 {len(findings)} blocking call(s) on the main thread in {functions} function(s): "
+              + ', '.join(f"{category} {count}" for category, count in sorted(counts.items())))
+    print(f"⏱️  Analyzed {files} files in {seconds * 1000:.0f} ms")
+    return 1 if args.strict and findings else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
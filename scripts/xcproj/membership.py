@@ -0,0 +1,382 @@
+"""
+Target membership of platform-exclusive Shared files
+
+Every file under Shared/ is added to both the iOS and the macOS Sources
+phase (see add.determine_targets). A file whose code sits entirely inside
+`#if os(iOS)` (or `os(macOS)`, `canImport(AppKit)`, ...) compiles to
+nothing on the other platform, yet that target still runs a frontend job
+for it: the file is read, lexed and its inactive regions skipped on every
+clean build. This tool finds those files from their conditional-compilation
+structure and, with --fix, moves them to the one target that needs them.
+
+Each `#if`/`#elseif`/`#else` branch condition is evaluated per platform in
+three-valued logic: `os()` is always known, `canImport()` is known for
+UIKit and AppKit, `targetEnvironment(macCatalyst)` is false (the macOS
+target is native AppKit), and anything else (`DEBUG`, `swift(>=...)`) is
+unknown. Code under an unknown condition counts as compiled, so a file is
+only reported when its code is excluded on a platform for certain.
+Imports don't count as code: `import SwiftUI` above an `#if os(iOS)`
+block compiles to nothing either.
+
+File scans are cached by content hash under .cache/xcproj/. The fix is one
+ProjectEditor batch: each wasted PBXBuildFile is removed from the other
+target's Sources phase (and deleted unless another phase lists it), and
+project.pbxproj is written once.
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+from .accessibility import tokenize
+from .cache import Cache, map_files, source_version
+from .session import open_project
+from .sources import DEFAULT_PROJECT
+from .writer import ProjectEditor
+
+PLATFORMS = ('iOS', 'macOS')
+
+# What each platform's app target answers for os() and canImport()
+OPERATING_SYSTEMS = {'iOS': {'iOS'}, 'macOS': {'macOS', 'OSX'}}
+IMPORTABLE = {'iOS': {'UIKit'}, 'macOS': {'AppKit', 'Cocoa'}}
+# Modules whose availability is known on every platform above
+PLATFORM_MODULES = {'UIKit', 'AppKit', 'Cocoa'}
+
+# Cache misses needed before scanning in a process pool
+PARALLEL_THRESHOLD = 300
+
+_DIRECTIVES = ('#if', '#elseif', '#else', '#endif')
+_DECLARATION_KINDS = ('typealias', 'struct', 'class', 'enum', 'protocol', 'let', 'var', 'func')
+_CONDITION_TOKEN = re.compile(r'\s*(\|\||&&|[!(),]|[^\s!(),&|]+)')
+
+_SOURCE_VERSION = source_version(__name__)
+
+
+def _and(a, b):
+    if a is False or b is False:
+        return False
+    return None if a is None or b is None else True
+
+
+def _or(a, b):
+    if a is True or b is True:
+        return True
+    return None if a is None or b is None else False
+
+
+def _not(a):
+    return None if a is None else not a
+
+
+class _Condition:
+    """Recursive-descent evaluation of one #if condition for one platform"""
+
+    def __init__(self, text, platform):
+        self.tokens = _CONDITION_TOKEN.findall(text)
+        self.platform = platform
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def evaluate(self):
+        value = self.disjunction()
+        # Trailing tokens mean a condition this parser doesn't understand
+        return value if self.peek() is None else None
+
+    def disjunction(self):
+        value = self.conjunction()
+        while self.peek() == '||':
+            self.take()
+            value = _or(value, self.conjunction())
+        return value
+
+    def conjunction(self):
+        value = self.unary()
+        while self.peek() == '&&':
+            self.take()
+            value = _and(value, self.unary())
+        return value
+
+    def unary(self):
+        if self.peek() == '!':
+            self.take()
+            return _not(self.unary())
+        return self.primary()
+
+    def primary(self):
+        token = self.take()
+        if token == '(':
+            value = self.disjunction()
+            if self.take() != ')':
+                return None
+            return value
+        if token in ('true', 'false'):
+            return token == 'true'
+        if self.peek() != '(':
+            return None  # A compilation flag such as DEBUG
+        self.take()
+        argument = []
+        depth = 1
+        while self.peek() is not None:
+            part = self.take()
+            depth += {'(': 1, ')': -1}.get(part, 0)
+            if depth == 0:
+                break
+            argument.append(part)
+        return self.platform_test(token, ''.join(argument))
+
+    def platform_test(self, name, argument):
+        if name == 'os':
+            return argument in OPERATING_SYSTEMS[self.platform]
+        if name == 'canImport' and argument in PLATFORM_MODULES:
+            return argument in IMPORTABLE[self.platform]
+        if name == 'targetEnvironment' and argument == 'macCatalyst':
+            return False
+        return None
+
+
+def evaluate(condition, platform):
+    """True, False or None (unknown) for an #if condition on a platform"""
+    return _Condition(condition, platform).evaluate()
+
+
+def _skip_import(tokens, index):
+    """Index after an import declaration starting at index, or None if there is none"""
+    while index < len(tokens) and tokens[index][1].startswith('@'):
+        index += 1
+        if index < len(tokens) and tokens[index][1] == '(':
+            while index < len(tokens) and tokens[index][1] != ')':
+                index += 1
+            index += 1
+    if index >= len(tokens) or tokens[index][1] != 'import':
+        return None
+    index += 1
+    if index < len(tokens) and tokens[index][1] in _DECLARATION_KINDS:
+        index += 1
+    index += 1  # module name
+    while index + 1 < len(tokens) and tokens[index][1] == '.' and tokens[index + 1][0] == 'ident':
+        index += 2
+    return index
+
+
+def scan_source(text):
+    """Platforms on which any code of the file may compile
+
+    Returns {'compiles': [platform], 'lines': n}; a file with no code at
+    all compiles on no platform.
+    """
+    tokens = [token for token in tokenize(text) if token[0] != 'comment']
+    # Per open #if: (value of the current branch, whether an earlier branch was taken), per platform
+    stack = []
+    compiles = set()
+    index = 0
+    while index < len(tokens):
+        _, value, line = tokens[index]
+        if value in _DIRECTIVES:
+            end = index + 1
+            while end < len(tokens) and tokens[end][2] == line and tokens[end][1] not in _DIRECTIVES:
+                end += 1
+            condition = ''.join(token[1] for token in tokens[index + 1:end])
+            if value == '#if':
+                branch = {p: evaluate(condition, p) for p in PLATFORMS}
+                stack.append((branch, dict(branch)))
+            elif stack and value == '#elseif':
+                _, taken = stack[-1]
+                tested = {p: evaluate(condition, p) for p in PLATFORMS}
+                stack[-1] = ({p: _and(_not(taken[p]), tested[p]) for p in PLATFORMS},
+                             {p: _or(taken[p], tested[p]) for p in PLATFORMS})
+            elif stack and value == '#else':
+                _, taken = stack[-1]
+                stack[-1] = ({p: _not(taken[p]) for p in PLATFORMS}, {p: True for p in PLATFORMS})
+            elif stack and value == '#endif':
+                stack.pop()
+            index = end
+            continue
+        after_import = _skip_import(tokens, index)
+        if after_import is not None:
+            index = after_import
+            continue
+        for platform in PLATFORMS:
+            active = True
+            for branch, _ in stack:
+                active = _and(active, branch[platform])
+            if active is not False:
+                compiles.add(platform)
+        if len(compiles) == len(PLATFORMS):
+            break
+        index += 1
+    return {'compiles': [p for p in PLATFORMS if p in compiles], 'lines': text.count('\n') + 1}
+
+
+def _scan_file(path):
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return scan_source(f.read())
+
+
+def compiled_platforms(path):
+    """Platforms a Swift file has code for, or None when it can't be read"""
+    try:
+        return _scan_file(path)['compiles']
+    except OSError:
+        return None
+
+
+def sources_phases(project):
+    """{platform: Sources phase id} of the app targets, matched by target name suffix"""
+    phases = {}
+    for target_id in project.targets():
+        name = project.display_name(target_id)
+        for platform in PLATFORMS:
+            if name.endswith(platform) and platform not in phases:
+                phase_id = project.build_phase(target_id, 'PBXSourcesBuildPhase')
+                if phase_id is not None:
+                    phases[platform] = phase_id
+    return phases
+
+
+def analyze(project, root='.', cache=True, files=None):
+    """Files compiled by every app target that only have code for one platform
+
+    Pass a FileIndex of root to check which files exist without a stat each.
+
+    Returns (phases, members, findings): {platform: phase id}, {platform:
+    number of Swift files}, and per finding {'path', 'platform' (the one
+    that needs it), 'wasted' (targets compiling it for nothing), 'lines',
+    'bytes', 'build_files' {platform: build file id}}.
+    """
+    phases = sources_phases(project)
+    paths = project.file_paths()
+    build_files = {}  # path -> {platform: build file id}
+    for platform, phase_id in phases.items():
+        for build_file_id, file_ref_id in project.phase_file_refs(phase_id):
+            path = paths.get(file_ref_id)
+            if path and path.endswith('.swift'):
+                build_files.setdefault(path, {})[platform] = build_file_id
+    members = {platform: sum(platform in found for found in build_files.values()) for platform in phases}
+
+    shared = {
+        str(Path(root, path)): path for path, found in build_files.items()
+        if len(found) > 1 and (path in files if files is not None else Path(root, path).is_file())
+    }
+    scans = map_files(
+        _scan_file, sorted(shared), cache=Cache('membership') if cache else None,
+        version=_SOURCE_VERSION, parallel_threshold=PARALLEL_THRESHOLD,
+    )
+
+    findings = []
+    for disk_path, scan in sorted(scans.items()):
+        found = build_files[shared[disk_path]]
+        needed = [platform for platform in scan['compiles'] if platform in found]
+        # Files with no code anywhere are left alone: dropping them from
+        # every target is a decision for a person, not for this tool
+        if len(needed) != 1:
+            continue
+        findings.append({
+            'path': shared[disk_path],
+            'platform': needed[0],
+            'wasted': sorted(platform for platform in found if platform != needed[0]),
+            'lines': scan['lines'],
+            'bytes': Path(disk_path).stat().st_size,
+            'build_files': found,
+        })
+    return phases, members, findings
+
+
+def wasted_by_target(findings):
+    """{platform: (files, lines, bytes)} compiled for nothing"""
+    totals = {}
+    for finding in findings:
+        for platform in finding['wasted']:
+            files, lines, size = totals.get(platform, (0, 0, 0))
+            totals[platform] = (files + 1, lines + finding['lines'], size + finding['bytes'])
+    return totals
+
+
+def fix(editor, phases, findings):
+    """Record the edits giving each finding single-target membership; returns the removed memberships"""
+    project = editor.project
+    other_phases = [phase_id for phase_id in project.ids() if project.isa(phase_id).endswith('BuildPhase')]
+    removed = 0
+    for finding in findings:
+        for platform in finding['wasted']:
+            build_file_id = finding['build_files'][platform]
+            editor.remove_child(phases[platform], 'files', build_file_id)
+            removed += 1
+            # Projects edited by add.py before it made one per phase can list a build file in both
+            if not any(build_file_id in editor.get(phase_id).get('files', [])
+                       for phase_id in other_phases if phase_id != phases[platform]):
+                editor.remove_object(build_file_id)
+    return removed
+
+
+def _size(count):
+    return f"{count / 1024:.1f} KB" if count >= 1024 else f"{count} B"
+
+
+def print_report(members, findings):
+    if not findings:
+        print('✅ Every file compiled by several app targets has code for each of them')
+        return
+    print(f"🎯 {len(findings)} Shared files compile to nothing on one of their targets:")
+    for finding in findings:
+        print(f"  - {finding['path']} ({finding['lines']} lines): {finding['platform']} only, "
+              f"also compiled by {', '.join(finding['wasted'])}")
+    print()
+    for platform, (files, lines, size) in sorted(wasted_by_target(findings).items()):
+        print(f"⏱️  {platform}: {files} of {members[platform]} Swift files compile to nothing "
+              f"({lines} lines, {_size(size)}), one frontend job each per clean build")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Move platform-exclusive Shared files to single-target membership')
+    parser.add_argument('--project', default=DEFAULT_PROJECT, help='Path to project.pbxproj')
+    parser.add_argument('--fix', action='store_true', help='Remove each file from the target it compiles to nothing on')
+    parser.add_argument('--dry-run', action='store_true', help='With --fix, show the edits without writing them')
+    parser.add_argument('--format', choices=['text', 'json'], default='text')
+    parser.add_argument('--strict', action='store_true', help='Exit 1 when files are found (and not fixed)')
+    parser.add_argument('--no-cache', action='store_true', help='Re-scan every file')
+    args = parser.parse_args(argv)
+
+    if not Path(args.project).exists():
+        print(f"❌ Project file not found: {args.project}")
+        return 1
+    root = Path(args.project).parent.parent
+    with open_project(args.project) as project:
+        phases, members, findings = analyze(project, root, cache=not args.no_cache)
+        if len(phases) < len(PLATFORMS):
+            print(f"❌ No Sources phase for {', '.join(p for p in PLATFORMS if p not in phases)} in {args.project}")
+            return 1
+
+        if args.format == 'json':
+            print(json.dumps({
+                'files': [{key: value for key, value in finding.items() if key != 'build_files'}
+                          for finding in findings],
+                'wasted': {platform: dict(zip(('files', 'lines', 'bytes'), totals))
+                           for platform, totals in wasted_by_target(findings).items()},
+            }, indent=2))
+        else:
+            print_report(members, findings)
+
+        if args.fix and findings:
+            editor = ProjectEditor(project)
+            removed = fix(editor, phases, findings)
+            if args.dry_run:
+                print(f"\n🔍 [DRY RUN] Would remove {removed} target membership(s)", file=sys.stderr)
+            else:
+                editor.write(args.project)
+                print(f"\n✅ Removed {removed} target membership(s) from {args.project}", file=sys.stderr)
+            return 0
+
+    return 1 if args.strict and findings else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""
+Three-way merge of project.pbxproj
+
+Used as a git merge driver. Base, ours and theirs are indexed (not parsed)
+and compared object by object on their raw bytes; only objects changed on
+both sides are decoded and merged key by key:
+
+- lists (group children, phase files, targets) merge as ordered sets, so
+  two branches that each add files to the same group both keep their files
+- dictionaries (buildSettings) merge recursively
+- scalars merge when only one side changed them
+
+The result is applied to ours with ProjectEditor, so untouched objects stay
+byte-for-byte and merged objects are written in Xcode's canonical format.
+Anything that can't be merged by meaning - the same setting changed to two
+different values, an object edited on one side and deleted on the other, a
+reference to an object the other side removed - is a real conflict, and the
+file is handed to `git merge-file` for ordinary conflict markers.
+"""
+
+import re
+import subprocess
+import sys
+import time
+
+from .pbxproj import PBXProject, PlistError
+from .writer import SECTION_MARKER, ProjectEditor
+
+OBJECT_ID = re.compile(r'[0-9A-F]{24}')
+
+
+class MergeConflict(Exception):
+    """A change that can't be merged without a human"""
+
+
+def merge_lists(base, ours, theirs):
+    """Merge lists as ordered sets: keep ours' order, apply theirs' additions and removals"""
+    base_items = set(base)
+    ours_items = set(ours)
+    removed = base_items - set(theirs)
+    merged = [item for item in ours if item not in removed]
+
+    previous = None
+    for item in theirs:
+        if item not in base_items and item not in ours_items:
+            # Insert after the item it followed in theirs, if we still have it
+            position = merged.index(previous) + 1 if previous in merged else len(merged)
+            merged.insert(position, item)
+            ours_items.add(item)
+        previous = item
+    return merged
+
+
+def merge_values(base, ours, theirs, where):
+    """Three-way merge of two plist values that both sides changed"""
+    if ours == theirs:
+        return ours
+    if ours == base:
+        return theirs
+    if theirs == base:
+        return ours
+    if isinstance(ours, list) and isinstance(theirs, list) and isinstance(base, (list, type(None))):
+        return merge_lists(base or [], ours, theirs)
+    if isinstance(ours, dict) and isinstance(theirs, dict) and isinstance(base, (dict, type(None))):
+        return merge_dicts(base or {}, ours, theirs, where)
+    raise MergeConflict(f"{where} changed on both sides: {ours!r} vs {theirs!r}")
+
+
+def merge_dicts(base, ours, theirs, where):
+    """Merge key by key; a key deleted on one side and untouched on the other stays deleted"""
+    merged = {}
+    for key in list(ours) + [key for key in theirs if key not in ours]:
+        value = merge_values(base.get(key), ours.get(key), theirs.get(key), f"{where}.{key}")
+        if value is not None:
+            merged[key] = value
+    return merged
+
+
+def _envelope(project):
+    """Everything outside the objects, ignoring section markers"""
+    ids = project.ids()
+    if not ids:
+        return bytes(project.data)
+    first = project.span(ids[0])[0]
+    last = project.span(ids[-1])[1]
+    data = project.data
+    return SECTION_MARKER.sub(b'', data[:first]) + SECTION_MARKER.sub(b'', data[last:])
+
+
+def _references(value):
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _references(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _references(item)
+    elif isinstance(value, str) and OBJECT_ID.fullmatch(value):
+        yield value
+
+
+def merge_projects(base, ours, theirs):
+    """Return a ProjectEditor applying theirs' changes on top of ours
+
+    Raises MergeConflict when the revisions can't be merged by meaning.
+    """
+    theirs_envelope = _envelope(theirs)
+    if theirs_envelope != _envelope(base) and theirs_envelope != _envelope(ours):
+        # objectVersion, rootObject etc. - rare enough to leave to a line merge
+        raise MergeConflict("their side changed the project header (archive/object version or rootObject)")
+
+    editor = ProjectEditor(ours)
+    touched = []
+    for object_id in theirs.ids():
+        theirs_raw = theirs.raw(object_id)
+        in_base = object_id in base
+        if in_base and base.raw(object_id) == theirs_raw:
+            continue  # theirs didn't change it
+        if object_id in ours and ours.raw(object_id) == theirs_raw:
+            continue  # both made the same change
+
+        theirs_obj = theirs.get(object_id)
+        if object_id not in ours:
+            if in_base:
+                if base.get(object_id) != theirs_obj:
+                    raise MergeConflict(f"{object_id} ({theirs.comment(object_id)}) edited by them, removed by us")
+                continue
+            editor.add_object(object_id, theirs_obj, comment=theirs.comment(object_id))
+            touched.append(object_id)
+            continue
+
+        base_obj = base.get(object_id) if in_base else {}
+        ours_obj = ours.get(object_id)
+        if base_obj == theirs_obj or ours_obj == theirs_obj:
+            continue  # only formatting differs
+        name = f"{ours.comment(object_id)} ({object_id})"
+        merged = merge_values(base_obj, ours_obj, theirs_obj, name)
+        if merged != ours_obj:
+            comment = theirs.comment(object_id) if ours_obj == base_obj else None
+            editor.update_object(object_id, merged, comment=comment)
+            touched.append(object_id)
+
+    removed = []
+    for object_id in base.ids():
+        if object_id in theirs or object_id not in ours:
+            continue
+        if ours.raw(object_id) != base.raw(object_id) and ours.get(object_id) != base.get(object_id):
+            raise MergeConflict(f"{object_id} ({ours.comment(object_id)}) edited by us, removed by them")
+        editor.remove_object(object_id)
+        removed.append(object_id)
+
+    # Objects that only one side references may have been deleted by the other
+    for object_id in touched:
+        for reference in _references(editor.get(object_id)):
+            if reference not in editor:
+                raise MergeConflict(f"{object_id} refers to {reference}, which was removed")
+    return editor, removed
+
+
+def merged_bytes(editor, removed):
+    """Render the merge, checking nothing still refers to a removed object"""
+    output = b''.join(editor.chunks())
+    for object_id in removed:
+        if object_id.encode('ascii') in output:
+            raise MergeConflict(f"{object_id} was removed by them but is still referenced by us")
+    return output
+
+
+def merge_file(base_path, ours_path, theirs_path):
+    """Merge theirs into ours_path in place; return True on a clean merge"""
+    with open(ours_path, 'rb') as f:
+        ours_data = f.read()
+    with open(theirs_path, 'rb') as f:
+        theirs_data = f.read()
+    with open(base_path, 'rb') as f:
+        base_data = f.read()
+
+    if theirs_data == base_data or theirs_data == ours_data:
+        return True
+    if ours_data == base_data:
+        with open(ours_path, 'wb') as f:
+            f.write(theirs_data)
+        return True
+
+    editor, removed = merge_projects(PBXProject(base_data), PBXProject(ours_data), PBXProject(theirs_data))
+    output = merged_bytes(editor, removed)
+    with open(ours_path, 'wb') as f:
+        f.write(output)
+    return True
+
+
+def install():
+    """Register the driver in this clone's git config"""
+    subprocess.run(['git', 'config', 'merge.pbxproj.name', 'project.pbxproj three-way merge'], check=True)
+    subprocess.run([
+        'git', 'config', 'merge.pbxproj.driver', 'python3 scripts/pbxmerge.py %O %A %B %P'
+    ], check=True)
+    print("✅ Registered the pbxproj merge driver (see .gitattributes)")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv == ['--install']:
+        install()
+        return 0
+    if len(argv) not in (3, 4):
+        print("Usage: pbxmerge.py BASE OURS THEIRS [PATH]  |  pbxmerge.py --install", file=sys.stderr)
+        return 2
+
+    base_path, ours_path, theirs_path = argv[:3]
+    name = argv[3] if len(argv) == 4 else ours_path
+    started = time.perf_counter()
+    try:
+        merge_file(base_path, ours_path, theirs_path)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"✅ {name}: merged by object in {elapsed:.0f} ms", file=sys.stderr)
+        return 0
+    except (MergeConflict, PlistError, UnicodeDecodeError, ValueError) as e:
+        print(f"⚠️  {name}: {e}", file=sys.stderr)
+        print("   Falling back to a line-based merge with conflict markers", file=sys.stderr)
+
+    # git merge-file writes the textual merge into ours and exits with the conflict count
+    result = subprocess.run([
+        'git', 'merge-file', '-L', 'ours', '-L', 'base', '-L', 'theirs',
+        ours_path, base_path, theirs_path,
+    ])
+    return 1 if result.returncode != 0 else 0
@@ -0,0 +1,502 @@
+"""
+Module split advisor for Shared/
+
+Shared/ compiles into each app target as one module, so a change anywhere
+rebuilds all of it and the compiler can't overlap its parts. This tool
+builds the type-level dependency graph of Shared/ and proposes a split
+into Swift Package modules:
+
+1. Each file is scanned (comments and strings stripped) for the types it
+   declares, the types it extends, and the capitalized names each
+   top-level declaration uses. Names declared in more than one file
+   (nested CodingKeys and the like) are ambiguous and ignored.
+2. Type-level edges are folded into file-level edges. Files in one strongly
+   connected component (Tarjan) must share a module, since SwiftPM doesn't
+   allow cyclic module dependencies.
+3. Components start in the module of their directory (Shared/<Dir>,
+   one level deeper for directories over --split-above of the code).
+   Modules are ordered by the average dependency layer of their files; a
+   component that depends on a module later in that order pulls its
+   dependencies down into its own module, so the module graph is acyclic.
+4. A refinement pass moves single components between modules when that
+   removes cross-module edges without breaking the order.
+
+Compile cost is estimated from non-blank lines plus a fixed per-module
+overhead; the critical path is the most expensive chain of dependent
+modules, and parallel width is total cost over critical path. File scans
+are cached by content hash, and the graph work is linear, so the advisor
+is fast enough to run on every pull request.
+"""
+
+import argparse
+import re
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from . import tracing
+from .cache import Cache, map_files, source_version
+from .sources import find_swift_files_in_filesystem
+
+DEFAULT_ROOT = 'Shared'
+
+# Cache misses needed before scanning in a process pool
+PARALLEL_THRESHOLD = 300
+
+# Estimated fixed cost of a module (driver, module emission, linking), in lines
+MODULE_OVERHEAD = 150
+
+# Directories with more than this share of the code are split by subdirectory
+SPLIT_ABOVE = 0.25
+
+REFINE_PASSES = 4
+
+_STRIP = re.compile(r'//[^\n]*|/\*.*?\*/|"""(?:.|\n)*?"""|"(?:[^"\\\n]|\\.)*"', re.S)
+_DECLARATION = re.compile(r'\b(class|struct|enum|protocol|actor|typealias|extension)\s+([A-Z]\w*)')
+_NAME = re.compile(r'\b[A-Z]\w*')
+# Keywords and attributes that precede a top-level declaration
+_TOP_LEVEL = re.compile(
+    r'^(?:@\w+(?:\([^)]*\))?\s*)*(?:(?:public|internal|private|fileprivate|open|final|nonisolated|'
+    r'indirect)\s+)*(class|struct|enum|protocol|actor|typealias|extension|func|let|var)\b', re.M
+)
+
+_SOURCE_VERSION = source_version(__name__)
+
+
+def scan_source(text):
+    """Declarations and references of one file
+
+    Returns {'declares': [names], 'extends': [names], 'uses': {owner: [names]},
+    'nested': {name: owner}, 'lines': non-blank lines}. Owners are top-level
+    types; free functions and globals are owned by '' (the file itself).
+    """
+    code = _STRIP.sub('""', text)
+    declares = []
+    extends = []
+    for kind, name in _DECLARATION.findall(code):
+        (extends if kind == 'extension' else declares).append(name)
+
+    uses = defaultdict(set)
+    nested = {}
+    starts = []
+    depth = scanned = 0
+    for match in _TOP_LEVEL.finditer(code):
+        segment = code[scanned:match.start()]
+        depth += segment.count('{') - segment.count('}')
+        scanned = match.start()
+        if depth == 0:
+            starts.append(match)
+    for index, match in enumerate(starts):
+        end = starts[index + 1].start() if index + 1 < len(starts) else len(code)
+        body = code[match.start():end]
+        kind = match.group(1)
+        owner = ''
+        if kind not in ('func', 'let', 'var'):
+            declared = _DECLARATION.search(body)
+            owner = declared.group(2) if declared else ''
+            for inner_kind, name in _DECLARATION.findall(body)[1:]:
+                if inner_kind != 'extension' and name != owner:
+                    nested.setdefault(name, owner)
+        uses[owner].update(_NAME.findall(body))
+    for owner, names in uses.items():
+        names.discard(owner)
+    return {
+        'declares': sorted(set(declares)),
+        'extends': sorted(set(extends)),
+        'uses': {owner: sorted(names) for owner, names in uses.items()},
+        'nested': nested,
+        'lines': sum(1 for line in text.splitlines() if line.strip()),
+    }
+
+
+def _scan_file(path):
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return scan_source(f.read())
+
+
+def strongly_connected(nodes, edges):
+    """Tarjan's algorithm, iterative; returns sorted components, each one
+    after every component it depends on"""
+    index = {}
+    low = {}
+    on_stack = set()
+    stack = []
+    components = []
+    counter = 0
+    for root in nodes:
+        if root in index:
+            continue
+        work = [(root, iter(sorted(edges.get(root, ()))))]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, successors = work[-1]
+            advanced = False
+            for successor in successors:
+                if successor not in index:
+                    index[successor] = low[successor] = counter
+                    counter += 1
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(sorted(edges.get(successor, ())))))
+                    advanced = True
+                    break
+                if successor in on_stack:
+                    low[node] = min(low[node], index[successor])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(sorted(component))
+    return components
+
+
+class Graph:
+    """Type and file dependency graphs of a set of scanned files"""
+
+    def __init__(self, scans):
+        self.scans = scans
+        declared_in = defaultdict(set)
+        for path, scan in scans.items():
+            for name in scan['declares']:
+                declared_in[name].add(path)
+        self.ambiguous = sorted(name for name, paths in declared_in.items() if len(paths) > 1)
+        self.home = {name: next(iter(paths)) for name, paths in declared_in.items() if len(paths) == 1}
+        # Nested types are nodes of the type that declares them
+        owner_of = {
+            name: owner for scan in scans.values() for name, owner in scan['nested'].items()
+            if name in self.home and owner
+        }
+
+        # Type level: owner -> owners it uses ('' owners are named after their file)
+        self.types = defaultdict(set)
+        self.files = {path: set() for path in scans}
+        for path, scan in scans.items():
+            local = set(scan['declares'])
+            for owner, names in scan['uses'].items():
+                node = owner or Path(path).name
+                self.types.setdefault(node, set())
+                for name in names:
+                    if name in local or name not in self.home:
+                        continue
+                    target = owner_of.get(name, name)
+                    if target != node:
+                        self.types[node].add(target)
+                    if self.home[name] != path:
+                        self.files[path].add(self.home[name])
+            for name in scan['extends']:
+                if name in self.home and self.home[name] != path:
+                    self.files[path].add(self.home[name])
+
+    def type_cycles(self):
+        """Strongly connected groups of more than one type, largest first"""
+        components = strongly_connected(sorted(self.types), self.types)
+        return sorted((c for c in components if len(c) > 1), key=len, reverse=True)
+
+
+def _layers(components, edges):
+    """Layer of each component: 0 for no dependencies, else 1 + deepest dependency"""
+    layer = {}
+    for index in range(len(components)):  # Tarjan emits dependencies first
+        layer[index] = 1 + max((layer[d] for d in edges[index]), default=-1)
+    return layer
+
+
+def _initial_modules(paths, lines, root, split_above):
+    """Directory of each file under root: Shared/<Dir>, or deeper for large directories"""
+    total = sum(lines.values()) or 1
+    module = {}
+    by_top = defaultdict(list)
+    for path in paths:
+        parts = Path(path).relative_to(root).parts
+        by_top[parts[0] if len(parts) > 1 else ''].append(path)
+    for top, members in by_top.items():
+        large = sum(lines[p] for p in members) / total > split_above
+        for path in members:
+            parts = Path(path).relative_to(root).parts
+            name = top or Path(root).name
+            if large and len(parts) > 2:
+                name = f"{top}{parts[1]}"
+            module[path] = name
+    return module
+
+
+class Split:
+    """A proposed assignment of files to modules"""
+
+    def __init__(self, graph, root=DEFAULT_ROOT, split_above=SPLIT_ABOVE, overhead=MODULE_OVERHEAD):
+        self.graph = graph
+        self.overhead = overhead
+        paths = sorted(graph.files)
+        self.lines = {path: graph.scans[path]['lines'] for path in paths}
+
+        # File components, in dependency-first order, and their DAG
+        self.components = strongly_connected(paths, graph.files)
+        self.component_of = {path: i for i, members in enumerate(self.components) for path in members}
+        self.edges = [set() for _ in self.components]
+        for path, targets in graph.files.items():
+            for target in targets:
+                if self.component_of[target] != self.component_of[path]:
+                    self.edges[self.component_of[path]].add(self.component_of[target])
+        self.dependents = [set() for _ in self.components]
+        for source, targets in enumerate(self.edges):
+            for target in targets:
+                self.dependents[target].add(source)
+        self.layer = _layers(self.components, self.edges)
+        self.cost = [sum(self.lines[p] for p in members) for members in self.components]
+
+        # Start from directories: each component goes where most of its lines are
+        by_file = _initial_modules(paths, self.lines, root, split_above)
+        self.assignment = []
+        for members in self.components:
+            votes = defaultdict(int)
+            for path in members:
+                votes[by_file[path]] += self.lines[path] or 1
+            self.assignment.append(max(sorted(votes), key=votes.get))
+        self.initial = list(self.assignment)
+
+        modules = defaultdict(list)
+        for component, module in enumerate(self.assignment):
+            modules[module].append(component)
+        # Foundational modules (low average layer) come first
+        self.order = {
+            module: position for position, module in enumerate(sorted(
+                modules, key=lambda m: (sum(self.layer[c] for c in modules[m]) / len(modules[m]), m)
+            ))
+        }
+        self.moves = 0
+        self._make_acyclic()
+        self._refine()
+
+    def _position(self, component):
+        return self.order[self.assignment[component]]
+
+    def _closure(self, start, neighbours, keep):
+        """Components reachable from start through neighbours while keep(component)"""
+        seen = set()
+        pending = [start]
+        while pending:
+            component = pending.pop()
+            if component in seen or not keep(component):
+                continue
+            seen.add(component)
+            pending.extend(neighbours[component])
+        return seen
+
+    def _make_acyclic(self):
+        """Resolve every dependency that points later in the module order
+
+        For a dependency from component c (module A) on d (module B, after A)
+        either d and its dependencies after A move down into A, or c and its
+        dependents before B move up into B - whichever moves fewer lines.
+        Pulls only ever move components earlier, so after a bounded number
+        of rounds the remaining conflicts are settled by pulling.
+        """
+        budget = 4 * len(self.components)
+        while True:
+            upward = next((
+                (component, dependency)
+                for component in range(len(self.components))
+                for dependency in sorted(self.edges[component])
+                if self._position(dependency) > self._position(component)
+            ), None)
+            if upward is None:
+                return
+            component, dependency = upward
+            low, high = self._position(component), self._position(dependency)
+            pull = self._closure(dependency, self.edges, lambda c: self._position(c) > low)
+            push = self._closure(component, self.dependents, lambda c: self._position(c) < high)
+            if budget > 0 and sum(self.cost[c] for c in push) < sum(self.cost[c] for c in pull):
+                moved, target = push, self.assignment[dependency]
+            else:
+                moved, target = pull, self.assignment[component]
+            budget -= 1
+            for moving in moved:
+                self.assignment[moving] = target
+            self.moves += len(moved)
+
+    def _crossing(self, component, module):
+        """Cross-module edges touching component if it were in module"""
+        return (
+            sum(1 for d in self.edges[component] if self.assignment[d] != module)
+            + sum(1 for d in self.dependents[component] if self.assignment[d] != module)
+        )
+
+    def _refine(self):
+        """Move single components to a neighbour's module when that cuts edges"""
+        for _ in range(REFINE_PASSES):
+            changed = False
+            for component in range(len(self.components)):
+                current = self.assignment[component]
+                lowest = max((self._position(d) for d in self.edges[component]), default=-1)
+                highest = min((self._position(d) for d in self.dependents[component]), default=len(self.order))
+                candidates = {self.assignment[d] for d in self.edges[component] | self.dependents[component]}
+                best, best_crossing = current, self._crossing(component, current)
+                for module in sorted(candidates - {current}):
+                    if not lowest <= self.order[module] <= highest:
+                        continue
+                    crossing = self._crossing(component, module)
+                    if crossing < best_crossing:
+                        best, best_crossing = module, crossing
+                if best != current:
+                    self.assignment[component] = best
+                    self.moves += 1
+                    changed = True
+            if not changed:
+                break
+
+    def modules(self):
+        """{module: sorted file paths}, without empty modules"""
+        members = defaultdict(list)
+        for component, module in enumerate(self.assignment):
+            members[module].extend(self.components[component])
+        return {module: sorted(paths) for module, paths in members.items()}
+
+    def module_edges(self):
+        """{module: {dependency module: file-level edge count}}"""
+        edges = defaultdict(lambda: defaultdict(int))
+        for path, targets in self.graph.files.items():
+            source = self.assignment[self.component_of[path]]
+            for target in targets:
+                module = self.assignment[self.component_of[target]]
+                if module != source:
+                    edges[source][module] += 1
+        return edges
+
+    def public_types(self):
+        """Types used from another module; they'd need to become public"""
+        exported = defaultdict(set)
+        graph = self.graph
+        for path, scan in graph.scans.items():
+            source = self.assignment[self.component_of[path]]
+            local = set(scan['declares'])
+            for names in scan['uses'].values():
+                for name in names:
+                    home = graph.home.get(name)
+                    if name in local or home is None:
+                        continue
+                    module = self.assignment[self.component_of[home]]
+                    if module != source:
+                        exported[module].add(name)
+        return exported
+
+    def critical_path(self):
+        """(cost, [modules]) of the most expensive chain of dependent modules"""
+        modules = self.modules()
+        edges = self.module_edges()
+        cost = {m: sum(self.lines[p] for p in paths) + self.overhead for m, paths in modules.items()}
+        best = {}
+        for module in sorted(modules, key=self.order.get):  # dependencies come first
+            dependency = max(edges[module], key=lambda d: best[d][0], default=None)
+            chain_cost, chain = best[dependency] if dependency else (0, [])
+            best[module] = (chain_cost + cost[module], chain + [module])
+        return max(best.values(), default=(0, []))
+
+
+def analyze(root=DEFAULT_ROOT, base='.', cache=True):
+    """Scan root and return (Graph, seconds spent)"""
+    started = time.perf_counter()
+    with tracing.span('walk sources', 'fs'):
+        paths = sorted(str(Path(base, root, p)) for p in find_swift_files_in_filesystem(Path(base, root)))
+    scans = map_files(
+        _scan_file, paths, cache=Cache('modules') if cache else None,
+        version=_SOURCE_VERSION, parallel_threshold=PARALLEL_THRESHOLD,
+    )
+    with tracing.span('build graph', 'compute'):
+        graph = Graph(scans)
+    return graph, time.perf_counter() - started
+
+
+def package_manifest(split, name='Shared'):
+    """Package.swift target declarations for the proposed modules"""
+    edges = split.module_edges()
+    modules = split.modules()
+    lines = []
+    for module in sorted(modules, key=split.order.get):
+        dependencies = ', '.join(f'"{name}{d}"' for d in sorted(edges[module], key=split.order.get))
+        lines.append(f'        .target(name: "{name}{module}", dependencies: [{dependencies}]),')
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Propose a Swift Package module split of Shared/')
+    parser.add_argument('root', nargs='?', default=DEFAULT_ROOT, help='Directory to split (default: Shared)')
+    parser.add_argument('--split-above', type=float, default=SPLIT_ABOVE,
+                        help='Split directories holding more than this share of the code (default: 0.25)')
+    parser.add_argument('--overhead', type=int, default=MODULE_OVERHEAD,
+                        help='Estimated fixed cost per module, in lines (default: 150)')
+    parser.add_argument('--files', action='store_true', help='List the files of each proposed module')
+    parser.add_argument('--package', action='store_true', help='Print Package.swift targets')
+    parser.add_argument('--no-cache', action='store_true', help='Re-scan every file')
+    args = parser.parse_args(argv)
+
+    if not Path(args.root).is_dir():
+        print(f"❌ {args.root} not found")
+        return 1
+    graph, seconds = analyze(args.root, cache=not args.no_cache)
+    with tracing.span('propose split', 'compute'):
+        split = Split(graph, args.root, args.split_above, args.overhead)
+        modules = split.modules()
+        edges = split.module_edges()
+        exported = split.public_types()
+        critical_cost, critical_chain = split.critical_path()
+
+    total_lines = sum(split.lines.values())
+    file_edges = sum(len(targets) for targets in graph.files.values())
+    cycles = [c for c in split.components if len(c) > 1]
+    type_cycles = graph.type_cycles()
+    print(f"🧩 {args.root}: {len(graph.files)} files, {total_lines} lines, {len(graph.types)} types, "
+          f"{file_edges} file dependencies (graph built in {seconds * 1000:.0f} ms)")
+    print()
+    print(f"Type cycles: {len(type_cycles)}" + (f" (largest: {', '.join(type_cycles[0][:8])}"
+                                                + (' ...' if len(type_cycles[0]) > 8 else '') + ')'
+                                                if type_cycles else ''))
+    print(f"File cycles: {len(cycles)} component(s) of more than one file must share a module"
+          + (f" (largest has {max(len(c) for c in cycles)} files)" if cycles else ''))
+    if graph.ambiguous:
+        print(f"Ambiguous names ignored: {', '.join(graph.ambiguous[:8])}"
+              + (' ...' if len(graph.ambiguous) > 8 else ''))
+    print(f"Dependency layers: {max(split.layer.values(), default=-1) + 1}")
+    print()
+
+    print(f"{'Module':<22} {'Files':>5} {'Lines':>6}  Depends on")
+    for module in sorted(modules, key=split.order.get):
+        module_lines = sum(split.lines[p] for p in modules[module])
+        dependencies = ', '.join(f"{d} ({count})" for d, count in sorted(edges[module].items(), key=lambda e: split.order[e[0]]))
+        print(f"{module:<22} {len(modules[module]):>5} {module_lines:>6}  {dependencies or '-'}")
+        if args.files:
+            for path in modules[module]:
+                moved = split.initial[split.component_of[path]] != module
+                print(f"    {path}" + ('  (moved)' if moved else ''))
+    print()
+
+    crossing = sum(count for targets in edges.values() for count in targets.values())
+    monolith = total_lines + args.overhead
+    print(f"📊 Cross-module file dependencies: {crossing} of {file_edges}; "
+          f"{sum(len(names) for names in exported.values())} types would need to be public")
+    print(f"⏱️  Estimated critical path: {critical_cost} of {monolith} line-equivalents "
+          f"({' → '.join(reversed(critical_chain))})")
+    print(f"⚡ Parallel width: {(total_lines + args.overhead * len(modules)) / max(critical_cost, 1):.1f}x "
+          f"({len(modules)} modules, {split.moves} component moves from the directory layout)")
+
+    if args.package:
+        print()
+        print(package_manifest(split))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
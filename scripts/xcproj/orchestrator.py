@@ -0,0 +1,425 @@
+"""
+Build and test every platform in parallel
+
+build-all-platforms.sh ran the iOS and macOS builds one after another,
+and every test run resolved its simulator again. Here builds and tests
+are jobs in a DAG (a test needs the build of its platform) and a
+scheduler starts each job as soon as its needs have finished and the
+resources it declares are free:
+
+- CPU slots: --slots in total (default: CPU count); a job holds `slots`
+  of them and xcodebuild gets the same number as -jobs, so two builds
+  split the machine instead of each assuming it has all of it
+- simulators: a job marked `simulator` takes one from a pool resolved once
+  per run (see destinations.py; the inventory is cached) or given with
+  --destination, and its command gets the specifier as {destination}
+- DerivedData: a build writes its platform's directory and holds it
+  alone; tests only read it (test-without-building) and share it
+
+Each job's output is streamed with a `[job]` prefix and saved under
+build-reports/. The first failure stops the run (running jobs are
+terminated, jobs not yet started are skipped) unless --keep-going is
+given. Per-job start, duration, status and warning/error counts are
+written to build-reports/timings_<timestamp>.json.
+
+The default plan is built in code; --plan FILE runs any DAG given as JSON
+(`--dump-plan` prints the default one to start from), and --xcodebuild
+replaces the xcodebuild executable, so the scheduler runs on Linux with
+stub commands.
+"""
+
+import argparse
+import json
+import os
+import queue
+import re
+import signal
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from . import destinations
+
+PROJECT_FILE = 'DisabilityAdvocacy.xcodeproj'
+REPORT_DIR = 'build-reports'
+UNIT_TESTS = 'DisabilityAdvocacyTests'
+UI_TESTS = 'DisabilityAdvocacyUITests'
+
+# platform -> (scheme, sdk, build destination)
+PLATFORMS = {
+    'ios': ('DisabilityAdvocacy-iOS', 'iphonesimulator', 'generic/platform=iOS Simulator'),
+    'macos': ('DisabilityAdvocacy-macOS', 'macosx', 'platform=macOS'),
+}
+
+SIGNING_OFF = ['CODE_SIGN_IDENTITY=', 'CODE_SIGNING_REQUIRED=NO', 'CODE_SIGNING_ALLOWED=NO']
+
+_DIAGNOSTIC = re.compile(r'\b(error|warning):')
+_NOTABLE = re.compile(r'\b(error|warning):|^\*\* |Test Suite .* (passed|failed)|Executed \d+ test')
+
+
+class PlanError(Exception):
+    pass
+
+
+class Job:
+    """One command in the DAG and the resources it holds while running"""
+
+    def __init__(self, name, command, needs=(), slots=1, simulator=False, derived_data=None, writes=False):
+        self.name = name
+        self.command = list(command)
+        self.needs = list(needs)
+        self.slots = slots
+        self.simulator = simulator
+        self.derived_data = derived_data
+        self.writes = writes  # holds derived_data alone
+        self.status = 'pending'
+        self.start = None
+        self.duration = None
+        self.returncode = None
+        self.warnings = 0
+        self.errors = 0
+        self.log = None
+        self.destination = None
+        self.process = None
+
+    def as_dict(self):
+        return {
+            'name': self.name, 'command': self.command, 'needs': self.needs, 'slots': self.slots,
+            'simulator': self.simulator, 'derived_data': self.derived_data, 'writes': self.writes,
+        }
+
+
+def default_plan(configuration='Debug', slots=None, tests=True, ui_tests=False, clean=False,
+                 platforms=tuple(PLATFORMS), xcodebuild='xcodebuild'):
+    """Build (and test) each platform; tests reuse their build's DerivedData"""
+    slots = slots or os.cpu_count() or 2
+    build_slots = max(1, slots // len(platforms))
+    jobs = []
+    for platform in platforms:
+        scheme, sdk, generic = PLATFORMS[platform]
+        derived_data = f"build/{platform}"
+        common = [xcodebuild, '-project', PROJECT_FILE, '-scheme', scheme, '-sdk', sdk,
+                  '-configuration', configuration, '-derivedDataPath', derived_data]
+        actions = (['clean'] if clean else []) + ['build-for-testing' if tests else 'build']
+        jobs.append(Job(f"build-{platform}", common + ['-destination', generic, '-jobs', '{slots}']
+                        + SIGNING_OFF + actions,
+                        slots=build_slots, derived_data=derived_data, writes=True))
+        if not tests:
+            continue
+        simulator = platform == 'ios'
+        destination = '{destination}' if simulator else generic
+        for suffix, bundle in [('', UNIT_TESTS)] + ([('-ui', UI_TESTS)] if ui_tests and simulator else []):
+            jobs.append(Job(f"test-{platform}{suffix}", common + ['-destination', destination,
+                            f"-only-testing:{bundle}"] + SIGNING_OFF + ['test-without-building'],
+                            needs=[f"build-{platform}"], slots=min(2, slots), simulator=simulator,
+                            derived_data=derived_data))
+    return jobs
+
+
+def load_plan(path):
+    """Jobs from a JSON plan: {"jobs": [{"name", "command", "needs", ...}]}"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    try:
+        return [Job(**entry) for entry in data['jobs']]
+    except (KeyError, TypeError) as e:
+        raise PlanError(f"{path}: not a plan ({e})")
+
+
+def check_plan(jobs):
+    """Raise PlanError for unknown needs, duplicate names or cycles"""
+    names = [job.name for job in jobs]
+    duplicates = sorted(name for name, count in Counter(names).items() if count > 1)
+    if duplicates:
+        raise PlanError(f"duplicate job names: {', '.join(duplicates)}")
+    by_name = {job.name: job for job in jobs}
+    for job in jobs:
+        unknown = [need for need in job.needs if need not in by_name]
+        if unknown:
+            raise PlanError(f"{job.name} needs unknown job(s): {', '.join(unknown)}")
+    state = {}
+
+    def visit(job, path):
+        if state.get(job.name) == 'done':
+            return
+        if state.get(job.name) == 'visiting':
+            raise PlanError(f"needs cycle: {' → '.join(path + [job.name])}")
+        state[job.name] = 'visiting'
+        for need in job.needs:
+            visit(by_name[need], path + [job.name])
+        state[job.name] = 'done'
+
+    for job in jobs:
+        visit(job, [])
+
+
+def simulators(count, names=(), family='iphone'):
+    """Up to count destination specifiers: the resolved device, then the
+    newest others of its family on the same OS"""
+    devices = destinations.simctl_inventory()
+    chosen, note = destinations.resolve(devices, names, family)
+    if note:
+        print(f"⚠️  {note}", file=sys.stderr)
+    others = sorted(
+        (device for device in devices
+         if device['platform'] == chosen['platform'] and device['os'] == chosen['os']
+         and device['id'] != chosen['id'] and device['name'].lower().startswith(family.replace('any', ''))),
+        key=lambda device: (device.get('state') == 'Booted', [int(n) for n in re.findall(r'\d+', device['name'])]),
+        reverse=True,
+    )
+    return [destinations.specifier(device) for device in [chosen] + others[:count - 1]]
+
+
+class Scheduler:
+    """Runs a checked plan; call run(), then read each job's status"""
+
+    def __init__(self, jobs, slots, devices=(), report_dir=REPORT_DIR, stamp='', keep_going=False, quiet=False):
+        self.jobs = jobs
+        self.slots = slots
+        self.free_slots = slots
+        self.free_devices = list(devices)
+        self.writers = set()     # DerivedData directories being written
+        self.readers = Counter()  # DerivedData directory -> running readers
+        self.report_dir = Path(report_dir)
+        self.stamp = stamp
+        self.keep_going = keep_going
+        self.quiet = quiet
+        self.width = max((len(job.name) for job in jobs), default=0)
+        self.output = threading.Lock()
+        self.finished = queue.Queue()
+        self.failed = False
+
+    def _say(self, text):
+        with self.output:
+            print(text, flush=True)
+
+    def _available(self, job, running):
+        if job.simulator and not self.free_devices:
+            return False
+        if job.derived_data and (job.derived_data in self.writers
+                                 or (job.writes and self.readers[job.derived_data])):
+            return False
+        # A job wanting more slots than exist runs once the machine is idle
+        return job.slots <= self.free_slots or not running
+
+    def _acquire(self, job):
+        self.free_slots -= job.slots
+        if job.simulator:
+            job.destination = self.free_devices.pop(0)
+        if job.derived_data:
+            if job.writes:
+                self.writers.add(job.derived_data)
+            else:
+                self.readers[job.derived_data] += 1
+
+    def _release(self, job):
+        self.free_slots += job.slots
+        if job.destination:
+            self.free_devices.append(job.destination)
+        if job.derived_data:
+            if job.writes:
+                self.writers.discard(job.derived_data)
+            else:
+                self.readers[job.derived_data] -= 1
+
+    def _command(self, job):
+        values = {'slots': str(min(job.slots, self.slots)), 'destination': job.destination or ''}
+        return [re.sub(r'\{(slots|destination)\}', lambda m: values[m.group(1)], part) for part in job.command]
+
+    def _start(self, job):
+        self._acquire(job)
+        command = self._command(job)
+        job.log = self.report_dir / f"{job.name}_{self.stamp}.txt"
+        job.status = 'running'
+        job.start = time.time()
+        self._say(f"▶️  {job.name}" + (f" on {job.destination}" if job.destination else ''))
+        try:
+            # A session of its own, so stopping the job stops the compilers it started
+            job.process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                           stdin=subprocess.DEVNULL, text=True, errors='replace', bufsize=1,
+                                           start_new_session=True)
+        except OSError as e:
+            self._say(f"[{job.name:<{self.width}}] {e}")
+            self.finished.put((job, 127))
+            return
+        threading.Thread(target=self._stream, args=(job,), daemon=True).start()
+
+    def _stream(self, job):
+        prefix = f"[{job.name:<{self.width}}] "
+        with open(job.log, 'w', encoding='utf-8') as log:
+            for line in job.process.stdout:
+                log.write(line)
+                if _DIAGNOSTIC.search(line):
+                    if 'error:' in line:
+                        job.errors += 1
+                    else:
+                        job.warnings += 1
+                if not self.quiet or _NOTABLE.search(line):
+                    self._say(prefix + line.rstrip('\n'))
+        self.finished.put((job, job.process.wait()))
+
+    def _finish(self, job, returncode):
+        self._release(job)
+        job.duration = time.time() - job.start
+        job.returncode = returncode
+        if job.status == 'cancelled':
+            self._say(f"⏹️  {job.name} stopped")
+            return
+        job.status = 'passed' if returncode == 0 else 'failed'
+        if returncode == 0:
+            self._say(f"✅ {job.name} ({format_duration(job.duration)})")
+            return
+        self._say(f"❌ {job.name} failed with exit code {returncode} ({format_duration(job.duration)}); "
+                  f"see {job.log}")
+        self.failed = True
+        if not self.keep_going:
+            self.cancel()
+
+    def cancel(self):
+        """Stop running jobs; nothing new is started afterwards"""
+        self.failed = True
+        for job in self.jobs:
+            if job.status == 'running' and job.process is not None:
+                job.status = 'cancelled'
+                try:
+                    os.killpg(job.process.pid, signal.SIGTERM)
+                except OSError:
+                    pass  # already gone
+
+    def run(self):
+        """Run every job whose needs pass; returns True if all of them passed"""
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        by_name = {job.name: job for job in self.jobs}
+        running = 0
+        try:
+            while True:
+                stopped = self.failed and not self.keep_going
+                for job in self.jobs:
+                    if job.status != 'pending':
+                        continue
+                    needs = [by_name[need].status for need in job.needs]
+                    if stopped or any(status in ('failed', 'skipped', 'cancelled') for status in needs):
+                        job.status = 'skipped'
+                    elif all(status == 'passed' for status in needs) and self._available(job, running):
+                        self._start(job)
+                        running += 1
+                if not running:
+                    break
+                job, returncode = self.finished.get()
+                running -= 1
+                self._finish(job, returncode)
+        except KeyboardInterrupt:
+            self.cancel()
+            while running:
+                job, returncode = self.finished.get()
+                running -= 1
+                self._finish(job, returncode)
+            raise
+        return all(job.status == 'passed' for job in self.jobs)
+
+
+def format_duration(seconds):
+    minutes, seconds = divmod(int(round(seconds or 0)), 60)
+    return f"{minutes}m{seconds:02d}s"
+
+
+def write_timings(jobs, path, started, wall):
+    data = {
+        'started': datetime.fromtimestamp(started).isoformat(timespec='seconds'),
+        'wall_seconds': round(wall, 3),
+        'jobs': [
+            {'name': job.name, 'status': job.status, 'needs': job.needs,
+             'start_offset': round(job.start - started, 3) if job.start else None,
+             'seconds': round(job.duration, 3) if job.duration is not None else None,
+             'returncode': job.returncode, 'warnings': job.warnings, 'errors': job.errors,
+             'destination': job.destination, 'log': str(job.log) if job.log else None}
+            for job in jobs
+        ],
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build and test every platform in parallel')
+    parser.add_argument('configuration', nargs='?', default='Debug', help='Build configuration (default: Debug)')
+    parser.add_argument('--platform', action='append', choices=sorted(PLATFORMS),
+                        help='Only this platform (repeatable; default: all)')
+    parser.add_argument('--skip-tests', action='store_true', help='Build only')
+    parser.add_argument('--ui-tests', action='store_true', help='Also run the iOS UI tests')
+    parser.add_argument('--clean', action='store_true', help='Clean before building')
+    parser.add_argument('--slots', type=int, default=os.cpu_count() or 2,
+                        help='CPU slots shared by running jobs (default: CPU count)')
+    parser.add_argument('--simulators', type=int, default=1, help='Simulators tests may use at once (default: 1)')
+    parser.add_argument('--name', action='append', default=[],
+                        help='Preferred simulator name (repeatable; see resolve-destination.py)')
+    parser.add_argument('--destination', action='append', default=[],
+                        help='Simulator destination specifier to use instead of resolving one (repeatable)')
+    parser.add_argument('--keep-going', action='store_true', help='Keep running independent jobs after a failure')
+    parser.add_argument('--quiet', action='store_true', help='Stream only errors, warnings and results')
+    parser.add_argument('--plan', help='Run the jobs of a JSON plan instead of the default one')
+    parser.add_argument('--dump-plan', action='store_true', help='Print the plan as JSON and exit')
+    parser.add_argument('--xcodebuild', default=os.environ.get('XCODEBUILD', 'xcodebuild'),
+                        help='xcodebuild executable, e.g. a stub (default: $XCODEBUILD or xcodebuild)')
+    parser.add_argument('--report-dir', default=REPORT_DIR, help=f'Logs and timings directory (default: {REPORT_DIR})')
+    parser.add_argument('--timings', help='Timings JSON path (default: REPORT_DIR/timings_<timestamp>.json)')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.plan:
+            jobs = load_plan(args.plan)
+        else:
+            jobs = default_plan(args.configuration, args.slots, not args.skip_tests, args.ui_tests, args.clean,
+                                tuple(args.platform or PLATFORMS), args.xcodebuild)
+        check_plan(jobs)
+    except (OSError, ValueError, PlanError) as e:
+        print(f"❌ {e}")
+        return 1
+    if args.dump_plan:
+        print(json.dumps({'jobs': [job.as_dict() for job in jobs]}, indent=2))
+        return 0
+
+    devices = args.destination
+    wanted = sum(1 for job in jobs if job.simulator)
+    if wanted and not devices:
+        try:
+            devices = simulators(min(args.simulators, wanted), args.name)
+        except destinations.DestinationError as e:
+            print(f"❌ {e}")
+            return 1
+
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    print(f"🏗️  {len(jobs)} jobs, {args.slots} CPU slots" + (f", simulators: {', '.join(devices)}" if wanted else ''))
+    scheduler = Scheduler(jobs, args.slots, devices, args.report_dir, stamp, args.keep_going, args.quiet)
+    started = time.time()
+    try:
+        passed = scheduler.run()
+    except KeyboardInterrupt:
+        passed = None
+    wall = time.time() - started
+
+    timings = args.timings or os.path.join(args.report_dir, f"timings_{stamp}.json")
+    write_timings(jobs, timings, started, wall)
+
+    print()
+    print('=== Build Summary ===')
+    icons = {'passed': '✅', 'failed': '❌', 'cancelled': '⏹️ ', 'skipped': '⏭️ ', 'pending': '⏭️ '}
+    width = max(len(job.name) for job in jobs)
+    for job in jobs:
+        detail = format_duration(job.duration) if job.duration is not None else job.status
+        counts = ', '.join(f"{count} {kind}(s)" for kind, count in (('error', job.errors), ('warning', job.warnings))
+                           if count)
+        print(f"  {icons[job.status]} {job.name:<{width}}  {detail}" + (f"  {counts}" if counts else ''))
+    busy = sum(job.duration or 0 for job in jobs)
+    print(f"⏱️  Wall time {format_duration(wall)} for {format_duration(busy)} of jobs; timings in {timings}")
+    if passed is None:
+        return 130
+    return 0 if passed else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
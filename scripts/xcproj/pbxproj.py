@@ -0,0 +1,417 @@
+"""
+Memory-mapped, lazily decoded reader for project.pbxproj
+
+The project file is mapped into memory and indexed with one byte-level scan
+for object headers (`ID /* comment */ = {isa = ...;`). An object is only
+decoded and parsed when something asks for it, so a query such as "list the
+Sources of target X" reads a few KB no matter how large the project is.
+
+Files that don't follow Xcode's layout fall back to a full parse.
+"""
+
+import mmap
+import posixpath
+import re
+
+# `ID /* comment */ = {isa = Type;` at the start of a line inside `objects`
+OBJECT_HEADER = re.compile(
+    rb'^[ \t]*(\w+)(?: /\* (.*?) \*/)?[ \t]*=[ \t]*\{\s*isa = (\w+);', re.M
+)
+OBJECTS_START = re.compile(rb'^[ \t]*objects = \{', re.M)
+ROOT_OBJECT = re.compile(rb'^[ \t]*rootObject = (\w+)', re.M)
+HEADER_COMMENT = re.compile(r'\w+ /\* (.*?) \*/')
+
+_SKIP = re.compile(r'(?:\s+|/\*.*?\*/|//[^\n]*)*', re.S)
+_QUOTED = re.compile(r'"((?:[^"\\]|\\.)*)"', re.S)
+_BARE = re.compile(r'(?:[^\s{}();=,"/]|/(?![/*]))+')
+_ESCAPE = re.compile(r'\\(U[0-9a-fA-F]{4}|.)', re.S)
+_ESCAPES = {
+    'n': '\n', 't': '\t', 'r': '\r', 'a': '\a', 'b': '\b', 'f': '\f',
+    'v': '\v', '"': '"', "'": "'", '\\': '\\',
+}
+
+
+class PlistError(ValueError):
+    """Raised when project.pbxproj is not a valid old-style plist"""
+
+
+def _unescape(match):
+    code = match.group(1)
+    if len(code) == 5:
+        return chr(int(code[1:], 16))
+    return _ESCAPES.get(code, code)
+
+
+class _Parser:
+    """Recursive-descent parser for the old-style (OpenStep) plist format"""
+
+    def __init__(self, text, pos=0):
+        self.text = text
+        self.pos = pos
+
+    def error(self, message):
+        line = self.text.count('\n', 0, self.pos) + 1
+        raise PlistError(f"{message} at line {line}")
+
+    def skip(self):
+        self.pos = _SKIP.match(self.text, self.pos).end()
+
+    def peek(self):
+        self.skip()
+        return self.text[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        if self.peek() != char:
+            self.error(f"Expected '{char}'")
+        self.pos += 1
+
+    def value(self):
+        char = self.peek()
+        if char == '{':
+            return self.dictionary()
+        if char == '(':
+            return self.array()
+        return self.string()
+
+    def string(self):
+        self.skip()
+        match = _QUOTED.match(self.text, self.pos) or _BARE.match(self.text, self.pos)
+        if not match:
+            self.error("Expected a value")
+        self.pos = match.end()
+        if match.re is _QUOTED:
+            return _ESCAPE.sub(_unescape, match.group(1))
+        return match.group(0)
+
+    def entries(self):
+        """Yield (key, key_start, value, end) for each entry of a dictionary"""
+        self.expect('{')
+        while self.peek() != '}':
+            if not self.peek():
+                self.error("Unterminated dictionary")
+            key_start = self.pos
+            key = self.string()
+            self.expect('=')
+            value = self.value()
+            self.expect(';')
+            yield key, key_start, value, self.pos
+        self.pos += 1
+
+    def dictionary(self):
+        return {key: value for key, _, value, _ in self.entries()}
+
+    def array(self):
+        self.expect('(')
+        items = []
+        while self.peek() != ')':
+            if not self.peek():
+                self.error("Unterminated array")
+            items.append(self.value())
+            if self.peek() == ',':
+                self.pos += 1
+            elif self.peek() != ')':
+                self.error("Expected ',' or ')'")
+        self.pos += 1
+        return items
+
+
+def parse_plist(text):
+    """Parse a complete old-style plist document such as project.pbxproj"""
+    parser = _Parser(text)
+    value = parser.value()
+    if parser.peek():
+        parser.error("Unexpected content after the top-level value")
+    return value
+
+
+def _byte_offset(text):
+    """Return a function mapping character offsets in text to UTF-8 byte offsets"""
+    if text.isascii():
+        return lambda pos: pos
+
+    # Offsets are requested in increasing order, so encode incrementally
+    state = [0, 0]
+
+    def to_bytes(pos):
+        if pos < state[0]:
+            state[:] = [0, 0]
+        state[1] += len(text[state[0]:pos].encode('utf-8'))
+        state[0] = pos
+        return state[1]
+    return to_bytes
+
+
+class PBXProject:
+    """Lazily decoded view of a project.pbxproj file
+
+    `data` is anything supporting the buffer protocol and slicing (bytes or
+    an mmap). Use PBXProject.open() to map a file from disk.
+    """
+
+    def __init__(self, data, path=None):
+        self.data = data
+        self.path = path
+        self._index = {}   # id -> [start, limit, isa, comment]
+        self._ends = {}    # id -> end offset, known once the object is parsed
+        self._cache = {}
+        self._paths = None
+        self._root_object = None
+        self._build_index()
+
+    @classmethod
+    def open(cls, path):
+        """Memory-map a project.pbxproj file"""
+        with open(path, 'rb') as f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can't be mapped
+                data = b''
+        return cls(data, path=str(path))
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __contains__(self, object_id):
+        return object_id in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    # -- Indexing ---------------------------------------------------------
+
+    def _build_index(self):
+        """Index object boundaries with a byte-level scan for object headers"""
+        start = OBJECTS_START.search(self.data)
+        headers = list(OBJECT_HEADER.finditer(self.data, start.end())) if start else []
+        if not headers:
+            self._parse_everything()
+            return
+
+        for i, match in enumerate(headers):
+            limit = headers[i + 1].start() if i + 1 < len(headers) else len(self.data)
+            comment = match.group(2).decode('utf-8') if match.group(2) is not None else None
+            self._index[match.group(1).decode('ascii')] = [
+                match.start(1), limit, match.group(3).decode('ascii'), comment
+            ]
+
+        root = ROOT_OBJECT.search(self.data, headers[-1].start())
+        self._root_object = root.group(1).decode('ascii') if root else None
+
+    def _parse_everything(self):
+        """Slow path: parse the whole file and record every object's span"""
+        text = bytes(self.data[:]).decode('utf-8')
+        to_bytes = _byte_offset(text)
+        self._index.clear()
+        self._ends.clear()
+        self._cache.clear()
+        self._paths = None
+        self._root_object = None
+
+        parser = _Parser(text)
+        parser.expect('{')
+        while parser.peek() not in ('}', ''):
+            key = parser.string()
+            parser.expect('=')
+            if key == 'objects':
+                for object_id, key_start, obj, end in parser.entries():
+                    if not isinstance(obj, dict):
+                        parser.error(f"Object {object_id} is not a dictionary")
+                    comment = HEADER_COMMENT.match(text, key_start)
+                    self._index[object_id] = [
+                        to_bytes(key_start), to_bytes(end), obj.get('isa'),
+                        comment.group(1) if comment else None
+                    ]
+                    self._ends[object_id] = to_bytes(end)
+                    self._cache[object_id] = obj
+            elif key == 'rootObject':
+                self._root_object = parser.string()
+            else:
+                parser.value()
+            parser.expect(';')
+        parser.expect('}')
+
+    def _decode(self, object_id):
+        start, limit = self._index[object_id][:2]
+        text = self.data[start:limit].decode('utf-8')
+        parser = _Parser(text)
+        try:
+            parser.string()
+            parser.expect('=')
+            obj = parser.dictionary()
+            parser.expect(';')
+            consistent = limit == len(self.data) or _SKIP.match(text, parser.pos).end() == len(text)
+        except PlistError:
+            consistent = False
+        if not consistent:
+            # The object doesn't end where the next header begins, so the file
+            # isn't laid out the way Xcode writes it; don't trust the index.
+            self._parse_everything()
+            return self._cache[object_id]
+        self._ends[object_id] = start + _byte_offset(text)(parser.pos)
+        return obj
+
+    # -- Object access ----------------------------------------------------
+
+    @property
+    def root_object(self):
+        return self._root_object
+
+    def ids(self, isa=None):
+        """Return object IDs in file order, optionally only those of one isa"""
+        if isa is None:
+            return list(self._index)
+        return [object_id for object_id, entry in self._index.items() if entry[2] == isa]
+
+    def isa(self, object_id):
+        return self._index[object_id][2]
+
+    def comment(self, object_id):
+        """Return the `/* ... */` comment from an object's header, if any"""
+        return self._index[object_id][3]
+
+    def get(self, object_id):
+        """Decode and return one object as a dict"""
+        obj = self._cache.get(object_id)
+        if obj is None:
+            obj = self._cache[object_id] = self._decode(object_id)
+        return obj
+
+    def raw(self, object_id):
+        """Return an object's bytes up to the next object header, without decoding it"""
+        start, limit = self._index[object_id][:2]
+        return self.data[start:limit]
+
+    def span(self, object_id):
+        """Return the (start, end) byte range of an object's `ID = {...};` entry"""
+        if object_id not in self._ends:
+            self.get(object_id)
+        return self._index[object_id][0], self._ends[object_id]
+
+    def value_spans(self, object_id):
+        """Return {key: (start, end)} byte ranges of an object's top-level values"""
+        start, end = self.span(object_id)
+        text = self.data[start:end].decode('utf-8')
+        to_bytes = _byte_offset(text)
+        parser = _Parser(text)
+        parser.string()
+        parser.expect('=')
+        parser.expect('{')
+        spans = {}
+        while parser.peek() != '}':
+            key = parser.string()
+            parser.expect('=')
+            parser.skip()
+            value_start = parser.pos
+            parser.value()
+            spans[key] = (start + to_bytes(value_start), start + to_bytes(parser.pos))
+            parser.expect(';')
+        return spans
+
+    def objects(self):
+        """Decode every object (prefer get() for targeted queries)"""
+        return {object_id: self.get(object_id) for object_id in list(self._index)}
+
+    def find(self, sub):
+        """Return the byte offset of sub in the raw file, or -1"""
+        return self.data.find(sub)
+
+    def count(self, byte):
+        """Count occurrences of a single byte without copying the whole file"""
+        chunk = 1 << 20
+        return sum(
+            self.data[pos:pos + chunk].count(byte)
+            for pos in range(0, len(self.data), chunk)
+        )
+
+    # -- Graph queries ----------------------------------------------------
+
+    def display_name(self, object_id):
+        """Name Xcode shows for an object: its header comment, name or path"""
+        comment = self.comment(object_id)
+        if comment is not None:
+            return comment
+        obj = self.get(object_id)
+        return obj.get('name') or obj.get('path')
+
+    def targets(self):
+        """Return the IDs of the project's targets, in project order"""
+        if self.root_object in self._index:
+            return list(self.get(self.root_object).get('targets', []))
+        return self.ids('PBXNativeTarget')
+
+    def target(self, name):
+        """Return the ID of the target called name, or None"""
+        for target_id in self.targets():
+            if self.comment(target_id) == name or self.get(target_id).get('name') == name:
+                return target_id
+        return None
+
+    def build_phase(self, target_id, isa):
+        """Return the ID of a target's build phase of the given isa, or None"""
+        for phase_id in self.get(target_id).get('buildPhases', []):
+            if self.isa(phase_id) == isa:
+                return phase_id
+        return None
+
+    def phase_file_refs(self, phase_id):
+        """Return (build_file_id, file_ref_id) pairs for a build phase"""
+        pairs = []
+        for build_file_id in self.get(phase_id).get('files', []):
+            file_ref_id = self.get(build_file_id).get('fileRef') if build_file_id in self else None
+            pairs.append((build_file_id, file_ref_id))
+        return pairs
+
+    def sources(self, target_name):
+        """Return the file references compiled by a target's Sources phase"""
+        target_id = self.target(target_name)
+        if target_id is None:
+            return []
+        phase_id = self.build_phase(target_id, 'PBXSourcesBuildPhase')
+        if phase_id is None:
+            return []
+        return [
+            file_ref_id for _, file_ref_id in self.phase_file_refs(phase_id)
+            if file_ref_id is not None
+        ]
+
+    def file_paths(self):
+        """Resolve every group and file reference to its path via the group tree
+
+        Returns {id: path}, relative to the project root for `<group>` and
+        SOURCE_ROOT references and `$(TREE)/path` for other source trees.
+        Only objects reachable from the main group are included.
+        """
+        if self._paths is not None:
+            return self._paths
+
+        paths = {}
+        root = self.get(self.root_object) if self.root_object in self else {}
+        stack = [(root.get('mainGroup'), '')]
+        while stack:
+            object_id, parent_path = stack.pop()
+            if object_id in paths or object_id not in self:
+                continue
+            obj = self.get(object_id)
+            path = obj.get('path', '')
+            tree = obj.get('sourceTree', '<group>')
+            if tree == '<group>':
+                full_path = posixpath.join(parent_path, path)
+            elif tree in ('SOURCE_ROOT', '<absolute>'):
+                full_path = path
+            else:
+                full_path = posixpath.join(f'$({tree})', path)
+            full_path = posixpath.normpath(full_path) if full_path else ''
+            paths[object_id] = full_path
+            for child_id in reversed(obj.get('children', [])):
+                stack.append((child_id, full_path))
+
+        self._paths = paths
+        return paths
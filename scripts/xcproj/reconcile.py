@@ -0,0 +1,165 @@
+"""
+Path-exact reconciliation of files on disk with project references
+
+Comparing basenames can't tell iOS/Views/ContentView.swift from
+macOS/Views/ContentView.swift, so a file missing from the project hides
+behind its twin. Here every file reference is resolved to its full path
+through the group tree (PBXProject.file_paths) and joined with the
+filesystem on that exact path: two set differences, no pairwise matching.
+What's left on each side is then explained where possible, by grouping on
+basename and on directory:
+
+- moved          the project points at dir/A.swift, disk has other/A.swift
+- renamed        the project points at dir/A.swift, disk has dir/B.swift
+- missing        on disk, not in the project
+- orphaned       in the project, not on disk
+- ungrouped      a reference in no group, so its path can't be resolved
+                 (paired with the disk file it names, when unambiguous)
+- duplicate refs one path referenced by several file references
+- clashes        one target compiling two files with the same basename,
+                 which Xcode rejects ("filename used twice")
+
+A moved or renamed file is reported as such only when the pairing is
+unambiguous (one candidate on each side). Every step is a dict or set
+operation, so the cost is linear in the number of files and references.
+"""
+
+import posixpath
+from collections import defaultdict
+
+from .sources import EXCLUDED
+
+
+class Reconciliation:
+    """Result of reconcile(); path lists are sorted"""
+
+    def __init__(self):
+        self.matched = []
+        self.missing = []
+        self.orphaned = []
+        self.moved = []           # (project path, disk path)
+        self.renamed = []         # (project path, disk path)
+        self.ungrouped = []       # (file reference id, its path attribute, disk path or None)
+        self.duplicate_refs = {}  # path -> [file reference ids]
+        self.clashes = []         # (target, basename, [paths])
+        self.twins = {}           # basename -> [paths], matched files sharing a basename
+
+    @property
+    def clean(self):
+        return not (self.missing or self.orphaned or self.moved or self.renamed
+                    or self.ungrouped or self.duplicate_refs or self.clashes)
+
+
+def _included(path, suffixes):
+    return (
+        path.endswith(suffixes) and not path.startswith('$(')
+        and not any(fragment in path for fragment in EXCLUDED)
+    )
+
+
+def project_files(project, suffixes=('.swift',)):
+    """({path: [file reference ids]} for references reachable from the main
+    group, [(id, path attribute)] of matching references in no group)"""
+    paths = project.file_paths()
+    files = defaultdict(list)
+    ungrouped = []
+    for file_id in project.ids('PBXFileReference'):
+        path = paths.get(file_id)
+        if path is None:
+            attribute = project.get(file_id).get('path') or ''
+            if _included(attribute, suffixes):
+                ungrouped.append((file_id, attribute))
+        elif _included(path, suffixes):
+            files[path].append(file_id)
+    return files, ungrouped
+
+
+def _pair(left, right, key, left_key=None):
+    """Pair items of left and right whose key is shared by exactly one of each"""
+    left_groups = defaultdict(list)
+    right_groups = defaultdict(list)
+    for item in left:
+        left_groups[(left_key or key)(item)].append(item)
+    for item in right:
+        right_groups[key(item)].append(item)
+    return [
+        (items[0], right_groups[k][0]) for k, items in left_groups.items()
+        if len(items) == 1 and len(right_groups.get(k, ())) == 1
+    ]
+
+
+def reconcile(project, disk_paths, suffixes=('.swift',)):
+    """Join resolved project references with disk_paths (relative to the project root)"""
+    result = Reconciliation()
+    references, ungrouped = project_files(project, suffixes)
+    disk = {path.replace('\\', '/') for path in disk_paths if _included(path, suffixes)}
+
+    in_project = set(references)
+    result.matched = sorted(in_project & disk)
+    missing = disk - in_project
+    orphaned = in_project - disk
+
+    moved = _pair(orphaned, missing, posixpath.basename)
+    for old, new in moved:
+        orphaned.discard(old)
+        missing.discard(new)
+    renamed = _pair(orphaned, missing, posixpath.dirname)
+    for old, new in renamed:
+        orphaned.discard(old)
+        missing.discard(new)
+    found = dict(_pair(ungrouped, missing, posixpath.basename, lambda item: posixpath.basename(item[1])))
+    for file_id, attribute in sorted(ungrouped, key=lambda item: item[1]):
+        disk_path = found.get((file_id, attribute))
+        missing.discard(disk_path)
+        result.ungrouped.append((file_id, attribute, disk_path))
+    result.moved = sorted(moved)
+    result.renamed = sorted(renamed)
+    result.missing = sorted(missing)
+    result.orphaned = sorted(orphaned)
+    result.duplicate_refs = {path: ids for path, ids in sorted(references.items()) if len(ids) > 1}
+
+    by_basename = defaultdict(list)
+    for path in result.matched:
+        by_basename[posixpath.basename(path)].append(path)
+    result.twins = {name: paths for name, paths in sorted(by_basename.items()) if len(paths) > 1}
+
+    # Basename clashes within one target's Sources phase
+    paths = project.file_paths()
+    for target_id in project.targets():
+        phase_id = project.build_phase(target_id, 'PBXSourcesBuildPhase')
+        if phase_id is None:
+            continue
+        compiled = defaultdict(set)
+        for _, file_ref_id in project.phase_file_refs(phase_id):
+            path = paths.get(file_ref_id)
+            if path and _included(path, suffixes):
+                compiled[posixpath.basename(path)].add(path)
+        name = project.display_name(target_id)
+        result.clashes.extend(
+            (name, basename, sorted(group)) for basename, group in sorted(compiled.items()) if len(group) > 1
+        )
+    return result
+
+
+def report(result, indent='  '):
+    """Print a reconciliation the way the structure tools do; returns True if clean"""
+    sections = [
+        ('⚠️  Files NOT in project.pbxproj:', result.missing),
+        ('⚠️  Orphaned references in project.pbxproj:', result.orphaned),
+        ('🚚 Moved on disk (update the reference):', [f"{old} → {new}" for old, new in result.moved]),
+        ('✏️  Renamed on disk (update the reference):', [f"{old} → {new}" for old, new in result.renamed]),
+        ('⚠️  References in no group (add them to the group of their folder):',
+         [f"{attribute} ({file_id})" + (f" → {disk_path}" if disk_path else '')
+          for file_id, attribute, disk_path in result.ungrouped]),
+        ('⚠️  Paths referenced more than once:',
+         [f"{path} ({len(ids)} references)" for path, ids in result.duplicate_refs.items()]),
+        ('❌ Same filename compiled twice in one target:',
+         [f"{target}: {', '.join(paths)}" for target, _, paths in result.clashes]),
+    ]
+    for title, lines in sections:
+        if lines:
+            print(title)
+            for line in lines:
+                print(f"{indent}- {line}")
+            print()
+    return result.clean
@@ -0,0 +1,192 @@
+"""
+Native replacement for `xcodebuild -list`
+
+Reads targets and build configurations from project.pbxproj and schemes from
+the .xcscheme XML files (shared ones in xcshareddata/, per-user ones in
+xcuserdata/). No Xcode, no subprocess, same answer on macOS and Linux.
+
+Listings are cached by a hash of every input file, so repeated runs only
+read and hash the files.
+"""
+
+import argparse
+import json
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from .cache import Cache, content_hash
+from .pbxproj import PlistError
+from .session import open_project
+
+DEFAULT_PROJECT = 'DisabilityAdvocacy.xcodeproj'
+
+# Scheme actions that carry a buildConfiguration attribute
+SCHEME_ACTIONS = ['TestAction', 'LaunchAction', 'ProfileAction', 'AnalyzeAction', 'ArchiveAction']
+
+
+class SchemeError(ValueError):
+    """Raised when an .xcscheme file can't be read"""
+
+
+def scheme_files(xcodeproj):
+    """Return (path, shared) for every scheme in a .xcodeproj bundle"""
+    xcodeproj = Path(xcodeproj)
+    files = [(path, True) for path in sorted(xcodeproj.glob('xcshareddata/xcschemes/*.xcscheme'))]
+    files += [(path, False) for path in sorted(xcodeproj.glob('xcuserdata/*.xcuserdatad/xcschemes/*.xcscheme'))]
+    return files
+
+
+def _buildable(element):
+    return {
+        'id': element.get('BlueprintIdentifier'),
+        'name': element.get('BlueprintName'),
+        'product': element.get('BuildableName'),
+        'container': element.get('ReferencedContainer'),
+    }
+
+
+def read_scheme(data, name, shared=True):
+    """Summarize one .xcscheme document"""
+    try:
+        root = ET.fromstring(data)
+    except ET.ParseError as e:
+        raise SchemeError(f"{name}.xcscheme: {e}") from e
+
+    scheme = {
+        'name': name,
+        'shared': shared,
+        'build': [_buildable(ref) for ref in root.iterfind('BuildAction/BuildActionEntries/BuildActionEntry/BuildableReference')],
+        'tests': [
+            _buildable(ref) for testable in root.iterfind('TestAction/Testables/TestableReference')
+            if testable.get('skipped') != 'YES'
+            for ref in testable.iterfind('BuildableReference')
+        ],
+        'configurations': {},
+    }
+    for action in SCHEME_ACTIONS:
+        element = root.find(action)
+        if element is not None and element.get('buildConfiguration'):
+            scheme['configurations'][action] = element.get('buildConfiguration')
+    runnable = root.find('LaunchAction/BuildableProductRunnable/BuildableReference')
+    scheme['launch'] = _buildable(runnable) if runnable is not None else None
+    return scheme
+
+
+def _list_uncached(project, name, schemes):
+    root = project.get(project.root_object) if project.root_object in project else {}
+    targets = [
+        {'id': target_id, 'name': project.display_name(target_id), 'isa': project.isa(target_id)}
+        for target_id in root.get('targets', []) if target_id in project
+    ]
+    config_list = project.get(root['buildConfigurationList']) if root.get('buildConfigurationList') in project else {}
+    configurations = [
+        project.get(config_id).get('name')
+        for config_id in config_list.get('buildConfigurations', []) if config_id in project
+    ]
+
+    details = [read_scheme(data, path.stem, shared) for path, shared, data in schemes]
+    if not details:
+        # Xcode autocreates one scheme per target when none are saved
+        details = [
+            {'name': target['name'], 'shared': False, 'autocreated': True,
+             'build': [{'id': target['id'], 'name': target['name'], 'product': None, 'container': None}],
+             'tests': [], 'configurations': {}, 'launch': None}
+            for target in targets
+        ]
+    return {
+        'project': name,
+        'targets': targets,
+        'configurations': configurations,
+        'default_configuration': config_list.get('defaultConfigurationName'),
+        'schemes': sorted(details, key=lambda scheme: scheme['name']),
+    }
+
+
+def list_project(xcodeproj=DEFAULT_PROJECT, cache=None):
+    """Return targets, configurations and schemes of a .xcodeproj, like `xcodebuild -list`
+
+    Pass a Cache to reuse listings across runs; the key covers project.pbxproj
+    and every scheme file, byte for byte.
+    """
+    xcodeproj = Path(xcodeproj)
+    with open_project(xcodeproj / 'project.pbxproj') as project:
+        schemes = [(path, shared, path.read_bytes()) for path, shared in scheme_files(xcodeproj)]
+        key = None
+        if cache is not None:
+            parts = [bytes(project.data)]
+            for path, shared, data in schemes:
+                parts += [f"{path.relative_to(xcodeproj)}:{shared}", data]
+            key = content_hash(*parts)
+            listing = cache.get(key)
+            if listing is not None:
+                return listing
+        listing = _list_uncached(project, xcodeproj.stem, schemes)
+
+    if cache is not None:
+        cache.set(key, listing)
+        cache.save()
+    return listing
+
+
+def check_schemes(listing):
+    """Return problems with schemes that xcodebuild would only report at build time"""
+    targets = {target['id']: target['name'] for target in listing['targets']}
+    configurations = set(listing['configurations'])
+    problems = []
+    for scheme in listing['schemes']:
+        references = scheme['build'] + scheme['tests'] + ([scheme['launch']] if scheme['launch'] else [])
+        for reference in references:
+            container = reference.get('container') or ''
+            if container and not container.endswith(f"{listing['project']}.xcodeproj"):
+                continue  # target lives in another project
+            if reference['id'] not in targets:
+                problems.append(
+                    f"Scheme {scheme['name']} references missing target {reference['name']} ({reference['id']})"
+                )
+            elif reference['name'] and targets[reference['id']] != reference['name']:
+                problems.append(
+                    f"Scheme {scheme['name']} calls target {reference['id']} '{reference['name']}', "
+                    f"but it is named '{targets[reference['id']]}'"
+                )
+        for action, configuration in scheme['configurations'].items():
+            if configuration not in configurations:
+                problems.append(f"Scheme {scheme['name']} {action} uses unknown configuration {configuration}")
+    return problems
+
+
+def format_listing(listing):
+    """Render a listing the way `xcodebuild -list` prints it"""
+    lines = [f'Information about project "{listing["project"]}":', '    Targets:']
+    lines += [f"        {target['name']}" for target in listing['targets']]
+    lines += ['', '    Build Configurations:']
+    lines += [f"        {name}" for name in listing['configurations']]
+    if listing['default_configuration']:
+        lines += ['', f'    If no build configuration is specified and -scheme is not passed then '
+                      f'"{listing["default_configuration"]}" is used.']
+    lines += ['', '    Schemes:']
+    lines += [f"        {scheme['name']}" for scheme in listing['schemes']]
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='List targets, configurations and schemes without xcodebuild')
+    parser.add_argument('--project', default=DEFAULT_PROJECT, help='Path to the .xcodeproj bundle')
+    parser.add_argument('--json', action='store_true', help='Print the full listing, including scheme details, as JSON')
+    parser.add_argument('--check', action='store_true', help='Also verify schemes reference existing targets and configurations')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and do not update the listing cache')
+    args = parser.parse_args(argv)
+
+    try:
+        listing = list_project(args.project, cache=None if args.no_cache else Cache('schemes'))
+    except (PlistError, SchemeError, OSError) as e:
+        print(f"❌ Could not read {args.project}: {e}", file=sys.stderr)
+        return 1
+
+    print(json.dumps(listing, indent=2) if args.json else format_listing(listing))
+    if args.check:
+        problems = check_schemes(listing)
+        for problem in problems:
+            print(f"❌ {problem}", file=sys.stderr)
+        return 1 if problems else 0
+    return 0
@@ -0,0 +1,47 @@
+"""
+One parsed project per process
+
+Chained `xcproj` subcommands (and the checks inside project_validator.py)
+all read the same project.pbxproj. open_project() maps and indexes it once
+and hands every caller the same PBXProject, so objects decoded by one
+command are already decoded for the next. A file replaced on disk - as
+ProjectEditor.write() does - is noticed by its new inode and reopened.
+"""
+
+import contextlib
+import os
+
+from . import tracing
+
+_projects = {}  # absolute path -> (stat signature, PBXProject)
+
+
+def _signature(path):
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def shared_project(path):
+    """Return the process-wide PBXProject for path, reopening it if the file changed"""
+    from .pbxproj import PBXProject
+
+    key = os.path.abspath(path)
+    signature = _signature(path)
+    entry = _projects.get(key)
+    if entry is None or entry[0] != signature:
+        # Earlier callers may still hold the old project, so it is left to
+        # the garbage collector rather than closed here
+        with tracing.span('open project', 'read', path=str(path)) as opened:
+            entry = _projects[key] = (signature, PBXProject.open(path))
+            opened.set(objects=len(entry[1]))
+    return entry[1]
+
+
+def open_project(path):
+    """Context manager over shared_project(); unlike PBXProject.open() it doesn't close the map"""
+    return contextlib.nullcontext(shared_project(path))
+
+
+def clear():
+    """Forget all shared projects (they are closed once unreferenced)"""
+    _projects.clear()
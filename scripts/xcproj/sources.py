@@ -0,0 +1,26 @@
+"""
+Swift sources on disk
+
+Shared by the structure validators and auto-add so they agree on what
+counts as a source file. Project references are matched against these by
+exact path in reconcile.py.
+"""
+
+from pathlib import Path
+
+DEFAULT_PROJECT = 'DisabilityAdvocacy.xcodeproj/project.pbxproj'
+
+# Path fragments of project internals and build products
+EXCLUDED = ('.xcodeproj', 'DerivedData', '.build')
+
+
+def find_swift_files_in_filesystem(root_dir='.'):
+    """Return Swift files under root_dir as relative path strings"""
+    root_path = Path(root_dir)
+    swift_files = set()
+    for swift_file in root_path.rglob('*.swift'):
+        rel_path = str(swift_file.relative_to(root_path))
+        if any(fragment in rel_path for fragment in EXCLUDED):
+            continue
+        swift_files.add(rel_path)
+    return swift_files
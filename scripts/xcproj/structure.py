@@ -0,0 +1,67 @@
+"""
+Simple Xcode Project Structure Validator
+Compares Swift files referenced by the project with the filesystem by
+exact path (see reconcile.py), and checks the project and its schemes
+can be read (without xcodebuild)
+"""
+
+import argparse
+from pathlib import Path
+
+from .cache import Cache
+from .pbxproj import PlistError
+from .reconcile import reconcile, report
+from .schemes import SchemeError, check_schemes, list_project
+from .session import open_project
+from .sources import DEFAULT_PROJECT, find_swift_files_in_filesystem
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare Swift files on disk with those in the project')
+    parser.add_argument('--project', default=DEFAULT_PROJECT, help='Path to project.pbxproj')
+    args = parser.parse_args(argv)
+    
+    project_root = Path('.')
+    project_file = Path(args.project)
+    
+    if not project_file.exists():
+        print(f"❌ Project file not found: {project_file}")
+        return 1
+    
+    print("🔍 Analyzing Xcode project structure...")
+    print()
+    
+    # Resolve every reference to its full path and join with the filesystem
+    with open_project(project_file) as project:
+        result = reconcile(project, find_swift_files_in_filesystem(project_root))
+    
+    # Statistics
+    print("📊 Statistics:")
+    print(f"  Swift files in filesystem: {len(result.matched) + len(result.missing)}")
+    print(f"  Matched by exact path: {len(result.matched)}")
+    if result.twins:
+        print(f"  Filenames shared by several files: {len(result.twins)} "
+              f"({', '.join(result.twins)})")
+    print()
+    
+    issues = 0 if report(result) else 1
+    
+    # Validate project can be parsed and its schemes point at real targets
+    try:
+        listing = list_project(project_file.parent, cache=Cache('schemes'))
+        print(f"✅ Project file is valid and can be parsed "
+              f"({len(listing['targets'])} targets, {len(listing['schemes'])} schemes)")
+        for problem in check_schemes(listing):
+            print(f"❌ {problem}")
+            issues = 1
+    except (PlistError, SchemeError) as e:
+        print(f"❌ Project file cannot be parsed: {e}")
+        issues = 1
+    
+    if issues == 0:
+        print()
+        print("✅ Project structure appears valid!")
+        return 0
+    else:
+        print()
+        print("❌ Project structure issues found")
+        return 1
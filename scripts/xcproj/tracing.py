@@ -0,0 +1,226 @@
+"""
+Spans for profiling the project tools
+
+Code marks phases with `with tracing.span('walk filesystem', 'fs'):`. While
+no tracer is active (the normal case) span() returns a shared no-op object,
+so instrumentation costs one global lookup. Inside profile():
+
+- every span records wall time, CPU time of its thread, net traced memory,
+  peak traced memory and net allocated blocks (tracemalloc and
+  sys.getallocatedblocks()); nested spans are included in their parents
+- writes to stdout become 'print' spans, so output cost shows up per check
+- on exit, the spans are written as Chrome trace JSON (chrome://tracing,
+  https://ui.perfetto.dev) and summarized on stderr, and an optional
+  cProfile dump is written for `python3 -m pstats` or snakeviz
+
+tracemalloc slows allocation-heavy code down several times over, so compare
+wall times between runs with the same options; memory=False skips it and
+keeps only block counts. Spans in process pool workers are not recorded.
+"""
+
+import _thread
+import contextlib
+import os
+import sys
+import time
+
+# tracemalloc (which imports pickle) and json are loaded by profile() and
+# write() only, since every tool imports this module
+tracemalloc = None
+
+_active = None
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, category='phase', **args):
+    """Context manager timing one phase; a no-op unless a tracer is active"""
+    if _active is None:
+        return _NULL_SPAN
+    return Span(_active, name, category, args)
+
+
+class Span:
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start', 'cpu', 'memory', 'blocks', 'peak')
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def set(self, **args):
+        """Attach extra values (counts, paths) to the span's trace event"""
+        self.args.update(args)
+
+    def __enter__(self):
+        tracer = self.tracer
+        tracer.flush_peak()
+        self.memory = tracer.traced()
+        self.peak = self.memory
+        self.blocks = sys.getallocatedblocks()
+        tracer.stack.append(self)
+        self.cpu = time.thread_time_ns()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter_ns()
+        cpu = time.thread_time_ns() - self.cpu
+        tracer = self.tracer
+        tracer.flush_peak()
+        tracer.stack.remove(self)
+        memory = tracer.traced()
+        tracer.record(self, end, cpu, memory - self.memory, self.peak - self.memory,
+                      sys.getallocatedblocks() - self.blocks)
+        return False
+
+
+class Tracer:
+    """Collects finished spans as Chrome trace events"""
+
+    def __init__(self, process_name='xcproj', memory=True):
+        self.process_name = process_name
+        self.memory = memory
+        self.events = []
+        self.stack = []
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+
+    def traced(self):
+        return tracemalloc.get_traced_memory()[0] if self.memory else 0
+
+    def flush_peak(self):
+        """Fold the peak since the last call into every open span"""
+        if not self.memory:
+            return
+        peak = tracemalloc.get_traced_memory()[1]
+        for open_span in self.stack:
+            open_span.peak = max(open_span.peak, peak)
+        tracemalloc.reset_peak()
+
+    def record(self, finished, end, cpu, allocated, peak, blocks):
+        args = dict(finished.args, cpu_ms=round(cpu / 1e6, 3), blocks=blocks)
+        if self.memory:
+            args.update(allocated_kb=round(allocated / 1024, 1), peak_kb=round(peak / 1024, 1))
+        self.events.append({
+            'name': finished.name, 'cat': finished.category, 'ph': 'X',
+            'ts': (finished.start - self.origin) / 1000, 'dur': (end - finished.start) / 1000,
+            'pid': self.pid, 'tid': _thread.get_ident(), 'args': args,
+        })
+        if self.memory:
+            self.events.append({
+                'name': 'traced memory', 'ph': 'C', 'ts': (end - self.origin) / 1000, 'pid': self.pid,
+                'args': {'kb': round(self.traced() / 1024, 1)},
+            })
+
+    def chrome_trace(self):
+        metadata = [
+            {'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'args': {'name': self.process_name}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': _thread.get_ident(),
+             'args': {'name': 'main'}},
+        ]
+        return {'traceEvents': metadata + self.events, 'displayTimeUnit': 'ms'}
+
+    def write(self, path):
+        import json
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+
+    def summary(self, limit=15):
+        """Lines totalling spans by name, slowest first"""
+        totals = {}
+        for event in self.events:
+            if event['ph'] != 'X':
+                continue
+            row = totals.setdefault((event['cat'], event['name']), [0, 0.0, 0.0, 0.0])
+            row[0] += 1
+            row[1] += event['dur'] / 1000
+            row[2] += event['args']['cpu_ms']
+            row[3] = max(row[3], event['args'].get('peak_kb', 0))
+        rows = sorted(totals.items(), key=lambda item: -item[1][1])
+        lines = [f"{'span':<40} {'calls':>6} {'wall ms':>9} {'cpu ms':>9} {'peak KB':>9}"]
+        for (category, name), (count, wall, cpu, peak) in rows[:limit]:
+            peak = f"{peak:>9.0f}" if self.memory else f"{'-':>9}"
+            lines.append(f"{(category + ': ' + name)[:40]:<40} {count:>6} {wall:>9.1f} {cpu:>9.1f} {peak}")
+        return lines
+
+
+class _TimedStream:
+    """Wraps stdout so each write is recorded as a 'print' span"""
+
+    def __init__(self, stream, tracer):
+        self._stream = stream
+        self._tracer = tracer
+
+    def write(self, text):
+        with Span(self._tracer, 'print', 'print', {}):
+            return self._stream.write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+@contextlib.contextmanager
+def profile(trace_path=None, cprofile_path=None, process_name='xcproj', memory=True):
+    """Trace spans to trace_path and/or run cProfile into cprofile_path
+
+    With neither path set this does nothing, so callers can wrap their work
+    unconditionally and pass the values of their --profile/--cprofile options.
+    """
+    global _active, tracemalloc
+    if not trace_path and not cprofile_path:
+        yield None
+        return
+
+    tracer = None
+    started_tracemalloc = False
+    stdout = sys.stdout
+    if trace_path:
+        import tracemalloc
+        tracer = Tracer(process_name, memory=memory)
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracemalloc = True
+        sys.stdout = _TimedStream(stdout, tracer)
+        _active = tracer
+
+    profiler = None
+    if cprofile_path:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        if tracer is not None:
+            with Span(tracer, process_name, 'run', {}):
+                yield tracer
+        else:
+            yield None
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(cprofile_path)
+        if tracer is not None:
+            _active = None
+            sys.stdout = stdout
+            if started_tracemalloc:
+                tracemalloc.stop()
+            tracer.write(trace_path)
+            for line in tracer.summary():
+                print(line, file=sys.stderr)
+            print(f"📈 Trace written to {trace_path} (open in https://ui.perfetto.dev)", file=sys.stderr)
+        if profiler is not None:
+            print(f"📈 cProfile stats written to {cprofile_path} (python3 -m pstats {cprofile_path})",
+                  file=sys.stderr)
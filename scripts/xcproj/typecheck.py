@@ -0,0 +1,497 @@
+"""
+Swift type-checker hotspots
+
+Type-checking dominates our Swift compile times, and most of it goes to a
+few expression shapes the constraint solver handles badly. Each file is
+tokenized once and scored for those shapes:
+
+- operator-chain   long chains of binary operators mixing literals, where
+                   every literal and operator multiplies the overloads the
+                   solver has to try (`a + 1 + b * 2.0 - c / 3`)
+- collection       large array/dictionary literals assigned without a type
+                   annotation, so the element type has to be inferred from
+                   every element (worse when the elements mix literal kinds)
+- view-builder     deeply nested `some View` builder bodies, which are
+                   type-checked as one result-builder expression
+- implicit-closure chains of `$0` closures (`.filter { $0... }.map { ... }`)
+                   whose parameter and result types are all inferred
+
+Scores are relative weights for ranking, not milliseconds. When logs from a
+build with `-Xfrontend -debug-time-function-bodies` (or
+`-debug-time-expression-type-checking`) are given, measured times are
+matched to the files, the ranking follows them, and the static scores are
+checked against them (Spearman rank correlation) so the heuristics can be
+trusted - or tuned - for the files that weren't measured.
+
+Results are cached per file by content hash.
+"""
+
+import argparse
+import gzip
+import os
+import re
+import sys
+from pathlib import Path
+
+from . import tracing
+from .cache import Cache, map_files, source_version
+from .sources import find_swift_files_in_filesystem
+
+DEFAULT_ROOTS = ('Shared', 'iOS', 'macOS')
+
+# Cache misses needed before analyzing in a process pool
+PARALLEL_THRESHOLD = 200
+
+# Thresholds below which a shape is not reported
+MIN_OPERATORS = 4
+MIN_ELEMENTS = 8
+MIN_VIEW_DEPTH = 6
+MIN_CLOSURES = 3
+
+BINARY_OPERATORS = {
+    '+', '-', '*', '/', '%', '??', '&&', '||', '==', '!=', '<', '>', '<=', '>=',
+    '&', '|', '^', '<<', '>>', '...', '..<',
+}
+LITERAL_KEYWORDS = {'nil', 'true', 'false'}
+
+_TOKEN = re.compile(r'''
+    (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>"""(?:.|\n)*?"""|"(?:[^"\\\n]|\\.)*")
+  | (?P<shorthand>\$\d+)
+  | (?P<ident>[@#$]?[A-Za-z_]\w*)
+  | (?P<number>\d(?:[\w]|\.\d)*)
+  | (?P<operator>\.\.[.<]|[-+*/%<>!=&|^~?]+)
+  | (?P<newline>\n)
+  | (?P<space>[ \t\r]+)
+  | (?P<punct>.)
+''', re.S | re.X)
+
+_CLOSE = {'(': ')', '{': '}', '[': ']'}
+# Tokens after which a newline doesn't end the statement
+_CONTINUES = {'(', '[', ','}
+
+# -debug-time-function-bodies: "12.34ms\t/path/File.swift:42:10\tgetter body"
+# -debug-time-expression-type-checking: "12.34ms\t/path/File.swift:42:10"
+_TIMING = re.compile(r'^\s*(\d+(?:\.\d+)?)ms\s+(\S+?\.swift):(\d+):(\d+)\s*(.*?)\s*$')
+
+_SOURCE_VERSION = source_version(__name__)
+
+
+def tokenize(text):
+    """Return [(kind, value, line)] without whitespace or comments"""
+    tokens = []
+    line = 1
+    for match in _TOKEN.finditer(text):
+        kind = match.lastgroup
+        value = match.group()
+        if kind not in ('space', 'newline', 'comment'):
+            tokens.append((kind, value, line))
+        line += value.count('\n')
+    return tokens
+
+
+def _is_literal(token):
+    kind, value, _ = token
+    return kind in ('number', 'string') or value in LITERAL_KEYWORDS
+
+
+def _literal_kind(token):
+    kind, value, _ = token
+    if kind == 'number':
+        return 'float' if '.' in value or 'e' in value.lower() and not value.startswith('0x') else 'int'
+    return kind if kind == 'string' else value
+
+
+def _matching(tokens):
+    """Index of the closing bracket for every opening bracket"""
+    matches = {}
+    stack = []
+    for index, (kind, value, _) in enumerate(tokens):
+        if kind != 'punct':
+            continue
+        if value in _CLOSE:
+            stack.append(index)
+        elif value in (')', ']', '}') and stack:
+            matches[stack.pop()] = index
+    return matches
+
+
+def _statements(tokens):
+    """Split tokens into (start, end) spans of single expressions
+
+    Braces always split (closure bodies are separate expressions here);
+    newlines split unless inside ()/[] or next to a binary operator or a
+    leading '.', which continue the expression.
+    """
+    spans = []
+    start = 0
+    depth = 0
+    for index, (kind, value, line) in enumerate(tokens):
+        if kind == 'punct' and value in ('{', '}', ';'):
+            spans.append((start, index))
+            start = index + 1
+            depth = 0
+            continue
+        if kind == 'punct' and value in ('(', '['):
+            depth += 1
+        elif kind == 'punct' and value in (')', ']'):
+            depth = max(depth - 1, 0)
+        if index > start and depth == 0 and line != tokens[index - 1][2]:
+            previous = tokens[index - 1]
+            continued = (
+                previous[1] in _CONTINUES
+                or previous[0] == 'operator' and previous[1] in BINARY_OPERATORS
+                or kind == 'operator' and value in BINARY_OPERATORS
+                or value == '.'
+            )
+            if not continued:
+                spans.append((start, index))
+                start = index
+    spans.append((start, len(tokens)))
+    return [(start, end) for start, end in spans if end > start]
+
+
+def _is_binary(tokens, index):
+    """An operator token with an operand on its left (not prefix `-x`)"""
+    kind, value, _ = tokens[index]
+    if kind != 'operator' or value not in BINARY_OPERATORS or index == 0:
+        return False
+    previous_kind, previous, _ = tokens[index - 1]
+    return previous_kind in ('ident', 'number', 'string', 'shorthand') or previous in (')', ']')
+
+
+def operator_chains(tokens):
+    """Findings for expressions with many binary operators mixing literals"""
+    findings = []
+    for start, end in _statements(tokens):
+        binary = [index for index in range(start, end) if _is_binary(tokens, index)]
+        operators = len(binary)
+        if operators < MIN_OPERATORS:
+            continue
+        # Only literals that are operands; `f("label") && g()` costs nothing extra
+        operands = {index + offset for index in binary for offset in (-1, 1)}
+        literals = sum(1 for index in operands if start <= index < end and _is_literal(tokens[index]))
+        if not literals:
+            continue
+        score = operators * (1 + literals)
+        findings.append(('operator-chain', tokens[start][2], score,
+                         f'{operators} operators with {literals} literals in one expression; '
+                         'split it into typed intermediate lets'))
+    return findings
+
+
+def _literal_elements(tokens, open_index, close_index, matches):
+    """(element count including nested literals, is dictionary, literal kinds)"""
+    count = 0
+    dictionary = False
+    kinds = set()
+    index = open_index + 1
+    element_start = index
+    while index < close_index:
+        kind, value, _ = tokens[index]
+        if kind == 'punct' and value in _CLOSE:
+            closing = matches.get(index, close_index)
+            if value == '[' and index == element_start:
+                nested, nested_dictionary, nested_kinds = _literal_elements(tokens, index, closing, matches)
+                count += nested
+                dictionary |= nested_dictionary
+                kinds |= nested_kinds
+                kinds.add('collection')
+            index = closing + 1
+            continue
+        if value == ':':
+            dictionary = True
+            element_start = index + 1
+        elif value == ',':
+            if index > element_start:
+                count += 1
+            element_start = index + 1
+        elif index == element_start:
+            kinds.add(_literal_kind(tokens[index]) if _is_literal(tokens[index]) else 'expression')
+        index += 1
+    if close_index > element_start:
+        count += 1
+    return count, dictionary, kinds
+
+
+def collection_literals(tokens, matches):
+    """Findings for large literals bound by `let/var name = [...]` with no type"""
+    findings = []
+    for index, (kind, value, line) in enumerate(tokens):
+        if value != '[' or kind != 'punct' or index < 3:
+            continue
+        if tokens[index - 1][1] != '=' or tokens[index - 3][1] not in ('let', 'var'):
+            continue  # typed (`let x: [T] = [`), a subscript, or an argument
+        close = matches.get(index)
+        if close is None:
+            continue
+        elements, dictionary, kinds = _literal_elements(tokens, index, close, matches)
+        if elements < MIN_ELEMENTS:
+            continue
+        score = elements * (2 if dictionary else 1) * max(len(kinds), 1)
+        shape = 'dictionary' if dictionary else 'array'
+        findings.append(('collection', line, score,
+                         f'untyped {shape} literal of {elements} elements ({", ".join(sorted(kinds))}); '
+                         f'annotate {tokens[index - 2][1]} with its type'))
+    return findings
+
+
+def view_builders(tokens, matches):
+    """Findings for `some View {...}` bodies nested deeper than MIN_VIEW_DEPTH"""
+    findings = []
+    for index, (kind, value, line) in enumerate(tokens):
+        if value != 'some' or index + 2 >= len(tokens) or tokens[index + 2][1] != '{':
+            continue
+        open_index = index + 2
+        close = matches.get(open_index)
+        if close is None:
+            continue
+        depth = deepest = 0
+        for _, inner, _ in tokens[open_index:close + 1]:
+            if inner == '{':
+                depth += 1
+                deepest = max(deepest, depth)
+            elif inner == '}':
+                depth -= 1
+        if deepest < MIN_VIEW_DEPTH:
+            continue
+        lines = tokens[close][2] - line + 1
+        name = tokens[index - 2][1] if index >= 2 and tokens[index - 1][1] == ':' else 'builder'
+        score = 2 ** (deepest - MIN_VIEW_DEPTH + 2) + lines // 10
+        findings.append(('view-builder', line, score,
+                         f'{name} nests {deepest} levels over {lines} lines; '
+                         'extract subviews or @ViewBuilder properties'))
+    return findings
+
+
+def implicit_closures(tokens, matches):
+    """Findings for runs of shorthand-argument closures in one expression"""
+    closures = []  # (first line, last line) of each `{ ... $0 ... }` without `in`
+    for open_index, close in sorted(matches.items()):
+        if tokens[open_index][1] != '{':
+            continue
+        depth = 0
+        shorthand = explicit = False
+        for kind, value, _ in tokens[open_index + 1:close]:
+            if value == '{':
+                depth += 1
+            elif value == '}':
+                depth -= 1
+            elif depth == 0 and kind == 'shorthand':
+                shorthand = True
+            elif depth == 0 and value == 'in':
+                explicit = True
+        if shorthand and not explicit:
+            closures.append((tokens[open_index][2], tokens[close][2]))
+
+    findings = []
+    chain = []
+    for first, last in closures + [(None, None)]:
+        if chain and first is not None and first <= chain[-1][1] + 1:
+            chain.append((first, last))
+            continue
+        if len(chain) >= MIN_CLOSURES:
+            findings.append(('implicit-closure', chain[0][0], len(chain) ** 2,
+                             f'{len(chain)} chained $0 closures; name the parameters or split the chain'))
+        chain = [(first, last)] if first is not None else []
+    return findings
+
+
+def analyze_source(text):
+    """Return [(rule, line, score, message)] sorted by descending score"""
+    tokens = tokenize(text)
+    matches = _matching(tokens)
+    findings = (
+        operator_chains(tokens) + collection_literals(tokens, matches)
+        + view_builders(tokens, matches) + implicit_closures(tokens, matches)
+    )
+    return sorted(findings, key=lambda finding: (-finding[2], finding[1], finding[0]))
+
+
+def _analyze_file(path):
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return analyze_source(f.read())
+
+
+def swift_sources(roots=DEFAULT_ROOTS, base='.'):
+    return sorted(
+        str(Path(base, root, path)) for root in roots
+        for path in find_swift_files_in_filesystem(Path(base, root))
+    )
+
+
+def analyze(roots=DEFAULT_ROOTS, base='.', cache=True, workers=None):
+    """Return {path: [(rule, line, score, message)]} for every Swift file under roots"""
+    with tracing.span('walk sources', 'fs'):
+        paths = swift_sources(roots, base)
+    results = map_files(
+        _analyze_file, paths, cache=Cache('typecheck') if cache else None,
+        version=_SOURCE_VERSION, parallel_threshold=PARALLEL_THRESHOLD, workers=workers,
+    )
+    return {path: [tuple(finding) for finding in findings] for path, findings in results.items()}
+
+
+def _log_lines(path):
+    """Lines of a build log; .xcactivitylog files are gzip with \\r line breaks"""
+    opener = gzip.open if path.endswith('.xcactivitylog') else open
+    with opener(path, 'rt', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            yield from line.split('\r')
+
+
+def read_timings(logs):
+    """Return {absolute or relative swift path: {(line, column): (ms, description)}}
+
+    The same location is reported once per architecture and per build in a
+    log, so the slowest report of each location is kept rather than a sum.
+    """
+    timings = {}
+    for log in logs:
+        paths = [str(p) for p in sorted(Path(log).rglob('*')) if p.is_file()] if os.path.isdir(log) else [log]
+        for path in paths:
+            for line in _log_lines(path):
+                match = _TIMING.match(line)
+                if not match:
+                    continue
+                ms, source, row, column, description = match.groups()
+                locations = timings.setdefault(source, {})
+                key = (int(row), int(column))
+                if key not in locations or float(ms) > locations[key][0]:
+                    locations[key] = (float(ms), description)
+    return timings
+
+
+def match_timings(timings, paths):
+    """Map log paths (usually absolute, from another checkout) onto analyzed paths
+    by the longest matching path suffix; returns {path: [(ms, line, description)]}"""
+    by_name = {}
+    for path in paths:
+        by_name.setdefault(os.path.basename(path), []).append(path)
+    matched = {}
+    for source, locations in timings.items():
+        candidates = by_name.get(os.path.basename(source), [])
+        if not candidates:
+            continue
+        normalized = source.replace(os.sep, '/')
+        path = max(candidates, key=lambda candidate: _common_suffix(normalized, candidate))
+        entries = matched.setdefault(path, [])
+        entries.extend((ms, row, description) for (row, _), (ms, description) in locations.items())
+    for entries in matched.values():
+        entries.sort(reverse=True)
+    return matched
+
+
+def _common_suffix(a, b):
+    parts_a, parts_b = a.split('/')[::-1], b.replace(os.sep, '/').split('/')[::-1]
+    count = 0
+    for part_a, part_b in zip(parts_a, parts_b):
+        if part_a != part_b:
+            break
+        count += 1
+    return count
+
+
+def _ranks(values):
+    """Average ranks (1-based) with ties sharing their mean rank"""
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return ranks
+
+
+def spearman(xs, ys):
+    """Spearman rank correlation, or None when either side is constant"""
+    if len(xs) < 3:
+        return None
+    rx, ry = _ranks(xs), _ranks(ys)
+    mean_x, mean_y = sum(rx) / len(rx), sum(ry) / len(ry)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(rx, ry))
+    spread = (sum((x - mean_x) ** 2 for x in rx) * sum((y - mean_y) ** 2 for y in ry)) ** 0.5
+    return covariance / spread if spread else None
+
+
+def rank(results, measured=None):
+    """[(path, score, measured ms or None, findings)], most in need of refactoring first"""
+    measured = measured or {}
+    rows = []
+    for path in set(results) | set(measured):
+        findings = results.get(path, [])
+        ms = sum(entry[0] for entry in measured[path]) if path in measured else None
+        rows.append((path, sum(finding[2] for finding in findings), ms, findings))
+    rows.sort(key=lambda row: (-(row[2] or 0), -row[1], row[0]))
+    return [row for row in rows if row[1] or row[2]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Rank Swift files by likely type-checking cost')
+    parser.add_argument('roots', nargs='*', default=list(DEFAULT_ROOTS), help='Directories to analyze')
+    parser.add_argument('--timings', action='append', metavar='LOG',
+                        help='Build log (or directory of logs) with -debug-time-function-bodies output')
+    parser.add_argument('--top', type=int, default=20, help='Files to list (default: 20, 0 for all)')
+    parser.add_argument('--details', type=int, default=3, help='Findings shown per file (default: 3)')
+    parser.add_argument('--rule', action='append',
+                        choices=['operator-chain', 'collection', 'view-builder', 'implicit-closure'],
+                        help='Only score these shapes')
+    parser.add_argument('--no-cache', action='store_true', help='Re-analyze every file')
+    args = parser.parse_args(argv)
+
+    results = analyze(args.roots, cache=not args.no_cache)
+    if args.rule:
+        results = {path: [f for f in findings if f[0] in args.rule] for path, findings in results.items()}
+
+    measured = None
+    if args.timings:
+        try:
+            with tracing.span('read timings', 'read'):
+                measured = match_timings(read_timings(args.timings), results)
+        except OSError as e:
+            print(f"❌ Could not read timings: {e}")
+            return 1
+        if not measured:
+            print(f"⚠️  No -debug-time-function-bodies lines for these sources in {', '.join(args.timings)}")
+
+    rows = rank(results, measured)
+    shown = rows[:args.top] if args.top else rows
+    print(f"🐢 Type-checking hotspots in {len(results)} Swift files"
+          + (f" ({len(measured)} with measured times)" if measured else ''))
+    print()
+    for number, (path, score, ms, findings) in enumerate(shown, 1):
+        timing = f"{ms:9.1f}ms" if ms is not None else ' ' * 11
+        print(f"{number:3}. {score:5}  {timing}  {path}")
+        for rule, line, finding_score, message in findings[:args.details]:
+            print(f"          :{line} [{rule}] {message}")
+        if measured and path in measured:
+            for entry_ms, line, description in measured[path][:args.details]:
+                print(f"          :{line} {entry_ms:.1f}ms {description}".rstrip())
+    if len(rows) > len(shown):
+        print(f"     ... and {len(rows) - len(shown)} more")
+
+    counts = {}
+    for findings in results.values():
+        for rule, *_ in findings:
+            counts[rule] = counts.get(rule, 0) + 1
+    print()
+    print(f"📊 {sum(counts.values())} hotspot(s) in {sum(1 for f in results.values() if f)} files: "
+          + (', '.join(f"{rule} {count}" for rule, count in sorted(counts.items())) or 'none'))
+
+    if measured:
+        both = [path for path in measured if path in results]
+        rho = spearman([sum(f[2] for f in results[p]) for p in both], [sum(e[0] for e in measured[p]) for p in both])
+        if rho is not None:
+            print(f"📈 Static score vs measured time: Spearman ρ = {rho:.2f} over {len(both)} files")
+        unflagged = [row for row in rows if row[2] and not row[1]]
+        if unflagged:
+            print("🔍 Slow but not flagged (heuristics miss these): "
+                  + ', '.join(f"{os.path.basename(path)} {ms:.0f}ms" for path, _, ms, _ in unflagged[:5]))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,743 @@
+"""
+CI workflow graph: critical path and duplicated work per trigger
+
+Every workflow under .github/workflows is parsed (PyYAML) and, for each
+trigger (push, pull_request, ...), the jobs that event starts are
+expanded into one graph:
+
+- matrix jobs become one node per combination (include/exclude applied),
+  named the way GitHub names them, so historical durations match
+- `uses: ./.github/workflows/...` jobs are replaced by the called
+  workflow's jobs, with `with:` inputs substituted; its root jobs inherit
+  the caller's `needs`, and jobs needing the caller need all of them
+- `workflow_run` workflows are chained after the workflows they follow
+- a job whose `if:` is a single `github.event_name ==`/`!=` test for
+  another event is left out
+
+Each node is weighted by its median duration over the runs given with
+--runs (`gh run view ID --json jobs,workflowName` output, or the REST
+API's jobs listing) or fetched with --fetch N through `gh` (completed runs
+are cached by run id under .cache/xcproj/). Without durations, steps are
+counted instead. The critical path is the heaviest chain of `needs`: the
+wall clock lower bound for that event, while the sum of all nodes is what
+it bills.
+
+Duplicated work is found by reducing every `run:` step to the commands
+that do work - xcodebuild actions (a test also builds), repository
+scripts, swift/swiftlint - normalized to what they do rather than how
+they are spelled (log redirections, signing overrides, derived data
+paths and -enableCodeCoverage are ignored), and every non-setup action
+to its name and inputs. A unit run by two different jobs on the same
+trigger is duplicated; a step all of whose units run elsewhere could be
+dropped (steps with more options, e.g. a coverage run, are kept over
+plainer ones). Matrix instances of one job are never duplicates of each
+other - varying them is what the matrix is for.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import posixpath
+import re
+import shlex
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from datetime import datetime
+
+from .cache import Cache
+
+WORKFLOW_DIR = '.github/workflows'
+
+# Actions that prepare a job rather than do its work
+SETUP_ACTIONS = (
+    'actions/checkout', 'actions/cache', 'actions/setup-python', 'actions/upload-artifact',
+    'actions/download-artifact', 'actions/github-script', 'maxim-lobanov/setup-xcode',
+)
+
+# Commands that need a macOS runner
+MACOS_COMMANDS = ('xcodebuild', 'xcrun', 'swift', 'swiftlint', 'simctl', 'plutil', 'codesign', 'pod')
+
+XCODEBUILD_ACTIONS = ('build', 'build-for-testing', 'test', 'test-without-building', 'analyze', 'archive')
+
+_SHELL_KEYWORDS = {'if', 'then', 'else', 'elif', 'fi', 'do', 'done', 'while', 'until', '!', '{', '}', 'time'}
+_OPERATORS = {'&&', '||', ';', '|', '&', '(', ')', ';;'}
+_REDIRECTS = re.compile(r'^\d*(>>?|<|>&|&>|<&)$')
+_CONTEXT = re.compile(r'\$\{\{\s*(matrix|inputs)\.([\w-]+)\s*\}\}')
+_DESTINATION_OUTPUT = re.compile(r'\$\{\{\s*steps\.([\w-]+)\.outputs\.destination\s*\}\}')
+_EXPRESSION = re.compile(r'\$\{\{.*?\}\}')
+_EVENT_TEST = re.compile(r"^\s*github\.event_name\s*(==|!=)\s*'([\w-]+)'\s*$")
+
+
+class WorkflowError(Exception):
+    pass
+
+
+class Job:
+    """One job instance in a trigger's graph"""
+
+    def __init__(self, key, path, workflow, name, job, matrix):
+        self.key = key
+        self.path = path
+        self.workflow = workflow
+        self.name = name
+        self.runs_on = str(job.get('runs-on', ''))
+        self.steps = job.get('steps') or []
+        self.matrix = matrix
+        self.needs = []
+        self.conditional = False  # the workflow only runs when matching paths change
+
+    @property
+    def label(self):
+        return f"{self.workflow} › {self.name}"
+
+
+def load(directory=WORKFLOW_DIR):
+    """{path: parsed workflow} for every .yml/.yaml below directory"""
+    try:
+        import yaml
+    except ImportError:
+        raise WorkflowError("PyYAML is required: python3 -m pip install -r scripts/requirements.txt")
+    workflows = {}
+    for current, _, names in os.walk(directory):
+        for name in sorted(names):
+            if name.endswith(('.yml', '.yaml')):
+                path = posixpath.normpath(posixpath.join(current.replace(os.sep, '/'), name))
+                with open(path, encoding='utf-8') as f:
+                    try:
+                        data = yaml.safe_load(f)
+                    except yaml.YAMLError as e:
+                        raise WorkflowError(f"{path}: {e}")
+                if isinstance(data, dict):
+                    workflows[path] = data
+    return workflows
+
+
+def triggers(data):
+    """{event: its filter dict or None}; PyYAML reads the `on` key as True"""
+    on = data.get('on', data.get(True))
+    if isinstance(on, str):
+        return {on: None}
+    if isinstance(on, list):
+        return {event: None for event in on}
+    return dict(on or {})
+
+
+def matrix_combinations(strategy):
+    """Matrix combinations as dicts, with GitHub's include/exclude rules"""
+    matrix = (strategy or {}).get('matrix') if isinstance(strategy, dict) else None
+    if not isinstance(matrix, dict):
+        return [{}]  # no matrix, or one computed at run time
+    keys = [key for key in matrix if key not in ('include', 'exclude')]
+    values = [matrix[key] if isinstance(matrix[key], list) else [matrix[key]] for key in keys]
+    combinations = [dict(zip(keys, combination)) for combination in itertools.product(*values)] if keys else []
+    for excluded in matrix.get('exclude') or []:
+        combinations = [c for c in combinations if any(c.get(k) != v for k, v in excluded.items())]
+    for included in matrix.get('include') or []:
+        # Extends every combination whose original values it doesn't overwrite,
+        # or becomes a combination of its own
+        matched = False
+        for combination in combinations:
+            if all(combination.get(key) == value for key, value in included.items() if key in keys):
+                combination.update(included)
+                matched = True
+        if not matched:
+            combinations.append(dict(included))
+    return combinations or [{}]
+
+
+def _substitute(value, context):
+    """Replace ${{ matrix.x }} and ${{ inputs.x }} in every string of value"""
+    if isinstance(value, str):
+        def replace(match):
+            scope = context.get(match.group(1)) or {}
+            return str(scope[match.group(2)]) if match.group(2) in scope else match.group(0)
+        return _CONTEXT.sub(replace, value)
+    if isinstance(value, dict):
+        return {key: _substitute(item, context) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_substitute(item, context) for item in value]
+    return value
+
+
+def _skipped_for(condition, event):
+    """True if a job's `if:` is a lone event_name test that rules event out"""
+    match = _EVENT_TEST.match(condition) if isinstance(condition, str) else None
+    if not match:
+        return False
+    operator, name = match.groups()
+    return (operator == '==') != (name == event)
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def expand(workflows, path, event, inputs=None, prefix='', name_prefix='', stack=(), workflow=None):
+    """Job instances of one run of the workflow at path, needs resolved to keys
+
+    Called workflows' jobs run (and are timed) as part of the caller's
+    run, so they keep the caller's workflow name.
+    """
+    data = workflows[path]
+    workflow = workflow or data.get('name') or path
+    jobs = data.get('jobs') or {}
+    instances = {}  # job id -> [Job]
+    roots = {}      # job id -> jobs that inherit this job's needs (called workflows)
+    for job_id, job in jobs.items():
+        if not isinstance(job, dict) or _skipped_for(job.get('if'), event):
+            continue
+        job = _substitute(job, {'inputs': inputs or {}})
+        instances[job_id] = []
+        roots[job_id] = []
+        for combination in matrix_combinations(job.get('strategy')):
+            resolved = _substitute(job, {'matrix': combination})
+            name = resolved.get('name') or job_id
+            suffix = ''
+            if combination and 'matrix.' not in str(job.get('name', '')):
+                # GitHub appends the values unless the name already shows them
+                suffix = f" ({', '.join(str(value) for value in combination.values())})"
+            display = f"{name_prefix}{name}{suffix}"
+            uses = resolved.get('uses')
+            if isinstance(uses, str) and uses.startswith('./'):
+                called = posixpath.normpath(uses.split('@')[0][2:])
+                if called not in workflows or called in stack:
+                    raise WorkflowError(f"{path}: job {job_id} calls {uses}, which " +
+                                        ('calls itself' if called in stack else 'does not exist'))
+                called_inputs = {
+                    key: spec.get('default') for key, spec in
+                    ((triggers(workflows[called]).get('workflow_call') or {}).get('inputs') or {}).items()
+                    if isinstance(spec, dict)
+                }
+                called_inputs.update(resolved.get('with') or {})
+                called_jobs = expand(workflows, called, event, called_inputs,
+                                     f"{prefix}{job_id}{suffix}/", f"{display} / ", stack + (path,), workflow)
+                instances[job_id].extend(called_jobs)
+                roots[job_id].extend(j for j in called_jobs if not j.needs)
+                continue
+            instance = Job(f"{path}:{prefix}{job_id}{suffix}", path, workflow, display, resolved, combination)
+            if isinstance(uses, str):
+                # A workflow in another repository: one opaque step
+                instance.steps = [{'name': uses, 'uses': uses}]
+            instances[job_id].append(instance)
+            roots[job_id].append(instance)
+
+    for job_id, job in jobs.items():
+        if job_id not in instances:
+            continue
+        needed = [key for need in _as_list(job.get('needs')) for key in
+                  (instance.key for instance in instances.get(need, []))]
+        for instance in roots[job_id]:
+            instance.needs.extend(needed)
+    return [instance for job_instances in instances.values() for instance in job_instances]
+
+
+def graph(workflows, event):
+    """Every job instance the event starts, across workflows"""
+    started = {}
+    for path, data in workflows.items():
+        events = triggers(data)
+        if event in events:
+            jobs = expand(workflows, path, event)
+            filters = events[event]
+            for job in jobs:
+                job.conditional = isinstance(filters, dict) and 'paths' in filters
+            started[path] = jobs
+
+    # workflow_run workflows follow the ones they name, until nothing is added
+    added = True
+    while added:
+        added = False
+        names = {workflows[path].get('name') or path: path for path in started}
+        for path, data in workflows.items():
+            follows = (triggers(data).get('workflow_run') or {}) if path not in started else {}
+            after = [names[name] for name in _as_list(follows.get('workflows')) if name in names]
+            if not after:
+                continue
+            jobs = expand(workflows, path, 'workflow_run')
+            sinks = [job.key for previous in after for job in started[previous]]
+            for job in jobs:
+                if not job.needs:
+                    job.needs = list(sinks)
+            started[path] = jobs
+            added = True
+    return [job for jobs in started.values() for job in jobs]
+
+
+def step_name(step, index):
+    """The name GitHub shows for a step"""
+    if step.get('name'):
+        return str(step['name'])
+    if isinstance(step.get('run'), str) and step['run'].strip():
+        return f"Run {step['run'].strip().splitlines()[0]}"
+    if step.get('uses'):
+        return f"Run {step['uses']}"
+    return f"step {index + 1}"
+
+
+def _seconds(start, end):
+    try:
+        started = datetime.fromisoformat(start.replace('Z', '+00:00'))
+        completed = datetime.fromisoformat(end.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+    if started.year < 2000:
+        return None  # skipped steps report 0001-01-01
+    seconds = (completed - started).total_seconds()
+    return seconds if seconds > 0 else None
+
+
+class Durations:
+    """Median job and step durations from run exports, keyed by workflow and job name"""
+
+    def __init__(self):
+        self.jobs = defaultdict(list)
+        self.steps = defaultdict(list)
+        self.runs = 0
+
+    def add_run(self, data):
+        """One run's jobs: gh run view --json jobs,workflowName, or a REST jobs listing"""
+        self.runs += 1
+        for job in data.get('jobs') or []:
+            workflow = data.get('workflowName') or job.get('workflow_name') or ''
+            seconds = _seconds(job.get('startedAt') or job.get('started_at'),
+                               job.get('completedAt') or job.get('completed_at'))
+            if seconds is not None:
+                self.jobs[(workflow, job.get('name'))].append(seconds)
+            for step in job.get('steps') or []:
+                seconds = _seconds(step.get('startedAt') or step.get('started_at'),
+                                   step.get('completedAt') or step.get('completed_at'))
+                if seconds is not None:
+                    self.steps[(workflow, job.get('name'), step.get('name'))].append(seconds)
+
+    def __bool__(self):
+        return bool(self.jobs)
+
+    def per_step(self):
+        """Median seconds per step, to estimate jobs with no history"""
+        ratios = [
+            statistics.median(times) / len(job_steps)
+            for (workflow, name), times in self.jobs.items()
+            for job_steps in [[key for key in self.steps if key[:2] == (workflow, name)]] if job_steps
+        ]
+        return statistics.median(ratios) if ratios else 60.0
+
+
+def read_runs(paths, durations):
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        for run in data if isinstance(data, list) else [data]:
+            durations.add_run(run)
+
+
+def fetch_runs(limit, durations):
+    """The last `limit` completed runs through gh; each run is fetched once"""
+    cache = Cache('ci-runs')
+    try:
+        listed = subprocess.run(
+            ['gh', 'run', 'list', '--limit', str(limit), '--status', 'completed',
+             '--json', 'databaseId,workflowName'],
+            capture_output=True, text=True, check=True)
+        for run in json.loads(listed.stdout):
+            key = str(run['databaseId'])
+            data = cache.get(key)
+            if data is None:
+                viewed = subprocess.run(['gh', 'run', 'view', key, '--json', 'jobs,workflowName'],
+                                        capture_output=True, text=True, check=True)
+                data = json.loads(viewed.stdout)
+                cache.set(key, data)
+            durations.add_run(data)
+    except (OSError, subprocess.CalledProcessError, ValueError) as e:
+        raise WorkflowError(f"could not fetch runs with gh: {getattr(e, 'stderr', '') or e}")
+    finally:
+        cache.save()
+
+
+class Weights:
+    """Seconds when durations are known (estimated from step counts where
+    a job has no history), step counts otherwise"""
+
+    def __init__(self, durations):
+        self.durations = durations
+        self.seconds = bool(durations)
+        self.per_step = durations.per_step() if self.seconds else 1.0
+        self.estimated = set()
+
+    def job(self, job):
+        times = self.durations.jobs.get((job.workflow, job.name))
+        if times:
+            return statistics.median(times)
+        if self.seconds:
+            self.estimated.add(job.key)
+        return max(len(job.steps), 1) * self.per_step
+
+    def step(self, job, index):
+        times = self.durations.steps.get((job.workflow, job.name, step_name(job.steps[index], index)))
+        return statistics.median(times) if times else self.per_step
+
+    def format(self, value):
+        if not self.seconds:
+            return f"{value:g} step{'s' if value != 1 else ''}"
+        minutes, seconds = divmod(int(round(value)), 60)
+        return f"{minutes}m{seconds:02d}s" if minutes else f"{seconds}s"
+
+
+def critical_path(jobs, weight):
+    """(total weight, [jobs]) of the heaviest chain of needs"""
+    by_key = {job.key: job for job in jobs}
+    best = {}
+
+    def finish(job, visiting=()):
+        if job.key not in best:
+            if job.key in visiting:
+                raise WorkflowError(f"needs cycle through {job.label}")
+            previous = [finish(by_key[key], visiting + (job.key,)) for key in job.needs if key in by_key]
+            total, chain = max(previous, key=lambda item: item[0], default=(0, []))
+            best[job.key] = (total + weight(job), chain + [job])
+        return best[job.key]
+
+    return max((finish(job) for job in jobs), key=lambda item: item[0], default=(0, []))
+
+
+def _commands(script):
+    """Simple commands (token lists) of a shell script, keywords and redirections removed"""
+    script = re.sub(r'\\\n', ' ', script)
+    for line in script.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            lexer = shlex.shlex(line, posix=True, punctuation_chars=True)
+            lexer.whitespace_split = True
+            lexer.commenters = '#'
+            tokens = list(lexer)
+        except ValueError:
+            tokens = line.split()
+        command = []
+        skip_next = False
+        for token in tokens + [';']:
+            if skip_next:
+                skip_next = False
+            elif token in _OPERATORS:
+                while command and command[0] in _SHELL_KEYWORDS:
+                    command.pop(0)
+                if command:
+                    yield command
+                command = []
+            elif _REDIRECTS.match(token):
+                # `2>&1` arrives as '2', '>&', '1'
+                if command and command[-1].isdigit():
+                    command.pop()
+                skip_next = True
+            else:
+                command.append(token)
+
+
+def _xcodebuild_units(tokens):
+    """Work units of one xcodebuild invocation; a test also builds
+
+    Only the scheme, SDK, configuration, destination and test selection
+    say what is done; every other option is left out.
+    """
+    options = {}
+    actions = []
+    only = []
+    index = 1
+    while index < len(tokens):
+        token = tokens[index]
+        if token.startswith('-only-testing:') or token.startswith('-skip-testing:'):
+            only.append(token.lstrip('-'))
+        elif token == '-resolvePackageDependencies':
+            actions.append('resolve')
+        elif token.startswith('-') and index + 1 < len(tokens):
+            options[token] = tokens[index + 1]
+            index += 1
+        elif token in XCODEBUILD_ACTIONS:
+            actions.append(token)
+        index += 1
+    scheme = options.get('-scheme', '')
+    sdk = options.get('-sdk', '')
+    configuration = options.get('-configuration', '')
+    units = []
+    for action in actions or ['build']:
+        if action == 'resolve':
+            units.append(('xcodebuild -resolvePackageDependencies',))
+            continue
+        if action in ('build', 'build-for-testing', 'test'):
+            units.append(('xcodebuild build', scheme, sdk, configuration or 'Debug'))
+        if action in ('test', 'test-without-building'):
+            units.append(('xcodebuild test', scheme, sdk, configuration or 'Debug',
+                          options.get('-destination', ''), *sorted(only)))
+        if action in ('analyze', 'archive'):
+            units.append((f"xcodebuild {action}", scheme, sdk, configuration))
+    return list(dict.fromkeys(units))
+
+
+def step_units(step, outputs=None):
+    """(work units, option count, needs macOS) of one step
+
+    outputs maps step ids to the destination they resolved, so a
+    `-destination "${{ steps.simulator.outputs.destination }}"` compares
+    by device rather than by spelling.
+    """
+    uses = step.get('uses')
+    if isinstance(uses, str):
+        action = uses.split('@')[0]
+        if action.startswith(SETUP_ACTIONS):
+            return [], 0, False
+        inputs = json.dumps(step.get('with') or {}, sort_keys=True)
+        return [('action', action, inputs)], 0, False
+    script = step.get('run')
+    if not isinstance(script, str):
+        return [], 0, False
+    script = _DESTINATION_OUTPUT.sub(lambda m: (outputs or {}).get(m.group(1), m.group(0)), script)
+    script = _EXPRESSION.sub('EXPR', script)
+    units = []
+    options = 0
+    macos = False
+    for tokens in _commands(script):
+        while tokens and '=' in tokens[0] and not tokens[0].startswith('-'):
+            tokens = tokens[1:]  # VAR=value prefixes
+        if not tokens:
+            continue
+        program = posixpath.basename(tokens[0])
+        macos = macos or program in MACOS_COMMANDS
+        if program == 'xcodebuild':
+            units.extend(_xcodebuild_units(tokens))
+            options += len(tokens)
+        elif program.startswith('python') and len(tokens) > 1 and tokens[1].endswith('.py'):
+            units.append(('python3', posixpath.normpath(tokens[1]), *tokens[2:]))
+            options += len(tokens)
+        elif program in ('bash', 'sh', 'zsh') and len(tokens) > 1 and tokens[1].endswith('.sh'):
+            units.append(('sh', posixpath.normpath(tokens[1]), *tokens[2:]))
+            options += len(tokens)
+        elif program.endswith('.sh'):
+            units.append(('sh', posixpath.normpath(tokens[0]), *tokens[1:]))
+            options += len(tokens)
+        elif program in ('swift', 'swiftlint'):
+            units.append(tuple(tokens))
+            options += len(tokens)
+    return list(dict.fromkeys(units)), options, macos
+
+
+def _destinations(job):
+    """{step id: 'name=Device'} for resolve-destination.py steps"""
+    outputs = {}
+    for step in job.steps:
+        script = step.get('run') or ''
+        if step.get('id') and 'resolve-destination.py' in script:
+            match = re.search(r'--name\s+"([^"]+)"|--name\s+(\S+)', script)
+            if match:
+                outputs[step['id']] = f"name={match.group(1) or match.group(2)}"
+    return outputs
+
+
+def _needs_macos(job, root):
+    for step in job.steps:
+        if not isinstance(step.get('run'), str):
+            continue
+        _, _, macos = step_units(step)
+        if macos:
+            return True
+        for tokens in _commands(_EXPRESSION.sub('EXPR', step['run'])):
+            script = next((token for token in tokens if token.endswith('.sh')), None)
+            script = script and os.path.join(root, script)
+            if script and os.path.isfile(script):
+                with open(script, encoding='utf-8', errors='replace') as f:
+                    if re.search(r'\b(%s)\b' % '|'.join(MACOS_COMMANDS), f.read()):
+                        return True
+    return False
+
+
+def duplicates(jobs, weights):
+    """([(unit, [(job, step index)])], [(job, step index, weight)] removable)"""
+    occurrences = defaultdict(list)
+    steps = []  # (job, index, units, options)
+    for job in jobs:
+        outputs = _destinations(job)
+        # A step whose outputs a later step reads can't go
+        read = set(re.findall(r'steps\.([\w-]+)\.', json.dumps(job.steps)))
+        for index, step in enumerate(job.steps):
+            units, options, _ = step_units(step, outputs)
+            if units:
+                if step.get('id') not in read:
+                    steps.append((job, index, units, options))
+                for unit in units:
+                    occurrences[unit].append((job, index))
+
+    def family(job):
+        # Matrix instances of one job are one family
+        return (job.path, job.key.split(' (')[0])
+
+    repeated = {
+        unit: places for unit, places in occurrences.items()
+        if len({family(job) for job, _ in places}) > 1
+    }
+
+    # Drop plain, heavy steps first while what they do still runs elsewhere
+    removed = set()
+    removable = []
+    candidates = sorted(steps, key=lambda item: (item[3], -weights.step(item[0], item[1]), item[0].key))
+    for job, index, units, _ in candidates:
+        if all(
+            any(family(other) != family(job) and (other.key, other_index) not in removed
+                for other, other_index in repeated.get(unit, []))
+            for unit in units
+        ):
+            removed.add((job.key, index))
+            removable.append((job, index, weights.step(job, index)))
+    return sorted(repeated.items(), key=lambda item: (item[0][0], item[0])), removable
+
+
+def describe_unit(unit):
+    kind = unit[0]
+    if kind == 'xcodebuild test':
+        _, scheme, sdk, configuration, destination, *only = unit
+        detail = ', '.join(part for part in (sdk, configuration, destination, *only) if part)
+        return f"xcodebuild test {scheme} ({detail})"
+    if kind.startswith('xcodebuild') and len(unit) > 1:
+        detail = ', '.join(part for part in unit[2:] if part)
+        return f"{kind} {unit[1]}" + (f" ({detail})" if detail else '')
+    if kind == 'action':
+        return f"uses {unit[1]}" + ('' if unit[2] == '{}' else f" with {unit[2]}")
+    return ' '.join(unit)
+
+
+def analyze(workflows, durations=None, events=None, root='.'):
+    """Per-event graphs, duplicated work and runner advice as a dict"""
+    weights = Weights(durations or Durations())
+    all_events = sorted({event for data in workflows.values() for event in triggers(data)} - {'workflow_call'})
+    report = {'unit': 'seconds' if weights.seconds else 'steps', 'runs': (durations or Durations()).runs,
+              'events': {}, 'duplicates': [], 'ubuntu_candidates': [], 'uncalled': []}
+
+    merged = {}
+    for event in events or all_events:
+        jobs = graph(workflows, event)
+        if not jobs:
+            continue
+        job_weight = {job.key: weights.job(job) for job in jobs}
+        total, chain = critical_path(jobs, lambda job: job_weight[job.key])
+        per_workflow = defaultdict(list)
+        for job in jobs:
+            per_workflow[job.workflow].append(job)
+        repeated, removable = duplicates(jobs, weights)
+        report['events'][event] = {
+            'jobs': [{'workflow': job.workflow, 'job': job.name, 'runs_on': job.runs_on,
+                      'weight': job_weight[job.key], 'estimated': job.key in weights.estimated,
+                      'conditional': job.conditional, 'needs': job.needs} for job in jobs],
+            'work': sum(job_weight.values()),
+            'critical_path': {'weight': total, 'jobs': [job.label for job in chain]},
+            'workflows': sorted(
+                ((name, critical_path(members, lambda job: job_weight[job.key])[0])
+                 for name, members in per_workflow.items()),
+                key=lambda item: -item[1]),
+            'removable': [{'job': job.label, 'step': step_name(job.steps[index], index),
+                           'weight': weight} for job, index, weight in removable],
+            'saving': sum(weight for _, _, weight in removable),
+        }
+        for unit, places in repeated:
+            labels = tuple(sorted(dict.fromkeys(
+                f"{job.label} › {step_name(job.steps[index], index)}" for job, index in places)))
+            merged.setdefault((unit, labels), []).append(event)
+        for job in jobs:
+            if 'macos' in job.runs_on.lower() and not _needs_macos(job, root):
+                if job.label not in report['ubuntu_candidates']:
+                    report['ubuntu_candidates'].append(job.label)
+
+    report['duplicates'] = [
+        {'work': describe_unit(unit), 'events': events_, 'steps': list(labels)}
+        for (unit, labels), events_ in merged.items()
+    ]
+    called = {
+        posixpath.normpath(job['uses'].split('@')[0][2:])
+        for data in workflows.values() for job in (data.get('jobs') or {}).values()
+        if isinstance(job, dict) and isinstance(job.get('uses'), str) and job['uses'].startswith('./')
+    }
+    report['uncalled'] = sorted(
+        path for path, data in workflows.items()
+        if set(triggers(data)) == {'workflow_call'} and path not in called
+    )
+    report['estimated'] = sorted(weights.estimated)
+    return report, weights
+
+
+def print_report(report, weights, directory):
+    source = (f"median durations from {report['runs']} run(s)" if weights.seconds else
+              'step counts (no run history given; see --runs/--fetch)')
+    print(f"🔀 CI workflow graph ({directory}), weighted by {source}")
+    for event, details in report['events'].items():
+        conditional = sum(1 for job in details['jobs'] if job['conditional'])
+        print()
+        print(f"▶ {event}: {len(details['jobs'])} jobs, {weights.format(details['work'])} of work"
+              + (f" ({conditional} only when matching paths change)" if conditional else ''))
+        path = details['critical_path']
+        print(f"  ⏱️  Critical path ({weights.format(path['weight'])}): {'  →  '.join(path['jobs'])}")
+        for name, weight in details['workflows'][:5]:
+            print(f"     {weights.format(weight):>9}  {name}")
+        if details['removable']:
+            print(f"  ✂️  Steps whose work runs elsewhere ({weights.format(details['saving'])} per {event}):")
+            for item in details['removable']:
+                print(f"     - {item['job']} › {item['step']} ({weights.format(item['weight'])})")
+
+    if report['duplicates']:
+        print()
+        print('🔁 Duplicated work (one unit run by different jobs on the same event):')
+        for item in report['duplicates']:
+            print(f"  {item['work']}  [{', '.join(item['events'])}]")
+            for step in item['steps']:
+                print(f"    - {step}")
+    if report['ubuntu_candidates']:
+        print()
+        print('🖥️  macOS jobs with no macOS-only command (ubuntu-latest minutes cost a tenth):')
+        for label in report['ubuntu_candidates']:
+            print(f"  - {label}")
+    if report['uncalled']:
+        print()
+        print('📦 Reusable workflows no job calls (GitHub only loads them directly from .github/workflows):')
+        for path in report['uncalled']:
+            print(f"  - {path}")
+    if report['estimated'] and weights.seconds:
+        print()
+        print(f"ℹ️  {len(report['estimated'])} job(s) had no history; estimated from their step count")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Critical path and duplicated work of the CI workflows')
+    parser.add_argument('--workflows', default=WORKFLOW_DIR, help=f'Workflow directory (default: {WORKFLOW_DIR})')
+    parser.add_argument('--event', action='append', help='Only this trigger (repeatable; default: all)')
+    parser.add_argument('--runs', action='append', default=[], metavar='FILE',
+                        help="Job durations: `gh run view ID --json jobs,workflowName` output or a REST jobs listing")
+    parser.add_argument('--fetch', type=int, metavar='N', help='Fetch the last N completed runs with gh')
+    parser.add_argument('--format', choices=['text', 'json'], default='text', help='Output format')
+    parser.add_argument('--strict', action='store_true', help='Exit 1 when duplicated work is found')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.workflows):
+        print(f"❌ Workflow directory not found: {args.workflows}")
+        return 1
+    try:
+        workflows = load(args.workflows)
+        durations = Durations()
+        read_runs(args.runs, durations)
+        if args.fetch:
+            fetch_runs(args.fetch, durations)
+        root = os.path.dirname(os.path.dirname(os.path.normpath(args.workflows)))
+        report, weights = analyze(workflows, durations, args.event, root)
+    except (OSError, ValueError, WorkflowError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    if args.format == 'json':
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print_report(report, weights, args.workflows)
+    return 1 if args.strict and report['duplicates'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
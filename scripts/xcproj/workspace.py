@@ -0,0 +1,98 @@
+"""
+Find the Xcode projects in a repository
+
+Projects are found two ways, both from one FileIndex of the repository:
+every `*.xcodeproj/project.pbxproj` on disk, and every project referenced
+by a standalone workspace's contents.xcworkspacedata (a workspace can point
+outside its own directory, or at a project that no longer exists).
+Workspaces embedded in a project (project.xcworkspace) and SwiftPM's
+generated .swiftpm workspaces only refer to their own container and are
+skipped.
+"""
+
+import os
+import xml.etree.ElementTree as ET
+
+WORKSPACE_DATA = 'contents.xcworkspacedata'
+
+
+class WorkspaceError(ValueError):
+    pass
+
+
+def _resolve(location, group_dir, container_dir):
+    kind, _, path = location.partition(':')
+    if kind == 'group':
+        return os.path.normpath(os.path.join(group_dir, path))
+    if kind == 'container':
+        return os.path.normpath(os.path.join(container_dir, path))
+    if kind == 'absolute':
+        return os.path.normpath(path)
+    if kind == 'self':
+        return container_dir
+    raise WorkspaceError(f"unsupported location '{location}'")
+
+
+def read_workspace(workspace):
+    """Return the .xcodeproj paths a .xcworkspace references, in file order
+
+    Paths are relative to the current directory when the workspace path is.
+    Group elements nest: a group's location is the base for its children.
+    """
+    container_dir = os.path.dirname(os.path.normpath(workspace))
+    try:
+        root = ET.parse(os.path.join(workspace, WORKSPACE_DATA)).getroot()
+    except (OSError, ET.ParseError) as e:
+        raise WorkspaceError(f"{workspace}: {e}")
+    if root.tag != 'Workspace':
+        raise WorkspaceError(f"{workspace}: not a workspace (root element <{root.tag}>)")
+
+    projects = []
+
+    def visit(element, group_dir):
+        for child in element:
+            location = child.get('location', '')
+            if child.tag == 'Group':
+                visit(child, _resolve(location, group_dir, container_dir) if location else group_dir)
+            elif child.tag == 'FileRef' and location:
+                path = _resolve(location, group_dir, container_dir)
+                if path.endswith('.xcodeproj') and path not in projects:
+                    projects.append(path)
+
+    visit(root, container_dir)
+    return projects
+
+
+def _is_generated(path):
+    parts = path.split('/')
+    return any(part.endswith('.xcodeproj') or part == '.swiftpm' for part in parts[:-1])
+
+
+def discover(index):
+    """Projects and workspaces under a FileIndex
+
+    Returns (projects, workspaces, missing): projects are .xcodeproj paths
+    relative to the index root, sorted; workspaces maps each standalone
+    .xcworkspace to the projects it references; missing lists
+    (workspace, project) references to projects that aren't on disk.
+    """
+    projects = set()
+    workspaces = {}
+    for path in index.files:
+        directory, _, name = path.rpartition('/')
+        if name == 'project.pbxproj' and directory.endswith('.xcodeproj'):
+            projects.add(directory)
+        elif name == WORKSPACE_DATA and directory.endswith('.xcworkspace') and not _is_generated(directory):
+            workspaces[directory] = None
+
+    missing = []
+    for workspace in workspaces:
+        referenced = [
+            os.path.relpath(project, index.root).replace(os.sep, '/')
+            for project in read_workspace(os.path.join(index.root, workspace))
+        ]
+        workspaces[workspace] = referenced
+        for project in referenced:
+            if f"{project}/project.pbxproj" not in index:
+                missing.append((workspace, project))
+    return sorted(projects), workspaces, missing
@@ -0,0 +1,350 @@
+"""
+Minimal-diff, canonical writer for project.pbxproj
+
+ProjectEditor records edits against a PBXProject and writes them back as
+byte-range splices over the original file in one buffered write. Untouched
+objects are copied byte-for-byte, so an unedited project round-trips exactly
+and an edit only changes the lines it has to.
+
+New and rewritten objects are formatted the way Xcode writes them: `isa`
+first, keys sorted, PBXBuildFile/PBXFileReference on a single line, objects
+sorted by ID within their `/* Begin ... section */`.
+"""
+
+import copy
+import os
+import re
+import tempfile
+
+# Objects Xcode writes on a single line
+SINGLE_LINE_ISAS = {'PBXBuildFile', 'PBXFileReference'}
+
+# Keys whose values are object IDs but which Xcode writes without a comment
+UNCOMMENTED_KEYS = {'remoteGlobalIDString', 'TestTargetID'}
+
+BUILD_PHASE_NAMES = {
+    'PBXSourcesBuildPhase': 'Sources',
+    'PBXResourcesBuildPhase': 'Resources',
+    'PBXFrameworksBuildPhase': 'Frameworks',
+    'PBXHeadersBuildPhase': 'Headers',
+    'PBXCopyFilesBuildPhase': 'CopyFiles',
+    'PBXShellScriptBuildPhase': 'ShellScript',
+    'PBXRezBuildPhase': 'Rez',
+}
+
+SECTION_MARKER = re.compile(rb'^[ \t]*/\* (Begin|End) (\w+) section \*/[^\n]*\n?', re.M)
+_UNQUOTED = re.compile(r'[A-Za-z0-9_$./]+')
+
+
+def quote(value):
+    """Quote a string the way Xcode does, only when it has to"""
+    if _UNQUOTED.fullmatch(value) and '//' not in value and '___' not in value:
+        return value
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"')
+               .replace('\n', '\\n').replace('\t', '\\t'))
+    return f'"{escaped}"'
+
+
+def sorted_keys(obj):
+    """Xcode's key order: isa first, then the remaining keys sorted"""
+    keys = sorted(key for key in obj if key != 'isa')
+    return ['isa'] + keys if 'isa' in obj else keys
+
+
+class ProjectEditor:
+    """Collects edits to a PBXProject and writes them as spliced byte ranges"""
+
+    def __init__(self, project):
+        self.project = project
+        self._new = {}        # id -> dict for objects added in this transaction
+        self._current = {}    # id -> edited copy of an existing object
+        self._rewrite = set()  # existing objects to re-serialize in full
+        self._removed = set()
+        self._splices = {}    # id -> [(start, end, bytes)] inside an existing object
+        self._comments = {}   # id -> reference comment overriding the computed one
+
+    # -- Reading through the pending edits ---------------------------------
+
+    def __contains__(self, object_id):
+        return object_id in self._new or (object_id in self.project and object_id not in self._removed)
+
+    def get(self, object_id):
+        """Return an object as it will be written"""
+        if object_id in self._new:
+            return self._new[object_id]
+        if object_id in self._current:
+            return self._current[object_id]
+        return self.project.get(object_id)
+
+    def isa(self, object_id):
+        if object_id in self._new:
+            return self._new[object_id].get('isa')
+        return self.project.isa(object_id)
+
+    def ids(self, isa=None):
+        ids = [object_id for object_id in self.project.ids(isa) if object_id not in self._removed]
+        return ids + [object_id for object_id, obj in self._new.items() if isa is None or obj.get('isa') == isa]
+
+    def _editable(self, object_id):
+        if object_id in self._new:
+            return self._new[object_id]
+        if object_id not in self._current:
+            self._current[object_id] = copy.deepcopy(self.project.get(object_id))
+        return self._current[object_id]
+
+    @property
+    def modified(self):
+        return bool(self._new or self._current or self._removed)
+
+    # -- Edits --------------------------------------------------------------
+
+    def add_object(self, object_id, obj, comment=None):
+        """Add a new object; it is placed in its section in ID order
+
+        `comment` overrides the reference comment computed from the object,
+        e.g. when copying an object from another revision of the project.
+        """
+        if object_id in self:
+            raise KeyError(f"Object {object_id} already exists")
+        self._new[object_id] = obj
+        if comment is not None:
+            self._comments[object_id] = comment
+
+    def update_object(self, object_id, obj, comment=None):
+        """Replace an object's contents (and optionally its reference comment)"""
+        if comment is not None:
+            self._comments[object_id] = comment
+        if object_id in self._new:
+            self._new[object_id] = obj
+            return
+        self._current[object_id] = obj
+        self._rewrite.add(object_id)
+        self._splices.pop(object_id, None)
+
+    def remove_object(self, object_id):
+        if self._new.pop(object_id, None) is not None:
+            return
+        self._removed.add(object_id)
+        self._rewrite.discard(object_id)
+        self._splices.pop(object_id, None)
+
+    def append_child(self, owner_id, key, child_id):
+        """Append an ID to a list such as a group's children or a phase's files"""
+        obj = self._editable(owner_id)
+        obj.setdefault(key, []).append(child_id)
+        if owner_id in self._new or owner_id in self._rewrite:
+            return
+
+        span = self.project.value_spans(owner_id).get(key)
+        data = self.project.data
+        if span is None or data[span[1] - 1:span[1]] != b')':
+            self._rewrite.add(owner_id)
+            return
+        close = span[1] - 1
+        line_start = data.rfind(b'\n', span[0], close) + 1
+        indent = data[line_start:close]
+        if line_start == 0 or indent.strip(b' \t'):
+            # Inline list, e.g. `files = ();` - rewrite the whole object
+            self._rewrite.add(owner_id)
+            return
+        line = f"{indent.decode('ascii')}\t{self._reference(child_id)},\n"
+        self._splices.setdefault(owner_id, []).append((line_start, line_start, line.encode('utf-8')))
+
+    def remove_child(self, owner_id, key, child_id):
+        """Remove an ID from a list, leaving the rest of the object untouched"""
+        obj = self._editable(owner_id)
+        if child_id not in obj.get(key, []):
+            return
+        obj[key] = [item for item in obj[key] if item != child_id]
+        if owner_id in self._new or owner_id in self._rewrite:
+            return
+
+        span = self.project.value_spans(owner_id).get(key)
+        data = self.project.data
+        item = re.compile(rb'^[ \t]*' + re.escape(child_id.encode('ascii')) + rb'(?: /\*.*?\*/)?,[ \t]*\n', re.M)
+        match = item.search(data, span[0], span[1]) if span else None
+        if match is None:
+            self._rewrite.add(owner_id)
+            return
+        self._splices.setdefault(owner_id, []).append((match.start(), match.end(), b''))
+
+    # -- Comments -----------------------------------------------------------
+
+    def comment(self, object_id):
+        """Return the `/* ... */` comment Xcode writes for a reference"""
+        if object_id in self._comments:
+            return self._comments[object_id]
+        if object_id in self.project:
+            return self.project.comment(object_id)
+        if object_id not in self:
+            return None
+
+        obj = self.get(object_id)
+        isa = obj.get('isa')
+        if isa == 'PBXBuildFile':
+            file_id = obj.get('fileRef') or obj.get('productRef')
+            file_name = self.comment(file_id) if file_id else None
+            phase = next((
+                phase_id for phase_id in self.ids()
+                if self.isa(phase_id) in BUILD_PHASE_NAMES and object_id in self.get(phase_id).get('files', [])
+            ), None)
+            if phase is None:
+                return file_name
+            return f"{file_name} in {self.comment(phase)}"
+        if isa in BUILD_PHASE_NAMES:
+            return obj.get('name') or BUILD_PHASE_NAMES[isa]
+        if isa == 'PBXProject':
+            return 'Project object'
+        if isa == 'XCConfigurationList':
+            for owner_id in self.ids():
+                owner = self.get(owner_id)
+                if owner.get('buildConfigurationList') == object_id:
+                    owner_name = owner.get('name') if owner.get('isa') != 'PBXProject' else self._project_name()
+                    return f'Build configuration list for {owner["isa"]} "{owner_name}"'
+            return None
+        if isa in ('PBXContainerItemProxy', 'PBXTargetDependency'):
+            return isa
+        return obj.get('name') or obj.get('path') or obj.get('productName')
+
+    def _project_name(self):
+        if self.project.path:
+            return os.path.splitext(os.path.basename(os.path.dirname(os.path.abspath(self.project.path))))[0]
+        return None
+
+    def _reference(self, value, key=None):
+        if key in UNCOMMENTED_KEYS or value not in self:
+            return quote(value)
+        comment = self.comment(value)
+        return f"{quote(value)} /* {comment} */" if comment else quote(value)
+
+    # -- Formatting ---------------------------------------------------------
+
+    def _format_value(self, value, key, depth, single_line):
+        if isinstance(value, dict):
+            if single_line:
+                body = ''.join(
+                    f"{quote(k)} = {self._format_value(value[k], k, depth + 1, True)}; "
+                    for k in sorted_keys(value)
+                )
+                return '{' + body + '}'
+            inner = '\t' * (depth + 1)
+            body = ''.join(
+                f"{inner}{quote(k)} = {self._format_value(value[k], k, depth + 1, False)};\n"
+                for k in sorted_keys(value)
+            )
+            return '{\n' + body + '\t' * depth + '}'
+        if isinstance(value, list):
+            if single_line:
+                return '(' + ''.join(f"{self._format_value(item, key, depth + 1, True)}, " for item in value) + ')'
+            inner = '\t' * (depth + 1)
+            body = ''.join(f"{inner}{self._format_value(item, key, depth + 1, False)},\n" for item in value)
+            return '(\n' + body + '\t' * depth + ')'
+        return self._reference(value, key)
+
+    def format_object(self, object_id, obj=None, depth=2):
+        """Format an `ID = {...};` entry nested depth tabs deep (without indentation)"""
+        obj = self.get(object_id) if obj is None else obj
+        single_line = obj.get('isa') in SINGLE_LINE_ISAS
+        return f"{self._reference(object_id)} = {self._format_value(obj, None, depth, single_line)};"
+
+    # -- Writing ------------------------------------------------------------
+
+    def _line_range(self, object_id):
+        """Byte range of an object's whole line(s), including indentation and newline"""
+        data = self.project.data
+        start, end = self.project.span(object_id)
+        line_start = data.rfind(b'\n', 0, start) + 1
+        if data[line_start:start].strip(b' \t'):
+            line_start = start
+        if data[end:end + 1] == b'\n':
+            end += 1
+        return line_start, end
+
+    def _section_insertions(self):
+        """Place each new object in its section, creating sections as needed"""
+        data = self.project.data
+        sections = {}
+        for match in SECTION_MARKER.finditer(data):
+            kind, isa = match.group(1).decode('ascii'), match.group(2).decode('ascii')
+            sections.setdefault(isa, {})[kind] = match
+
+        edits = []
+        new_sections = {}
+        for object_id in sorted(self._new):
+            isa = self._new[object_id].get('isa')
+            existing = self.project.ids(isa)
+            text = ('\t\t' + self.format_object(object_id) + '\n').encode('utf-8')
+            if existing:
+                following = next((oid for oid in existing if oid > object_id), None)
+                if following is not None:
+                    offset = self._line_range(following)[0]
+                else:
+                    offset = self._line_range(existing[-1])[1]
+                edits.append((offset, offset, text))
+            else:
+                new_sections.setdefault(isa, []).append(text)
+
+        for isa, texts in new_sections.items():
+            body = f"/* Begin {isa} section */\n".encode('ascii') + b''.join(texts) + \
+                f"/* End {isa} section */\n\n".encode('ascii')
+            following = sorted(name for name in sections if name > isa and 'Begin' in sections[name])
+            if following:
+                offset = sections[following[0]]['Begin'].start()
+            else:
+                ends = [section['End'].end() for section in sections.values() if 'End' in section]
+                if not ends:
+                    raise ValueError("Project file has no object sections to insert into")
+                offset = max(ends)
+                body = b'\n' + body.rstrip(b'\n') + b'\n'
+            edits.append((offset, offset, body))
+        return edits
+
+    def edits(self):
+        """Return the pending (start, end, replacement) byte splices, in order"""
+        edits = []
+        for object_id in self._removed:
+            start, end = self._line_range(object_id)
+            edits.append((start, end, b''))
+        for object_id in self._rewrite:
+            start, end = self.project.span(object_id)
+            line_start = self._line_range(object_id)[0]
+            depth = self.project.data[line_start:start].count(b'\t') or 2
+            edits.append((start, end, self.format_object(object_id, depth=depth).encode('utf-8')))
+        for object_id, splices in self._splices.items():
+            if object_id not in self._rewrite and object_id not in self._removed:
+                edits.extend(splices)
+        edits.extend(self._section_insertions())
+
+        # Stable sort keeps insertions at the same offset in the order they were made
+        edits.sort(key=lambda edit: (edit[0], edit[1]))
+        for previous, edit in zip(edits, edits[1:]):
+            if edit[0] < previous[1]:
+                raise ValueError("Overlapping edits to project file")
+        return edits
+
+    def chunks(self):
+        """Yield the output file as a sequence of byte chunks"""
+        data = self.project.data
+        position = 0
+        for start, end, replacement in self.edits():
+            yield data[position:start]
+            yield replacement
+            position = end
+        yield data[position:]
+
+    def write(self, path=None):
+        """Write the project with all edits applied in one buffered write"""
+        path = str(path or self.project.path)
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(prefix='.project.pbxproj.', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+                for chunk in self.chunks():
+                    f.write(chunk)
+            if os.path.exists(path):
+                os.chmod(temp_path, os.stat(path).st_mode & 0o777)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
@@ -0,0 +1,368 @@
+"""
+Per-locale compaction of a string catalog
+
+Resources/Localizable.xcstrings is one JSON document holding every
+locale, with comments, extraction state and review states alongside the
+translations. This stage validates the catalog and compiles it into one
+compact table per locale:
+
+    <output>/<locale>.lproj/Localizable.strings       plain strings
+    <output>/<locale>.lproj/Localizable.stringsdict   plural variations
+
+Only translated units are kept; comments, extraction state and units that
+are new, stale or awaiting review are stripped, and so are units whose
+value is their key (a lookup falls back to the key anyway). A launch then
+reads just the active locale's table.
+Tables are written as UTF-8 text (Xcode converts .strings to binary when
+it copies them, see STRINGS_FILE_OUTPUT_ENCODING) or, with --binary, as
+binary property lists for use outside Xcode.
+
+The stage is incremental at two levels: an unchanged catalog is recognized
+by its content hash without being parsed, and a changed one rewrites only
+the locales whose compiled bytes differ, so editing one translation
+touches one file. --register adds the tables to the Resources phases (as
+variant groups, see importtree.py), takes the catalog itself out of them
+(both would produce <locale>.lproj/Localizable.strings) and adds a Run
+Script phase that runs this stage before resources are copied.
+"""
+
+import argparse
+import json
+import os
+import plistlib
+import re
+import sys
+from pathlib import Path
+
+from . import tracing
+from .add import generate_uuid
+from .cache import Cache, content_hash, source_version
+from .importtree import TreeImport
+from .session import open_project
+from .sources import DEFAULT_PROJECT
+from .writer import ProjectEditor
+
+DEFAULT_CATALOG = 'Resources/Localizable.xcstrings'
+DEFAULT_OUTPUT = 'Resources/Generated'
+
+# stringUnit states that are shipped; 'new', 'stale' and 'needs_review' are not
+SHIPPED_STATES = {'translated'}
+
+PLURAL_CATEGORIES = ('zero', 'one', 'two', 'few', 'many', 'other')
+
+RUN_SCRIPT_NAME = 'Compile String Catalog'
+
+_FORMAT_SPECIFIER = re.compile(
+    r'%(?:\d+\$)?[-+ #0]*(?:\d+|\*)?(?:\.(?:\d+|\*))?(hh|h|ll|l|q|z|t|j)?([@dDiuUxXoOfFeEgGcCsSaAp%])'
+)
+
+_SOURCE_VERSION = source_version(__name__)
+
+
+class CatalogError(Exception):
+    pass
+
+
+def load(path):
+    """The catalog as a dict; raises CatalogError if it isn't one"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            catalog = json.load(f)
+    except (OSError, ValueError) as e:
+        raise CatalogError(f"{path}: {e}")
+    if not isinstance(catalog, dict) or not isinstance(catalog.get('strings'), dict):
+        raise CatalogError(f"{path}: not a string catalog (no 'strings' object)")
+    return catalog
+
+
+def _specifiers(text):
+    """Format specifiers of a string, ignoring '%%'"""
+    return [(length or '') + conversion for length, conversion in _FORMAT_SPECIFIER.findall(text)
+            if conversion != '%']
+
+
+def _plural_units(localization):
+    """{category: value} of a plural variation, or None"""
+    plural = localization.get('variations', {}).get('plural')
+    if not isinstance(plural, dict):
+        return None
+    return {category: variant.get('stringUnit', {}).get('value')
+            for category, variant in plural.items() if category in PLURAL_CATEGORIES}
+
+
+def validate(catalog):
+    """Problems that would make a compiled table wrong; an empty list if none"""
+    problems = []
+    source_language = catalog.get('sourceLanguage')
+    if not source_language:
+        problems.append("catalog has no sourceLanguage")
+    for key, entry in catalog['strings'].items():
+        if not isinstance(entry, dict):
+            problems.append(f"{key!r}: entry is not an object")
+            continue
+        source = entry.get('localizations', {}).get(source_language, {})
+        source_value = source.get('stringUnit', {}).get('value', key)
+        expected = sorted(_specifiers(source_value))
+        for locale, localization in entry.get('localizations', {}).items():
+            unit = localization.get('stringUnit')
+            plural = _plural_units(localization)
+            if unit is None and plural is None and 'substitutions' not in localization \
+                    and 'device' not in localization.get('variations', {}):
+                problems.append(f"{key!r} [{locale}]: no stringUnit or variations")
+                continue
+            if unit is not None:
+                if 'value' not in unit:
+                    problems.append(f"{key!r} [{locale}]: stringUnit without a value")
+                elif unit.get('state') in SHIPPED_STATES and 'substitutions' not in localization \
+                        and sorted(_specifiers(unit['value'])) != expected:
+                    problems.append(f"{key!r} [{locale}]: format specifiers {_specifiers(unit['value'])} "
+                                    f"don't match the source {_specifiers(source_value)}")
+            if plural is not None and 'other' not in plural:
+                problems.append(f"{key!r} [{locale}]: plural variation without an 'other' case")
+    return problems
+
+
+def locale_tables(catalog):
+    """{locale: (strings, plurals, skipped)} with only the shipped units
+
+    strings is {key: value}; plurals is {key: stringsdict entry}; skipped
+    counts translated units this stage can't express (substitutions,
+    device-only variations), which then fall back to the key.
+    """
+    tables = {}
+    for key, entry in catalog['strings'].items():
+        if entry.get('shouldTranslate') is False:
+            continue
+        for locale, localization in entry.get('localizations', {}).items():
+            strings, plurals, skipped = tables.setdefault(locale, ({}, {}, [0]))
+            unit = localization.get('stringUnit')
+            if unit is not None:
+                if unit.get('state') in SHIPPED_STATES and 'substitutions' not in localization:
+                    if unit['value'] != key:
+                        strings[key] = unit['value']
+                elif 'substitutions' in localization:
+                    skipped[0] += 1
+                continue
+            variations = localization.get('variations', {})
+            plural = variations.get('plural')
+            if isinstance(plural, dict):
+                cases = {
+                    category: variant['stringUnit']['value']
+                    for category, variant in plural.items()
+                    if category in PLURAL_CATEGORIES
+                    and variant.get('stringUnit', {}).get('state') in SHIPPED_STATES
+                }
+                if 'other' in cases:
+                    specifiers = _specifiers(cases['other'])
+                    rule = {'NSStringFormatSpecTypeKey': 'NSStringPluralRuleType'}
+                    rule['NSStringFormatValueTypeKey'] = specifiers[0] if specifiers else 'd'
+                    rule.update(cases)
+                    plurals[key] = {'NSStringLocalizedFormatKey': '%#@value@', 'value': rule}
+            elif variations:
+                # Device variations: ship the default case if it is translated
+                default = variations.get('device', {}).get('other', {}).get('stringUnit', {})
+                if default.get('state') in SHIPPED_STATES:
+                    if default['value'] != key:
+                        strings[key] = default['value']
+                else:
+                    skipped[0] += 1
+    return {locale: (strings, plurals, skipped[0]) for locale, (strings, plurals, skipped) in tables.items()}
+
+
+def _escape(text):
+    return (text.replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t'))
+
+
+def format_strings(strings, binary=False):
+    """A .strings table: sorted `"key" = "value";` lines, or a binary plist"""
+    if binary:
+        return plistlib.dumps(strings, fmt=plistlib.FMT_BINARY, sort_keys=True)
+    return ''.join(f'"{_escape(key)}" = "{_escape(value)}";\n' for key, value in sorted(strings.items())).encode('utf-8')
+
+
+def _write_if_changed(path, data):
+    """Write data unless the file already holds exactly these bytes; True if written"""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+
+class Compilation:
+    def __init__(self):
+        self.outputs = []     # every table this catalog compiles to
+        self.written = []     # tables whose bytes changed
+        self.removed = []     # tables of locales no longer in the catalog
+        self.skipped = {}     # locale -> units that fall back to the key
+        self.up_to_date = False
+
+
+def compile_catalog(catalog_path, output_dir=DEFAULT_OUTPUT, binary=False, cache=True):
+    """Validate and compile a catalog; raises CatalogError with every problem"""
+    with open(catalog_path, 'rb') as f:
+        data = f.read()
+    table = Path(catalog_path).stem
+    key = content_hash(_SOURCE_VERSION, data, str(output_dir), str(binary))
+    store = Cache('xcstrings') if cache else None
+    result = Compilation()
+
+    known = store.get(key) if store is not None else None
+    if known is not None and all(os.path.isfile(path) for path in known['outputs']):
+        result.outputs = known['outputs']
+        result.skipped = known['skipped']
+        result.up_to_date = True
+        store.save(prune=False)
+        return result
+
+    with tracing.span('compile string catalog', 'compute', path=str(catalog_path)):
+        catalog = load(catalog_path)
+        problems = validate(catalog)
+        if problems:
+            raise CatalogError('\n'.join(problems))
+        for locale, (strings, plurals, skipped) in sorted(locale_tables(catalog).items()):
+            directory = os.path.join(output_dir, f"{locale}.lproj")
+            files = [(os.path.join(directory, f"{table}.strings"), format_strings(strings, binary))]
+            if plurals:
+                files.append((os.path.join(directory, f"{table}.stringsdict"),
+                              plistlib.dumps(plurals, sort_keys=True)))
+            for path, contents in files:
+                path = Path(path).as_posix()
+                result.outputs.append(path)
+                if _write_if_changed(path, contents):
+                    result.written.append(path)
+            if skipped:
+                result.skipped[locale] = skipped
+
+        # Locales dropped from the catalog
+        if os.path.isdir(output_dir):
+            for name in sorted(os.listdir(output_dir)):
+                for suffix in ('.strings', '.stringsdict'):
+                    path = Path(output_dir, name, table + suffix).as_posix()
+                    if name.endswith('.lproj') and path not in result.outputs and os.path.isfile(path):
+                        os.remove(path)
+                        result.removed.append(path)
+
+    if store is not None:
+        store.set(key, {'outputs': result.outputs, 'skipped': result.skipped})
+        store.save(prune=False)
+    return result
+
+
+def register(project_path, catalog_path, outputs, output_dir=DEFAULT_OUTPUT):
+    """Wire the compiled tables into the project in place of the catalog
+
+    Returns a list of what changed (empty if the project was already set up).
+    """
+    changes = []
+    with open_project(project_path) as project:
+        editor = ProjectEditor(project)
+        tree = TreeImport(editor)
+        for path in outputs:
+            if tree.add(path):
+                changes.append(f"added {path} to Resources")
+
+        paths = project.file_paths()
+        catalog = Path(catalog_path).as_posix()
+        inputs = [f"$(SRCROOT)/{catalog}"]
+        script_outputs = [f"$(SRCROOT)/{path}" for path in outputs]
+        script = (f'python3 "${{SRCROOT}}/scripts/compile-string-catalog.py" '
+                  f'--catalog "${{SRCROOT}}/{catalog}" --output "${{SRCROOT}}/{output_dir}"\n')
+        for target_id in project.targets():
+            phase_ids = list(project.get(target_id).get('buildPhases', []))
+            resources_id = project.build_phase(target_id, 'PBXResourcesBuildPhase')
+            if resources_id is None:
+                continue
+            ships_catalog = False
+            for build_file_id, file_ref_id in project.phase_file_refs(resources_id):
+                if paths.get(file_ref_id) == catalog:
+                    ships_catalog = True
+                    editor.remove_child(resources_id, 'files', build_file_id)
+                    editor.remove_object(build_file_id)
+            has_stage = any(project.isa(phase_id) == 'PBXShellScriptBuildPhase'
+                            and project.get(phase_id).get('name') == RUN_SCRIPT_NAME for phase_id in phase_ids)
+            if not ships_catalog or has_stage:
+                continue
+            name = project.display_name(target_id)
+            changes.append(f"{name}: moved {catalog} out of Resources")
+            phase_id = generate_uuid()
+            editor.add_object(phase_id, {
+                'isa': 'PBXShellScriptBuildPhase',
+                'buildActionMask': '2147483647',
+                'files': [],
+                'inputPaths': inputs,
+                'name': RUN_SCRIPT_NAME,
+                'outputPaths': script_outputs,
+                'runOnlyForDeploymentPostprocessing': '0',
+                'shellPath': '/bin/sh',
+                'shellScript': script,
+            })
+            target = dict(editor.get(target_id))
+            phase_ids.insert(phase_ids.index(resources_id), phase_id)
+            target['buildPhases'] = phase_ids
+            editor.update_object(target_id, target)
+            changes.append(f"{name}: added the '{RUN_SCRIPT_NAME}' phase before Resources")
+        if editor.modified:
+            editor.write(project_path)
+    return changes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Validate a string catalog and compile per-locale tables')
+    parser.add_argument('--catalog', default=DEFAULT_CATALOG, help=f'String catalog (default: {DEFAULT_CATALOG})')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f'Output directory (default: {DEFAULT_OUTPUT})')
+    parser.add_argument('--binary', action='store_true', help='Write .strings as binary property lists')
+    parser.add_argument('--check', action='store_true', help='Only validate the catalog')
+    parser.add_argument('--register', action='store_true',
+                        help='Add the tables and a build phase to the project in place of the catalog')
+    parser.add_argument('--project', default=DEFAULT_PROJECT, help='Path to project.pbxproj (for --register)')
+    parser.add_argument('--no-cache', action='store_true', help='Recompile even if the catalog is unchanged')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.check:
+            catalog = load(args.catalog)
+            problems = validate(catalog)
+            for problem in problems:
+                print(f"❌ {problem}")
+            if problems:
+                return 1
+            tables = locale_tables(catalog)
+            print(f"✅ {args.catalog}: {len(catalog['strings'])} keys, {len(tables)} locale(s) "
+                  f"({', '.join(sorted(tables))})")
+            return 0
+        result = compile_catalog(args.catalog, args.output, binary=args.binary, cache=not args.no_cache)
+    except CatalogError as e:
+        for line in str(e).splitlines():
+            print(f"❌ {line}")
+        return 1
+
+    if result.up_to_date:
+        print(f"✅ {args.catalog} unchanged; {len(result.outputs)} tables up to date")
+    else:
+        catalog_size = os.path.getsize(args.catalog)
+        sizes = ', '.join(f"{Path(path).parent.name}/{Path(path).name} {os.path.getsize(path)} B"
+                          for path in result.outputs)
+        print(f"🌐 {args.catalog} ({catalog_size} B) → {sizes}")
+        print(f"   {len(result.written)} written, {len(result.outputs) - len(result.written)} unchanged"
+              + (f", {len(result.removed)} removed" if result.removed else ''))
+    for locale, count in sorted(result.skipped.items()):
+        print(f"⚠️  {locale}: {count} units with substitutions or device variations fall back to the key")
+
+    if args.register:
+        changes = register(args.project, args.catalog, result.outputs, args.output)
+        for change in changes:
+            print(f"📎 {change}")
+        if not changes:
+            print("📎 Project already compiles the catalog per locale")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())